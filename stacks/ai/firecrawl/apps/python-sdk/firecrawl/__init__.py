@@ -9,6 +9,18 @@ import os
 from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
 from .v2.watcher import Watcher
 from .v2.watcher_async import AsyncWatcher
+from .v2.feeder import BatchFeeder
+from .v2.async_engine import AsyncEngine
+from .v2.webhook import WebhookSink
+from .v2.utils.decoder_pool import DecoderPool
+from .v2.utils.deadline import Deadline
+from .v2.utils.hedging import HedgePolicy
+from .v2.utils.circuit_breaker import CircuitBreakerRegistry
+from .v2.utils.cassette import Cassette, RecordTransport, ReplayTransport
+from .v2.utils.columnar import ColumnarResults
+from .v2.utils.projection import FieldProjection
+from .v2.methods.extract import merge_extract_data
+from .v2.utils.error_handler import CircuitOpenError
 from .v1 import (
     V1FirecrawlApp,
     AsyncV1FirecrawlApp,
@@ -79,6 +91,20 @@ __all__ = [
     'AsyncFirecrawlApp',
     'Watcher',
     'AsyncWatcher',
+    'BatchFeeder',
+    'AsyncEngine',
+    'WebhookSink',
+    'DecoderPool',
+    'Deadline',
+    'HedgePolicy',
+    'CircuitBreakerRegistry',
+    'CircuitOpenError',
+    'Cassette',
+    'RecordTransport',
+    'ReplayTransport',
+    'ColumnarResults',
+    'FieldProjection',
+    'merge_extract_data',
     'V1FirecrawlApp',
     'AsyncV1FirecrawlApp',
     'V1JsonConfig',
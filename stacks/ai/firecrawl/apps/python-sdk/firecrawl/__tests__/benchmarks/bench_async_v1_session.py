@@ -0,0 +1,79 @@
+"""
+Benchmark: per-request aiohttp sessions vs. the shared AsyncV1FirecrawlApp session.
+
+Starts a local aiohttp server that mimics the v1 crawl status endpoint and
+issues the same number of GET requests both ways. Not collected by pytest;
+run it directly:
+
+    python -m firecrawl.__tests__.benchmarks.bench_async_v1_session --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+from firecrawl.v1.client import AsyncV1FirecrawlApp
+
+
+async def _start_server():
+    async def status(request):
+        return web.json_response({"success": True, "status": "scraping", "completed": 1, "total": 2})
+
+    app = web.Application()
+    app.router.add_get("/v1/crawl/{id}", status)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _run(fetch, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await fetch()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - start
+
+
+async def main(total: int, concurrency: int) -> None:
+    runner, base_url = await _start_server()
+    url = f"{base_url}/v1/crawl/bench"
+    headers = {"Authorization": "Bearer fc-bench"}
+    try:
+        async def per_request_session():
+            # Previous behaviour: a new session (and connection) for every call
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, headers=headers) as response:
+                    await response.json()
+
+        baseline = await _run(per_request_session, total, concurrency)
+
+        async with AsyncV1FirecrawlApp(api_key="fc-bench", api_url=base_url) as app:
+            async def shared_session():
+                await app._async_get_request(url, headers)
+
+            shared = await _run(shared_session, total, concurrency)
+    finally:
+        await runner.cleanup()
+
+    print(f"requests={total} concurrency={concurrency}")
+    print(f"per-request session: {baseline:.3f}s ({total / baseline:.0f} req/s)")
+    print(f"shared session:      {shared:.3f}s ({total / shared:.0f} req/s)")
+    print(f"speedup:             {baseline / shared:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
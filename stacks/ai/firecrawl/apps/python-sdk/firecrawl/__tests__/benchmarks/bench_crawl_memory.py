@@ -0,0 +1,459 @@
+"""
+Memory profile: where large crawl results spend memory in the v2 SDK.
+
+Starts a local aiohttp server that serves synthetic crawl and batch pages
+(HTTP status pages with ``next`` links, plus a WebSocket stream of
+``document``/``done`` events) and runs each stage in a fresh process:
+
+    decode               raw JSON -> dicts -> normalized dicts -> DocumentMetadata -> Document
+    get_crawl_status     FirecrawlClient.get_crawl_status with auto-pagination
+    watcher              Watcher consuming the WebSocket stream (buffers + final job)
+    async_watcher        AsyncWatcher consuming the same stream
+    process_large_batch  process_large_batch over chunked batch jobs
+
+Each stage reports peak RSS above the process baseline (measured without
+tracemalloc, which would inflate it) and, in a second run, the tracemalloc
+peak plus the top allocation sites; ``decode`` also reports the memory
+retained after each step. Stages whose peak RSS exceeds their budget (a fixed
+allowance plus KB per document) or a saved baseline by more than
+``--tolerance`` are reported as regressions and the exit code is 1. Not collected by pytest; run it directly:
+
+    python -m firecrawl.__tests__.benchmarks.bench_crawl_memory --pages 20 --docs-per-page 100
+    python -m firecrawl.__tests__.benchmarks.bench_crawl_memory --save baseline.json
+    python -m firecrawl.__tests__.benchmarks.bench_crawl_memory --baseline baseline.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import random
+import resource
+import sys
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+# Peak RSS budgets in KB per document, about 1.5-2x what the default run measures
+DEFAULT_BUDGETS_KB = {
+    "decode": 48.0,
+    "get_crawl_status": 32.0,
+    "watcher": 32.0,
+    "async_watcher": 80.0,
+    "process_large_batch": 32.0,
+}
+
+# Fixed peak RSS every stage may use regardless of document count (imports,
+# thread stacks, socket buffers), so small runs are not judged per document
+DEFAULT_ALLOWANCE_MB = 2.0
+
+STAGES = list(DEFAULT_BUDGETS_KB)
+
+
+# Synthetic data
+
+def make_document(rng: random.Random, index: int, markdown_kb: int, html: bool) -> Dict[str, Any]:
+    url = f"https://docs.example.com/section-{index // 50}/page-{index}"
+    words = [rng.choice(("crawl", "scrape", "page", "memory", "token", "vector", "index", "result")) for _ in range(64)]
+    paragraph = " ".join(words) + "\n\n"
+    markdown = (f"# Page {index}\n\n" + paragraph * (markdown_kb * 1024 // len(paragraph) + 1))[: markdown_kb * 1024]
+    doc: Dict[str, Any] = {
+        "markdown": markdown,
+        "links": [f"https://docs.example.com/section-{rng.randrange(20)}/page-{rng.randrange(10000)}" for _ in range(25)],
+        "metadata": {
+            "title": f"Page {index}",
+            "description": paragraph[:160],
+            "language": "en",
+            "keywords": "crawl,scrape,benchmark",
+            "ogTitle": f"Page {index}",
+            "ogDescription": paragraph[:120],
+            "ogUrl": url,
+            "ogImage": f"https://docs.example.com/img/{index}.png",
+            "ogSiteName": "Example Docs",
+            "sourceURL": url,
+            "url": url,
+            "statusCode": 200,
+            "contentType": "text/html; charset=utf-8",
+            "scrapeId": f"scrape-{index:08d}",
+            "creditsUsed": 1,
+        },
+    }
+    if html:
+        doc["html"] = f"<html><body><article>{markdown}</article></body></html>"
+    return doc
+
+
+class SyntheticSite:
+    """Synthetic crawl documents and the response bodies served for them."""
+
+    def __init__(self, pages: int, docs_per_page: int, markdown_kb: int, html: bool, seed: int = 0) -> None:
+        self.pages = pages
+        self.docs_per_page = docs_per_page
+        self.total = pages * docs_per_page
+        rng = random.Random(seed)
+        self.docs = [
+            [make_document(rng, p * docs_per_page + i, markdown_kb, html) for i in range(docs_per_page)]
+            for p in range(pages)
+        ]
+        self.base_url = ""
+
+    def crawl_page(self, page: int) -> bytes:
+        skip = (page + 1) * self.docs_per_page
+        return json.dumps({
+            "success": True,
+            "status": "completed",
+            "completed": self.total,
+            "total": self.total,
+            "creditsUsed": self.total,
+            "expiresAt": "2030-01-01T00:00:00Z",
+            "next": f"{self.base_url}/v2/crawl/bench?skip={skip}" if page + 1 < self.pages else None,
+            "data": self.docs[page],
+        }).encode("utf-8")
+
+    def batch_page(self, count: int) -> bytes:
+        docs = [doc for page in self.docs for doc in page][:count]
+        return json.dumps({
+            "success": True,
+            "status": "completed",
+            "completed": count,
+            "total": count,
+            "creditsUsed": count,
+            "expiresAt": "2030-01-01T00:00:00Z",
+            "next": None,
+            "data": docs,
+        }).encode("utf-8")
+
+
+# Mock server
+
+def start_server(site: SyntheticSite) -> Tuple[str, Callable[[], None]]:
+    """Serve ``site`` from a background thread; returns (base_url, stop)."""
+    ready = threading.Event()
+    state: Dict[str, Any] = {}
+    batches: Dict[str, int] = {}
+
+    async def crawl_status(request: web.Request) -> web.StreamResponse:
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await crawl_stream(request)
+        job_id = request.match_info["id"]
+        if job_id == "stream":
+            # The watchers' job: progress arrives over the WebSocket
+            body = json.dumps({"success": True, "status": "scraping", "completed": 0, "total": site.total, "data": []})
+            return web.Response(body=body.encode("utf-8"), content_type="application/json")
+        page = int(request.query.get("skip", "0")) // site.docs_per_page
+        return web.Response(body=site.crawl_page(page), content_type="application/json")
+
+    async def crawl_stream(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        for page in site.docs:
+            for doc in page:
+                await ws.send_str(json.dumps({"type": "document", "data": doc}))
+        await ws.send_str(json.dumps({
+            "type": "done",
+            "data": {"status": "completed", "completed": site.total, "total": site.total, "creditsUsed": site.total},
+        }))
+        await ws.close()
+        return ws
+
+    async def start_batch(request: web.Request) -> web.Response:
+        body = await request.json()
+        job_id = f"batch-{len(batches)}"
+        batches[job_id] = len(body.get("urls", []))
+        return web.json_response({"success": True, "id": job_id, "url": f"{site.base_url}/v2/batch/scrape/{job_id}"})
+
+    async def batch_status(request: web.Request) -> web.Response:
+        count = batches.get(request.match_info["id"], 0)
+        return web.Response(body=site.batch_page(count), content_type="application/json")
+
+    def run() -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_get("/v2/crawl/{id}", crawl_status)
+        app.router.add_post("/v2/batch/scrape", start_batch)
+        app.router.add_get("/v2/batch/scrape/{id}", batch_status)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site_ = web.TCPSite(runner, "127.0.0.1", 0)
+        loop.run_until_complete(site_.start())
+        state["port"] = site_._server.sockets[0].getsockname()[1]
+        state["loop"] = loop
+        ready.set()
+        loop.run_forever()
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait()
+    base_url = f"http://127.0.0.1:{state['port']}"
+    site.base_url = base_url
+
+    def stop() -> None:
+        state["loop"].call_soon_threadsafe(state["loop"].stop)
+        thread.join(timeout=5)
+
+    return base_url, stop
+
+
+# Stages (run in a child process; each returns what it keeps alive)
+
+def _client(base_url: str):
+    from firecrawl.v2.client import FirecrawlClient
+
+    return FirecrawlClient(api_key="fc-bench", api_url=base_url)
+
+
+def stage_decode(base_url: str, cfg: Dict[str, Any], step: Callable[[str], None]) -> Any:
+    import requests
+
+    from firecrawl.v2.types import Document, DocumentMetadata
+    from firecrawl.v2.utils.normalize import _map_metadata_keys
+
+    raw: List[bytes] = []
+    url: Optional[str] = f"{base_url}/v2/crawl/bench"
+    while url:
+        response = requests.get(url, timeout=60)
+        raw.append(response.content)
+        url = json.loads(response.content).get("next")
+    step("raw")
+    parsed = [json.loads(page) for page in raw]
+    step("parsed")
+    # normalize_document_input, split so the metadata model is measured on its own
+    normalized = [{**item, "metadata": _map_metadata_keys(item["metadata"])} for page in parsed for item in page["data"]]
+    step("normalized")
+    metadata = [DocumentMetadata(**item["metadata"]) for item in normalized]
+    step("metadata")
+    documents = [Document(**{**item, "metadata": meta}) for item, meta in zip(normalized, metadata)]
+    step("documents")
+    return raw, parsed, normalized, metadata, documents
+
+
+def stage_get_crawl_status(base_url: str, cfg: Dict[str, Any], step: Callable[[str], None]) -> Any:
+    job = _client(base_url).get_crawl_status("bench")
+    assert len(job.data) == cfg["total"], len(job.data)
+    return job
+
+
+def stage_watcher(base_url: str, cfg: Dict[str, Any], step: Callable[[str], None]) -> Any:
+    from firecrawl.v2.watcher import Watcher
+
+    finished = threading.Event()
+    jobs: List[Any] = []
+    watcher = Watcher(_client(base_url), "stream", kind="crawl", poll_interval=30, timeout=300)
+    watcher.add_listener(jobs.append)
+    watcher.add_event_listener("done", lambda detail: finished.set())
+    watcher.start()
+    finished.wait(timeout=300)
+    watcher.stop()
+    assert len(watcher.data) == cfg["total"], len(watcher.data)
+    return watcher, jobs
+
+
+def stage_async_watcher(base_url: str, cfg: Dict[str, Any], step: Callable[[str], None]) -> Any:
+    from firecrawl.v2.watcher_async import AsyncWatcher
+
+    async def consume() -> Any:
+        last = None
+        async for snapshot in AsyncWatcher(_client(base_url), "stream", kind="crawl", timeout=300):
+            last = snapshot
+        return last
+
+    job = asyncio.run(consume())
+    assert job is not None and len(job.data) == cfg["total"], job
+    return job
+
+
+def stage_process_large_batch(base_url: str, cfg: Dict[str, Any], step: Callable[[str], None]) -> Any:
+    from firecrawl.v2.methods.batch import process_large_batch
+
+    urls = [f"https://docs.example.com/page-{i}" for i in range(cfg["total"])]
+    documents = process_large_batch(_client(base_url).http_client, urls, chunk_size=cfg["docs_per_page"], poll_interval=0)
+    assert len(documents) == cfg["total"], len(documents)
+    return documents
+
+
+STAGE_FUNCS = {
+    "decode": stage_decode,
+    "get_crawl_status": stage_get_crawl_status,
+    "watcher": stage_watcher,
+    "async_watcher": stage_async_watcher,
+    "process_large_batch": stage_process_large_batch,
+}
+
+
+# Measurement
+
+def _current_rss_kb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024
+    except OSError:
+        return _peak_rss_kb()
+
+
+def _peak_rss_kb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+def _run_stage(stage: str, base_url: str, cfg: Dict[str, Any], trace: bool, queue: Any) -> None:
+    # Import the SDK before taking the baseline so it is not counted
+    import firecrawl.v2.client  # noqa: F401
+    import firecrawl.v2.watcher  # noqa: F401
+    import firecrawl.v2.watcher_async  # noqa: F401
+
+    steps: List[Dict[str, Any]] = []
+    gc.collect()
+    baseline_kb = _current_rss_kb()
+    if trace:
+        tracemalloc.start(10)
+
+    def step(name: str) -> None:
+        if not trace:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        steps.append({"step": name, "retained_mb": current / 2 ** 20, "peak_mb": peak / 2 ** 20})
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    kept = STAGE_FUNCS[stage](base_url, cfg, step)
+    result: Dict[str, Any] = {"stage": stage}
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        if steps:
+            peak = max([peak] + [s["peak_mb"] * 2 ** 20 for s in steps])
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ])
+        result.update(
+            traced_peak_mb=peak / 2 ** 20,
+            retained_mb=current / 2 ** 20,
+            steps=steps,
+            top=[
+                {"site": str(stat.traceback[0]), "mb": stat.size / 2 ** 20, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:5]
+            ],
+        )
+        tracemalloc.stop()
+    else:
+        result["rss_peak_mb"] = max(0.0, _peak_rss_kb() - baseline_kb) / 1024
+    del kept
+    queue.put(result)
+
+
+def measure(stage: str, base_url: str, cfg: Dict[str, Any], trace: bool) -> Dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_stage, args=(stage, base_url, cfg, trace, queue))
+    process.start()
+    while True:
+        try:
+            result = queue.get(timeout=1)
+            break
+        except queue_module.Empty:
+            if not process.is_alive():
+                raise RuntimeError(f"Stage {stage} failed with exit code {process.exitcode}")
+    process.join()
+    return result
+
+
+def check(results: Dict[str, Dict[str, Any]], total: int, budgets: Dict[str, float],
+          baseline: Optional[Dict[str, Any]], tolerance: float,
+          allowance_mb: float = DEFAULT_ALLOWANCE_MB) -> List[str]:
+    """Return a message per stage over its budget or its baseline."""
+    regressions = []
+    for stage, result in results.items():
+        budget = budgets.get(stage)
+        if budget is not None:
+            limit_mb = allowance_mb + budget * total / 1024
+            if result["rss_peak_mb"] > limit_mb:
+                per_doc_kb = max(result["rss_peak_mb"] - allowance_mb, 0.0) * 1024 / total
+                regressions.append(
+                    f"{stage}: {per_doc_kb:.1f} KB/doc peak RSS above the {allowance_mb:.1f} MB allowance "
+                    f"exceeds budget {budget:.1f} KB/doc"
+                )
+        previous = (baseline or {}).get("stages", {}).get(stage)
+        if previous and previous.get("rss_peak_mb"):
+            limit = previous["rss_peak_mb"] * (1 + tolerance)
+            if result["rss_peak_mb"] > limit:
+                regressions.append(
+                    f"{stage}: peak RSS {result['rss_peak_mb']:.1f} MB exceeds baseline "
+                    f"{previous['rss_peak_mb']:.1f} MB by more than {tolerance:.0%}"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--docs-per-page", type=int, default=100)
+    parser.add_argument("--markdown-kb", type=int, default=8, help="Markdown size per document")
+    parser.add_argument("--html", action="store_true", help="Also include an html field per document")
+    parser.add_argument("--stages", default=",".join(STAGES), help="Comma-separated subset of: " + ", ".join(STAGES))
+    parser.add_argument("--no-trace", action="store_true", help="Skip the tracemalloc breakdown")
+    parser.add_argument("--budget", action="append", default=[], metavar="STAGE=KB",
+                        help="Override a stage's peak RSS budget in KB per document")
+    parser.add_argument("--allowance-mb", type=float, default=DEFAULT_ALLOWANCE_MB,
+                        help="Fixed peak RSS per stage not counted against the per-document budget")
+    parser.add_argument("--baseline", help="Compare against results saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed growth over the baseline")
+    parser.add_argument("--save", help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    budgets = dict(DEFAULT_BUDGETS_KB)
+    for item in args.budget:
+        stage, _, kb = item.partition("=")
+        budgets[stage] = float(kb)
+
+    site = SyntheticSite(args.pages, args.docs_per_page, args.markdown_kb, args.html)
+    cfg = {"total": site.total, "docs_per_page": args.docs_per_page}
+    raw_mb = sum(len(site.crawl_page(p)) for p in range(site.pages)) / 2 ** 20
+    base_url, stop = start_server(site)
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for stage in stages:
+            results[stage] = measure(stage, base_url, cfg, trace=False)
+            if not args.no_trace:
+                results[stage].update({k: v for k, v in measure(stage, base_url, cfg, trace=True).items() if k != "stage"})
+    finally:
+        stop()
+
+    print(f"documents={site.total} pages={site.pages} markdown={args.markdown_kb}KB html={args.html} raw JSON={raw_mb:.1f}MB")
+    for stage, result in results.items():
+        line = f"{stage:<20} peak RSS {result['rss_peak_mb']:8.1f} MB ({result['rss_peak_mb'] * 1024 / site.total:6.1f} KB/doc)"
+        if "traced_peak_mb" in result:
+            line += f"   traced peak {result['traced_peak_mb']:8.1f} MB   retained {result['retained_mb']:8.1f} MB"
+        print(line)
+        for s in result.get("steps", []):
+            print(f"    {s['step']:<12} retained {s['retained_mb']:8.1f} MB   step peak {s['peak_mb']:8.1f} MB")
+        for top in result.get("top", []):
+            print(f"    {top['mb']:8.1f} MB {top['count']:>9} blocks  {top['site']}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = check(results, site.total, budgets, baseline, args.tolerance, args.allowance_mb)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"config": vars(args), "documents": site.total, "stages": results}, f, indent=2)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
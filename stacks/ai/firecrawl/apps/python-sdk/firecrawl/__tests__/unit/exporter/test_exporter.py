@@ -0,0 +1,128 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from firecrawl.exporter import Exporter, TelemetryCache
+from firecrawl.v2.types import (
+    ConcurrencyCheck,
+    CreditUsage,
+    CreditUsageHistoricalPeriod,
+    CreditUsageHistoricalResponse,
+    QueueStatusResponse,
+    TokenUsage,
+    TokenUsageHistoricalResponse,
+)
+
+
+class FakeAsyncClient:
+    def __init__(self, delay=0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = {}
+
+    async def _record(self, name, value):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        await asyncio.sleep(self.delay)
+        if name in self.fail:
+            raise RuntimeError(f"{name} unavailable")
+        return value
+
+    async def get_queue_status(self):
+        return await self._record("queue_status", QueueStatusResponse(
+            jobs_in_queue=7, active_jobs_in_queue=5, waiting_jobs_in_queue=2, max_concurrency=10,
+            most_recent_success="2026-01-01T00:00:00Z",
+        ))
+
+    async def get_concurrency(self):
+        return await self._record("concurrency", ConcurrencyCheck(concurrency=3, max_concurrency=10))
+
+    async def get_credit_usage(self):
+        return await self._record("credit_usage", CreditUsage(
+            remaining_credits=900, plan_credits=1000, billing_period_end="2026-02-01T00:00:00Z",
+        ))
+
+    async def get_token_usage(self):
+        return await self._record("token_usage", TokenUsage(remaining_tokens=50))
+
+    async def get_credit_usage_historical(self, by_api_key=False):
+        return await self._record("credit_usage_historical", CreditUsageHistoricalResponse(success=True, periods=[
+            CreditUsageHistoricalPeriod(startDate="2026-01-01", endDate="2026-02-01", apiKey="k1" if by_api_key else None, creditsUsed=100),
+        ]))
+
+    async def get_token_usage_historical(self, by_api_key=False):
+        return await self._record("token_usage_historical", TokenUsageHistoricalResponse(success=True, periods=[]))
+
+
+class TestTelemetryCache:
+    @pytest.mark.asyncio
+    async def test_renders_prometheus_text(self):
+        cache = TelemetryCache(FakeAsyncClient(), by_api_key=True)
+        await cache.refresh()
+        text = cache.render()
+
+        assert '# TYPE firecrawl_queue_jobs gauge' in text
+        assert 'firecrawl_queue_jobs{state="waiting"} 2.0' in text
+        assert 'firecrawl_queue_most_recent_success_timestamp_seconds 1767225600.0' in text
+        assert 'firecrawl_concurrency 3.0' in text
+        assert 'firecrawl_remaining_credits 900.0' in text
+        assert 'firecrawl_plan_credits 1000.0' in text
+        assert 'firecrawl_remaining_tokens 50.0' in text
+        # Unset values are omitted rather than reported as 0
+        assert 'firecrawl_plan_tokens' not in text
+        assert 'firecrawl_credits_used{start="2026-01-01",end="2026-02-01",api_key="k1"} 100.0' in text
+        assert 'firecrawl_exporter_up{endpoint="concurrency"} 1.0' in text
+
+    @pytest.mark.asyncio
+    async def test_samples_each_endpoint_once_per_interval(self):
+        client = FakeAsyncClient(delay=0.02)
+        cache = TelemetryCache(client, interval=60, historical_interval=None)
+        # Concurrent scrapes (e.g. several Prometheus replicas) share one refresh
+        await asyncio.gather(*(cache.refresh() for _ in range(5)))
+        await cache.refresh()
+        assert client.calls == {name: 1 for name in ("queue_status", "concurrency", "credit_usage", "token_usage")}
+
+        await cache.refresh(force=True)
+        assert client.calls["concurrency"] == 2
+        assert "credit_usage_historical" not in cache.render()
+
+    @pytest.mark.asyncio
+    async def test_failed_sample_keeps_last_value_and_marks_endpoint_down(self):
+        client = FakeAsyncClient()
+        cache = TelemetryCache(client, historical_interval=None)
+        await cache.refresh()
+        client.fail.add("concurrency")
+        await cache.refresh(force=True)
+        text = cache.render()
+        assert 'firecrawl_concurrency 3.0' in text
+        assert 'firecrawl_exporter_up{endpoint="concurrency"} 0.0' in text
+        assert 'firecrawl_exporter_api_errors_total{endpoint="concurrency"} 1.0' in text
+        assert 'firecrawl_exporter_api_requests_total{endpoint="concurrency"} 2.0' in text
+
+    def test_rejects_non_positive_intervals(self):
+        with pytest.raises(ValueError):
+            TelemetryCache(FakeAsyncClient(), interval=0)
+
+
+class TestExporter:
+    @pytest.mark.asyncio
+    async def test_serves_metrics_on_demand(self):
+        client = FakeAsyncClient()
+        cache = TelemetryCache(client, interval=60, historical_interval=None)
+        async with Exporter(cache, host="127.0.0.1", port=0, on_demand=True) as exporter:
+            async with aiohttp.ClientSession() as session:
+                for _ in range(3):
+                    async with session.get(f"http://127.0.0.1:{exporter.port}/metrics") as response:
+                        assert response.status == 200
+                        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                        body = await response.text()
+        assert "firecrawl_queue_jobs" in body
+        assert client.calls["queue_status"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scheduled_sampling_runs_in_background(self):
+        client = FakeAsyncClient()
+        cache = TelemetryCache(client, interval=0.05, historical_interval=None)
+        async with Exporter(cache, host="127.0.0.1", port=0):
+            await asyncio.sleep(0.2)
+        assert client.calls["concurrency"] >= 2
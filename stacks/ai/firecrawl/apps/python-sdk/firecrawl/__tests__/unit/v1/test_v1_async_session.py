@@ -0,0 +1,100 @@
+"""
+Unit tests for the shared aiohttp session in AsyncV1FirecrawlApp.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+from firecrawl.v1.client import AsyncV1FirecrawlApp
+
+
+async def _start_server():
+    requests_seen = []
+
+    async def status(request):
+        requests_seen.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"success": True, "status": "completed"})
+
+    async def cancel(request):
+        return web.json_response({"success": True})
+
+    app = web.Application()
+    app.router.add_get("/v1/crawl/{id}", status)
+    app.router.add_delete("/v1/crawl/{id}", cancel)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", requests_seen
+
+
+class TestAsyncV1Session:
+    @pytest.mark.asyncio
+    async def test_requests_share_one_session_and_connection(self):
+        runner, url, peers = await _start_server()
+        try:
+            async with AsyncV1FirecrawlApp(api_key="fc-test", api_url=url) as app:
+                for _ in range(3):
+                    await app._async_get_request(f"{url}/v1/crawl/abc", app._prepare_headers())
+                session = app._session
+                assert await app.cancel_crawl("abc") == {"success": True}
+                assert app._session is session
+            assert session.closed
+            assert app._session is None
+            # Keep-alive: every request arrived over the same client socket
+            assert len(set(peers)) == 1
+        finally:
+            await runner.cleanup()
+
+    def test_connector_settings_and_new_loop(self):
+        app = AsyncV1FirecrawlApp(
+            api_key="fc-test",
+            connection_limit=10,
+            connection_limit_per_host=4,
+            dns_cache_ttl=60,
+        )
+
+        async def open_session():
+            return await app._get_session()
+
+        first = asyncio.run(open_session())
+        assert first.connector.limit == 10
+        assert first.connector.limit_per_host == 4
+
+        # A later asyncio.run() gets a fresh session bound to its own loop
+        second = asyncio.run(open_session())
+        assert second is not first
+        # ...and the session left behind by the first loop is closed
+        assert first.closed
+        asyncio.run(app.close())
+        assert second.closed
+
+    def test_session_of_a_running_loop_is_closed_on_that_loop(self):
+        app = AsyncV1FirecrawlApp(api_key="fc-test")
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            first = asyncio.run_coroutine_threadsafe(app._get_session(), other_loop).result(timeout=5)
+
+            async def reopen():
+                session = await app._get_session()
+                # Give the other loop a moment to run the close
+                for _ in range(50):
+                    if first.closed:
+                        break
+                    await asyncio.sleep(0.01)
+                return session
+
+            second = asyncio.run(reopen())
+            assert second is not first
+            assert first.closed
+            asyncio.run(app.close())
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
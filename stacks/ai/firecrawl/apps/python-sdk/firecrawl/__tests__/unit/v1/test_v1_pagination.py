@@ -0,0 +1,104 @@
+"""
+Unit tests for session-backed, streaming pagination in V1FirecrawlApp.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v1.client import V1FirecrawlApp
+
+
+def _response(payload, status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+def _page(docs, next_url=None, status="completed"):
+    payload = {
+        "success": True,
+        "status": status,
+        "completed": 3,
+        "total": 3,
+        "creditsUsed": 3,
+        "expiresAt": "2030-01-01T00:00:00Z",
+        "data": [{"markdown": d} for d in docs],
+    }
+    if next_url:
+        payload["next"] = next_url
+    return payload
+
+
+@pytest.fixture
+def app():
+    return V1FirecrawlApp(api_key="fc-test", api_url="https://api.test")
+
+
+class TestV1Pagination:
+    def test_requests_reuse_the_pooled_session(self, app, monkeypatch):
+        request = Mock(return_value=_response({"success": True}))
+        monkeypatch.setattr(app._http_session, "request", request)
+
+        app._get_request("https://api.test/v1/crawl/1", {})
+        app._delete_request("https://api.test/v1/crawl/1", {})
+
+        assert [c.args[0] for c in request.call_args_list] == ["get", "delete"]
+
+    def test_no_sleep_after_final_502(self, app, monkeypatch):
+        request = Mock(return_value=_response({}, status_code=502))
+        sleeps = []
+        monkeypatch.setattr(app._http_session, "request", request)
+        monkeypatch.setattr("firecrawl.v1.client.time.sleep", sleeps.append)
+
+        response = app._get_request("https://api.test/v1/crawl/1", {}, retries=3, backoff_factor=0.5)
+
+        assert response.status_code == 502
+        assert request.call_count == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_iter_crawl_url_results_streams_pages(self, app, monkeypatch):
+        pages = {
+            "https://api.test/v1/crawl/abc": _page(["a"], "https://api.test/v1/crawl/abc?skip=1"),
+            "https://api.test/v1/crawl/abc?skip=1": _page(["b"], "https://api.test/v1/crawl/abc?skip=2"),
+            "https://api.test/v1/crawl/abc?skip=2": _page(["c"]),
+        }
+        fetched = []
+
+        def fake_request(method, url, **kwargs):
+            fetched.append(url)
+            return _response(pages[url])
+
+        monkeypatch.setattr(app._http_session, "request", fake_request)
+
+        results = app.iter_crawl_url_results("abc")
+        assert next(results).markdown == "a"
+        # Later pages are only requested as the iterator advances
+        assert len(fetched) == 1
+        assert [d.markdown for d in results] == ["b", "c"]
+        assert len(fetched) == 3
+
+    def test_iter_batch_results_waits_then_raises_on_failure(self, app, monkeypatch):
+        responses = iter([
+            _response(_page([], status="scraping")),
+            _response(_page([], status="failed")),
+        ])
+        monkeypatch.setattr(app._http_session, "request", lambda method, url, **kwargs: next(responses))
+        monkeypatch.setattr("firecrawl.v1.client.time.sleep", lambda s: None)
+
+        with pytest.raises(Exception, match="failed"):
+            list(app.iter_batch_results("job"))
+
+    def test_check_batch_scrape_status_merges_pages(self, app, monkeypatch):
+        pages = {
+            "https://api.test/v1/batch/scrape/b1": _page(["a"], "https://api.test/v1/batch/scrape/b1?skip=1"),
+            "https://api.test/v1/batch/scrape/b1?skip=1": _page(["b"]),
+        }
+        monkeypatch.setattr(app._http_session, "request", lambda method, url, **kwargs: _response(pages[url]))
+
+        status = app.check_batch_scrape_status("b1")
+
+        assert [d.markdown for d in status.data] == ["a", "b"]
+        assert status.next is None
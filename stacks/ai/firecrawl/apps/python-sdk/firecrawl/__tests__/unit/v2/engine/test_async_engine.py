@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, as_completed
+
+import pytest
+
+from firecrawl.v2.async_engine import AsyncEngine
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods.aio import scrape as async_scrape
+from firecrawl.v2.types import Document, DocumentMetadata
+
+
+class FakeAsyncHttpClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncClient:
+    """Records peak concurrency and the thread its coroutines run on."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self.async_http_client = FakeAsyncHttpClient()
+
+    async def _call(self, value):
+        self.threads.add(threading.current_thread().name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if value == "boom":
+            raise ValueError("boom")
+        return value
+
+    async def scrape(self, url, **kwargs):
+        return (await self._call(url), kwargs)
+
+    async def map(self, url, **kwargs):
+        return await self._call(f"map:{url}")
+
+    async def get_batch_scrape_status(self, job_id, pagination_config=None, fields=None):
+        return await self._call(f"status:{job_id}:{fields}")
+
+
+class TestAsyncEngine:
+    def test_runs_calls_concurrently_on_one_background_thread(self):
+        client = FakeAsyncClient()
+        with AsyncEngine(client, max_concurrency=4) as engine:
+            futures = engine.scrape_many([f"https://a.dev/{i}" for i in range(10)], formats=["markdown"])
+            results = [f.result(timeout=5) for f in futures]
+
+        assert [url for url, _ in results] == [f"https://a.dev/{i}" for i in range(10)]
+        assert results[0][1] == {"formats": ["markdown"]}
+        assert client.peak == 4
+        assert client.threads == {"firecrawl-async-engine"}
+        assert client.async_http_client.closed
+
+    def test_map_many_and_batch_status_many(self):
+        with AsyncEngine(FakeAsyncClient(delay=0)) as engine:
+            maps = engine.map_many(["a", "b"])
+            statuses = engine.batch_status_many(["j1", "j2"], fields=["title"])
+            assert [f.result(timeout=5) for f in maps] == ["map:a", "map:b"]
+            assert sorted(f.result(timeout=5) for f in as_completed(statuses)) == [
+                "status:j1:['title']",
+                "status:j2:['title']",
+            ]
+
+    def test_errors_are_raised_from_their_future(self):
+        with AsyncEngine(FakeAsyncClient(delay=0)) as engine:
+            ok, bad = engine.scrape_many(["fine", "boom"])
+            assert ok.result(timeout=5)[0] == "fine"
+            with pytest.raises(ValueError, match="boom"):
+                bad.result(timeout=5)
+
+    def test_close_cancels_pending_calls_and_rejects_new_ones(self):
+        engine = AsyncEngine(FakeAsyncClient(delay=10), max_concurrency=1)
+        futures = engine.scrape_many(["a", "b"])
+        engine.close()
+        for future in futures:
+            with pytest.raises(CancelledError):
+                future.result(timeout=5)
+        with pytest.raises(RuntimeError):
+            engine.submit(lambda client: client.scrape("c"))
+
+    def test_validates_max_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncEngine(FakeAsyncClient(), max_concurrency=0)
+
+
+def test_sync_client_scrape_many_shares_one_async_client(monkeypatch):
+    seen = []
+
+    async def fake_scrape(client, url, options, **kwargs):
+        seen.append(client)
+        return Document(markdown=url, metadata=DocumentMetadata(source_url=url))
+
+    monkeypatch.setattr(async_scrape, "scrape", fake_scrape)
+    client = FirecrawlClient(api_key="test", max_parallel_requests=3)
+    futures = client.scrape_many(["https://a.dev/1", "https://a.dev/2"])
+    assert [f.result(timeout=5).markdown for f in futures] == ["https://a.dev/1", "https://a.dev/2"]
+
+    engine = client.async_engine
+    assert engine.max_concurrency == 3
+    assert client.async_engine is engine
+    assert len({id(c) for c in seen}) == 1 and seen[0] is engine.client.async_http_client
+    engine.close()
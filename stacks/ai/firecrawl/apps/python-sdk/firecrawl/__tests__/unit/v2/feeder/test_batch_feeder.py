@@ -0,0 +1,187 @@
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from firecrawl.v2.feeder import BatchFeeder
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+class FakeBatchApi:
+    """In-memory /v2/batch/scrape job that scrapes submitted URLs immediately."""
+
+    def __init__(self, page_size=2, fail_posts=False):
+        self.page_size = page_size
+        self.fail_posts = fail_posts
+        self.posts = []
+        self.docs = []
+        self.lock = threading.Lock()
+        self.decoder_pool = None
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {"x-idempotency-key": idempotency_key} if idempotency_key else {}
+
+    def post(self, endpoint, data, headers=None):
+        if self.fail_posts:
+            return FakeResponse({"success": False, "error": "boom"}, status_code=400)
+        with self.lock:
+            self.posts.append(data)
+            for url in data["urls"]:
+                if "invalid" in url:
+                    continue
+                self.docs.append({"markdown": f"md {url}", "metadata": {"sourceURL": url, "statusCode": 200, "title": url}})
+        invalid = [u for u in data["urls"] if "invalid" in u]
+        return FakeResponse({"success": True, "id": "job-1", "url": "https://api/job-1", "invalidURLs": invalid})
+
+    def delete(self, endpoint):
+        self.cancelled = endpoint
+        return FakeResponse({"success": True, "status": "cancelled"})
+
+    def get(self, endpoint):
+        skip = int(parse_qs(urlparse(endpoint).query).get("skip", ["0"])[0])
+        with self.lock:
+            page = self.docs[skip : skip + self.page_size]
+            total = len(self.docs)
+        more = skip + len(page) < total
+        return FakeResponse({
+            "success": True,
+            "status": "completed",
+            "completed": total,
+            "total": total,
+            "next": f"/v2/batch/scrape/job-1?skip={skip + len(page)}" if more else None,
+            "data": page,
+        })
+
+
+def _feeder(api, **kwargs):
+    kwargs.setdefault("poll_interval", 0.01)
+    return BatchFeeder(api, **kwargs)
+
+
+def _collect(feeder, timeout=5):
+    docs = []
+    worker = threading.Thread(target=lambda: docs.extend(feeder))
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive()
+    return docs
+
+
+class TestBatchFeeder:
+    def test_size_based_micro_batches_append_to_one_job(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, max_batch_size=2, max_delay=60)
+        for i in range(5):
+            feeder.add(f"https://a.dev/{i}")
+        feeder.close()
+        docs = _collect(feeder)
+
+        assert [d.metadata.source_url for d in docs] == [f"https://a.dev/{i}" for i in range(5)]
+        assert [len(p["urls"]) for p in api.posts] == [2, 2, 1]
+        assert "appendToId" not in api.posts[0]
+        assert all(p["appendToId"] == "job-1" for p in api.posts[1:])
+        assert feeder.job_id == "job-1" and feeder.submitted == 5 and feeder.delivered == 5
+
+    def test_delay_based_flush_delivers_before_close(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, max_batch_size=100, max_delay=0.05)
+        feeder.add("https://a.dev/first")
+        results = iter(feeder)
+        first = next(results)
+        assert first.metadata.source_url == "https://a.dev/first"
+
+        feeder.add("https://a.dev/second")
+        feeder.close()
+        assert [d.metadata.source_url for d in results] == ["https://a.dev/second"]
+        assert len(api.posts) == 2
+
+    def test_flush_submits_immediately(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, max_batch_size=100, max_delay=60)
+        feeder.add("https://a.dev/1")
+        feeder.flush()
+        deadline = time.time() + 2
+        while not api.posts and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(api.posts) == 1
+        assert feeder.cancel() is True
+        assert api.cancelled == "/v2/batch/scrape/job-1"
+        # Iteration ends; documents delivered before cancel() are still yielded
+        assert len(_collect(feeder)) <= 1
+
+    def test_canonicalize_drops_duplicates_across_stream(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, canonicalize_urls=True, max_batch_size=1)
+        assert feeder.add("https://A.dev/x/?utm_source=n") is True
+        assert feeder.add("https://a.dev/x") is False
+        assert feeder.add_many(["https://a.dev/y", "https://a.dev/y#frag"]) == 1
+        feeder.close()
+        assert len(_collect(feeder)) == 2
+        assert [p["urls"] for p in api.posts] == [["https://a.dev/x"], ["https://a.dev/y"]]
+
+    def test_invalid_urls_do_not_block_completion(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, max_batch_size=3)
+        feeder.add_many(["https://a.dev/1", "https://invalid.dev/", "https://a.dev/2"])
+        feeder.close()
+        assert len(_collect(feeder)) == 2
+        assert feeder.invalid_urls == ["https://invalid.dev/"]
+        assert api.posts[0]["ignoreInvalidURLs"] is True
+
+    def test_fields_projection_and_formats(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, fields=["title"], max_batch_size=1)
+        feeder.add("https://a.dev/1")
+        feeder.close()
+        (doc,) = _collect(feeder)
+        assert doc.markdown is None and doc.metadata.title == "https://a.dev/1"
+        assert doc.metadata.status_code is None
+
+    def test_close_without_urls_ends_iteration(self):
+        feeder = _feeder(FakeBatchApi())
+        feeder.close()
+        assert _collect(feeder) == []
+
+    def test_add_after_close_and_bad_urls_raise(self):
+        feeder = _feeder(FakeBatchApi())
+        with pytest.raises(ValueError):
+            feeder.add("ftp://a.dev/file")
+        feeder.close()
+        with pytest.raises(RuntimeError):
+            feeder.add("https://a.dev/1")
+
+    def test_submit_errors_surface_in_iterator(self):
+        feeder = _feeder(FakeBatchApi(fail_posts=True), max_batch_size=1)
+        feeder.add("https://a.dev/1")
+        with pytest.raises(Exception):
+            list(feeder)
+        with pytest.raises(RuntimeError):
+            feeder.add("https://a.dev/2")
+
+    def test_max_in_flight_blocks_until_scraped(self):
+        api = FakeBatchApi()
+        feeder = _feeder(api, max_batch_size=1, max_delay=60, max_in_flight=1)
+        feeder.add("https://a.dev/1")
+        # Returns only after the first URL has been submitted and reported completed
+        feeder.add("https://a.dev/2")
+        assert feeder.completed >= 1
+        feeder.close()
+        assert len(_collect(feeder)) == 2
+
+    def test_validates_arguments(self):
+        with pytest.raises(ValueError):
+            BatchFeeder(None, max_batch_size=0)
+        with pytest.raises(ValueError):
+            BatchFeeder(None, max_delay=0)
+        with pytest.raises(ValueError):
+            BatchFeeder(None, max_in_flight=0)
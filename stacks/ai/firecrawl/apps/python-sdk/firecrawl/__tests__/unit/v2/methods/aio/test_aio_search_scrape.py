@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.types import Document, SearchData, SearchRequest, SearchResultWeb
+from firecrawl.v2.methods.aio import search_scrape as aio_search_scrape
+
+
+def _patch(monkeypatch, delays):
+    async def fake_search(client, request):
+        return SearchData(web=[SearchResultWeb(url=u) for u in delays])
+
+    async def fake_scrape(client, url, options=None):
+        await asyncio.sleep(delays[url])
+        return Document(markdown=url)
+
+    monkeypatch.setattr(aio_search_scrape.async_search, "search", fake_search)
+    monkeypatch.setattr(aio_search_scrape.async_scrape, "scrape", fake_scrape)
+
+
+@pytest.mark.asyncio
+async def test_documents_arrive_in_completion_order(monkeypatch):
+    _patch(monkeypatch, {"https://a.dev/slow": 0.05, "https://a.dev/fast": 0.0})
+    stream = await aio_search_scrape.search_and_scrape(None, SearchRequest(query="q"))
+
+    assert [d.markdown async for d in stream] == ["https://a.dev/fast", "https://a.dev/slow"]
+
+
+@pytest.mark.asyncio
+async def test_stop_when_cancels_remaining(monkeypatch):
+    _patch(monkeypatch, {"https://a.dev/hit": 0.0, "https://a.dev/never": 10})
+    stream = await aio_search_scrape.search_and_scrape(
+        None, SearchRequest(query="q"), stop_when=lambda d: d.markdown.endswith("hit")
+    )
+
+    docs = await asyncio.wait_for(_collect(stream), timeout=2)
+
+    assert [d.markdown for d in docs] == ["https://a.dev/hit"]
+    assert stream.matched is docs[0]
+
+
+async def _collect(stream):
+    return [d async for d in stream]
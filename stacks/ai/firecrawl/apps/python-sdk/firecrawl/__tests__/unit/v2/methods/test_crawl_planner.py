@@ -0,0 +1,147 @@
+"""
+Unit tests for the map-driven sharded crawl planner in Firecrawl v2 SDK.
+"""
+
+import threading
+import time
+
+import pytest
+
+from firecrawl.v2.types import BatchScrapeJob, BatchScrapeResponse, CrawlShard, Document, LinkResult, MapData
+from firecrawl.v2.methods import crawl_planner as planner_module
+
+
+class TestFilterUrls:
+    def test_include_exclude_are_searched_against_path(self):
+        urls = [
+            "https://a.dev/blog/post-1",
+            "https://a.dev/blog/drafts/x",
+            "https://a.dev/docs/intro",
+            "https://a.dev/shop?page=blog",
+        ]
+        kept = planner_module.filter_urls(
+            urls, "https://a.dev", include_paths=["^/blog"], exclude_paths=["drafts"]
+        )
+        assert kept == ["https://a.dev/blog/post-1"]
+
+    def test_host_depth_and_limit(self):
+        urls = [
+            "https://a.dev/a",
+            "https://www.a.dev/b",
+            "https://docs.a.dev/c",
+            "https://other.dev/d",
+            "https://a.dev/x/y/z",
+            "https://a.dev/a",
+        ]
+        assert planner_module.filter_urls(urls, "https://a.dev", max_discovery_depth=2) == [
+            "https://a.dev/a",
+            "https://www.a.dev/b",
+        ]
+        assert planner_module.filter_urls(urls, "https://a.dev", allow_subdomains=True, limit=3) == [
+            "https://a.dev/a",
+            "https://www.a.dev/b",
+            "https://docs.a.dev/c",
+        ]
+
+
+class TestPlanShards:
+    def test_groups_by_prefix_and_packs_small_sections(self):
+        urls = [f"https://a.dev/blog/{i}" for i in range(5)] + [
+            "https://a.dev/about",
+            "https://a.dev/docs/1",
+            "https://a.dev/docs/2",
+        ]
+        shards = planner_module.plan_shards(urls, max_shard_size=4)
+
+        assert [s.prefixes for s in shards] == [["/blog"], ["/blog", "/docs", "/about"]]
+        assert [len(s.urls) for s in shards] == [4, 4]
+        assert sorted(u for s in shards for u in s.urls) == sorted(urls)
+
+    def test_rejects_oversized_shards(self):
+        with pytest.raises(ValueError):
+            planner_module.plan_shards([], max_shard_size=1001)
+
+
+class TestShardedCrawl:
+    def test_merges_documents_from_parallel_jobs(self, monkeypatch):
+        links = [f"https://a.dev/{section}/{i}" for section in ("a", "b", "c") for i in range(3)]
+        links.append("https://a.dev/private/1")
+        monkeypatch.setattr(
+            planner_module.map_module, "map",
+            lambda client, url, options=None: MapData(links=[LinkResult(url=u) for u in links]),
+        )
+
+        calls = []
+        jobs = {}
+        lock = threading.Lock()
+
+        def fake_start(client, urls, *, options=None, max_concurrency=None):
+            with lock:
+                calls.append((list(urls), max_concurrency))
+                job_id = f"job-{len(calls)}"
+                jobs[job_id] = list(urls)
+            return BatchScrapeResponse(id=job_id, url="")
+
+        def fake_wait(client, job_id, poll_interval=2, timeout=None):
+            docs = [Document(markdown=u) for u in jobs[job_id]]
+            return BatchScrapeJob(status="completed", completed=len(docs), total=len(docs), data=docs)
+
+        monkeypatch.setattr(planner_module.batch_module, "start_batch_scrape", fake_start)
+        monkeypatch.setattr(planner_module.batch_module, "wait_for_batch_completion", fake_wait)
+        monkeypatch.setattr(planner_module, "_team_max_concurrency", lambda client: 10)
+
+        docs = list(planner_module.sharded_crawl(
+            None, "https://a.dev", exclude_paths=["^/private"], max_shard_size=3, max_workers=2
+        ))
+
+        assert sorted(d.markdown for d in docs) == sorted(links[:-1])
+        assert len(calls) == 3
+        assert all(mc == 5 for _, mc in calls)
+
+    def test_failed_shard_raises(self, monkeypatch):
+        monkeypatch.setattr(
+            planner_module.map_module, "map",
+            lambda client, url, options=None: MapData(links=[LinkResult(url="https://a.dev/x")]),
+        )
+
+        def failing(client, urls, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(planner_module.batch_module, "start_batch_scrape", failing)
+        monkeypatch.setattr(planner_module, "_team_max_concurrency", lambda client: None)
+
+        with pytest.raises(RuntimeError):
+            list(planner_module.sharded_crawl(None, "https://a.dev"))
+
+    def test_closing_early_cancels_running_shard_jobs(self, monkeypatch):
+        shards = [CrawlShard(prefixes=[f"/{i}"], urls=[f"https://a.dev/{i}"]) for i in range(3)]
+        release = threading.Event()
+        cancelled = []
+
+        def fake_start(client, urls, **kwargs):
+            return BatchScrapeResponse(id=urls[0].rsplit("/", 1)[1], url="")
+
+        def fake_wait(client, job_id, poll_interval=2, timeout=None):
+            if job_id != "0":
+                release.wait(5)
+            return BatchScrapeJob(status="completed", completed=1, total=1, data=[Document(markdown=job_id)])
+
+        def fake_cancel(client, job_id):
+            cancelled.append(job_id)
+            return True
+
+        monkeypatch.setattr(planner_module.batch_module, "start_batch_scrape", fake_start)
+        monkeypatch.setattr(planner_module.batch_module, "wait_for_batch_completion", fake_wait)
+        monkeypatch.setattr(planner_module.batch_module, "cancel_batch_scrape", fake_cancel)
+
+        documents = planner_module.run_shards(None, shards, max_workers=3, max_concurrency=1)
+        assert next(documents).markdown == "0"
+        documents.close()
+        # A shard still starting when the iterator closes cancels its own job
+        for _ in range(100):
+            if len(cancelled) == 2:
+                break
+            time.sleep(0.01)
+        release.set()
+
+        assert sorted(cancelled) == ["1", "2"]
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from firecrawl.v2.methods import extract as extract_module
+from firecrawl.v2.methods.aio import extract as async_extract
+from firecrawl.v2.types import AgentOptions, ExtractPartitionResult, ExtractResponse
+
+
+def _urls():
+    return [
+        "https://a.dev/1", "https://A.dev/2", "https://a.dev/3",
+        "https://b.dev/1",
+        "https://c.dev/*",
+    ]
+
+
+class TestPartitionUrls:
+    def test_by_domain_groups_hosts_and_chunks_large_ones(self):
+        partitions = extract_module.partition_urls(_urls(), by="domain", max_urls_per_job=2)
+        assert partitions == [
+            ("a.dev#0", ["https://a.dev/1", "https://A.dev/2"]),
+            ("a.dev#1", ["https://a.dev/3"]),
+            ("b.dev", ["https://b.dev/1"]),
+            ("c.dev", ["https://c.dev/*"]),
+        ]
+
+    def test_by_size_keeps_order(self):
+        partitions = extract_module.partition_urls(_urls(), by="size", max_urls_per_job=2)
+        assert [key for key, _ in partitions] == ["chunk-0", "chunk-1", "chunk-2"]
+        assert [url for _, chunk in partitions for url in chunk] == _urls()
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError):
+            extract_module.partition_urls(_urls(), max_urls_per_job=0)
+        with pytest.raises(ValueError):
+            extract_module.partition_urls(_urls(), by="hash")
+
+
+class TestMergeExtractData:
+    def test_merges_against_schema(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "company": {"type": "string"},
+                "products": {"type": "array"},
+                "contact": {"type": "object", "properties": {"email": {"type": "string"}}},
+            },
+        }
+        results = [
+            ExtractPartitionResult(key="a", urls=[], response=ExtractResponse(status="completed", data={
+                "company": "Acme", "products": ["x"], "contact": {"email": None},
+            })),
+            ExtractPartitionResult(key="b", urls=[], error="boom"),
+            ExtractPartitionResult(key="c", urls=[], response=ExtractResponse(status="completed", data={
+                "company": "Other", "products": ["y", "z"], "contact": {"email": "hi@acme.dev"},
+            })),
+        ]
+        assert extract_module.merge_extract_data(results, schema) == {
+            "company": "Acme",
+            "products": ["x", "y", "z"],
+            "contact": {"email": "hi@acme.dev"},
+        }
+
+    def test_skips_failed_partitions(self):
+        results = [ExtractPartitionResult(key="a", urls=[], response=ExtractResponse(status="failed", data={"x": 1}))]
+        assert extract_module.merge_extract_data(results) is None
+
+
+class TestExtractMany:
+    def test_runs_partitions_concurrently_and_streams_results(self, monkeypatch):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def fake_extract(client, urls, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            # b.dev finishes first even though it is submitted later
+            time.sleep(0.01 if "b.dev" in urls[0] else 0.1)
+            with lock:
+                active[0] -= 1
+            if "c.dev" in urls[0]:
+                raise RuntimeError("c.dev blew up")
+            return ExtractResponse(status="completed", data={"urls": list(urls)}, id="j")
+
+        monkeypatch.setattr(extract_module, "extract", fake_extract)
+        results = list(extract_module.extract_many(object(), _urls(), prompt="p", max_workers=3))
+
+        assert results[0].key == "b.dev"
+        assert peak[0] == 3
+        by_key = {r.key: r for r in results}
+        assert by_key["c.dev"].error == "c.dev blew up" and by_key["c.dev"].response is None
+        assert by_key["a.dev"].response.data == {"urls": _urls()[:3]}
+        merged = extract_module.merge_extract_data(results)
+        assert sorted(merged["urls"]) == sorted(_urls()[:4])
+
+    def test_failed_job_status_is_reported_as_error(self, monkeypatch):
+        monkeypatch.setattr(
+            extract_module, "extract", lambda client, urls, **kwargs: ExtractResponse(status="failed", error="quota")
+        )
+        (result,) = extract_module.extract_many(object(), ["https://a.dev/1"])
+        assert result.error == "quota" and result.response.status == "failed"
+
+    def test_timed_out_partition_is_reported_as_error(self, monkeypatch):
+        monkeypatch.setattr(
+            extract_module, "start_extract", lambda client, urls, **kwargs: ExtractResponse(id="job", status="processing")
+        )
+        monkeypatch.setattr(
+            extract_module, "get_extract_status",
+            lambda client, job_id: ExtractResponse(id=job_id, status="processing", data={"partial": True}),
+        )
+        monkeypatch.setattr(extract_module, "poll_sleep", lambda seconds, action=None: None)
+
+        (result,) = extract_module.extract_many(object(), ["https://a.dev/1"], timeout=0)
+        assert result.response.status == "processing"
+        assert result.error == "Extract job timed out in status processing"
+        assert extract_module.merge_extract_data([result]) is None
+
+    def test_async_timed_out_partition_is_reported_as_error(self, monkeypatch):
+        async def fake_extract(client, urls, **kwargs):
+            return ExtractResponse(status="processing")
+
+        monkeypatch.setattr(async_extract, "extract", fake_extract)
+
+        async def collect():
+            return [r async for r in async_extract.extract_many(object(), ["https://a.dev/1"])]
+
+        (result,) = asyncio.run(collect())
+        assert result.error == "Extract job timed out in status processing"
+
+    def test_async_extract_many(self, monkeypatch):
+        active, peak = [0], [0]
+
+        async def fake_extract(client, urls, **kwargs):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return ExtractResponse(status="completed", data={"n": len(urls)})
+
+        monkeypatch.setattr(async_extract, "extract", fake_extract)
+
+        async def collect():
+            return [r async for r in async_extract.extract_many(object(), _urls(), max_workers=2)]
+
+        results = asyncio.run(collect())
+        assert sorted(r.key for r in results) == ["a.dev", "b.dev", "c.dev"]
+        assert peak[0] == 2
+        assert sum(r.response.data["n"] for r in results) == 5
+
+    def test_async_extract_many_sends_agent(self):
+        bodies = []
+
+        class _Client:
+            async def post(self, endpoint, body):
+                bodies.append(body)
+                return SimpleNamespace(json=lambda: {"success": True, "status": "completed", "data": {}})
+
+        async def collect():
+            return [r async for r in async_extract.extract_many(_Client(), ["https://a.dev/1"], agent=AgentOptions(model="FIRE-1"))]
+
+        (result,) = asyncio.run(collect())
+        assert result.error is None
+        assert bodies[0]["agent"] == {"model": "FIRE-1"}
+
+    def test_merge_extract_data_is_exported(self):
+        import firecrawl
+
+        assert firecrawl.merge_extract_data is extract_module.merge_extract_data
@@ -0,0 +1,181 @@
+"""
+Unit tests for incremental recrawl in Firecrawl v2 SDK.
+"""
+
+import json
+
+import pytest
+
+from firecrawl.v2.types import BatchScrapeJob, ChangeTrackingFormat, Document, Format, LinkResult, MapData, ScrapeOptions
+from firecrawl.v2.methods import recrawl as recrawl_module
+from firecrawl.v2.utils.normalize import normalize_document_input
+
+
+def _doc(url, markdown, final_url=None):
+    raw = {"markdown": markdown, "metadata": {"sourceURL": url, "statusCode": 200}}
+    if final_url:
+        raw["metadata"]["url"] = final_url
+    return Document(**normalize_document_input(raw))
+
+
+class FakeSite:
+    """Patches map/batch_scrape to serve an in-memory site."""
+
+    def __init__(self, monkeypatch, pages):
+        self.pages = dict(pages)
+        self.scraped = []
+        monkeypatch.setattr(recrawl_module.map_module, "map", self._map)
+        monkeypatch.setattr(recrawl_module.batch_module, "batch_scrape", self._batch_scrape)
+
+    def _map(self, client, url, options=None):
+        return MapData(links=[LinkResult(url=u) for u in self.pages])
+
+    def _batch_scrape(self, client, urls, *, options=None, poll_interval=2, timeout=None):
+        self.scraped.append(list(urls))
+        self.last_options = options
+        docs = [_doc(u, self.pages[u]) for u in urls]
+        return BatchScrapeJob(status="completed", completed=len(docs), total=len(docs), data=docs)
+
+
+class TestRecrawl:
+    def test_first_run_marks_everything_new(self, tmp_path, monkeypatch):
+        FakeSite(monkeypatch, {"https://a.dev/1": "one", "https://a.dev/2": "two"})
+        manifest_path = str(tmp_path / "manifest.json")
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert sorted(result.new) == ["https://a.dev/1", "https://a.dev/2"]
+        assert result.changed == [] and result.unchanged == []
+        assert len(result.data) == 2
+        with open(manifest_path) as f:
+            saved = json.load(f)
+        assert set(saved["entries"]) == {"https://a.dev/1", "https://a.dev/2"}
+        assert saved["entries"]["https://a.dev/1"]["content_hash"]
+
+    def test_second_run_detects_changes_and_removals(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one", "https://a.dev/2": "two"})
+        manifest_path = str(tmp_path / "manifest.json")
+        recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        site.pages = {"https://a.dev/1": "one (edited)", "https://a.dev/3": "three"}
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert result.new == ["https://a.dev/3"]
+        assert result.changed == ["https://a.dev/1"]
+        assert result.removed == ["https://a.dev/2"]
+        assert [d.markdown for d in result.data] == ["one (edited)", "three"]
+
+        manifest = recrawl_module.load_manifest(manifest_path)
+        assert "https://a.dev/2" not in manifest.entries
+        assert manifest.entries["https://a.dev/1"].change_status == "changed"
+
+    def test_unchanged_pages_are_not_returned(self, tmp_path, monkeypatch):
+        FakeSite(monkeypatch, {"https://a.dev/1": "one"})
+        manifest_path = str(tmp_path / "manifest.json")
+        recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert result.unchanged == ["https://a.dev/1"]
+        assert result.data == []
+
+    def test_min_age_skips_recently_seen_pages(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one"})
+        manifest_path = str(tmp_path / "manifest.json")
+        recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path, min_age=3600)
+
+        assert result.skipped == ["https://a.dev/1"]
+        assert len(site.scraped) == 1
+
+    def test_etag_probe_skips_unmodified_pages(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one", "https://a.dev/2": "two"})
+        monkeypatch.setattr(recrawl_module, "_probe_etags", lambda urls, entries: {u: f"etag-{u[-1]}" for u in urls})
+        manifest_path = str(tmp_path / "manifest.json")
+        recrawl_module.recrawl(None, "https://a.dev", manifest_path, probe_etags=True)
+
+        monkeypatch.setattr(
+            recrawl_module,
+            "_probe_etags",
+            lambda urls, entries: {"https://a.dev/1": "etag-1", "https://a.dev/2": "etag-2b"},
+        )
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path, probe_etags=True)
+
+        # Only the page with a new ETag is scraped; its content turned out identical
+        assert site.scraped[-1] == ["https://a.dev/2"]
+        assert result.unchanged == ["https://a.dev/1", "https://a.dev/2"]
+
+    def test_change_tracking_format_is_requested(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one"})
+        recrawl_module.recrawl(
+            None,
+            "https://a.dev",
+            str(tmp_path / "m.json"),
+            scrape_options=ScrapeOptions(formats=["links"]),
+            tag="nightly",
+        )
+
+        formats = site.last_options.formats
+        assert formats[0] == "markdown"
+        assert "links" in formats
+        assert {"type": "changeTracking", "modes": ["git-diff"], "tag": "nightly"} in formats
+
+    @pytest.mark.parametrize("markdown", [{"type": "markdown"}, Format(type="markdown")])
+    def test_markdown_format_given_as_dict_or_model_is_not_duplicated(self, markdown):
+        stale = ChangeTrackingFormat(type="changeTracking", modes=["json"])
+        options = recrawl_module._prepare_recrawl_options(ScrapeOptions(formats=[markdown, stale]), None)
+
+        assert options.formats == [markdown, {"type": "changeTracking", "modes": ["git-diff"]}]
+
+    def test_documents_are_keyed_by_mapped_url(self, tmp_path, monkeypatch):
+        FakeSite(monkeypatch, {"https://a.dev/1": "one"})
+        monkeypatch.setattr(
+            recrawl_module.batch_module,
+            "batch_scrape",
+            lambda client, urls, **kwargs: BatchScrapeJob(
+                status="completed", completed=1, total=1,
+                data=[_doc("https://a.dev/1/", "one", final_url="https://a.dev/one")],
+            ),
+        )
+        manifest_path = str(tmp_path / "manifest.json")
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert result.new == ["https://a.dev/1"]
+        assert set(recrawl_module.load_manifest(manifest_path).entries) == {"https://a.dev/1"}
+
+    def test_pages_without_a_document_are_failed_and_retried(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one", "https://a.dev/2": "two"})
+        manifest_path = str(tmp_path / "manifest.json")
+        scrape = site._batch_scrape
+        monkeypatch.setattr(
+            recrawl_module.batch_module,
+            "batch_scrape",
+            lambda client, urls, **kwargs: scrape(client, [u for u in urls if u != "https://a.dev/2"], **kwargs),
+        )
+
+        result = recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert result.new == ["https://a.dev/1"]
+        assert result.failed == ["https://a.dev/2"]
+        assert "https://a.dev/2" not in recrawl_module.load_manifest(manifest_path).entries
+
+    def test_finished_batches_are_saved_when_a_later_batch_fails(self, tmp_path, monkeypatch):
+        site = FakeSite(monkeypatch, {"https://a.dev/1": "one", "https://a.dev/2": "two"})
+        monkeypatch.setattr(recrawl_module, "_MAX_BATCH_SIZE", 1)
+        scrape = site._batch_scrape
+
+        def flaky(client, urls, **kwargs):
+            if urls == ["https://a.dev/2"]:
+                raise TimeoutError("batch timed out")
+            return scrape(client, urls, **kwargs)
+
+        monkeypatch.setattr(recrawl_module.batch_module, "batch_scrape", flaky)
+        manifest_path = str(tmp_path / "manifest.json")
+
+        with pytest.raises(TimeoutError):
+            recrawl_module.recrawl(None, "https://a.dev", manifest_path)
+
+        assert set(recrawl_module.load_manifest(manifest_path).entries) == {"https://a.dev/1"}
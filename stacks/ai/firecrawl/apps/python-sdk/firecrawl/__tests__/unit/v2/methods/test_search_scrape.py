@@ -0,0 +1,75 @@
+"""
+Unit tests for search-then-scrape fan-out in Firecrawl v2 SDK.
+"""
+
+import threading
+
+from firecrawl.v2.types import Document, SearchData, SearchRequest, SearchResultNews, SearchResultWeb
+from firecrawl.v2.methods import search_scrape as search_scrape_module
+
+
+def _hits():
+    return SearchData(
+        web=[
+            SearchResultWeb(url="https://a.dev/1"),
+            SearchResultWeb(url="https://a.dev/2"),
+            SearchResultWeb(url="https://a.dev/1"),
+        ],
+        news=[SearchResultNews(url="https://news.dev/3")],
+    )
+
+
+class TestSearchAndScrape:
+    def test_hit_urls_dedupes_and_ranks_web_first(self):
+        assert search_scrape_module.hit_urls(_hits(), 5) == [
+            "https://a.dev/1",
+            "https://a.dev/2",
+            "https://news.dev/3",
+        ]
+        assert search_scrape_module.hit_urls(_hits(), 1) == ["https://a.dev/1"]
+
+    def test_hits_returned_before_scraping_and_search_skips_scrape_options(self, monkeypatch):
+        seen_requests = []
+        release = threading.Event()
+
+        def fake_search(client, request):
+            seen_requests.append(request)
+            return _hits()
+
+        def fake_scrape(client, url, options=None):
+            release.wait(5)
+            return Document(markdown=url)
+
+        monkeypatch.setattr(search_scrape_module.search_module, "search", fake_search)
+        monkeypatch.setattr(search_scrape_module.scrape_module, "scrape", fake_scrape)
+
+        request = SearchRequest(query="q", scrape_options={"formats": ["markdown"]})
+        stream = search_scrape_module.search_and_scrape(None, request, top_k=3)
+
+        # Hits are usable while scrapes are still blocked
+        assert len(stream.hits.web) == 3
+        assert seen_requests[0].scrape_options is None
+        release.set()
+        assert sorted(d.markdown for d in stream) == stream.urls
+
+    def test_stop_when_ends_stream_and_failures_are_recorded(self, monkeypatch):
+        monkeypatch.setattr(search_scrape_module.search_module, "search", lambda client, request: _hits())
+
+        def fake_scrape(client, url, options=None):
+            if url.endswith("/2"):
+                raise RuntimeError("blocked")
+            return Document(markdown="needle" if "news" in url else "hay")
+
+        monkeypatch.setattr(search_scrape_module.scrape_module, "scrape", fake_scrape)
+
+        stream = search_scrape_module.search_and_scrape(
+            None,
+            SearchRequest(query="q"),
+            max_workers=1,
+            stop_when=lambda doc: doc.markdown == "needle",
+        )
+        docs = list(stream)
+
+        assert docs[-1].markdown == "needle"
+        assert stream.matched is docs[-1]
+        assert "https://a.dev/2" in stream.errors
@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from firecrawl.v2.scheduler import JobScheduler
+from firecrawl.v2.types import CrawlJob
+
+
+class FakeJob:
+    """Reports progress and completes after a number of polls."""
+
+    def __init__(self, polls_to_finish, total=10):
+        self.polls = 0
+        self.polls_to_finish = polls_to_finish
+        self.total = total
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.polls += 1
+            done = self.polls >= self.polls_to_finish
+        completed = self.total if done else min(self.total - 1, self.polls)
+        return {"status": "completed" if done else "scraping", "completed": completed, "total": self.total}
+
+
+def _scheduler(**kwargs):
+    kwargs.setdefault("max_polls_per_second", 1000)
+    kwargs.setdefault("min_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.05)
+    return JobScheduler(None, **kwargs)
+
+
+class TestJobScheduler:
+    def test_resolves_futures_and_callbacks_for_many_jobs(self):
+        jobs = [FakeJob(polls_to_finish=1 + i % 4) for i in range(30)]
+        finished = []
+        with _scheduler() as scheduler:
+            futures = [
+                scheduler.watch(f"job-{i}", job, callback=finished.append)
+                for i, job in enumerate(jobs)
+            ]
+            done, not_done = wait(futures, timeout=5)
+
+        assert not not_done
+        assert all(f.result()["status"] == "completed" for f in futures)
+        assert len(finished) == 30
+        assert all(job.polls == job.polls_to_finish for job in jobs)
+
+    def test_same_key_shares_a_future(self):
+        with _scheduler() as scheduler:
+            first = scheduler.watch("k", FakeJob(2))
+            second = scheduler.watch("k", FakeJob(2))
+            assert first is second
+            first.result(timeout=5)
+
+    def test_global_poll_rate_is_capped(self):
+        stamps = []
+        lock = threading.Lock()
+
+        def fetch():
+            with lock:
+                stamps.append(time.monotonic())
+            return {"status": "completed"}
+
+        with _scheduler(max_polls_per_second=20) as scheduler:
+            futures = [scheduler.watch(str(i), fetch) for i in range(6)]
+            wait(futures, timeout=5)
+
+        gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+        assert len(stamps) == 6
+        assert min(gaps) >= 0.045
+
+    def test_failures_and_timeouts_surface_on_the_future(self):
+        def broken():
+            raise RuntimeError("status endpoint down")
+
+        with _scheduler(max_failures=2) as scheduler:
+            failing = scheduler.watch("broken", broken)
+            slow = scheduler.watch("slow", lambda: {"status": "scraping"}, timeout=0.1)
+            with pytest.raises(RuntimeError):
+                failing.result(timeout=5)
+            with pytest.raises(TimeoutError):
+                slow.result(timeout=5)
+
+    def test_close_cancels_pending(self):
+        scheduler = _scheduler(min_interval=10, max_interval=10)
+        future = scheduler.watch("never", lambda: {"status": "scraping"})
+        time.sleep(0.05)
+        scheduler.close()
+        assert future.cancelled()
+        assert scheduler.pending == 0
+
+    def test_watch_crawl_fetches_all_pages_once_complete(self, monkeypatch):
+        from firecrawl.v2.scheduler import crawl_module
+
+        calls = []
+
+        def fake_status(client, job_id, pagination_config=None):
+            calls.append(pagination_config)
+            if pagination_config is not None:
+                return CrawlJob(status="completed", completed=2, total=2, next="https://next", data=[])
+            return CrawlJob(status="completed", completed=2, total=2, data=[])
+
+        monkeypatch.setattr(crawl_module, "get_crawl_status", fake_status)
+        with _scheduler() as scheduler:
+            job = scheduler.watch_crawl("abc").result(timeout=5)
+
+        assert job.next is None
+        assert calls[0].auto_paginate is False
+        assert calls[1] is None
@@ -0,0 +1,71 @@
+"""
+Unit tests for URL-indexed batch results.
+"""
+
+from firecrawl.v2.types import BatchScrapeJob, CrawlError, CrawlErrorsResponse, Document
+from firecrawl.v2.utils.batch_index import BatchResultIndex
+from firecrawl.v2.utils.urls import normalize_url
+from firecrawl.v2.methods import batch as batch_module
+
+
+def _doc(source_url, url=None):
+    return Document(markdown=source_url, metadata={"source_url": source_url, "url": url or source_url})
+
+
+class TestNormalizeUrl:
+    def test_normalizes_for_matching(self):
+        assert normalize_url("HTTPS://Example.com:443/a/") == "https://example.com/a"
+        assert normalize_url("https://example.com") == "https://example.com/"
+        assert normalize_url("https://example.com/a?b=1#frag") == "https://example.com/a?b=1"
+        assert normalize_url("http://example.com:8080/") == "http://example.com:8080/"
+
+
+class TestBatchResultIndex:
+    def test_lookup_tolerates_slashes_and_redirects(self):
+        urls = ["https://a.dev/one/", "https://a.dev/two", "https://a.dev/three"]
+        docs = [
+            _doc("https://a.dev/one"),
+            # Requested URL lost, but the final URL after redirect matches
+            _doc("https://other.dev/x", url="https://A.dev/two/"),
+            _doc("https://elsewhere.dev/"),
+        ]
+        index = BatchScrapeJob(status="completed", completed=2, total=3, data=docs).index(urls)
+
+        assert index["https://a.dev/one"].markdown == "https://a.dev/one"
+        assert index.get("https://a.dev/two").markdown == "https://other.dev/x"
+        assert "https://a.dev/three" not in index
+        assert len(index) == 2
+        assert [u for u, _ in index.items()] == ["https://a.dev/one/", "https://a.dev/two"]
+        assert [d.markdown for d in index.unmatched] == ["https://elsewhere.dev/"]
+
+    def test_missing_failed_and_gaps(self):
+        urls = ["https://a.dev/1", "https://a.dev/2", "https://a.dev/3", "https://a.dev/4"]
+        errors = CrawlErrorsResponse(
+            errors=[CrawlError(id="e1", url="https://a.dev/2/", error="timeout")],
+            robots_blocked=["https://a.dev/4"],
+        )
+        index = BatchResultIndex(urls, [_doc("https://a.dev/1")], errors)
+
+        assert list(index.failed) == ["https://a.dev/2"]
+        assert index.failed["https://a.dev/2"].error == "timeout"
+        assert index.missing == ["https://a.dev/3"]
+        assert index.robots_blocked == ["https://a.dev/4"]
+        assert index.gaps == ["https://a.dev/2", "https://a.dev/3"]
+
+        # A retry that succeeds clears the failure
+        index.add_documents([_doc("https://a.dev/2")])
+        assert index.failed == {} and index.gaps == ["https://a.dev/3"]
+
+    def test_index_batch_results_joins_errors(self, monkeypatch):
+        job = BatchScrapeJob(id="job-1", status="completed", completed=1, total=2, data=[_doc("https://a.dev/1")])
+        calls = []
+
+        def fake_errors(client, job_id):
+            calls.append(job_id)
+            return CrawlErrorsResponse(errors=[CrawlError(id="e", url="https://a.dev/2", error="blocked")], robots_blocked=[])
+
+        monkeypatch.setattr(batch_module, "get_batch_scrape_errors", fake_errors)
+        index = batch_module.index_batch_results(None, job, ["https://a.dev/1", "https://a.dev/2"])
+
+        assert calls == ["job-1"]
+        assert index.gaps == ["https://a.dev/2"]
@@ -0,0 +1,132 @@
+"""
+Unit tests for the record-and-replay transport.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.utils import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.cassette import Cassette, RecordTransport, ReplayTransport, request_key
+from firecrawl.v2.utils.error_handler import CassetteMissError
+
+
+def _live_response(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def test_request_key_ignores_host_and_origin():
+    a = request_key("POST", "https://api.firecrawl.dev/v2/scrape", {"url": "https://a.dev", "origin": "x"})
+    b = request_key("post", "/v2/scrape", {"origin": "y", "url": "https://a.dev"})
+    assert a == b
+    assert request_key("GET", "https://h/v2/crawl/1?skip=10") == "GET /v2/crawl/1?skip=10"
+
+
+def test_record_then_replay_roundtrip(monkeypatch, tmp_path):
+    statuses = iter([
+        _live_response(200, {"status": "scraping", "completed": 0}),
+        _live_response(200, {"status": "scraping", "completed": 0}),
+        _live_response(200, {"status": "completed", "completed": 2}),
+    ])
+    monkeypatch.setattr(requests, "get", lambda url, headers, timeout: next(statuses))
+    monkeypatch.setattr(requests, "post", lambda url, headers, json, timeout: _live_response(200, {"id": "job-1"}))
+
+    cassette = Cassette()
+    client = HttpClient("secret-key", "https://api.example.com")
+    client.transport = RecordTransport(cassette)
+    client.post("/v2/crawl", {"url": "https://a.dev"})
+    for _ in range(3):
+        client.get("/v2/crawl/job-1")
+
+    path = tmp_path / "run.cassette"
+    cassette.save(str(path))
+    raw = gzip.decompress(path.read_bytes()).decode("utf-8")
+    assert "secret-key" not in raw
+    # The two identical status pages share one stored body
+    assert len(json.loads(raw)["bodies"]) == 3
+
+    def offline(*args, **kwargs):
+        raise AssertionError("network used during replay")
+
+    monkeypatch.setattr(requests, "get", offline)
+    monkeypatch.setattr(requests, "post", offline)
+    replay = ReplayTransport(Cassette.load(str(path)))
+    client = HttpClient("other-key", "https://elsewhere.example.com")
+    client.transport = replay
+
+    assert client.post("/v2/crawl", {"url": "https://a.dev"}).json() == {"id": "job-1"}
+    seen = [client.get("/v2/crawl/job-1").json()["status"] for _ in range(4)]
+    assert seen == ["scraping", "scraping", "completed", "completed"]
+    response = client.get("/v2/crawl/job-1")
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["content-type"] == "application/json"
+
+    with pytest.raises(CassetteMissError):
+        client.get("/v2/crawl/unknown")
+    assert (replay.replayed, replay.misses) == (6, 1)
+
+
+def _cassette_with(url, latency):
+    cassette = Cassette()
+    cassette.add("GET", url, None, 200, {"content-type": "application/json"}, b'{"ok": true}', latency)
+    return cassette
+
+
+def test_replay_latency_and_concurrency():
+    cassette = _cassette_with("/v2/team/credit-usage", 0.05)
+    assert json.loads(cassette.bodies[next(iter(cassette.bodies))]) == {"ok": True}
+
+    instant = ReplayTransport(cassette)
+    started = time.monotonic()
+    instant.send("GET", "/v2/team/credit-usage", None, lambda: None)
+    assert time.monotonic() - started < 0.04
+
+    async def run(transport, n):
+        started = time.monotonic()
+        await asyncio.gather(*[
+            transport.asend("GET", "/v2/team/credit-usage", None, lambda: None) for _ in range(n)
+        ])
+        return time.monotonic() - started
+
+    parallel = asyncio.run(run(ReplayTransport(cassette, latency="recorded"), 4))
+    serial = asyncio.run(run(ReplayTransport(cassette, latency="recorded", max_concurrency=1), 4))
+    assert parallel < 0.15
+    assert serial >= 0.19
+
+    with pytest.raises(ValueError):
+        ReplayTransport(cassette, latency="slow")
+
+
+def test_async_client_replay():
+    cassette = Cassette()
+    cassette.add("POST", "https://api.example.com/v2/scrape", {"url": "https://a.dev"}, 200,
+                 {"content-type": "application/json"}, b'{"success": true}', 0.01)
+
+    async def run():
+        client = AsyncHttpClient("key", "https://api.example.com")
+        client.transport = ReplayTransport(cassette)
+        response = await client.post("/v2/scrape", {"url": "https://a.dev"})
+        await client.close()
+        return response
+
+    response = asyncio.run(run())
+    assert isinstance(response, httpx.Response)
+    assert response.json() == {"success": True}
+
+
+def test_non_strict_replay_falls_through():
+    replay = ReplayTransport(Cassette(), strict=False)
+    live = SimpleNamespace(status_code=200)
+    assert replay.send("GET", "/v2/crawl/1", None, lambda: live) is live
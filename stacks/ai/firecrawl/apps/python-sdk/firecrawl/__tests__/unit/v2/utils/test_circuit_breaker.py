@@ -0,0 +1,123 @@
+"""
+Unit tests for per-endpoint circuit breakers.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from firecrawl.v2.utils import HttpClient
+from firecrawl.v2.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, endpoint_family
+from firecrawl.v2.utils.deadline import Deadline
+from firecrawl.v2.utils.error_handler import CassetteMissError, CircuitOpenError, DeadlineExceededError, FirecrawlError
+
+
+def test_endpoint_families():
+    assert endpoint_family("POST", "/v2/scrape") == "scrape"
+    assert endpoint_family("POST", "/v2/batch/scrape") == "scrape"
+    assert endpoint_family("GET", "/v2/batch/scrape/abc") == "status"
+    assert endpoint_family("GET", "/v2/crawl/abc") == "status"
+    assert endpoint_family("POST", "/v2/crawl") == "crawl"
+    assert endpoint_family("DELETE", "/v2/crawl/abc") == "crawl"
+    assert endpoint_family("POST", "/v2/extract") == "extract"
+    assert endpoint_family("GET", "/v2/extract/abc") == "status"
+    assert endpoint_family("GET", "/v2/team/credit-usage") == "other"
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate_then_half_opens(self, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("firecrawl.v2.utils.circuit_breaker.time.monotonic", lambda: clock[0])
+        changes = []
+        breaker = CircuitBreaker(
+            "scrape", min_calls=4, window=4, reset_timeout=10, half_open_max_calls=1,
+            listeners=[lambda family, old, new: changes.append((family, old, new))],
+        )
+        for ok in (True, False, True, False):
+            breaker.before_call()
+            breaker.record(ok, 0.1)
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.before_call()
+        assert isinstance(exc.value, FirecrawlError)
+        assert exc.value.family == "scrape"
+
+        clock[0] += 11
+        breaker.before_call()
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+        breaker.record(True, 0.1)
+        assert breaker.state == "closed"
+        assert changes == [
+            ("scrape", "closed", "open"),
+            ("scrape", "open", "half_open"),
+            ("scrape", "half_open", "closed"),
+        ]
+
+    def test_opens_on_slow_calls_and_failed_probe_reopens(self):
+        breaker = CircuitBreaker("status", min_calls=3, window=3, slow_call_threshold=1.0, slow_call_rate=0.6, reset_timeout=0)
+        for latency in (2.0, 0.1, 2.0):
+            breaker.record(True, latency)
+        assert breaker.state == "open"
+        breaker.before_call()
+        breaker.record(False, 0.1)
+        assert breaker.state == "open"
+
+    def test_released_probe_is_given_back(self):
+        breaker = CircuitBreaker("scrape", min_calls=1, window=1, reset_timeout=0, half_open_max_calls=1)
+        breaker.record(False, 0.1)
+        breaker.before_call()
+        assert breaker.state == "half_open"
+        breaker.release()
+        breaker.before_call()  # the released probe slot is free again
+
+
+def test_http_client_fails_fast_per_family(monkeypatch):
+    calls = []
+
+    def post(url, headers, json, timeout):
+        calls.append(url)
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(requests, "post", post)
+    monkeypatch.setattr(requests, "get", lambda url, headers, timeout: SimpleNamespace(status_code=200))
+    monkeypatch.setattr("firecrawl.v2.utils.deadline.time.sleep", lambda s: None)
+
+    client = HttpClient("key", "https://api.example.com")
+    client.circuit_breakers = CircuitBreakerRegistry(min_calls=3, window=3, reset_timeout=60)
+
+    with pytest.raises(CircuitOpenError):
+        client.post("/v2/scrape", {"url": "https://a.dev"}, retries=5)
+    assert len(calls) == 3
+    with pytest.raises(CircuitOpenError):
+        client.post("/v2/scrape", {"url": "https://a.dev"})
+    assert len(calls) == 3
+
+    # Other families are unaffected
+    assert client.get("/v2/crawl/abc").status_code == 200
+    assert client.circuit_breakers.states == {"scrape": "open", "status": "closed"}
+
+
+def test_client_side_errors_are_not_breaker_failures(monkeypatch):
+    sent = []
+    monkeypatch.setattr(requests, "get", lambda url, headers, timeout: sent.append(url))
+
+    class _MissingTransport:
+        def send(self, method, url, body, network_send):
+            raise CassetteMissError(method, url)
+
+    client = HttpClient("key", "https://api.example.com")
+    client.circuit_breakers = CircuitBreakerRegistry(min_calls=1, window=1, reset_timeout=60)
+
+    with Deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            client.get("/v2/crawl/abc")
+    client.transport = _MissingTransport()
+    with pytest.raises(CassetteMissError):
+        client.get("/v2/crawl/abc")
+    assert sent == []
+    assert client.circuit_breakers.states == {"status": "closed"}
@@ -0,0 +1,122 @@
+"""
+Unit tests for the columnar result container.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from firecrawl.v2.types import Document, DocumentMetadata, PaginationConfig
+from firecrawl.v2.utils.columnar import ColumnarResults, afetch_columns, fetch_columns
+
+
+def _item(i, **metadata):
+    return {
+        "markdown": f"# Page {i}",
+        "links": [f"https://a.dev/{i}/x"],
+        "metadata": {"sourceURL": f"https://a.dev/{i}", "statusCode": 200, "title": f"Page {i}", **metadata},
+    }
+
+
+def _page(items, next_url=None, status="completed"):
+    return {"success": True, "status": status, "completed": 3, "total": 3, "creditsUsed": 3, "next": next_url, "data": items}
+
+
+def _response(body):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = body
+    return response
+
+
+class TestColumnarResults:
+    def test_append_page_fills_columns_from_raw_json(self):
+        results = ColumnarResults(["source_url", "status_code", "title", "keywords", "markdown", "links"])
+        page = _page([_item(0, keywords=["a", "b"]), "https://skipped.dev", _item(1, statusCode="404")])
+        assert results.append_page(json.dumps(page).encode("utf-8")) == 2
+
+        assert len(results) == 2
+        assert results.num_chunks == 1
+        assert results.column("source_url") == ["https://a.dev/0", "https://a.dev/1"]
+        assert results.column("status_code") == [200, 404]
+        assert results.column("keywords") == ["a, b", None]
+        assert results.column("links") == [["https://a.dev/0/x"], ["https://a.dev/1/x"]]
+        assert (results.status, results.total, results.credits_used) == ("completed", 3, 3)
+        with pytest.raises(KeyError):
+            results.column("html")
+
+    def test_chunked_appends_and_rows(self):
+        results = ColumnarResults(["source_url", "markdown"])
+        results.append_page(_page([_item(0)], next_url="https://api/next"))
+        results.append_page(_page([_item(1), _item(2)]))
+        results.append_items([])
+        assert results.num_chunks == 2
+        assert [row["source_url"] for row in results.rows()] == [f"https://a.dev/{i}" for i in range(3)]
+        assert results.next is None
+
+    def test_append_documents_matches_raw(self):
+        doc = Document(markdown="# Hi", metadata=DocumentMetadata(source_url="https://a.dev", status_code=200))
+        results = ColumnarResults(["source_url", "status_code", "markdown"])
+        results.append_documents([doc])
+        assert list(results.rows()) == [{"source_url": "https://a.dev", "status_code": 200, "markdown": "# Hi"}]
+
+    def test_duplicate_columns_rejected(self):
+        with pytest.raises(ValueError):
+            ColumnarResults(["title", "title"])
+
+    def test_arrow_and_pandas_export(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pytest.importorskip("pandas")
+        import pyarrow.parquet as pq
+
+        results = ColumnarResults(["source_url", "status_code", "links"])
+        results.append_page(_page([_item(0)]))
+        results.append_page(_page([_item(1)]))
+        table = results.to_arrow()
+        assert table.num_rows == 2
+        assert table.schema.field("status_code").type == pa.int64()
+        path = tmp_path / "results.parquet"
+        results.to_parquet(str(path))
+        assert pq.read_table(str(path)).column("source_url").to_pylist() == ["https://a.dev/0", "https://a.dev/1"]
+        assert list(results.to_pandas()["status_code"]) == [200, 200]
+
+
+def test_fetch_columns_follows_pages_with_limits():
+    client = Mock()
+    client.get.side_effect = [
+        _response(_page([_item(0), _item(1)], next_url="https://api/v2/crawl/j?skip=2")),
+        _response(_page([_item(2)])),
+    ]
+    results = fetch_columns(client, "/v2/crawl/j", "get crawl status", ["source_url"])
+    assert results.column("source_url") == [f"https://a.dev/{i}" for i in range(3)]
+    assert client.get.call_args_list[1].args == ("https://api/v2/crawl/j?skip=2",)
+
+    client.get.reset_mock(side_effect=True)
+    client.get.side_effect = [_response(_page([_item(0), _item(1)], next_url="https://api/next"))]
+    limited = fetch_columns(client, "/v2/crawl/j", "get crawl status", pagination_config=PaginationConfig(max_results=1))
+    assert len(limited) == 1
+    assert client.get.call_count == 1
+
+
+def test_afetch_columns():
+    client = Mock()
+    client.get = AsyncMock(side_effect=[_response(_page([_item(0)], next_url="/v2/batch/scrape/j?skip=1")), _response(_page([_item(1)]))])
+    results = asyncio.run(afetch_columns(client, "/v2/batch/scrape/j", "get batch scrape status", ["title"]))
+    assert results.column("title") == ["Page 0", "Page 1"]
+
+
+def test_fetch_columns_stops_when_last_page_omits_next():
+    last_page = _page([_item(1)])
+    del last_page["next"]
+    client = Mock()
+    client.get.side_effect = [
+        _response(_page([_item(0)], next_url="https://api/v2/crawl/j?skip=1")),
+        _response(last_page),
+    ]
+    results = fetch_columns(client, "/v2/crawl/j", "get crawl status", ["source_url"])
+    assert results.column("source_url") == ["https://a.dev/0", "https://a.dev/1"]
+    assert results.next is None
+    assert client.get.call_count == 2
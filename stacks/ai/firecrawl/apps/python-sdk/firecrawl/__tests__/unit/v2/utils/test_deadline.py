@@ -0,0 +1,215 @@
+"""
+Unit tests for end-to-end deadline propagation.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from firecrawl.v1.client import V1FirecrawlApp
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods import crawl_planner as planner_module
+from firecrawl.v2.methods import extract as extract_module
+from firecrawl.v2.methods import search_scrape as search_scrape_module
+from firecrawl.v2.types import (
+    BatchScrapeJob,
+    BatchScrapeResponse,
+    CrawlRequest,
+    CrawlShard,
+    Document,
+    ExtractResponse,
+    SearchData,
+    SearchRequest,
+    SearchResultWeb,
+)
+from firecrawl.v2.utils import HttpClient
+from firecrawl.v2.utils.deadline import Deadline, current_deadline, deadline_scope
+from firecrawl.v2.utils.error_handler import DeadlineExceededError
+
+
+def _ok(body):
+    return SimpleNamespace(ok=True, status_code=200, json=lambda: body)
+
+
+class TestDeadline:
+    def test_nested_deadline_only_tightens(self):
+        with Deadline(10) as outer:
+            with Deadline(60) as inner:
+                assert inner.expires_at == outer.expires_at
+                assert current_deadline() is inner
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+    def test_scope_without_timeout_keeps_outer(self):
+        with Deadline(5) as outer:
+            with deadline_scope(None) as active:
+                assert active is outer
+
+    def test_error_is_a_timeout(self):
+        with Deadline(0):
+            with pytest.raises(TimeoutError):
+                current_deadline().check()
+
+
+    def test_sleep_leaves_budget_for_a_last_check(self):
+        with Deadline(0.2) as deadline:
+            started = time.monotonic()
+            # Cut short instead of raising, with budget left for one more poll
+            deadline.sleep(5)
+            assert time.monotonic() - started < 0.2
+            assert not deadline.expired
+            # The next overrunning sleep uses up the rest and raises
+            with pytest.raises(DeadlineExceededError):
+                deadline.sleep(5)
+            assert deadline.expired
+
+
+class TestHttpClient:
+    def test_requests_get_remaining_budget(self, monkeypatch):
+        timeouts = []
+        monkeypatch.setattr(requests, "get", lambda url, headers, timeout: timeouts.append(timeout) or _ok({}))
+        client = HttpClient("key", "https://api.example.com")
+
+        client.get("/v2/crawl/x")
+        with Deadline(2):
+            client.get("/v2/crawl/x")
+            client.get("/v2/crawl/x", timeout=0.5)
+
+        assert timeouts[0] is None
+        assert 0 < timeouts[1] <= 2
+        assert timeouts[2] == 0.5
+
+    def test_backoff_does_not_outlast_deadline(self, monkeypatch):
+        calls = []
+
+        def fail(url, headers, timeout):
+            calls.append(timeout)
+            raise requests.ConnectionError("down")
+
+        monkeypatch.setattr(requests, "get", fail)
+        client = HttpClient("key", "https://api.example.com")
+        started = time.monotonic()
+        with Deadline(0.2):
+            with pytest.raises(DeadlineExceededError):
+                client.get("/v2/crawl/x", retries=5, backoff_factor=1)
+        assert len(calls) == 1
+        assert time.monotonic() - started < 0.2
+
+
+def test_crawl_timeout_bounds_pagination(monkeypatch):
+    class _Client:
+        def __init__(self):
+            self.pages = 0
+
+        def _prepare_headers(self):
+            return {}
+
+        def post(self, endpoint, data, headers=None):
+            return _ok({"success": True, "id": "job", "url": "u"})
+
+        def get(self, endpoint, **kwargs):
+            current_deadline().check("get page")
+            self.pages += 1
+            time.sleep(0.05)
+            return _ok({"success": True, "status": "completed", "completed": 1, "total": 1, "data": [], "next": "more"})
+
+    client = _Client()
+    with pytest.raises(DeadlineExceededError):
+        crawl_module.crawl(client, CrawlRequest(url="https://example.com"), timeout=0.2)
+    assert 2 <= client.pages <= 6
+
+
+def test_v1_requests_get_remaining_budget(monkeypatch):
+    app = V1FirecrawlApp(api_key="key", api_url="https://api.example.com")
+    timeouts = []
+    monkeypatch.setattr(app._http_session, "request", lambda method, url, timeout=None, **kw: timeouts.append(timeout) or SimpleNamespace(status_code=200))
+
+    app._get_request("https://api.example.com/v1/crawl/x", {})
+    with Deadline(3):
+        app._get_request("https://api.example.com/v1/crawl/x", {})
+
+    assert timeouts[0] is None
+    assert 0 < timeouts[1] <= 3
+
+
+@pytest.mark.asyncio
+async def test_deadline_follows_asyncio_tasks():
+    async def inner():
+        return current_deadline()
+
+    with Deadline(1) as deadline:
+        assert await asyncio.create_task(inner()) is deadline
+
+
+def test_wait_for_crawl_gets_a_final_poll_before_the_deadline():
+    class _Client:
+        def __init__(self):
+            self.polls = 0
+
+        def get(self, endpoint, **kwargs):
+            current_deadline().check("get page")
+            self.polls += 1
+            status = "completed" if self.polls == 2 else "scraping"
+            return _ok({"success": True, "status": status, "completed": 1, "total": 1, "data": []})
+
+    client = _Client()
+    with Deadline(0.3):
+        job = crawl_module.wait_for_crawl_completion(client, "job", poll_interval=5)
+    assert job.status == "completed" and client.polls == 2
+
+
+def test_restarted_watcher_does_not_keep_an_old_deadline():
+    from firecrawl.v2.watcher import Watcher
+
+    watcher = Watcher(SimpleNamespace(), "job", timeout=None)
+    with Deadline(1):
+        assert 0 < watcher._effective_timeout() <= 1
+    assert watcher._effective_timeout() is None
+
+
+def _search_and_scrape(monkeypatch, seen):
+    monkeypatch.setattr(
+        search_scrape_module.search_module, "search",
+        lambda client, request: SearchData(web=[SearchResultWeb(url="https://a.dev/1"), SearchResultWeb(url="https://a.dev/2")]),
+    )
+
+    def scrape(client, url, options=None):
+        seen.append(current_deadline())
+        return Document(markdown=url)
+
+    monkeypatch.setattr(search_scrape_module.scrape_module, "scrape", scrape)
+    return list(search_scrape_module.search_and_scrape(None, SearchRequest(query="q"), top_k=2))
+
+
+def _run_shards(monkeypatch, seen):
+    def start(client, urls, **kwargs):
+        seen.append(current_deadline())
+        return BatchScrapeResponse(id=urls[0], url="")
+
+    monkeypatch.setattr(planner_module.batch_module, "start_batch_scrape", start)
+    monkeypatch.setattr(
+        planner_module.batch_module, "wait_for_batch_completion",
+        lambda client, job_id, poll_interval=2, timeout=None: BatchScrapeJob(status="completed", completed=1, total=1, data=[Document(markdown=job_id)]),
+    )
+    shards = [CrawlShard(prefixes=["/a"], urls=["https://a.dev/a"]), CrawlShard(prefixes=["/b"], urls=["https://a.dev/b"])]
+    return list(planner_module.run_shards(None, shards, max_concurrency=1))
+
+
+def _extract_many(monkeypatch, seen):
+    def extract(client, urls, **kwargs):
+        seen.append(current_deadline())
+        return ExtractResponse(status="completed", data={})
+
+    monkeypatch.setattr(extract_module, "extract", extract)
+    return list(extract_module.extract_many(None, ["https://a.dev/1", "https://b.dev/1"]))
+
+
+@pytest.mark.parametrize("fan_out", [_search_and_scrape, _run_shards, _extract_many])
+def test_deadline_reaches_fan_out_workers(monkeypatch, fan_out):
+    seen = []
+    with Deadline(5) as deadline:
+        assert len(fan_out(monkeypatch, seen)) == 2
+    assert seen == [deadline, deadline]
@@ -0,0 +1,80 @@
+"""
+Unit tests for the multi-process result page decoder.
+"""
+
+import json
+from types import SimpleNamespace
+
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.utils.decoder_pool import DecoderPool, decode_documents
+
+
+def _page(n, next_url=None):
+    data = [{"markdown": f"doc {i}", "metadata": {"sourceURL": f"https://a.dev/{i}", "statusCode": 200}} for i in range(n)]
+    body = {"success": True, "status": "completed", "completed": n, "total": n, "data": data}
+    if next_url:
+        body["next"] = next_url
+    return body
+
+
+def _response(body):
+    raw = json.dumps(body).encode("utf-8")
+    return SimpleNamespace(ok=True, status_code=200, content=raw, json=lambda: json.loads(raw))
+
+
+class TestDecoderPool:
+    def test_parallel_decode_preserves_order(self):
+        with DecoderPool(max_workers=3, min_parallel_items=100, min_slice_items=100) as pool:
+            docs = pool.decode(_page(1200))
+        assert len(docs) == 1200
+        assert [d.markdown for d in docs] == [f"doc {i}" for i in range(1200)]
+        assert docs[5].metadata_typed.source_url == "https://a.dev/5"
+
+    def test_small_pages_decode_inline(self):
+        pool = DecoderPool(max_workers=4, min_parallel_items=10)
+        docs = pool.decode(_page(3))
+        assert [d.markdown for d in docs] == ["doc 0", "doc 1", "doc 2"]
+        assert pool._executor is None
+
+    def test_workers_receive_only_their_slice(self):
+        submitted = []
+
+        class _Executor:
+            def submit(self, fn, raw, projection):
+                submitted.append(raw)
+                return SimpleNamespace(result=lambda: fn(raw, projection))
+
+        pool = DecoderPool(max_workers=4, min_parallel_items=100, min_slice_items=100)
+        pool._executor = _Executor()
+        docs = pool.decode(_page(400))
+        # Each worker gets its own slice as JSON bytes, not the whole page
+        assert all(isinstance(raw, bytes) for raw in submitted)
+        assert [len(json.loads(raw)) for raw in submitted] == [100, 100, 100, 100]
+        assert json.loads(submitted[1])[0]["markdown"] == "doc 100"
+        assert [d.markdown for d in docs] == [f"doc {i}" for i in range(400)]
+
+    def test_limit_applies_before_decoding(self):
+        body = _page(3)
+        body["data"].insert(0, "https://a.dev/skipped")
+        pool = DecoderPool(max_workers=4, min_parallel_items=10)
+        assert [d.markdown for d in pool.decode(body, limit=2)] == ["doc 0", "doc 1"]
+
+    def test_skips_non_dict_items(self):
+        assert [d.markdown for d in decode_documents(["https://a.dev", {"markdown": "x"}])] == ["x"]
+
+
+def test_batch_status_uses_client_decoder_pool():
+    pages = {"/v2/batch/scrape/job": _page(300, next_url="page2"), "page2": _page(300)}
+
+    class _Client:
+        def __init__(self, pool):
+            self.decoder_pool = pool
+
+        def get(self, endpoint, **kwargs):
+            return _response(pages[endpoint])
+
+    with DecoderPool(max_workers=2, min_parallel_items=200, min_slice_items=100) as pool:
+        job = batch_module.get_batch_scrape_status(_Client(pool), "job")
+        assert pool._executor is not None
+    assert len(job.data) == 600
+    assert job.data[299].markdown == "doc 299"
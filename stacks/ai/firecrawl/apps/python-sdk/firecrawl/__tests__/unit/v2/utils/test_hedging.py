@@ -0,0 +1,170 @@
+"""
+Unit tests for hedged scrape requests.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods import scrape as scrape_module
+from firecrawl.v2.types import Document
+from firecrawl.v2.utils.hedging import HedgePolicy, LatencyHistogram
+
+
+def _warm(policy, latency, n=20):
+    for _ in range(n):
+        policy.histogram.record(latency)
+
+
+class TestLatencyHistogram:
+    def test_percentile_tracks_window(self):
+        histogram = LatencyHistogram(window=100)
+        assert histogram.percentile(95) is None
+        for i in range(1, 101):
+            histogram.record(i / 100)
+        assert histogram.percentile(50) == pytest.approx(0.5, abs=0.011)
+        assert histogram.percentile(95) == pytest.approx(0.95, abs=0.011)
+        for _ in range(100):
+            histogram.record(2.0)
+        assert histogram.percentile(50) == 2.0
+
+
+class TestHedgePolicy:
+    def test_no_hedge_without_samples(self):
+        policy = HedgePolicy(budget=1.0)
+        assert policy.hedge_delay() is None
+        assert policy.run(lambda: "ok") == "ok"
+        assert policy.hedges == 0
+
+    def test_slow_primary_is_hedged_and_hedge_wins(self):
+        policy = HedgePolicy(budget=1.0, min_delay=0.01)
+        _warm(policy, 0.02)
+        calls = []
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                calls.append(len(calls))
+                rank = calls[-1]
+            time.sleep(0.5 if rank == 0 else 0.01)
+            return rank
+
+        started = time.monotonic()
+        assert policy.run(call) == 1
+        assert time.monotonic() - started < 0.3
+        assert policy.stats["hedges"] == 1 and policy.stats["hedge_wins"] == 1
+        policy.close()
+
+    def test_unhedgeable_request_runs_on_calling_thread(self):
+        policy = HedgePolicy(budget=0.0, min_delay=0.001)
+        _warm(policy, 0.001)
+        assert policy.run(threading.get_ident) == threading.get_ident()
+        assert policy._executor is None and policy._primary_executor is None
+
+    def test_primary_does_not_wait_for_pool_workers(self):
+        policy = HedgePolicy(budget=1.0, min_delay=0.05, max_workers=1)
+        _warm(policy, 0.05)
+        release = threading.Event()
+        # Occupy the only hedge worker
+        policy._get_executor().submit(release.wait)
+        started = time.monotonic()
+        assert policy.run(lambda: "ok") == "ok"
+        assert time.monotonic() - started < 0.05
+        release.set()
+        policy.close()
+
+    def test_primaries_run_on_a_bounded_pool(self):
+        policy = HedgePolicy(budget=1.0, min_delay=0.05, max_workers=2)
+        _warm(policy, 0.05)
+        names = set()
+
+        def call():
+            names.add(threading.current_thread().name)
+            return "ok"
+
+        callers = [threading.Thread(target=policy.run, args=(call,)) for _ in range(8)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(timeout=5)
+
+        assert names and all(name.startswith("firecrawl-primary") for name in names)
+        assert len(names) <= 2
+        policy.close()
+        assert policy._primary_executor is None
+
+    def test_budget_caps_hedges(self):
+        policy = HedgePolicy(budget=0.1, min_delay=0.001)
+        _warm(policy, 0.001)
+        for _ in range(30):
+            policy.run(lambda: time.sleep(0.01))
+        assert policy.requests == 30
+        assert policy.hedges <= 3
+        policy.close()
+
+    def test_failed_attempt_falls_back_to_other(self):
+        policy = HedgePolicy(budget=1.0, min_delay=0.01)
+        _warm(policy, 0.01)
+        calls = []
+
+        def call():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                raise RuntimeError("409 duplicate idempotency key")
+            time.sleep(0.2)
+            return "hedge"
+
+        assert policy.run(call) == "hedge"
+        policy.close()
+
+    def test_all_attempts_failing_raises(self):
+        policy = HedgePolicy(budget=1.0)
+
+        def call():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            policy.run(call)
+
+    @pytest.mark.asyncio
+    async def test_async_hedge_cancels_loser(self):
+        policy = HedgePolicy(budget=1.0, min_delay=0.01)
+        _warm(policy, 0.02)
+        cancelled = []
+        started = []
+
+        async def call():
+            rank = len(started)
+            started.append(rank)
+            try:
+                await asyncio.sleep(1.0 if rank == 0 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(rank)
+                raise
+            return rank
+
+        assert await policy.arun(call) == 1
+        await asyncio.sleep(0)
+        assert cancelled == [0]
+
+
+def test_client_scrape_hedges_with_one_idempotency_key(monkeypatch):
+    keys = []
+
+    def fake_scrape(client, url, options, idempotency_key=None):
+        keys.append(idempotency_key)
+        time.sleep(0.3 if len(keys) == 1 else 0.01)
+        return Document(markdown=url)
+
+    monkeypatch.setattr(scrape_module, "scrape", fake_scrape)
+    policy = HedgePolicy(budget=1.0, min_delay=0.01)
+    _warm(policy, 0.02)
+    client = FirecrawlClient(api_key="key", hedge_policy=policy)
+
+    assert client.scrape("https://example.com").markdown == "https://example.com"
+    assert len(keys) == 2 and keys[0] == keys[1] is not None
+    policy.close()
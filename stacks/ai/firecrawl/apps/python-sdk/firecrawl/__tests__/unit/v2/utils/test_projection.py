@@ -0,0 +1,185 @@
+"""
+Unit tests for field projection.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods.aio import batch as async_batch
+from firecrawl.v2.types import CrawlRequest, PaginationConfig, ScrapeOptions
+from firecrawl.v2.utils.decoder_pool import DecoderPool, decode_documents
+from firecrawl.v2.utils.projection import FieldProjection, with_projected_formats
+from firecrawl.v2.watcher import Watcher
+
+
+def _item(i):
+    return {
+        "markdown": f"# Page {i}",
+        "html": f"<h1>Page {i}</h1>",
+        "rawHtml": f"<html><h1>Page {i}</h1></html>",
+        "links": [f"https://a.dev/{i}/x"],
+        "metadata": {
+            "sourceURL": f"https://a.dev/{i}",
+            "statusCode": 200,
+            "title": f"Page {i}",
+            "description": "long description",
+            "ogImage": "https://a.dev/og.png",
+        },
+    }
+
+
+def _response(body):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = body
+    response.content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class TestFieldProjection:
+    def test_apply_keeps_only_requested_keys(self):
+        projection = FieldProjection(["markdown", "source_url", "metadata.statusCode"])
+        assert projection.apply(_item(0)) == {
+            "markdown": "# Page 0",
+            "metadata": {"sourceURL": "https://a.dev/0", "statusCode": 200},
+        }
+
+    def test_metadata_keeps_all_metadata(self):
+        projection = FieldProjection(["raw_html", "metadata"])
+        item = _item(1)
+        assert projection.apply(item) == {"rawHtml": item["rawHtml"], "metadata": item["metadata"]}
+
+    def test_document_fields_only_drops_metadata(self):
+        assert FieldProjection(["links"]).apply(_item(2)) == {"links": ["https://a.dev/2/x"]}
+
+    def test_unknown_field_raises(self):
+        with pytest.raises(ValueError, match="Unknown document field: bogus"):
+            FieldProjection(["markdown", "bogus"])
+
+    def test_of(self):
+        projection = FieldProjection(["title"])
+        assert FieldProjection.of(None) is None
+        assert FieldProjection.of(projection) is projection
+        assert FieldProjection.of("markdown").fields == ["markdown"]
+
+    def test_formats(self):
+        assert FieldProjection(["markdown", "title", "links"]).formats == ["markdown", "links"]
+        assert FieldProjection(["change_tracking"]).formats == ["markdown", "changeTracking"]
+        assert FieldProjection(["title", "metadata"]).formats is None
+
+    def test_with_projected_formats(self):
+        options = with_projected_formats(None, ["html", "title"])
+        assert [f if isinstance(f, str) else f.type for f in options.formats] == ["html"]
+
+        explicit = ScrapeOptions(formats=["markdown"], only_main_content=False)
+        assert with_projected_formats(explicit, ["html"]) is explicit
+
+        updated = with_projected_formats(ScrapeOptions(only_main_content=False), ["links"])
+        assert updated.only_main_content is False
+        assert [f if isinstance(f, str) else f.type for f in updated.formats] == ["links"]
+
+        assert with_projected_formats(explicit, None) is explicit
+        assert with_projected_formats(explicit, ["title"]) is explicit
+
+
+class TestProjectedDecoding:
+    def test_decode_documents_projects_before_validation(self):
+        docs = decode_documents([_item(0), "https://skipped.dev", _item(1)], FieldProjection(["markdown", "title"]))
+        assert [d.markdown for d in docs] == ["# Page 0", "# Page 1"]
+        assert [d.metadata.title for d in docs] == ["Page 0", "Page 1"]
+        assert docs[0].html is None and docs[0].links is None
+        assert docs[0].metadata.description is None
+
+    def test_decoder_pool_projects(self):
+        items = [_item(i) for i in range(4)]
+        body = {"data": items}
+        with DecoderPool(max_workers=2, min_parallel_items=1, min_slice_items=1) as pool:
+            docs = pool.decode(body, FieldProjection(["source_url"]))
+        assert [d.metadata.source_url for d in docs] == [f"https://a.dev/{i}" for i in range(4)]
+        assert all(d.markdown is None for d in docs)
+
+    def test_get_crawl_status_with_fields_follows_pages(self):
+        client = Mock()
+        client.decoder_pool = None
+        client.get.side_effect = [
+            _response({"success": True, "status": "completed", "completed": 2, "total": 2, "next": "/v2/crawl/j?skip=1", "data": [_item(0)]}),
+            _response({"success": True, "status": "completed", "completed": 2, "total": 2, "data": [_item(1)]}),
+        ]
+        job = crawl_module.get_crawl_status(client, "j", fields=["markdown", "status_code"])
+        assert [d.markdown for d in job.data] == ["# Page 0", "# Page 1"]
+        assert all(d.html is None and d.metadata.status_code == 200 and d.metadata.title is None for d in job.data)
+
+    def test_crawl_requests_projected_formats(self, monkeypatch):
+        captured = {}
+
+        def fake_start(client, request):
+            captured["request"] = request
+            return Mock(id="j")
+
+        monkeypatch.setattr(crawl_module, "start_crawl", fake_start)
+        monkeypatch.setattr(crawl_module, "wait_for_crawl_completion", lambda *a, **k: "done")
+        assert crawl_module.crawl(Mock(), CrawlRequest(url="https://a.dev"), fields=["html"]) == "done"
+        formats = captured["request"].scrape_options.formats
+        assert [f if isinstance(f, str) else f.type for f in formats] == ["html"]
+
+    def test_async_batch_status_with_fields(self):
+        client = Mock()
+        body = {"success": True, "status": "completed", "completed": 1, "total": 1, "data": [_item(0)]}
+        client.get = AsyncMock(return_value=_response(body))
+        job = asyncio.run(
+            async_batch.get_batch_scrape_status(client, "b", PaginationConfig(auto_paginate=False), fields=["links"])
+        )
+        assert job.data[0].links == ["https://a.dev/0/x"]
+        assert job.data[0].markdown is None
+
+
+class _WS:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+        return json.dumps(self._messages.pop(0))
+
+
+class _Connect:
+    def __init__(self, ws):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def test_watcher_projects_streamed_documents(monkeypatch):
+    import websockets
+
+    ws = _WS([
+        {"type": "document", "data": _item(0)},
+        {"type": "done", "data": {"status": "completed", "data": []}},
+    ])
+    monkeypatch.setattr(websockets, "connect", lambda uri, *a, **k: _Connect(ws))
+
+    client = Mock()
+    client.http_client.api_url = "http://localhost"
+    client.http_client.api_key = "TEST"
+    watcher = Watcher(client, job_id="jid", kind="crawl", fields=["markdown", "title"])
+    seen = []
+    watcher.add_event_listener("document", lambda event: seen.append(event["data"]))
+    watcher.start()
+    deadline = time.time() + 2
+    while watcher._thread and watcher._thread.is_alive() and time.time() < deadline:
+        time.sleep(0.01)
+    watcher.stop()
+
+    assert seen == [{"markdown": "# Page 0", "metadata": {"title": "Page 0"}}]
@@ -0,0 +1,95 @@
+"""
+Unit tests for URL canonicalization, dedup and chunked batch submission.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.utils.urls import UrlCanonicalizer, canonicalize_url, dedupe_urls, group_urls_by_domain
+
+
+class TestCanonicalizeUrl:
+    def test_canonical_form(self):
+        assert canonicalize_url("HTTPS://Example.com:443/A/?b=2&utm_source=x&a=1#top") == "https://example.com/A?a=1&b=2"
+        assert canonicalize_url("https://example.com") == "https://example.com/"
+        assert canonicalize_url("https://example.com/p?gclid=1&fbclid=2") == "https://example.com/p"
+        assert canonicalize_url("http://[::1]:80/x") == "http://[::1]/x"
+
+    def test_rejects_invalid(self):
+        assert canonicalize_url("ftp://example.com/file") is None
+        assert canonicalize_url("not a url") is None
+        assert canonicalize_url("https://") is None
+        assert canonicalize_url("") is None
+
+    def test_custom_rules(self):
+        canonicalizer = UrlCanonicalizer(
+            strip_www=True,
+            lowercase_path=True,
+            domain_params={"shop.dev": [r"sessionid"]},
+        )
+        assert canonicalizer("https://www.Shop.dev/Cart?sessionid=9&item=3") == "https://shop.dev/cart?item=3"
+        assert canonicalizer("https://other.dev/?sessionid=9") == "https://other.dev/?sessionid=9"
+
+
+class TestDedupe:
+    def test_preserves_first_seen_order(self):
+        urls = [
+            "https://b.dev/x/",
+            "https://a.dev/y?utm_campaign=z",
+            "https://B.dev/x",
+            "mailto:someone@a.dev",
+            "https://a.dev/y",
+        ]
+        assert dedupe_urls(urls) == ["https://b.dev/x", "https://a.dev/y"]
+        assert UrlCanonicalizer().dedupe(urls, keep_original=True) == ["https://b.dev/x/", "https://a.dev/y?utm_campaign=z"]
+
+    def test_group_by_domain(self):
+        groups = group_urls_by_domain(["https://a.dev/1", "https://b.dev/1", "https://a.dev/2", "https://a.dev/1/"])
+        assert groups == {"a.dev": ["https://a.dev/1", "https://a.dev/2"], "b.dev": ["https://b.dev/1"]}
+
+    def test_prepare_batch_urls_chunks(self):
+        urls = [f"https://{host}.dev/{i}" for i in range(3) for host in ("a", "b")] * 2
+        chunks = batch_module.prepare_batch_urls(urls, group_by_domain=True, chunk_size=4)
+        assert chunks == [
+            ["https://a.dev/0", "https://a.dev/1", "https://a.dev/2", "https://b.dev/0"],
+            ["https://b.dev/1", "https://b.dev/2"],
+        ]
+        with pytest.raises(ValueError):
+            batch_module.prepare_batch_urls(urls, chunk_size=batch_module.MAX_BATCH_URLS + 1)
+
+
+class _FakeClient:
+    def __init__(self):
+        self.posts = []
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {"x-idempotency-key": idempotency_key} if idempotency_key else {}
+
+    def post(self, endpoint, data, headers=None):
+        self.posts.append((data, headers))
+        body = {"success": True, "id": data.get("appendToId", "job-1"), "url": "u", "invalidURLs": []}
+        return SimpleNamespace(ok=True, json=lambda: body)
+
+
+class TestChunkedStart:
+    def test_large_lists_append_to_one_job(self):
+        client = _FakeClient()
+        urls = [f"https://a.dev/{i}" for i in range(2500)]
+        response = batch_module.start_batch_scrape(client, urls, idempotency_key="key")
+
+        assert response.id == "job-1"
+        assert [len(data["urls"]) for data, _ in client.posts] == [1000, 1000, 500]
+        assert "appendToId" not in client.posts[0][0]
+        assert all(data["appendToId"] == "job-1" for data, _ in client.posts[1:])
+        assert [headers.get("x-idempotency-key") for _, headers in client.posts] == ["key", "key-1", "key-2"]
+
+    def test_canonicalize_before_submitting(self):
+        client = _FakeClient()
+        batch_module.start_batch_scrape(
+            client,
+            ["https://a.dev/x?utm_source=n", "https://a.dev/x/", "https://a.dev/y"],
+            canonicalize_urls=True,
+        )
+        assert client.posts[0][0]["urls"] == ["https://a.dev/x", "https://a.dev/y"]
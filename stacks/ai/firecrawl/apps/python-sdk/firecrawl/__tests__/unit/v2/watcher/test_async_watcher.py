@@ -0,0 +1,76 @@
+"""
+Unit tests for the async job watcher.
+"""
+
+import json
+
+import pytest
+
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils.deadline import Deadline
+from firecrawl.v2.watcher_async import AsyncWatcher
+
+
+class _PollingClient:
+    api_url = "http://localhost"
+    api_key = "TEST"
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+
+    def get_crawl_status(self, job_id):
+        return CrawlJob(status=self.statuses.pop(0), completed=0, total=0, data=[])
+
+
+def _refuse(monkeypatch):
+    import websockets
+
+    def refuse(*args, **kwargs):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(websockets, "connect", refuse)
+
+
+@pytest.mark.asyncio
+async def test_deadline_does_not_replace_the_watcher_timeout(monkeypatch):
+    _refuse(monkeypatch)
+    watcher = AsyncWatcher(_PollingClient(["completed", "completed"]), "jid", timeout=600)
+
+    with Deadline(0.2):
+        assert watcher._effective_timeout() <= 0.2
+        assert [job.status async for job in watcher] == ["completed"]
+
+    assert watcher._timeout == 600
+    assert watcher._effective_timeout() == 600
+    assert [job.status async for job in watcher] == ["completed"]
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_replays_status_polls_from_cassette(monkeypatch):
+    from firecrawl.v2.client_async import AsyncFirecrawlClient
+    from firecrawl.v2.utils.cassette import Cassette, ReplayTransport
+
+    cassette = Cassette()
+    headers = {"content-type": "application/json"}
+    for status, completed in (("scraping", 0), ("scraping", 1), ("completed", 2)):
+        body = {"success": True, "status": status, "completed": completed, "total": 2,
+                "data": [{"markdown": "m", "metadata": {"sourceURL": "https://a.dev"}}] if completed == 2 else []}
+        cassette.add("GET", "/v2/crawl/job-1", None, 200, headers, json.dumps(body).encode("utf-8"), 0.0)
+
+    import websockets
+
+    opened = []
+
+    def no_websocket(*args, **kwargs):
+        # A connect error would be swallowed by the polling fallback, so record the attempt
+        opened.append(args)
+        raise OSError("WebSocket opened during replay")
+
+    monkeypatch.setattr(websockets, "connect", no_websocket)
+
+    replay = ReplayTransport(cassette)
+    client = AsyncFirecrawlClient(api_key="test", api_url="https://api.example.com", transport=replay)
+    watcher = client.watcher("job-1", poll_interval=0.01, timeout=5)
+
+    assert [job.status async for job in watcher] == ["scraping", "scraping", "completed"]
+    assert replay.replayed == 3 and opened == []
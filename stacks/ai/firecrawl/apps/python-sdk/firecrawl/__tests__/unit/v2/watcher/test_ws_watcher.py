@@ -330,3 +330,64 @@ def test_ws_watcher_uses_correct_ws_uri(monkeypatch, kind):
     assert captured_uri["uri"] is not None
     expected = "ws://localhost/v2/crawl/jid" if kind == "crawl" else "ws://localhost/v2/batch/scrape/jid"
     assert captured_uri["uri"] == expected
+
+
+def test_watcher_replays_status_polls_from_cassette(monkeypatch):
+    from firecrawl.v2.client import FirecrawlClient
+    from firecrawl.v2.utils.cassette import Cassette, ReplayTransport
+
+    cassette = Cassette()
+    headers = {"content-type": "application/json"}
+    for status, completed in (("scraping", 0), ("scraping", 1), ("completed", 2)):
+        body = {"success": True, "status": status, "completed": completed, "total": 2,
+                "data": [{"markdown": "m", "metadata": {"sourceURL": "https://a.dev"}}] if completed == 2 else []}
+        cassette.add("GET", "/v2/crawl/job-1", None, 200, headers, json.dumps(body).encode("utf-8"), 0.0)
+
+    import websockets
+
+    def no_websocket(*args, **kwargs):
+        raise AssertionError("WebSocket opened during replay")
+
+    monkeypatch.setattr(websockets, "connect", no_websocket)
+
+    client = FirecrawlClient(api_key="test", api_url="https://api.example.com")
+    replay = ReplayTransport(cassette)
+    client.http_client.transport = replay
+    watcher = client.watcher("job-1", poll_interval=0.01, timeout=5)
+
+    statuses = []
+    done = []
+    watcher.add_listener(lambda job: statuses.append(job.status))
+    watcher.add_event_listener("done", lambda detail: done.append(detail))
+    watcher.start()
+    watcher._thread.join(timeout=5)
+
+    assert statuses == ["scraping", "scraping", "completed"]
+    assert len(done) == 1 and replay.replayed == 3
+
+
+def test_watcher_polls_when_websocket_cannot_connect(monkeypatch):
+    import websockets
+
+    def refuse(*args, **kwargs):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(websockets, "connect", refuse)
+
+    class PollingClient(DummyClient):
+        def __init__(self):
+            super().__init__()
+            self.polls = 0
+
+        def get_crawl_status(self, job_id):
+            from firecrawl.v2.types import CrawlJob
+            self.polls += 1
+            return CrawlJob(status="completed" if self.polls >= 2 else "scraping", completed=0, total=0, data=[])
+
+    client = PollingClient()
+    watcher = Watcher(client, job_id="jid", poll_interval=0.01, timeout=5)
+    statuses = []
+    watcher.add_listener(lambda job: statuses.append(job.status))
+    watcher.start()
+    watcher._thread.join(timeout=5)
+    assert statuses == ["scraping", "completed"]
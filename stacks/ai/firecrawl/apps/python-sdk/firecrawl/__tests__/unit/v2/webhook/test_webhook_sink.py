@@ -0,0 +1,103 @@
+"""
+Unit tests for the webhook sink and its per-job handles.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.webhook import SIGNATURE_HEADER, WebhookSink, sign_payload, verify_signature
+
+
+def _body(event_type, job_id="job-1", data=None, success=True, error=None):
+    payload = {"success": success, "type": event_type, "id": job_id, "data": data or []}
+    if error:
+        payload["error"] = error
+    return json.dumps(payload).encode("utf-8")
+
+
+def _doc(url):
+    return {"markdown": f"# {url}", "metadata": {"sourceURL": url, "statusCode": 200}}
+
+
+class TestWebhookSink:
+    def test_signature_round_trip(self):
+        body = _body("crawl.page")
+        assert verify_signature(body, sign_payload(body, "s3cret"), "s3cret")
+        assert not verify_signature(body, sign_payload(body, "other"), "s3cret")
+        assert not verify_signature(body, None, "s3cret")
+
+    @pytest.mark.asyncio
+    async def test_routes_events_to_watcher_style_listeners(self, tmp_path):
+        sink = WebhookSink(spool_dir=str(tmp_path))
+        handle = sink.watch("job-1", kind="crawl")
+        documents, done, snapshots = [], [], []
+        handle.add_event_listener("document", documents.append)
+        handle.add_event_listener("done", done.append)
+        handle.add_listener(snapshots.append)
+
+        assert sink.handle_delivery(_body("crawl.started")) == 200
+        assert sink.handle_delivery(_body("crawl.page", data=[_doc("https://a.dev/1")])) == 200
+        assert sink.handle_delivery(_body("crawl.page", success=False, error="timeout")) == 200
+        assert sink.handle_delivery(_body("crawl.page", data=[_doc("https://a.dev/2")])) == 200
+        assert sink.handle_delivery(_body("crawl.completed")) == 200
+
+        assert [d["data"]["metadata"]["sourceURL"] for d in documents] == ["https://a.dev/1", "https://a.dev/2"]
+        assert done[0]["status"] == "completed" and done[0]["id"] == "job-1"
+        assert isinstance(snapshots[0], CrawlJob) and len(snapshots[0].data) == 2
+        assert handle.page_errors == ["timeout"]
+        assert await handle.wait(timeout=1) == "completed"
+
+        spooled = (tmp_path / "job-1.jsonl").read_text().splitlines()
+        assert [json.loads(line)["metadata"]["sourceURL"] for line in spooled] == ["https://a.dev/1", "https://a.dev/2"]
+
+    @pytest.mark.asyncio
+    async def test_unregistered_jobs_are_tracked_and_failures_dispatched(self):
+        sink = WebhookSink()
+        seen = []
+        sink.on_event(seen.append)
+
+        sink.handle_delivery(_body("batch_scrape.page", job_id="b1", data=[_doc("https://b.dev")]))
+        handle = sink.watch("b1")
+        errors = []
+        handle.add_event_listener("error", errors.append)
+        sink.handle_delivery(_body("extract.failed", job_id="b1", success=False, error="boom"))
+
+        assert handle.kind == "batch"
+        assert handle.pages_received == 1
+        assert errors[0]["error"] == "boom"
+        assert [e.type for e in seen] == ["batch_scrape.page", "extract.failed"]
+
+    def test_handle_created_outside_a_loop_can_be_awaited(self):
+        # A sync caller may watch a job before the sink's loop is running
+        sink = WebhookSink()
+        handle = sink.watch("job-2")
+        finished = sink.watch("job-3")
+        sink.handle_delivery(_body("crawl.completed", job_id="job-3"))
+
+        async def run():
+            waiter = asyncio.ensure_future(handle.wait(timeout=1))
+            await asyncio.sleep(0)
+            sink.handle_delivery(_body("crawl.completed", job_id="job-2"))
+            return await waiter, await finished.wait(timeout=1)
+
+        assert asyncio.run(run()) == ("completed", "completed")
+        assert handle.done and finished.done
+
+    @pytest.mark.asyncio
+    async def test_http_server_verifies_signatures(self):
+        async with WebhookSink(secret="s3cret", port=0) as sink:
+            handle = sink.watch("job-9")
+            body = _body("crawl.completed", job_id="job-9")
+            async with aiohttp.ClientSession() as session:
+                async with session.post(sink.url, data=body, headers={SIGNATURE_HEADER: "sha256=bad"}) as resp:
+                    assert resp.status == 401
+                async with session.post(sink.url, data=b"not json", headers={SIGNATURE_HEADER: sign_payload(b"not json", "s3cret")}) as resp:
+                    assert resp.status == 400
+                async with session.post(sink.url, data=body, headers={SIGNATURE_HEADER: sign_payload(body, "s3cret")}) as resp:
+                    assert resp.status == 200
+            assert await handle.wait(timeout=1) == "completed"
+            assert sink.webhook(events=["page", "completed"]).url == sink.url
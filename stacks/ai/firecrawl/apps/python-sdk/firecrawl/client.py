@@ -26,6 +26,10 @@ from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
 from .v2 import FirecrawlClient as V2FirecrawlClient
 from .v2.client_async import AsyncFirecrawlClient
 from .v2.types import Document
+from .v2.utils.decoder_pool import DecoderPool
+from .v2.utils.hedging import HedgePolicy
+from .v2.utils.circuit_breaker import CircuitBreakerRegistry
+from .v2.utils.cassette import Transport
 
 logger = logging.getLogger("firecrawl")
 
@@ -43,6 +47,8 @@ class V1Proxy:
             self.async_batch_scrape_urls = client_instance.async_batch_scrape_urls
             self.async_crawl_url = client_instance.async_crawl_url
             self.check_crawl_status = client_instance.check_crawl_status
+            self.iter_crawl_url_results = client_instance.iter_crawl_url_results
+            self.iter_batch_results = client_instance.iter_batch_results
             self.map_url = client_instance.map_url
             self.extract = client_instance.extract
             self.deep_research = client_instance.deep_research
@@ -58,9 +64,11 @@ class V2Proxy:
         if client_instance:
             self.scrape = client_instance.scrape
             self.search = client_instance.search
+            self.search_and_scrape = client_instance.search_and_scrape
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.get_crawl_columns = client_instance.get_crawl_columns
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -70,20 +78,32 @@ class V2Proxy:
             self.extract = client_instance.extract
             self.start_extract = client_instance.start_extract
             self.get_extract_status = client_instance.get_extract_status
+            self.extract_many = client_instance.extract_many
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.get_batch_scrape_columns = client_instance.get_batch_scrape_columns
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
+            self.index_batch_results = client_instance.index_batch_results
 
             self.map = client_instance.map
+            self.recrawl = client_instance.recrawl
+            self.plan_crawl = client_instance.plan_crawl
+            self.sharded_crawl = client_instance.sharded_crawl
             self.get_concurrency = client_instance.get_concurrency
             self.get_credit_usage = client_instance.get_credit_usage
             self.get_token_usage = client_instance.get_token_usage
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.job_scheduler = client_instance.job_scheduler
+            self.batch_feeder = client_instance.batch_feeder
+
+            self.scrape_many = client_instance.scrape_many
+            self.map_many = client_instance.map_many
+            self.batch_status_many = client_instance.batch_status_many
     
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -107,6 +127,7 @@ class AsyncV1Proxy:
             self.extract = client_instance.extract
             self.deep_research = client_instance.deep_research
             self.generate_llms_text = client_instance.generate_llms_text
+            self.close = client_instance.close
 
 class AsyncV2Proxy:
     """Proxy class that forwards method calls to the appropriate version client."""
@@ -118,10 +139,12 @@ class AsyncV2Proxy:
         if client_instance:
             self.scrape = client_instance.scrape
             self.search = client_instance.search
+            self.search_and_scrape = client_instance.search_and_scrape
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
             self.wait_crawl = client_instance.wait_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.get_crawl_columns = client_instance.get_crawl_columns
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -131,9 +154,11 @@ class AsyncV2Proxy:
             self.extract = client_instance.extract
             self.start_extract = client_instance.start_extract
             self.get_extract_status = client_instance.get_extract_status
+            self.extract_many = client_instance.extract_many
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.get_batch_scrape_columns = client_instance.get_batch_scrape_columns
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
@@ -146,6 +171,7 @@ class AsyncV2Proxy:
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.job_scheduler = client_instance.job_scheduler
 
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -162,19 +188,41 @@ class Firecrawl:
     keeping a feature-frozen v1 available for incremental migration.
     """
     
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        decoder_pool: Optional[DecoderPool] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        transport: Optional[Transport] = None,
+        max_parallel_requests: int = 16,
+    ):
         """Initialize the unified client.
 
         Args:
             api_key: Firecrawl API key (or set ``FIRECRAWL_API_KEY``)
             api_url: Base API URL (defaults to production)
+            decoder_pool: Process pool decoding large v2 crawl/batch result pages (opt-in)
+            hedge_policy: Send a duplicate of slow v2 scrape() requests (opt-in)
+            circuit_breakers: Fail fast on v2 endpoint families whose circuit is open (opt-in)
+            transport: Record v2 requests to, or replay them from, a cassette (opt-in)
+            max_parallel_requests: Concurrent requests of v2 scrape_many/map_many/batch_status_many
         """
         self.api_key = api_key
         self.api_url = api_url
         
         # Initialize version-specific clients
         self._v1_client = V1FirecrawlApp(api_key=api_key, api_url=api_url) if V1FirecrawlApp else None
-        self._v2_client = V2FirecrawlClient(api_key=api_key, api_url=api_url) if V2FirecrawlClient else None
+        self._v2_client = V2FirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            decoder_pool=decoder_pool,
+            hedge_policy=hedge_policy,
+            circuit_breakers=circuit_breakers,
+            transport=transport,
+            max_parallel_requests=max_parallel_requests,
+        ) if V2FirecrawlClient else None
         
         # Create version-specific proxies
         self.v1 = V1Proxy(self._v1_client) if self._v1_client else None
@@ -182,12 +230,17 @@ class Firecrawl:
         
         self.scrape = self._v2_client.scrape
         self.search = self._v2_client.search
+        self.search_and_scrape = self._v2_client.search_and_scrape
         self.map = self._v2_client.map
+        self.recrawl = self._v2_client.recrawl
+        self.plan_crawl = self._v2_client.plan_crawl
+        self.sharded_crawl = self._v2_client.sharded_crawl
 
         self.crawl = self._v2_client.crawl
         self.start_crawl = self._v2_client.start_crawl
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.get_crawl_columns = self._v2_client.get_crawl_columns
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -195,13 +248,16 @@ class Firecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.get_batch_scrape_columns = self._v2_client.get_batch_scrape_columns
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
+        self.index_batch_results = self._v2_client.index_batch_results
 
         self.start_extract = self._v2_client.start_extract
         self.get_extract_status = self._v2_client.get_extract_status
         self.extract = self._v2_client.extract
+        self.extract_many = self._v2_client.extract_many
 
         self.get_concurrency = self._v2_client.get_concurrency
         self.get_credit_usage = self._v2_client.get_credit_usage
@@ -209,17 +265,36 @@ class Firecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
         
         self.watcher = self._v2_client.watcher
+        self.job_scheduler = self._v2_client.job_scheduler
+        self.batch_feeder = self._v2_client.batch_feeder
+
+        self.scrape_many = self._v2_client.scrape_many
+        self.map_many = self._v2_client.map_many
+        self.batch_status_many = self._v2_client.batch_status_many
         
 class AsyncFirecrawl:
     """Async unified Firecrawl client (v2 by default, v1 under ``.v1``)."""
 
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        transport: Optional[Transport] = None,
+    ):
         self.api_key = api_key
         self.api_url = api_url
         
         # Initialize version-specific clients
         self._v1_client = AsyncV1FirecrawlApp(api_key=api_key, api_url=api_url) if AsyncV1FirecrawlApp else None
-        self._v2_client = AsyncFirecrawlClient(api_key=api_key, api_url=api_url) if AsyncFirecrawlClient else None
+        self._v2_client = AsyncFirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            hedge_policy=hedge_policy,
+            circuit_breakers=circuit_breakers,
+            transport=transport,
+        ) if AsyncFirecrawlClient else None
         
         # Create version-specific proxies
         self.v1 = AsyncV1Proxy(self._v1_client) if self._v1_client else None
@@ -229,10 +304,12 @@ class AsyncFirecrawl:
         # Keep method names aligned with the sync client
         self.scrape = self._v2_client.scrape
         self.search = self._v2_client.search
+        self.search_and_scrape = self._v2_client.search_and_scrape
         self.map = self._v2_client.map
 
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.get_crawl_columns = self._v2_client.get_crawl_columns
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.crawl = self._v2_client.crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
@@ -241,6 +318,7 @@ class AsyncFirecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.get_batch_scrape_columns = self._v2_client.get_batch_scrape_columns
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -248,6 +326,7 @@ class AsyncFirecrawl:
         self.start_extract = self._v2_client.start_extract
         self.get_extract_status = self._v2_client.get_extract_status
         self.extract = self._v2_client.extract
+        self.extract_many = self._v2_client.extract_many
 
         self.get_concurrency = self._v2_client.get_concurrency
         self.get_credit_usage = self._v2_client.get_credit_usage
@@ -255,6 +334,7 @@ class AsyncFirecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
 
         self.watcher = self._v2_client.watcher
+        self.job_scheduler = self._v2_client.job_scheduler
 
 # Export Firecrawl as an alias for FirecrawlApp
 FirecrawlApp = Firecrawl
@@ -0,0 +1,346 @@
+"""
+Prometheus exporter for Firecrawl queue, concurrency and usage telemetry.
+
+Samples ``get_queue_status``, ``get_concurrency``, ``get_credit_usage`` and
+``get_token_usage`` (and, less often, the historical usage endpoints) with
+one shared ``AsyncFirecrawlClient``, caches the latest values and serves them
+in the Prometheus text format on ``/metrics``.
+
+Each endpoint is sampled at most once per its interval, however many
+Prometheus replicas scrape the exporter: scrapes are answered from the cache.
+Set ``--interval`` to the Prometheus ``scrape_interval`` so every scrape sees
+a fresh sample. With ``--on-demand`` nothing is sampled in the background;
+a scrape refreshes stale endpoints first, and concurrent scrapes share that
+one refresh.
+
+Usage:
+    FIRECRAWL_API_KEY=fc-... python -m firecrawl.exporter --port 9712 --interval 15
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger("firecrawl")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LIVE_ENDPOINTS = ("queue_status", "concurrency", "credit_usage", "token_usage")
+HISTORICAL_ENDPOINTS = ("credit_usage_historical", "token_usage_historical")
+
+Labels = Dict[str, str]
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """Seconds since the epoch for a datetime or ISO-8601 string."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return value.timestamp() if isinstance(value, datetime) else None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metrics:
+    """Accumulates metric families in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def add(self, name: str, kind: str, help_text: str, samples: List[Tuple[Labels, Optional[float]]]) -> None:
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            self._lines.append(f"{name}{{{label_text}}} {float(value)!r}" if label_text else f"{name} {float(value)!r}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+class _Sample:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.value: Any = None
+        self.fetched_at: Optional[float] = None  # monotonic, last attempt
+        self.succeeded_at: Optional[float] = None  # wall clock, last success
+        self.duration: Optional[float] = None
+        self.ok = False
+        self.requests = 0
+        self.errors = 0
+
+    def stale(self, now: float) -> bool:
+        return self.fetched_at is None or now - self.fetched_at >= self.interval
+
+
+class TelemetryCache:
+    """
+    Latest values of the Firecrawl telemetry endpoints.
+
+    Endpoints are refreshed concurrently, each at most once per its interval;
+    a failed sample keeps the previous value and marks the endpoint down.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        interval: float = 15.0,
+        historical_interval: Optional[float] = 3600.0,
+        by_api_key: bool = False,
+    ) -> None:
+        """
+        Args:
+            client: AsyncFirecrawlClient used for every sample
+            interval: Seconds between samples of the live endpoints
+            historical_interval: Seconds between samples of the historical usage
+                endpoints (None to skip them)
+            by_api_key: Break historical usage down by API key
+        """
+        if interval <= 0 or (historical_interval is not None and historical_interval <= 0):
+            raise ValueError("Intervals must be positive")
+        self._client = client
+        self._by_api_key = by_api_key
+        self._samples: Dict[str, _Sample] = {name: _Sample(interval) for name in LIVE_ENDPOINTS}
+        if historical_interval is not None:
+            self._samples.update({name: _Sample(historical_interval) for name in HISTORICAL_ENDPOINTS})
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _fetcher(self, name: str) -> Callable[[], Awaitable[Any]]:
+        if name in HISTORICAL_ENDPOINTS:
+            return lambda: getattr(self._client, f"get_{name}")(by_api_key=self._by_api_key)
+        return getattr(self._client, f"get_{name}")
+
+    async def refresh(self, force: bool = False) -> None:
+        """Sample every endpoint whose value is older than its interval."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # Concurrent callers wait for one refresh instead of starting their own
+        async with self._lock:
+            now = time.monotonic()
+            due = [name for name, sample in self._samples.items() if force or sample.stale(now)]
+            if due:
+                await asyncio.gather(*(self._sample(name) for name in due))
+
+    async def _sample(self, name: str) -> None:
+        sample = self._samples[name]
+        started = time.monotonic()
+        sample.requests += 1
+        try:
+            sample.value = await self._fetcher(name)()
+            sample.ok = True
+            sample.succeeded_at = time.time()
+        except Exception as e:
+            sample.ok = False
+            sample.errors += 1
+            logger.warning("Failed to sample %s: %s", name, e)
+        finally:
+            sample.duration = time.monotonic() - started
+            sample.fetched_at = time.monotonic()
+
+    def next_due(self) -> float:
+        """Seconds until the next endpoint becomes stale."""
+        now = time.monotonic()
+        return max(0.0, min(
+            0.0 if sample.fetched_at is None else sample.fetched_at + sample.interval - now
+            for sample in self._samples.values()
+        ))
+
+    async def run(self) -> None:
+        """Refresh on schedule until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(max(self.next_due(), 0.05))
+
+    # Rendering
+
+    def render(self) -> str:
+        """Return the cached values in the Prometheus text format."""
+        metrics = _Metrics()
+        value = lambda name: self._samples[name].value if name in self._samples else None
+
+        queue = value("queue_status")
+        if queue is not None:
+            metrics.add("firecrawl_queue_jobs", "gauge", "Jobs in the team's scrape queue.", [
+                ({"state": "all"}, queue.jobs_in_queue),
+                ({"state": "active"}, queue.active_jobs_in_queue),
+                ({"state": "waiting"}, queue.waiting_jobs_in_queue),
+            ])
+            metrics.add("firecrawl_queue_max_concurrency", "gauge", "Maximum concurrency of the scrape queue.",
+                        [({}, queue.max_concurrency)])
+            metrics.add("firecrawl_queue_most_recent_success_timestamp_seconds", "gauge",
+                        "Time of the most recent successful job.", [({}, _timestamp(queue.most_recent_success))])
+
+        concurrency = value("concurrency")
+        if concurrency is not None:
+            metrics.add("firecrawl_concurrency", "gauge", "Current concurrency.", [({}, concurrency.concurrency)])
+            metrics.add("firecrawl_max_concurrency", "gauge", "Concurrency limit.", [({}, concurrency.max_concurrency)])
+
+        for name, unit in (("credit_usage", "credits"), ("token_usage", "tokens")):
+            usage = value(name)
+            if usage is None:
+                continue
+            metrics.add(f"firecrawl_remaining_{unit}", "gauge", f"Remaining {unit} in the billing period.",
+                        [({}, getattr(usage, f"remaining_{unit}"))])
+            metrics.add(f"firecrawl_plan_{unit}", "gauge", f"Plan {unit} per billing period.",
+                        [({}, getattr(usage, f"plan_{unit}"))])
+            metrics.add(f"firecrawl_{unit}_billing_period_end_timestamp_seconds", "gauge",
+                        f"End of the current {unit} billing period.", [({}, _timestamp(usage.billing_period_end))])
+
+        for name, unit, field in (
+            ("credit_usage_historical", "credits", "creditsUsed"),
+            ("token_usage_historical", "tokens", "tokensUsed"),
+        ):
+            history = value(name)
+            if history is None:
+                continue
+            samples = []
+            for period in history.periods:
+                labels = {"start": period.startDate or "", "end": period.endDate or ""}
+                if period.apiKey:
+                    labels["api_key"] = period.apiKey
+                samples.append((labels, getattr(period, field)))
+            metrics.add(f"firecrawl_{unit}_used", "gauge", f"{unit.capitalize()} used per billing period.", samples)
+
+        items = sorted(self._samples.items())
+        metrics.add("firecrawl_exporter_up", "gauge", "Whether the last sample of the endpoint succeeded.",
+                    [({"endpoint": n}, 1.0 if s.ok else 0.0) for n, s in items if s.fetched_at is not None])
+        metrics.add("firecrawl_exporter_last_success_timestamp_seconds", "gauge",
+                    "Time of the last successful sample.", [({"endpoint": n}, s.succeeded_at) for n, s in items])
+        metrics.add("firecrawl_exporter_sample_duration_seconds", "gauge", "Duration of the last sample.",
+                    [({"endpoint": n}, s.duration) for n, s in items])
+        metrics.add("firecrawl_exporter_api_requests_total", "counter", "Firecrawl API calls made by the exporter.",
+                    [({"endpoint": n}, s.requests) for n, s in items])
+        metrics.add("firecrawl_exporter_api_errors_total", "counter", "Failed Firecrawl API calls.",
+                    [({"endpoint": n}, s.errors) for n, s in items])
+        return metrics.render()
+
+
+class Exporter:
+    """HTTP server exposing a TelemetryCache on ``/metrics``."""
+
+    def __init__(
+        self,
+        cache: TelemetryCache,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 9712,
+        on_demand: bool = False,
+    ) -> None:
+        """
+        Args:
+            cache: Telemetry cache to serve
+            host: Interface to bind
+            port: Port to listen on (0 picks a free port)
+            on_demand: Refresh stale values when scraped instead of on a schedule
+        """
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.on_demand = on_demand
+        self._runner: Optional[web.AppRunner] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        if self.on_demand:
+            await self.cache.refresh()
+        return web.Response(body=self.cache.render().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    async def start(self) -> None:
+        """Start sampling (unless on demand) and listening."""
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            server = getattr(site, "_server", None)
+            if server is not None and server.sockets:
+                self.port = server.sockets[0].getsockname()[1]
+        self._runner = runner
+        if not self.on_demand:
+            self._task = asyncio.ensure_future(self.cache.run())
+
+    async def stop(self) -> None:
+        """Stop sampling and listening."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "Exporter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m firecrawl.exporter", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--api-key", default=os.getenv("FIRECRAWL_API_KEY"), help="defaults to FIRECRAWL_API_KEY")
+    parser.add_argument("--api-url", default=os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev"))
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9712)
+    parser.add_argument("--interval", type=float, default=15.0,
+                        help="seconds between samples of live endpoints; match the Prometheus scrape_interval")
+    parser.add_argument("--historical-interval", type=float, default=3600.0,
+                        help="seconds between samples of historical usage (0 disables them)")
+    parser.add_argument("--by-api-key", action="store_true", help="break historical usage down by API key")
+    parser.add_argument("--on-demand", action="store_true", help="sample only when scraped and values are stale")
+    return parser.parse_args(argv)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    from .v2.client_async import AsyncFirecrawlClient
+
+    client = AsyncFirecrawlClient(api_key=args.api_key, api_url=args.api_url)
+    cache = TelemetryCache(
+        client,
+        interval=args.interval,
+        historical_interval=args.historical_interval or None,
+        by_api_key=args.by_api_key,
+    )
+    async with Exporter(cache, host=args.host, port=args.port, on_demand=args.on_demand) as exporter:
+        logger.info("Serving Firecrawl metrics on http://%s:%d/metrics", exporter.host, exporter.port)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await client.async_http_client.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
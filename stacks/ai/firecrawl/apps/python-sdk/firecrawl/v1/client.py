@@ -14,16 +14,19 @@ Classes:
 import logging
 import os
 import time
-from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic
+from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic, Iterator
 import json
 from datetime import datetime
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import pydantic
 import websockets
 import aiohttp
 import asyncio
 
+from ..v2.utils.deadline import async_backoff_sleep, async_poll_sleep, backoff_sleep, poll_sleep, request_timeout
+
 logger : logging.Logger = logging.getLogger("firecrawl")
 
 def get_version():
@@ -499,13 +502,14 @@ class V1FirecrawlApp:
     This is used by the unified client to provide version-specific access
     through app.v1.method_name() patterns.
     """
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None, pool_maxsize: int = 10) -> None:
         """
         Initialize the V1FirecrawlApp instance with API key, API URL.
 
         Args:
             api_key (Optional[str]): API key for authenticating with the Firecrawl API.
             api_url (Optional[str]): Base URL for the Firecrawl API.
+            pool_maxsize (int): Maximum number of pooled connections kept per host.
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
@@ -514,9 +518,27 @@ class V1FirecrawlApp:
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
             logger.warning("No API key provided for cloud service")
             raise ValueError('No API key provided')
-            
+
+        # Pooled keep-alive connections shared by every sync request
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+        self._http_session.mount('https://', adapter)
+        self._http_session.mount('http://', adapter)
+
         logger.debug(f"Initialized V1FirecrawlApp with API URL: {self.api_url}")
 
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections used by this client.
+        """
+        self._http_session.close()
+
+    def __enter__(self) -> 'V1FirecrawlApp':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def scrape_url(
             self,
             url: str,
@@ -647,11 +669,11 @@ class V1FirecrawlApp:
             scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
 
         # Make request
-        response = requests.post(
+        response = self._http_session.post(
             f'{self.api_url}/v1/scrape',
             headers=_headers,
             json=scrape_params,
-            timeout=(timeout / 1000.0 + 5 if timeout is not None else None)
+            timeout=request_timeout(timeout / 1000.0 + 5 if timeout is not None else None)
         )
 
         if response.status_code == 200:
@@ -743,10 +765,11 @@ class V1FirecrawlApp:
             params_dict['integration'] = _integration
 
         # Make request
-        response = requests.post(
+        response = self._http_session.post(
             f"{self.api_url}/v1/search",
             headers={"Authorization": f"Bearer {self.api_key}"},
-            json=params_dict
+            json=params_dict,
+            timeout=request_timeout(None)
         )
 
         if response.status_code == 200:
@@ -1138,29 +1161,7 @@ class V1FirecrawlApp:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
-                    data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(next_data.get('data', []))
-                            status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
-                    status_data['data'] = data
+                    status_data = self._collect_result_pages(status_data, headers)
 
             response = {
                 'status': status_data.get('status'),
@@ -1396,10 +1397,11 @@ class V1FirecrawlApp:
             params_dict['integration'] = _integration
 
         # Make request
-        response = requests.post(
+        response = self._http_session.post(
             f"{self.api_url}/v1/map",
             headers={"Authorization": f"Bearer {self.api_key}"},
-            json=params_dict
+            json=params_dict,
+            timeout=request_timeout(None)
         )
 
         if response.status_code == 200:
@@ -1861,29 +1863,7 @@ class V1FirecrawlApp:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
-                    data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(next_data.get('data', []))
-                            status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
-                    status_data['data'] = data
+                    status_data = self._collect_result_pages(status_data, headers)
 
             return V1BatchScrapeStatusResponse(**{
                 'success': False if 'error' in status_data else True,
@@ -2033,7 +2013,7 @@ class V1FirecrawlApp:
                         else:
                             self._handle_error(status_response, "extract-status")
 
-                        time.sleep(2)  # Polling interval
+                        poll_sleep(2)  # Polling interval
                 else:
                     raise Exception(f'Failed to extract. Error: {data["error"]}')
             else:
@@ -2204,7 +2184,7 @@ class V1FirecrawlApp:
                     expiresAt=''
                 )
 
-            time.sleep(2)  # Polling interval
+            poll_sleep(2)  # Polling interval
 
     def async_generate_llms_text(
             self,
@@ -2349,13 +2329,8 @@ class V1FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
-        for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] / 1000.0 + 5) if "timeout" in data and data["timeout"] is not None else None))
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        timeout = (data["timeout"] / 1000.0 + 5) if "timeout" in data and data["timeout"] is not None else None
+        return self._request_with_retries('post', url, retries, backoff_factor, headers=headers, json=data, timeout=timeout)
 
     def _get_request(
             self,
@@ -2378,13 +2353,7 @@ class V1FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
-        for attempt in range(retries):
-            response = requests.get(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        return self._request_with_retries('get', url, retries, backoff_factor, headers=headers)
     
     def _delete_request(
             self,
@@ -2407,14 +2376,188 @@ class V1FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
+        return self._request_with_retries('delete', url, retries, backoff_factor, headers=headers)
+
+    def _request_with_retries(
+            self,
+            method: str,
+            url: str,
+            retries: int,
+            backoff_factor: float,
+            **kwargs: Any) -> requests.Response:
+        """
+        Send a request over the pooled session, retrying 502 responses.
+
+        Waits backoff_factor * (2 ** attempt) between attempts, or the server's
+        Retry-After value when one is given, and never sleeps after the final
+        attempt.
+
+        Args:
+            method (str): HTTP method name ("get", "post" or "delete").
+            url (str): The URL to send the request to.
+            retries (int): Number of attempts.
+            backoff_factor (float): Backoff factor for retries.
+            **kwargs: Passed through to requests.Session.request.
+
+        Returns:
+            requests.Response: The last response received.
+        """
+        response = None
+        timeout = kwargs.pop('timeout', None)
         for attempt in range(retries):
-            response = requests.delete(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
+            response = self._http_session.request(method, url, timeout=request_timeout(timeout), **kwargs)
+            if response.status_code != 502 or attempt == retries - 1:
                 return response
+            delay = backoff_factor * (2 ** attempt)
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            backoff_sleep(delay)
         return response
 
+    def _iter_result_pages(self, status_data: Dict[str, Any], headers: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a status payload and every page reachable through its ``next`` links.
+
+        Only one page is held at a time. Pagination stops quietly when a page is
+        empty, the ``next`` link is missing or a page request fails.
+
+        Args:
+            status_data (Dict[str, Any]): The first status payload.
+            headers (Dict[str, str]): The headers to include in page requests.
+
+        Yields:
+            Dict[str, Any]: Each page's parsed JSON payload.
+
+        Raises:
+            Exception: If a page is not valid JSON.
+        """
+        yield status_data
+        while 'next' in status_data:
+            if len(status_data.get('data', [])) == 0:
+                break
+            next_url = status_data.get('next')
+            if not next_url:
+                logger.warning("Expected 'next' URL is missing.")
+                break
+            try:
+                status_response = self._get_request(next_url, headers)
+            except requests.RequestException as e:
+                logger.error(f"Error during pagination request: {e}")
+                break
+            if status_response.status_code != 200:
+                logger.error(f"Failed to fetch next page: {status_response.status_code}")
+                break
+            try:
+                status_data = status_response.json()
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            yield status_data
+
+    def _collect_result_pages(self, status_data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Follow ``next`` links and return the last page with all documents merged into ``data``.
+        """
+        data: List[Any] = []
+        last = status_data
+        for page in self._iter_result_pages(status_data, headers):
+            data.extend(page.get('data', []))
+            last = page
+        last = dict(last)
+        last['data'] = data
+        return last
+
+    def _iter_job_results(
+            self,
+            endpoint: str,
+            action: str,
+            wait: bool,
+            poll_interval: int) -> Iterator[V1FirecrawlDocument]:
+        """
+        Wait for a crawl or batch job and stream its documents page by page.
+
+        Args:
+            endpoint (str): Status endpoint path, e.g. "/v1/crawl/{id}".
+            action (str): Description used in error messages.
+            wait (bool): Poll until the job finishes before streaming.
+            poll_interval (int): Seconds between status checks.
+
+        Yields:
+            V1FirecrawlDocument: Each result document, in API order.
+
+        Raises:
+            Exception: If the job fails or a status check fails.
+        """
+        headers = self._prepare_headers()
+        while True:
+            response = self._get_request(f'{self.api_url}{endpoint}', headers)
+            if response.status_code != 200:
+                self._handle_error(response, action)
+            try:
+                status_data = response.json()
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            status = status_data.get('status')
+            if status in ['failed', 'cancelled']:
+                raise Exception(f'Job failed or was stopped. Status: {status}')
+            if status == 'completed' or not wait:
+                break
+            poll_sleep(max(poll_interval, 2))
+
+        for page in self._iter_result_pages(status_data, headers):
+            for doc in page.get('data', []):
+                yield V1FirecrawlDocument(**doc)
+
+    def iter_crawl_url_results(
+            self,
+            id: str,
+            *,
+            wait: bool = True,
+            poll_interval: int = 2) -> Iterator[V1FirecrawlDocument]:
+        """
+        Stream the documents of a crawl job page by page.
+
+        Unlike check_crawl_status, results are never accumulated: each page is
+        fetched over the pooled connection only when the previous one has been
+        consumed, so memory stays constant regardless of crawl size.
+
+        Args:
+            id (str): The ID of the crawl job.
+            wait (bool): Wait for the crawl to complete before streaming (default: True).
+                When False, the results available right now are streamed.
+            poll_interval (int): Seconds between status checks while waiting.
+
+        Yields:
+            V1FirecrawlDocument: Each crawled document.
+
+        Raises:
+            Exception: If the crawl fails or a status check fails.
+        """
+        return self._iter_job_results(f'/v1/crawl/{id}', 'check crawl status', wait, poll_interval)
+
+    def iter_batch_results(
+            self,
+            id: str,
+            *,
+            wait: bool = True,
+            poll_interval: int = 2) -> Iterator[V1FirecrawlDocument]:
+        """
+        Stream the documents of a batch scrape job page by page.
+
+        Args:
+            id (str): The ID of the batch scrape job.
+            wait (bool): Wait for the batch to complete before streaming (default: True).
+                When False, the results available right now are streamed.
+            poll_interval (int): Seconds between status checks while waiting.
+
+        Yields:
+            V1FirecrawlDocument: Each scraped document.
+
+        Raises:
+            Exception: If the batch fails or a status check fails.
+        """
+        return self._iter_job_results(f'/v1/batch/scrape/{id}', 'check batch scrape status', wait, poll_interval)
+
     def _monitor_job_status(
             self,
             id: str,
@@ -2445,23 +2588,12 @@ class V1FirecrawlApp:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if status_data['status'] == 'completed':
                     if 'data' in status_data:
-                        data = status_data['data']
-                        while 'next' in status_data:
-                            if len(status_data['data']) == 0:
-                                break
-                            status_response = self._get_request(status_data['next'], headers)
-                            try:
-                                status_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(status_data.get('data', []))
-                        status_data['data'] = data
-                        return V1CrawlStatusResponse(**status_data)
+                        return V1CrawlStatusResponse(**self._collect_result_pages(status_data, headers))
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
                     poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
+                    poll_sleep(poll_interval)  # Wait for the specified interval before checking again
                 else:
                     raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
             else:
@@ -2622,7 +2754,7 @@ class V1FirecrawlApp:
             elif status['status'] != 'processing':
                 break
 
-            time.sleep(2)  # Polling interval
+            poll_sleep(2)  # Polling interval
 
         return {'success': False, 'error': 'Deep research job terminated unexpectedly'}
 
@@ -2905,9 +3037,98 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
     Provides non-blocking alternatives to all V1FirecrawlApp operations.
     """
 
-    def __init__(self, api_key: str, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+            self,
+            api_key: str,
+            api_url: str = "https://api.firecrawl.dev",
+            connection_limit: int = 100,
+            connection_limit_per_host: int = 0,
+            dns_cache_ttl: Optional[int] = 300):
+        """
+        Initialize the AsyncV1FirecrawlApp instance.
+
+        A single aiohttp.ClientSession is created lazily on first use and reused
+        for every request, so connections, DNS lookups and TLS sessions are
+        kept alive between calls. Call close() (or use the app as an async
+        context manager) to release it.
+
+        Args:
+            api_key (str): API key for authenticating with the Firecrawl API.
+            api_url (str): Base URL for the Firecrawl API.
+            connection_limit (int): Maximum number of simultaneous connections (0 for no limit).
+            connection_limit_per_host (int): Maximum simultaneous connections per host (0 for no limit).
+            dns_cache_ttl (Optional[int]): Seconds to cache DNS lookups (None to cache forever).
+        """
         # Reuse V1 helpers (_prepare_headers, _validate_kwargs, _ensure_schema_dict, _get_error_message)
         super().__init__(api_key=api_key, api_url=api_url)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared ClientSession, creating it on first use.
+
+        Sessions are bound to the event loop they were created in, so a new one
+        is opened if the app is reused from a different loop (e.g. across
+        separate asyncio.run() calls) and the old one is closed.
+
+        Returns:
+            aiohttp.ClientSession: The session used for all API requests.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return self._session
+        if self._session is not None and not self._session.closed:
+            logger.debug("Replacing aiohttp session bound to a different event loop")
+            await self._close_foreign_session(self._session, self._session_loop)
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    async def _close_foreign_session(
+            session: aiohttp.ClientSession,
+            session_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Close a session created in another event loop.
+
+        A session whose loop is still running (in another thread) is closed on
+        that loop. Otherwise its connector is closed from here: once the loop
+        has stopped there is nothing left to wait for.
+        """
+        if session_loop is not None and session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        try:
+            await session.connector.close()
+        except RuntimeError:
+            # The connector's loop is stopped but not closed; its transports are already closed
+            pass
+
+    async def close(self) -> None:
+        """
+        Close the shared ClientSession and its connection pool.
+        """
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+        self._http_session.close()
+
+    async def __aenter__(self) -> 'AsyncV1FirecrawlApp':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     async def _async_request(
             self,
@@ -2936,23 +3157,25 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             aiohttp.ClientError: If the request fails after all retries.
             Exception: If max retries are exceeded or other errors occur.
         """
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(retries):
-                try:
-                    async with session.request(
-                        method=method, url=url, headers=headers, json=data
-                    ) as response:
-                        if response.status == 502:
-                            await asyncio.sleep(backoff_factor * (2 ** attempt))
-                            continue
-                        if response.status >= 300:
-                            await self._handle_error(response, f"make {method} request")
-                        return await response.json()
-                except aiohttp.ClientError as e:
-                    if attempt == retries - 1:
-                        raise e
-                    await asyncio.sleep(backoff_factor * (2 ** attempt))
-            raise Exception("Max retries exceeded")
+        session = await self._get_session()
+        for attempt in range(retries):
+            try:
+                remaining = request_timeout(None)
+                request_kwargs = {'timeout': aiohttp.ClientTimeout(total=remaining)} if remaining is not None else {}
+                async with session.request(
+                    method=method, url=url, headers=headers, json=data, **request_kwargs
+                ) as response:
+                    if response.status == 502:
+                        await async_backoff_sleep(backoff_factor * (2 ** attempt))
+                        continue
+                    if response.status >= 300:
+                        await self._handle_error(response, f"make {method} request")
+                    return await response.json()
+            except aiohttp.ClientError as e:
+                if attempt == retries - 1:
+                    raise e
+                await async_backoff_sleep(backoff_factor * (2 ** attempt))
+        raise Exception("Max retries exceeded")
 
     async def _async_post_request(
             self, url: str, data: Dict[str, Any], headers: Dict[str, str],
@@ -3900,7 +4123,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
                 else:
                     raise Exception('Job completed but no data was returned')
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                await asyncio.sleep(max(poll_interval, 2))
+                await async_poll_sleep(max(poll_interval, 2))
             else:
                 raise Exception(f'Job failed or was stopped. Status: {status_data["status"]}')
 
@@ -4066,7 +4289,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
                 elif status_data['status'] in ['failed', 'cancelled']:
                     raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
 
-                await asyncio.sleep(2)
+                await async_poll_sleep(2)
         else:
             raise Exception(f'Failed to extract. Error: {response.get("error")}')
 
@@ -4204,9 +4427,9 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             Exception: If cancellation fails
         """
         headers = self._prepare_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
-                return await response.json()
+        session = await self._get_session()
+        async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
+            return await response.json()
 
     async def get_extract_status(self, job_id: str) -> V1ExtractResponse[Any]:
         """
@@ -4362,7 +4585,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            await async_poll_sleep(2)
 
         return V1GenerateLLMsTextStatusResponse(success=False, error='LLMs.txt generation job terminated unexpectedly', status='failed', expiresAt='')
 
@@ -4542,7 +4765,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            await async_poll_sleep(2)
 
         return V1DeepResearchStatusResponse(success=False, error='Deep research job terminated unexpectedly')
 
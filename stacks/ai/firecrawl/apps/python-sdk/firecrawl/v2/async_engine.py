@@ -0,0 +1,168 @@
+"""
+Background async engine for the sync client.
+
+An :class:`AsyncEngine` owns an event loop on a daemon thread and drives one
+shared ``AsyncFirecrawlClient`` on it. Sync code submits calls and gets
+``concurrent.futures.Future`` objects back, so many requests run concurrently
+on one thread (bounded by ``max_concurrency``) instead of one blocking
+``requests`` call per thread.
+
+Usage:
+    client = Firecrawl(api_key="...")
+    futures = client.scrape_many(urls, formats=["markdown"])
+    for future in concurrent.futures.as_completed(futures):
+        print(future.result().metadata.source_url)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from .types import PaginationConfig
+from .utils.projection import Fields
+
+T = TypeVar("T")
+
+
+class AsyncEngine:
+    """Run calls on a shared async client from sync code."""
+
+    def __init__(self, client: Any, *, max_concurrency: int = 16) -> None:
+        """
+        Args:
+            client: AsyncFirecrawlClient used for every call
+            max_concurrency: Maximum calls in flight at once
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # Submission
+
+    def submit(self, call: Callable[[Any], Awaitable[T]]) -> "Future[T]":
+        """
+        Schedule ``call(client)`` on the engine's loop.
+
+        Args:
+            call: Coroutine function taking the AsyncFirecrawlClient
+
+        Returns:
+            Future resolved with the call's result
+        """
+        loop = self._ensure_loop()
+
+        async def guarded() -> T:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                return await call(self.client)
+
+        return asyncio.run_coroutine_threadsafe(guarded(), loop)
+
+    def map(self, call: Callable[[Any, Any], Awaitable[T]], items: Iterable[Any]) -> "List[Future[T]]":
+        """Schedule ``call(client, item)`` for every item; futures are in input order."""
+        return [self.submit(lambda client, item=item: call(client, item)) for item in items]
+
+    def scrape_many(self, urls: Iterable[str], **kwargs: Any) -> List[Future]:
+        """
+        Scrape URLs concurrently.
+
+        Args:
+            urls: URLs to scrape
+            **kwargs: Scrape options (as for ``scrape``)
+
+        Returns:
+            One Future per URL resolving to its Document, in input order
+        """
+        return self.map(lambda client, url: client.scrape(url, **kwargs), urls)
+
+    def map_many(self, urls: Iterable[str], **kwargs: Any) -> List[Future]:
+        """
+        Map sites concurrently.
+
+        Args:
+            urls: Site URLs to map
+            **kwargs: Map options (as for ``map``)
+
+        Returns:
+            One Future per URL resolving to its MapData, in input order
+        """
+        return self.map(lambda client, url: client.map(url, **kwargs), urls)
+
+    def batch_status_many(
+        self,
+        job_ids: Iterable[str],
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
+    ) -> List[Future]:
+        """
+        Fetch the status of several batch scrape jobs concurrently.
+
+        Returns:
+            One Future per job id resolving to its BatchScrapeJob, in input order
+        """
+        return self.map(
+            lambda client, job_id: client.get_batch_scrape_status(
+                job_id, pagination_config=pagination_config, fields=fields
+            ),
+            job_ids,
+        )
+
+    # Lifecycle
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Cancel pending calls, close the async client and stop the loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            current = asyncio.current_task()
+            for task in asyncio.all_tasks():
+                if task is not current:
+                    task.cancel()
+            await self.client.async_http_client.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+
+    def __enter__(self) -> "AsyncEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Internals
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncEngine is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, args=(loop,), name="firecrawl-async-engine", daemon=True)
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
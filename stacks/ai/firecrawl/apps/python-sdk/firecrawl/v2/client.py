@@ -5,7 +5,10 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+import threading
+import uuid
+from concurrent.futures import Future
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union, Literal
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -38,8 +41,19 @@ from .types import (
     Location,
     PaginationConfig,
     AgentOptions,
+    RecrawlResult,
+    CrawlShard,
+    ExtractPartitionResult,
+    BatchScrapeJob,
 )
 from .utils.http_client import HttpClient
+from .utils.batch_index import BatchResultIndex
+from .utils.decoder_pool import DecoderPool
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreakerRegistry
+from .utils.cassette import Transport
+from .utils.columnar import ColumnarResults, fetch_columns
+from .utils.projection import Fields
 from .utils.error_handler import FirecrawlError
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
@@ -49,7 +63,13 @@ from .methods import map as map_module
 from .methods import batch as batch_methods
 from .methods import usage as usage_methods
 from .methods import extract as extract_module
+from .methods import recrawl as recrawl_module
+from .methods import crawl_planner as crawl_planner_module
+from .methods import search_scrape as search_scrape_module
 from .watcher import Watcher
+from .feeder import BatchFeeder
+from .async_engine import AsyncEngine
+from .scheduler import JobScheduler
 
 class FirecrawlClient:
     """
@@ -64,7 +84,12 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        decoder_pool: Optional[DecoderPool] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        transport: Optional[Transport] = None,
+        max_parallel_requests: int = 16,
     ):
         """
         Initialize the Firecrawl client.
@@ -75,6 +100,11 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            decoder_pool: Process pool decoding large crawl/batch result pages (opt-in)
+            hedge_policy: Send a duplicate of slow scrape() requests (opt-in)
+            circuit_breakers: Fail fast on endpoint families whose circuit is open (opt-in)
+            transport: Record requests to, or replay them from, a cassette (opt-in)
+            max_parallel_requests: Concurrent requests of scrape_many/map_many/batch_status_many
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -94,6 +124,31 @@ class FirecrawlClient:
         )
         
         self.http_client = HttpClient(api_key, api_url)
+        self.http_client.decoder_pool = decoder_pool
+        self.http_client.circuit_breakers = circuit_breakers
+        self.http_client.transport = transport
+        self.hedge_policy = hedge_policy
+        self.max_parallel_requests = max_parallel_requests
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_engine_lock = threading.Lock()
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """Shared AsyncEngine behind the *_many methods, started on first use."""
+        with self._async_engine_lock:
+            if self._async_engine is None:
+                # Imported here: client_async is only needed once parallel calls are used
+                from .client_async import AsyncFirecrawlClient
+
+                async_client = AsyncFirecrawlClient(
+                    api_key=self.config.api_key,
+                    api_url=self.config.api_url,
+                    hedge_policy=self.hedge_policy,
+                    circuit_breakers=self.http_client.circuit_breakers,
+                    transport=self.http_client.transport,
+                )
+                self._async_engine = AsyncEngine(async_client, max_concurrency=self.max_parallel_requests)
+            return self._async_engine
     
     def scrape(
         self,
@@ -170,6 +225,12 @@ class FirecrawlClient:
                 integration=integration,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache, integration]) else None
+        if self.hedge_policy is not None:
+            # Hedged duplicates share one idempotency key
+            key = str(uuid.uuid4())
+            return self.hedge_policy.run(
+                lambda: scrape_module.scrape(self.http_client, url, options, idempotency_key=key)
+            )
         return scrape_module.scrape(self.http_client, url, options)
 
     def search(
@@ -214,6 +275,64 @@ class FirecrawlClient:
         )
 
         return search_module.search(self.http_client, request)
+
+    def search_and_scrape(
+        self,
+        query: str,
+        *,
+        top_k: int = 5,
+        sources: Optional[List[SourceOption]] = None,
+        categories: Optional[List[CategoryOption]] = None,
+        limit: Optional[int] = None,
+        tbs: Optional[str] = None,
+        location: Optional[str] = None,
+        ignore_invalid_urls: Optional[bool] = None,
+        timeout: Optional[int] = None,
+        scrape_options: Optional[ScrapeOptions] = None,
+        max_workers: Optional[int] = None,
+        stop_when: Optional[Callable[[Document], bool]] = None,
+        integration: Optional[str] = None,
+    ) -> search_scrape_module.SearchScrapeStream:
+        """
+        Search, then scrape the top results concurrently.
+
+        The search hits are available immediately on the returned stream's
+        ``hits``; iterating the stream yields documents as each scrape finishes.
+
+        Args:
+            query: Search query string
+            top_k: Number of top result URLs to scrape
+            limit: Maximum number of search results to return
+            tbs: Time-based search filter
+            location: Location string for search
+            timeout: Search request timeout in milliseconds
+            scrape_options: Options for scraping each result
+            max_workers: Maximum concurrent scrapes (default: top_k)
+            stop_when: Predicate that ends the stream once a document matches
+
+        Returns:
+            SearchScrapeStream with ``hits`` and an iterator over scraped documents
+        """
+        request = SearchRequest(
+            query=query,
+            sources=sources,
+            categories=categories,
+            limit=limit if limit is not None else max(top_k, 5),
+            tbs=tbs,
+            location=location,
+            ignore_invalid_urls=ignore_invalid_urls,
+            timeout=timeout,
+            integration=integration,
+        )
+
+        return search_scrape_module.search_and_scrape(
+            self.http_client,
+            request,
+            top_k=top_k,
+            options=scrape_options,
+            max_workers=max_workers,
+            stop_when=stop_when,
+        )
     
     def crawl(
         self,
@@ -237,6 +356,7 @@ class FirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        fields: Optional[Fields] = None,
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -260,6 +380,8 @@ class FirecrawlClient:
             zero_data_retention: Whether to delete data after 24 hours
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None for no timeout)
+            fields: Document fields to keep (e.g. ["markdown", "title"]); also
+                requests only the formats they need unless scrape_options sets formats
             
         Returns:
             CrawlJob when job completes
@@ -293,7 +415,8 @@ class FirecrawlClient:
             self.http_client, 
             request, 
             poll_interval=poll_interval, 
-            timeout=timeout
+            timeout=timeout,
+            fields=fields,
         )
     
     def start_crawl(
@@ -370,7 +493,8 @@ class FirecrawlClient:
     def get_crawl_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -378,6 +502,7 @@ class FirecrawlClient:
         Args:
             job_id: ID of the crawl job
             pagination_config: Optional configuration for pagination behavior
+            fields: Document fields to keep; others are dropped while decoding
             
         Returns:
             CrawlJob with current status and data
@@ -388,9 +513,31 @@ class FirecrawlClient:
         return crawl_module.get_crawl_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            fields=fields,
         )
     
+    def get_crawl_columns(
+        self,
+        job_id: str,
+        columns: Optional[List[str]] = None,
+        pagination_config: Optional[PaginationConfig] = None,
+    ) -> ColumnarResults:
+        """
+        Get a crawl's results as columns, without building Document models.
+
+        Args:
+            job_id: ID of the crawl job
+            columns: Document/metadata fields to keep (default: common metadata plus markdown)
+            pagination_config: Optional configuration for pagination behavior
+
+        Returns:
+            ColumnarResults with one chunk per result page
+        """
+        return fetch_columns(
+            self.http_client, f"/v2/crawl/{job_id}", "get crawl status", columns, pagination_config
+        )
+
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
         """
         Retrieve error details and robots.txt blocks for a given crawl job.
@@ -457,7 +604,231 @@ class FirecrawlClient:
         ) if any(v is not None for v in [search, include_subdomains, limit, sitemap, timeout, integration, location]) else None
 
         return map_module.map(self.http_client, url, options)
+
+    def scrape_many(self, urls: List[str], **kwargs) -> List["Future[Document]"]:
+        """Scrape URLs concurrently on the shared async engine.
+
+        Args:
+            urls: URLs to scrape
+            **kwargs: Scrape options, as for scrape()
+
+        Returns:
+            One Future per URL resolving to its Document, in input order
+            (use concurrent.futures.as_completed to handle them as they finish)
+        """
+        return self.async_engine.scrape_many(urls, **kwargs)
+
+    def map_many(self, urls: List[str], **kwargs) -> List["Future[MapData]"]:
+        """Map several sites concurrently on the shared async engine.
+
+        Args:
+            urls: Root URLs to map
+            **kwargs: Map options, as for map()
+
+        Returns:
+            One Future per URL resolving to its MapData, in input order
+        """
+        return self.async_engine.map_many(urls, **kwargs)
+
+    def batch_status_many(
+        self,
+        job_ids: List[str],
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
+    ) -> List[Future]:
+        """Fetch the status of several batch scrape jobs concurrently on the shared async engine.
+
+        Args:
+            job_ids: Batch job IDs
+            pagination_config: Optional configuration for pagination behavior
+            fields: Document fields to keep
+
+        Returns:
+            One Future per job resolving to its BatchScrapeJob, in input order
+        """
+        return self.async_engine.batch_status_many(job_ids, pagination_config=pagination_config, fields=fields)
     
+    def recrawl(
+        self,
+        url: str,
+        manifest_path: str,
+        *,
+        search: Optional[str] = None,
+        include_subdomains: Optional[bool] = None,
+        limit: Optional[int] = None,
+        sitemap: Optional[Literal["only", "include", "skip"]] = None,
+        scrape_options: Optional[ScrapeOptions] = None,
+        tag: Optional[str] = None,
+        min_age: Optional[int] = None,
+        probe_etags: bool = False,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+    ) -> RecrawlResult:
+        """Re-crawl a site, scraping only pages that are new or modified.
+
+        Args:
+            url: Root URL to map
+            manifest_path: Local manifest file tracking URL, hash, ETag and timestamps
+            search: Optional substring filter for discovered links
+            include_subdomains: Whether to include subdomains
+            limit: Maximum number of links to map
+            sitemap: Sitemap usage mode ("only" | "include" | "skip")
+            scrape_options: Page scraping configuration
+            tag: Change tracking tag
+            min_age: Skip pages checked less than this many seconds ago
+            probe_etags: Skip pages whose origin ETag is unchanged
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait per batch (None for no timeout)
+
+        Returns:
+            RecrawlResult with new/changed/unchanged/removed URLs and changed documents
+        """
+        map_options = MapOptions(
+            search=search,
+            include_subdomains=include_subdomains,
+            limit=limit,
+            sitemap=sitemap if sitemap is not None else "include",
+        ) if any(v is not None for v in [search, include_subdomains, limit, sitemap]) else None
+
+        return recrawl_module.recrawl(
+            self.http_client,
+            url,
+            manifest_path,
+            map_options=map_options,
+            scrape_options=scrape_options,
+            tag=tag,
+            min_age=min_age,
+            probe_etags=probe_etags,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    def plan_crawl(
+        self,
+        url: str,
+        *,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        max_discovery_depth: Optional[int] = None,
+        allow_subdomains: bool = False,
+        allow_external_links: bool = False,
+        limit: Optional[int] = None,
+        sitemap: Optional[Literal["only", "include", "skip"]] = None,
+        map_limit: int = 100000,
+        shard_depth: int = 1,
+        max_shard_size: int = 1000,
+    ) -> List[CrawlShard]:
+        """Map a site and split the matching URLs into path-prefix shards.
+
+        Args:
+            url: Root URL to map
+            include_paths: Regex patterns a URL path must match
+            exclude_paths: Regex patterns that reject a URL path
+            max_discovery_depth: Maximum number of path segments
+            allow_subdomains: Keep URLs on subdomains of the root host
+            allow_external_links: Keep URLs on other hosts
+            limit: Maximum number of URLs to scrape
+            sitemap: Sitemap usage mode ("only" | "include" | "skip")
+            map_limit: Maximum URLs requested from ``map()`` before local filtering
+            shard_depth: Number of leading path segments forming a shard prefix
+            max_shard_size: Maximum URLs per shard (at most 1000)
+
+        Returns:
+            List of CrawlShard objects
+        """
+        return crawl_planner_module.plan_crawl(
+            self.http_client,
+            url,
+            map_options=self._planner_map_options(allow_subdomains, sitemap, map_limit),
+            include_paths=include_paths,
+            exclude_paths=exclude_paths,
+            max_discovery_depth=max_discovery_depth,
+            allow_subdomains=allow_subdomains,
+            allow_external_links=allow_external_links,
+            limit=limit,
+            shard_depth=shard_depth,
+            max_shard_size=max_shard_size,
+        )
+
+    def sharded_crawl(
+        self,
+        url: str,
+        *,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        max_discovery_depth: Optional[int] = None,
+        allow_subdomains: bool = False,
+        allow_external_links: bool = False,
+        limit: Optional[int] = None,
+        sitemap: Optional[Literal["only", "include", "skip"]] = None,
+        map_limit: int = 100000,
+        scrape_options: Optional[ScrapeOptions] = None,
+        shard_depth: int = 1,
+        max_shard_size: int = 1000,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+    ) -> Iterator[Document]:
+        """Crawl a large site as parallel batch scrape jobs planned from ``map()``.
+
+        The crawl's include/exclude rules are applied locally to the mapped
+        URLs, which are sharded by path prefix and scraped as independent
+        batch jobs. Documents are streamed as each shard completes.
+
+        Args:
+            url: Root URL to map
+            include_paths: Regex patterns a URL path must match
+            exclude_paths: Regex patterns that reject a URL path
+            max_discovery_depth: Maximum number of path segments
+            allow_subdomains: Keep URLs on subdomains of the root host
+            allow_external_links: Keep URLs on other hosts
+            limit: Maximum number of URLs to scrape
+            sitemap: Sitemap usage mode ("only" | "include" | "skip")
+            map_limit: Maximum URLs requested from ``map()`` before local filtering
+            scrape_options: Page scraping configuration
+            shard_depth: Number of leading path segments forming a shard prefix
+            max_shard_size: Maximum URLs per shard (at most 1000)
+            max_workers: Maximum number of shard jobs in flight (default 4)
+            max_concurrency: Per-job concurrency (default: team limit split across workers)
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait per shard (None for no timeout)
+
+        Returns:
+            Iterator over documents from all shards, in completion order
+        """
+        return crawl_planner_module.sharded_crawl(
+            self.http_client,
+            url,
+            map_options=self._planner_map_options(allow_subdomains, sitemap, map_limit),
+            include_paths=include_paths,
+            exclude_paths=exclude_paths,
+            max_discovery_depth=max_discovery_depth,
+            allow_subdomains=allow_subdomains,
+            allow_external_links=allow_external_links,
+            limit=limit,
+            scrape_options=scrape_options,
+            shard_depth=shard_depth,
+            max_shard_size=max_shard_size,
+            max_workers=max_workers,
+            max_concurrency=max_concurrency,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _planner_map_options(
+        allow_subdomains: bool,
+        sitemap: Optional[Literal["only", "include", "skip"]],
+        map_limit: int,
+    ) -> MapOptions:
+        # Map as widely as allowed; filtering and limits are applied locally
+        return MapOptions(
+            include_subdomains=allow_subdomains,
+            limit=map_limit,
+            sitemap=sitemap if sitemap is not None else "include",
+        )
+
     def cancel_crawl(self, crawl_id: str) -> bool:
         """
         Cancel a crawl job.
@@ -583,6 +954,67 @@ class FirecrawlClient:
             agent=agent,
         )
 
+    def extract_many(
+        self,
+        urls: List[str],
+        *,
+        partition_by: Literal["domain", "size"] = "domain",
+        max_urls_per_job: int = 25,
+        max_workers: Optional[int] = None,
+        prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
+        allow_external_links: Optional[bool] = None,
+        enable_web_search: Optional[bool] = None,
+        show_sources: Optional[bool] = None,
+        scrape_options: Optional['ScrapeOptions'] = None,
+        ignore_invalid_urls: Optional[bool] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        integration: Optional[str] = None,
+        agent: Optional[AgentOptions] = None,
+    ) -> Iterator[ExtractPartitionResult]:
+        """Extract from many URLs as concurrent jobs, streaming per-partition results.
+
+        URLs are partitioned by domain or in fixed-size chunks, each partition
+        runs as its own extract job and results are yielded as jobs finish. A
+        failed partition is reported with ``error`` set and does not affect the
+        others. Combine the results with ``firecrawl.merge_extract_data(results, schema)``.
+
+        Args:
+            urls: URLs to extract from
+            partition_by: "domain" (one host per job) or "size" (chunks in order)
+            max_urls_per_job: Maximum URLs per extract job
+            max_workers: Maximum number of extract jobs in flight (default 4)
+            prompt: Natural-language instruction for extraction
+            schema: Target JSON schema for the output
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait per partition (None for no timeout)
+            Other arguments are as for extract().
+
+        Returns:
+            Iterator over ExtractPartitionResult objects, in completion order
+        """
+        return extract_module.extract_many(
+            self.http_client,
+            urls,
+            partition_by=partition_by,
+            max_urls_per_job=max_urls_per_job,
+            max_workers=max_workers,
+            prompt=prompt,
+            schema=schema,
+            system_prompt=system_prompt,
+            allow_external_links=allow_external_links,
+            enable_web_search=enable_web_search,
+            show_sources=show_sources,
+            scrape_options=scrape_options,
+            ignore_invalid_urls=ignore_invalid_urls,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            integration=integration,
+            agent=agent,
+        )
+
     def start_batch_scrape(
         self,
         urls: List[str],
@@ -613,6 +1045,7 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        canonicalize_urls: bool = False,
     ):
         """Start a batch scrape job over multiple URLs (non-blocking).
 
@@ -644,6 +1077,8 @@ class FirecrawlClient:
             zero_data_retention: Delete data after 24 hours
             integration: Integration tag/name
             idempotency_key: Header used to deduplicate starts
+            canonicalize_urls: Canonicalize and deduplicate URLs before submitting
+                (lists over 1000 URLs are always submitted in appended chunks)
 
         Returns:
             Response payload with job id (poll with get_batch_scrape_status)
@@ -683,18 +1118,21 @@ class FirecrawlClient:
             zero_data_retention=zero_data_retention,
             integration=integration,
             idempotency_key=idempotency_key,
+            canonicalize_urls=canonicalize_urls,
         )
 
     def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
     ):
         """Get current status and any scraped data for a batch job.
 
         Args:
             job_id: Batch job ID
             pagination_config: Optional configuration for pagination behavior
+            fields: Document fields to keep; others are dropped while decoding
 
         Returns:
             Status payload including counts and partial data
@@ -702,7 +1140,28 @@ class FirecrawlClient:
         return batch_module.get_batch_scrape_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            fields=fields,
+        )
+
+    def get_batch_scrape_columns(
+        self,
+        job_id: str,
+        columns: Optional[List[str]] = None,
+        pagination_config: Optional[PaginationConfig] = None,
+    ) -> ColumnarResults:
+        """Get a batch job's results as columns, without building Document models.
+
+        Args:
+            job_id: Batch job ID
+            columns: Document/metadata fields to keep (default: common metadata plus markdown)
+            pagination_config: Optional configuration for pagination behavior
+
+        Returns:
+            ColumnarResults with one chunk per result page
+        """
+        return fetch_columns(
+            self.http_client, f"/v2/batch/scrape/{job_id}", "get batch scrape status", columns, pagination_config
         )
 
     def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -727,6 +1186,25 @@ class FirecrawlClient:
         """
         return batch_methods.get_batch_scrape_errors(self.http_client, job_id)
 
+    def index_batch_results(
+        self,
+        job: BatchScrapeJob,
+        urls: List[str],
+        *,
+        include_errors: bool = True,
+    ) -> BatchResultIndex:
+        """Index a batch's documents by submitted URL and join its errors.
+
+        Args:
+            job: Batch scrape job returned by batch_scrape/get_batch_scrape_status
+            urls: URLs that were submitted
+            include_errors: Also fetch the job's errors to populate ``failed``
+
+        Returns:
+            BatchResultIndex; ``index.gaps`` can be passed straight back to batch_scrape
+        """
+        return batch_methods.index_batch_results(self.http_client, job, urls, include_errors=include_errors)
+
     def get_extract_status(self, job_id: str):
         """Get the current status (and data if completed) of an extract job.
 
@@ -769,6 +1247,7 @@ class FirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
     ) -> Watcher:
         """Create a watcher for crawl or batch jobs.
 
@@ -777,11 +1256,87 @@ class FirecrawlClient:
             kind: Job kind ("crawl" or "batch")
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to watch (None for no timeout)
+            fields: Document fields to keep; others are dropped as documents arrive
 
         Returns:
             Watcher instance
         """
-        return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout, fields=fields)
+
+    def job_scheduler(
+        self,
+        *,
+        max_polls_per_second: float = 5.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> JobScheduler:
+        """Create a scheduler that polls many crawl, batch and extract jobs from one thread.
+
+        Args:
+            max_polls_per_second: Global cap on status requests across all jobs
+            min_interval: Minimum seconds between checks of the same job
+            max_interval: Maximum seconds between checks of the same job
+
+        Returns:
+            JobScheduler instance
+        """
+        return JobScheduler(
+            self.http_client,
+            max_polls_per_second=max_polls_per_second,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    def batch_feeder(
+        self,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        max_delay: float = 5.0,
+        max_concurrency: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        poll_interval: float = 2.0,
+        ignore_invalid_urls: bool = True,
+        canonicalize_urls: bool = False,
+        webhook: Optional[Union[str, WebhookConfig]] = None,
+        zero_data_retention: Optional[bool] = None,
+        integration: Optional[str] = None,
+        fields: Optional[Fields] = None,
+    ) -> BatchFeeder:
+        """Create a feeder that streams URLs into one growing batch scrape job.
+
+        Args:
+            options: Scrape options applied to every URL
+            max_batch_size: Submit when this many URLs are buffered
+            max_delay: Submit when the oldest buffered URL has waited this many seconds
+            max_concurrency: Per-job scrape concurrency limit
+            max_in_flight: Block add() while this many URLs are not yet scraped
+            poll_interval: Seconds between checks for new documents
+            ignore_invalid_urls: Skip URLs the API rejects
+            canonicalize_urls: Canonicalize URLs and drop duplicates across the stream
+            webhook: Webhook for the job
+            zero_data_retention: Enable zero data retention for the job
+            integration: Integration tag
+            fields: Document fields to keep
+
+        Returns:
+            BatchFeeder instance
+        """
+        return BatchFeeder(
+            self.http_client,
+            options=options,
+            max_batch_size=max_batch_size,
+            max_delay=max_delay,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight,
+            poll_interval=poll_interval,
+            ignore_invalid_urls=ignore_invalid_urls,
+            canonicalize_urls=canonicalize_urls,
+            webhook=webhook,
+            zero_data_retention=zero_data_retention,
+            integration=integration,
+            fields=fields,
+        )
 
     def batch_scrape(
         self,
@@ -813,11 +1368,16 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        canonicalize_urls: bool = False,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        ``fields`` keeps only the named document fields and, unless ``formats``
+        is given, requests only the formats they need.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -854,7 +1414,9 @@ class FirecrawlClient:
             zero_data_retention=zero_data_retention,
             integration=integration,
             idempotency_key=idempotency_key,
+            canonicalize_urls=canonicalize_urls,
             poll_interval=poll_interval,
             timeout=wait_timeout,
+            fields=fields,
         )
     
\ No newline at end of file
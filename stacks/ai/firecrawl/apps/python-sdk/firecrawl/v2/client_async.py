@@ -3,10 +3,13 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 """
 
 import os
+import uuid
 import asyncio
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from typing import Optional, List, Dict, Any, AsyncIterator, Union, Callable, Literal
 from .types import (
     ScrapeOptions,
+    AgentOptions,
+    Document,
     CrawlRequest,
     WebhookConfig,
     SearchRequest,
@@ -32,9 +35,16 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    ExtractPartitionResult,
 )
 from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.deadline import async_poll_sleep, deadline_scope
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreakerRegistry
+from .utils.cassette import Transport
+from .utils.columnar import ColumnarResults, afetch_columns
+from .utils.projection import Fields, with_projected_formats
 
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
@@ -43,17 +53,31 @@ from .methods.aio import search as async_search  # type: ignore[attr-defined]
 from .methods.aio import map as async_map # type: ignore[attr-defined]
 from .methods.aio import usage as async_usage # type: ignore[attr-defined]
 from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
+from .methods.aio import search_scrape as async_search_scrape  # type: ignore[attr-defined]
 
 from .watcher_async import AsyncWatcher
+from .scheduler import JobScheduler
 
 class AsyncFirecrawlClient:
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        transport: Optional[Transport] = None,
+    ):
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if not api_key:
             raise ValueError("API key is required. Set FIRECRAWL_API_KEY or pass api_key.")
         self.http_client = HttpClient(api_key, api_url)
         self.async_http_client = AsyncHttpClient(api_key, api_url)
+        self.http_client.circuit_breakers = circuit_breakers
+        self.async_http_client.circuit_breakers = circuit_breakers
+        self.http_client.transport = transport
+        self.async_http_client.transport = transport
+        self.hedge_policy = hedge_policy
 
     # Scrape
     async def scrape(
@@ -62,6 +86,12 @@ class AsyncFirecrawlClient:
         **kwargs,
     ):
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
+        if self.hedge_policy is not None:
+            # Hedged duplicates share one idempotency key
+            key = str(uuid.uuid4())
+            return await self.hedge_policy.arun(
+                lambda: async_scrape.scrape(self.async_http_client, url, options, idempotency_key=key)
+            )
         return await async_scrape.scrape(self.async_http_client, url, options)
 
     # Search
@@ -73,37 +103,82 @@ class AsyncFirecrawlClient:
         request = SearchRequest(query=query, **{k: v for k, v in kwargs.items() if v is not None})
         return await async_search.search(self.async_http_client, request)
 
+    async def search_and_scrape(
+        self,
+        query: str,
+        *,
+        top_k: int = 5,
+        scrape_options: Optional[ScrapeOptions] = None,
+        max_concurrency: Optional[int] = None,
+        stop_when: Optional[Callable[[Document], bool]] = None,
+        **kwargs,
+    ) -> async_search_scrape.AsyncSearchScrapeStream:
+        kwargs.setdefault("limit", max(top_k, 5))
+        request = SearchRequest(query=query, **{k: v for k, v in kwargs.items() if v is not None})
+        return await async_search_scrape.search_and_scrape(
+            self.async_http_client,
+            request,
+            top_k=top_k,
+            options=scrape_options,
+            max_concurrency=max_concurrency,
+            stop_when=stop_when,
+        )
+
     async def start_crawl(self, url: str, **kwargs) -> CrawlResponse:
         request = CrawlRequest(url=url, **kwargs)
         return await async_crawl.start_crawl(self.async_http_client, request)
 
-    async def wait_crawl(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> CrawlJob:
+    async def wait_crawl(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
+    ) -> CrawlJob:
         # simple polling loop using blocking get (ok for test-level async)
         start = asyncio.get_event_loop().time()
+        kwargs = {"fields": fields} if fields is not None else {}
         while True:
-            status = await async_crawl.get_crawl_status(self.async_http_client, job_id)
+            status = await async_crawl.get_crawl_status(self.async_http_client, job_id, **kwargs)
             if status.status in ["completed", "failed"]:
                 return status
             if timeout and (asyncio.get_event_loop().time() - start) > timeout:
                 raise TimeoutError("Crawl wait timed out")
-            await asyncio.sleep(poll_interval)
+            await async_poll_sleep(poll_interval, f"wait for crawl job {job_id}")
 
     async def crawl(self, **kwargs) -> CrawlJob:
-        # wrapper combining start and wait
-        resp = await self.start_crawl(**{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        # wrapper combining start and wait; timeout bounds the whole call
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
-        return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout)
+        fields = kwargs.get("fields")
+        start_kwargs = {k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "fields")}
+        if fields is not None:
+            start_kwargs["scrape_options"] = with_projected_formats(start_kwargs.get("scrape_options"), fields)
+        with deadline_scope(timeout):
+            resp = await self.start_crawl(**start_kwargs)
+            return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout, fields=fields)
 
     async def get_crawl_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
     ) -> CrawlJob:
         return await async_crawl.get_crawl_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            fields=fields,
+        )
+
+    async def get_crawl_columns(
+        self,
+        job_id: str,
+        columns: Optional[List[str]] = None,
+        pagination_config: Optional[PaginationConfig] = None,
+    ) -> ColumnarResults:
+        return await afetch_columns(
+            self.async_http_client, f"/v2/crawl/{job_id}", "get crawl status", columns, pagination_config
         )
 
     async def cancel_crawl(self, job_id: str) -> bool:
@@ -147,33 +222,56 @@ class AsyncFirecrawlClient:
     async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
-    async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
+    async def wait_batch_scrape(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
+    ) -> Any:
         start = asyncio.get_event_loop().time()
+        kwargs = {"fields": fields} if fields is not None else {}
         while True:
-            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
+            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id, **kwargs)
             if status.status in ["completed", "failed", "cancelled"]:
                 return status
             if timeout and (asyncio.get_event_loop().time() - start) > timeout:
                 raise TimeoutError("Batch wait timed out")
-            await asyncio.sleep(poll_interval)
+            await async_poll_sleep(poll_interval, f"wait for batch scrape job {job_id}")
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
-        # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
-        job_id = start.id
+        # waiter wrapper; timeout bounds the whole call
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+        fields = kwargs.get("fields")
+        start_kwargs = {k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "fields")}
+        if fields is not None:
+            start_kwargs["options"] = with_projected_formats(start_kwargs.get("options"), fields)
+        with deadline_scope(timeout):
+            start = await self.start_batch_scrape(urls, **start_kwargs)
+            return await self.wait_batch_scrape(start.id, poll_interval=poll_interval, timeout=timeout, fields=fields)
 
     async def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        fields: Optional[Fields] = None,
     ):
         return await async_batch.get_batch_scrape_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            fields=fields,
+        )
+
+    async def get_batch_scrape_columns(
+        self,
+        job_id: str,
+        columns: Optional[List[str]] = None,
+        pagination_config: Optional[PaginationConfig] = None,
+    ) -> ColumnarResults:
+        return await afetch_columns(
+            self.async_http_client, f"/v2/batch/scrape/{job_id}", "get batch scrape status", columns, pagination_config
         )
 
     async def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -199,6 +297,7 @@ class AsyncFirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        agent: Optional[AgentOptions] = None,
     ):
         return await async_extract.extract(
             self.async_http_client,
@@ -214,6 +313,26 @@ class AsyncFirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             integration=integration,
+            agent=agent,
+        )
+
+    def extract_many(
+        self,
+        urls: List[str],
+        *,
+        partition_by: Literal["domain", "size"] = "domain",
+        max_urls_per_job: int = 25,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[ExtractPartitionResult]:
+        # async iterator of per-partition results; other kwargs are as for extract()
+        return async_extract.extract_many(
+            self.async_http_client,
+            urls,
+            partition_by=partition_by,
+            max_urls_per_job=max_urls_per_job,
+            max_workers=max_workers,
+            **kwargs,
         )
 
     async def get_extract_status(self, job_id: str):
@@ -232,6 +351,7 @@ class AsyncFirecrawlClient:
         scrape_options: Optional['ScrapeOptions'] = None,
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
+        agent: Optional[AgentOptions] = None,
     ):
         return await async_extract.start_extract(
             self.async_http_client,
@@ -245,6 +365,7 @@ class AsyncFirecrawlClient:
             scrape_options=scrape_options,
             ignore_invalid_urls=ignore_invalid_urls,
             integration=integration,
+            agent=agent,
         )
 
     # Usage endpoints
@@ -280,6 +401,22 @@ class AsyncFirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
     ) -> AsyncWatcher:
-        return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout, fields=fields)
+
+    # Job scheduler (thread-backed; await its futures with asyncio.wrap_future)
+    def job_scheduler(
+        self,
+        *,
+        max_polls_per_second: float = 5.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> JobScheduler:
+        return JobScheduler(
+            self.http_client,
+            max_polls_per_second=max_polls_per_second,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
 
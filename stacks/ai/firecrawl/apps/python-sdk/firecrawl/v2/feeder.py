@@ -0,0 +1,347 @@
+"""
+Streaming batch scrape feeder.
+
+A :class:`BatchFeeder` opens one batch scrape job and grows it with
+``append_to_id`` as URLs arrive, so a discovery stage that produces URLs for
+hours feeds a single job instead of thousands of small ones. URLs are
+buffered and submitted in micro-batches, either when ``max_batch_size`` URLs
+are waiting or when the oldest has waited ``max_delay`` seconds. A background
+thread submits the micro-batches and polls the job for new documents, which
+are delivered by one iterator as soon as they are scraped.
+
+Usage:
+    feeder = client.batch_feeder(max_batch_size=50, max_delay=5)
+
+    def produce():
+        with feeder:  # closes the feeder when discovery ends
+            for url in discover():
+                feeder.add(url)
+
+    threading.Thread(target=produce).start()
+    for doc in feeder:
+        handle(doc)
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Iterable, Iterator, List, Optional, Set, Union
+
+from .methods import batch as batch_module
+from .types import Document, ScrapeOptions, WebhookConfig
+from .utils import HttpClient, handle_response_error
+from .utils.decoder_pool import decode_page
+from .utils.projection import FieldProjection, Fields, with_projected_formats
+from .utils.urls import UrlCanonicalizer
+
+logger = logging.getLogger("firecrawl")
+
+_DONE = object()
+
+
+class BatchFeeder:
+    """
+    Feed URLs into one growing batch scrape job and iterate its documents.
+
+    Documents are yielded in the order the job finishes them. Iteration ends
+    once :meth:`close` has been called, every buffered URL has been submitted
+    and the job has completed (or failed or been cancelled). Only one
+    iterator should consume the feeder.
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        max_delay: float = 5.0,
+        max_concurrency: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        poll_interval: float = 2.0,
+        ignore_invalid_urls: bool = True,
+        canonicalize_urls: bool = False,
+        webhook: Optional[Union[str, WebhookConfig]] = None,
+        zero_data_retention: Optional[bool] = None,
+        integration: Optional[str] = None,
+        fields: Optional[Fields] = None,
+    ) -> None:
+        """
+        Args:
+            client: HTTP client instance
+            options: Scrape options applied to every URL
+            max_batch_size: Submit when this many URLs are buffered
+            max_delay: Submit when the oldest buffered URL has waited this many seconds
+            max_concurrency: Per-job scrape concurrency limit on the API side
+            max_in_flight: Block :meth:`add` while this many URLs are buffered or
+                submitted but not yet scraped (None for no limit)
+            poll_interval: Seconds between checks for new documents
+            ignore_invalid_urls: Skip URLs the API rejects instead of failing the micro-batch
+            canonicalize_urls: Canonicalize URLs and drop duplicates across the whole stream
+            webhook: Webhook for the job
+            zero_data_retention: Enable zero data retention for the job
+            integration: Integration tag
+            fields: Document fields to keep (see FieldProjection)
+        """
+        if not 1 <= max_batch_size <= batch_module.MAX_BATCH_URLS:
+            raise ValueError(f"max_batch_size must be between 1 and {batch_module.MAX_BATCH_URLS}")
+        if max_delay <= 0 or poll_interval <= 0:
+            raise ValueError("max_delay and poll_interval must be positive")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._client = client
+        self._projection = FieldProjection.of(fields)
+        self._options = with_projected_formats(options, self._projection)
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._max_concurrency = max_concurrency
+        self._max_in_flight = max_in_flight
+        self._poll_interval = poll_interval
+        self._ignore_invalid_urls = ignore_invalid_urls
+        self._webhook = webhook
+        self._zero_data_retention = zero_data_retention
+        self._integration = integration
+        self._canonicalizer = UrlCanonicalizer() if canonicalize_urls else None
+        self._seen: Set[str] = set()
+
+        self._cond = threading.Condition()
+        self._buffer: List[str] = []
+        self._buffered_since: Optional[float] = None
+        self._flush_requested = False
+        self._closed = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._results: "queue.Queue[Any]" = queue.Queue()
+
+        self.job_id: Optional[str] = None
+        self.submitted = 0
+        self.completed = 0
+        self.delivered = 0
+        self.invalid_urls: List[str] = []
+        self._offset = 0
+
+    # Feeding
+
+    def add(self, url: str) -> bool:
+        """
+        Buffer a URL for scraping.
+
+        Returns:
+            False if the URL was dropped as a duplicate, True otherwise
+
+        Raises:
+            ValueError: If the URL is not an http(s) URL
+            RuntimeError: If the feeder is closed
+        """
+        if not isinstance(url, str) or not url.strip().startswith(("http://", "https://")):
+            raise ValueError(f"URL must start with http:// or https://: {url}")
+        url = url.strip()
+        if self._canonicalizer is not None:
+            canonical = self._canonicalizer.canonicalize(url)
+            if canonical is None:
+                raise ValueError(f"Invalid URL: {url}")
+            url = canonical
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchFeeder is closed")
+            if self._canonicalizer is not None:
+                if url in self._seen:
+                    return False
+                self._seen.add(url)
+            while self._max_in_flight is not None and self._in_flight() >= self._max_in_flight and not self._stopped:
+                self._cond.wait()
+            if self._stopped:
+                raise RuntimeError("BatchFeeder is closed")
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+            self._buffer.append(url)
+            self._ensure_thread()
+            self._cond.notify_all()
+        return True
+
+    def add_many(self, urls: Iterable[str]) -> int:
+        """Buffer several URLs; returns how many were accepted."""
+        return sum(1 for url in urls if self.add(url))
+
+    def flush(self) -> None:
+        """Submit buffered URLs now instead of waiting for size or delay."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """
+        Stop accepting URLs. Buffered URLs are still submitted and iteration
+        ends once the job has finished them.
+        """
+        with self._cond:
+            self._closed = True
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def cancel(self) -> bool:
+        """
+        Stop feeding and cancel the batch job.
+
+        Returns:
+            True if a job was cancelled
+        """
+        with self._cond:
+            self._closed = True
+            self._stopped = True
+            self._buffer.clear()
+            self._cond.notify_all()
+        self._results.put(_DONE)
+        if self.job_id is None:
+            return False
+        return batch_module.cancel_batch_scrape(self._client, self.job_id)
+
+    # Results
+
+    def results(self) -> Iterator[Document]:
+        """
+        Yield documents as the job scrapes them.
+
+        Raises:
+            Exception: Errors from submitting URLs or polling the job
+        """
+        while True:
+            item = self._results.get()
+            if item is _DONE:
+                # Let other waiters (and repeated iteration) see the end too
+                self._results.put(_DONE)
+                return
+            if isinstance(item, BaseException):
+                self._results.put(_DONE)
+                raise item
+            yield item
+
+    def __iter__(self) -> Iterator[Document]:
+        return self.results()
+
+    def __enter__(self) -> "BatchFeeder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.cancel()
+
+    # Internals
+
+    def _in_flight(self) -> int:
+        accepted = self.submitted - len(self.invalid_urls)
+        return len(self._buffer) + max(0, accepted - self.completed)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="firecrawl-batch-feeder", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        next_poll = 0.0
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._closed and not self._buffer and self.job_id is None:
+                        self._results.put(_DONE)
+                        return
+                    now = time.monotonic()
+                    flush_due = bool(self._buffer) and (
+                        len(self._buffer) >= self._max_batch_size
+                        or self._closed
+                        or self._flush_requested
+                        or now - (self._buffered_since or now) >= self._max_delay
+                    )
+                    poll_due = self.job_id is not None and now >= next_poll
+                    if flush_due or poll_due:
+                        break
+                    waits = []
+                    if self._buffer and self._buffered_since is not None:
+                        waits.append(self._buffered_since + self._max_delay - now)
+                    if self.job_id is not None:
+                        waits.append(next_poll - now)
+                    self._cond.wait(timeout=max(0.0, min(waits)) if waits else None)
+
+                batch: List[str] = []
+                if flush_due:
+                    batch = self._buffer[: self._max_batch_size]
+                    del self._buffer[: len(batch)]
+                    self._buffered_since = now if self._buffer else None
+                    self._flush_requested = self._flush_requested and bool(self._buffer)
+
+            try:
+                if batch:
+                    self._submit(batch)
+                if poll_due:
+                    finished = self._poll()
+                    next_poll = time.monotonic() + self._poll_interval
+                    if finished:
+                        self._results.put(_DONE)
+                        return
+            except Exception as exc:
+                logger.warning("Batch feeder stopped", extra={"job_id": self.job_id, "error": str(exc)})
+                with self._cond:
+                    self._stopped = True
+                    self._cond.notify_all()
+                self._results.put(exc)
+                return
+
+    def _submit(self, urls: List[str]) -> None:
+        response = batch_module.start_batch_scrape(
+            self._client,
+            urls,
+            options=self._options,
+            webhook=self._webhook,
+            append_to_id=self.job_id,
+            ignore_invalid_urls=self._ignore_invalid_urls,
+            max_concurrency=self._max_concurrency,
+            zero_data_retention=self._zero_data_retention,
+            integration=self._integration,
+            # Retried appends must not add the same URLs twice
+            idempotency_key=str(uuid.uuid4()),
+        )
+        with self._cond:
+            if self.job_id is None:
+                self.job_id = response.id
+            self.submitted += len(urls)
+            self.invalid_urls.extend(response.invalid_urls or [])
+
+    def _poll(self) -> bool:
+        """Deliver new documents; returns True once the job is finished."""
+        url: Optional[str] = f"/v2/batch/scrape/{self.job_id}?skip={self._offset}"
+        body: dict = {}
+        while url:
+            response = self._client.get(url)
+            if not response.ok:
+                handle_response_error(response, "get batch scrape status")
+            body = response.json()
+            if not body.get("success"):
+                raise Exception(body.get("error", "Unknown error occurred"))
+            items = body.get("data") or []
+            # skip counts raw items, including ones decode_page drops
+            self._offset += len(items)
+            for document in decode_page(self._client, body, self._projection):
+                self._results.put(document)
+                self.delivered += 1
+            url = body.get("next")
+
+        status = body.get("status")
+        with self._cond:
+            self.completed = body.get("completed", self.completed) or 0
+            self._cond.notify_all()
+            if status in ("failed", "cancelled"):
+                return True
+            accepted = self.submitted - len(self.invalid_urls)
+            # A completed job may still grow until the feeder is closed and drained
+            return (
+                status == "completed"
+                and self._closed
+                and not self._buffer
+                and (body.get("total") or 0) >= accepted
+            )
@@ -4,6 +4,9 @@ from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
 from ...utils.normalize import normalize_document_input
+from ...utils.projection import FieldProjection, Fields
+from ...utils.urls import dedupe_urls
+from ..batch import MAX_BATCH_URLS, chunk_urls
 import time
 
 
@@ -33,6 +36,17 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
 
 
 async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
+    if kwargs.pop("canonicalize_urls", False):
+        urls = dedupe_urls(urls)
+    if len(urls) > MAX_BATCH_URLS:
+        # Start with the first chunk, append the rest to the same job
+        chunks = chunk_urls(urls, MAX_BATCH_URLS)
+        first = await start_batch_scrape(client, chunks[0], **kwargs)
+        invalid_urls = list(first.invalid_urls or [])
+        for chunk in chunks[1:]:
+            appended = await start_batch_scrape(client, chunk, **{**kwargs, "append_to_id": first.id})
+            invalid_urls.extend(appended.invalid_urls or [])
+        return BatchScrapeResponse(id=first.id, url=first.url, invalid_urls=invalid_urls or None)
     payload = _prepare(urls, **kwargs)
     response = await client.post("/v2/batch/scrape", payload)
     if response.status_code >= 400:
@@ -46,7 +60,8 @@ async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs)
 async def get_batch_scrape_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -55,6 +70,7 @@ async def get_batch_scrape_status(
         client: Async HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -68,9 +84,12 @@ async def get_batch_scrape_status(
     body = response.json()
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
+    projection = FieldProjection.of(fields)
     docs: List[Document] = []
     for doc in body.get("data", []) or []:
         if isinstance(doc, dict):
+            if projection is not None:
+                doc = projection.apply(doc)
             normalized = normalize_document_input(doc)
             docs.append(Document(**normalized))
     
@@ -81,10 +100,12 @@ async def get_batch_scrape_status(
             client, 
             body.get("next"), 
             docs, 
-            pagination_config
+            pagination_config,
+            projection,
         )
     
     return BatchScrapeJob(
+        id=job_id,
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
@@ -99,7 +120,8 @@ async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results asynchronously.
@@ -109,12 +131,14 @@ async def _fetch_all_batch_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         List of all documents from all pages
     """
     documents = initial_documents.copy()
     current_url = next_url
+    projection = FieldProjection.of(fields)
     page_count = 0
     
     # Apply pagination limits
@@ -153,6 +177,8 @@ async def _fetch_all_batch_pages_async(
                 # Check max_results limit
                 if (max_results is not None) and (len(documents) >= max_results):
                     break
+                if projection is not None:
+                    doc = projection.apply(doc)
                 normalized = normalize_document_input(doc)
                 documents.append(Document(**normalized))
         
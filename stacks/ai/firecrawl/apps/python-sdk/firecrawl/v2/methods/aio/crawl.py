@@ -16,6 +16,7 @@ from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.normalize import normalize_document_input
+from ...utils.projection import FieldProjection, Fields
 import time
 
 
@@ -89,7 +90,8 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
 async def get_crawl_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -98,6 +100,7 @@ async def get_crawl_status(
         client: Async HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination limits
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         CrawlJob with job information
@@ -110,9 +113,12 @@ async def get_crawl_status(
         handle_response_error(response, "get crawl status")
     body = response.json()
     if body.get("success"):
+        projection = FieldProjection.of(fields)
         documents = []
         for doc_data in body.get("data", []):
             if isinstance(doc_data, dict):
+                if projection is not None:
+                    doc_data = projection.apply(doc_data)
                 normalized = normalize_document_input(doc_data)
                 documents.append(Document(**normalized))
         
@@ -123,7 +129,8 @@ async def get_crawl_status(
                 client, 
                 body.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                projection,
             )
         
         return CrawlJob(
@@ -142,7 +149,8 @@ async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> List[Document]:
     """
     Fetch all pages of crawl results asynchronously.
@@ -152,12 +160,14 @@ async def _fetch_all_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         List of all documents from all pages
     """
     documents = initial_documents.copy()
     current_url = next_url
+    projection = FieldProjection.of(fields)
     page_count = 0
     
     # Apply pagination limits
@@ -196,6 +206,8 @@ async def _fetch_all_pages_async(
                 # Check max_results limit
                 if (max_results is not None) and (len(documents) >= max_results):
                     break
+                if projection is not None:
+                    doc_data = projection.apply(doc_data)
                 normalized = normalize_document_input(doc_data)
                 documents.append(Document(**normalized))
         
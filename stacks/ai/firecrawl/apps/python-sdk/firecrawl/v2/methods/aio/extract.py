@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 import asyncio
 
-from ...types import ExtractResponse, ScrapeOptions
+from ...types import AgentOptions, ExtractPartitionResult, ExtractResponse, ScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
+from ...utils.deadline import async_poll_sleep
 from ...utils.validation import prepare_scrape_options
+from ..extract import PartitionBy, _partition_error, partition_urls
 
 
 def _prepare_extract_request(
@@ -18,6 +20,7 @@ def _prepare_extract_request(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    agent: Optional[AgentOptions] = None,
 ) -> Dict[str, Any]:
     body: Dict[str, Any] = {}
     if urls is not None:
@@ -42,6 +45,11 @@ def _prepare_extract_request(
             body["scrapeOptions"] = prepared
     if integration is not None and str(integration).strip():
         body["integration"] = str(integration).strip()
+    if agent is not None:
+        try:
+            body["agent"] = agent.model_dump(exclude_none=True)  # type: ignore[attr-defined]
+        except AttributeError:
+            body["agent"] = agent  # fallback
     return body
 
 
@@ -58,6 +66,7 @@ async def start_extract(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    agent: Optional[AgentOptions] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -70,6 +79,7 @@ async def start_extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
+        agent=agent,
     )
     resp = await client.post("/v2/extract", body)
     return ExtractResponse(**resp.json())
@@ -94,7 +104,7 @@ async def wait_extract(
             return status
         if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
             return status
-        await asyncio.sleep(max(1, poll_interval))
+        await async_poll_sleep(max(1, poll_interval), f"wait for extract job {job_id}")
 
 
 async def extract(
@@ -112,6 +122,7 @@ async def extract(
     poll_interval: int = 2,
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
+    agent: Optional[AgentOptions] = None,
 ) -> ExtractResponse:
     started = await start_extract(
         client,
@@ -125,9 +136,66 @@ async def extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
+        agent=agent,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
     return await wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
 
+
+async def extract_many(
+    client: AsyncHttpClient,
+    urls: List[str],
+    *,
+    partition_by: PartitionBy = "domain",
+    max_urls_per_job: int = 25,
+    max_workers: Optional[int] = None,
+    prompt: Optional[str] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    system_prompt: Optional[str] = None,
+    allow_external_links: Optional[bool] = None,
+    enable_web_search: Optional[bool] = None,
+    show_sources: Optional[bool] = None,
+    scrape_options: Optional[ScrapeOptions] = None,
+    ignore_invalid_urls: Optional[bool] = None,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    integration: Optional[str] = None,
+    agent: Optional[AgentOptions] = None,
+) -> AsyncIterator[ExtractPartitionResult]:
+    """Async variant of ``extract_many``; yields partition results as they finish."""
+    partitions = partition_urls(urls, by=partition_by, max_urls_per_job=max_urls_per_job)
+    semaphore = asyncio.Semaphore(max(1, max_workers or 4))
+
+    async def run(key: str, chunk: List[str]) -> ExtractPartitionResult:
+        async with semaphore:
+            try:
+                response = await extract(
+                    client,
+                    chunk,
+                    prompt=prompt,
+                    schema=schema,
+                    system_prompt=system_prompt,
+                    allow_external_links=allow_external_links,
+                    enable_web_search=enable_web_search,
+                    show_sources=show_sources,
+                    scrape_options=scrape_options,
+                    ignore_invalid_urls=ignore_invalid_urls,
+                    poll_interval=poll_interval,
+                    timeout=timeout,
+                    integration=integration,
+                    agent=agent,
+                )
+            except Exception as e:
+                return ExtractPartitionResult(key=key, urls=chunk, error=str(e))
+        return ExtractPartitionResult(key=key, urls=chunk, response=response, error=_partition_error(response))
+
+    tasks = [asyncio.ensure_future(run(key, chunk)) for key, chunk in partitions]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -19,9 +19,15 @@ async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = N
     return payload
 
 
-async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+async def scrape(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    idempotency_key: Optional[str] = None,
+) -> Document:
     payload = await _prepare_scrape_request(url, options)
-    response = await client.post("/v2/scrape", payload)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    response = await client.post("/v2/scrape", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "scrape")
     body = response.json()
@@ -0,0 +1,137 @@
+"""
+Async search-then-scrape fan-out for Firecrawl v2 API.
+
+Runs a plain ``search()`` so the hits are available immediately, then scrapes
+the top results as concurrent tasks and yields documents as each one finishes.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from ...types import Document, ScrapeOptions, SearchData, SearchRequest
+from ...utils.http_client_async import AsyncHttpClient
+from ..search_scrape import hit_urls
+from . import scrape as async_scrape
+from . import search as async_search
+
+logger = logging.getLogger("firecrawl")
+
+
+class AsyncSearchScrapeStream:
+    """
+    Async search hits plus a stream of scraped documents for the top results.
+
+    Scrape tasks start as soon as the stream is created. ``async for`` yields
+    documents in completion order; failed URLs are recorded in ``errors``.
+    When ``stop_when`` matches, the remaining tasks are cancelled.
+    """
+
+    def __init__(
+        self,
+        client: AsyncHttpClient,
+        hits: SearchData,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_concurrency: Optional[int] = None,
+        stop_when: Optional[Callable[[Document], bool]] = None,
+    ):
+        self.hits = hits
+        self.urls = urls
+        self.errors: Dict[str, Exception] = {}
+        self.matched: Optional[Document] = None
+        self._stop_when = stop_when
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or len(urls) or 1))
+
+        async def run(url: str) -> Document:
+            async with semaphore:
+                return await async_scrape.scrape(client, url, options)
+
+        self._pending: Dict["asyncio.Task[Document]", str] = {
+            asyncio.ensure_future(run(url)): url for url in urls
+        }
+        self._rank = {task: i for i, task in enumerate(self._pending)}
+
+    def __aiter__(self) -> AsyncIterator[Document]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Document]:
+        try:
+            while self._pending:
+                done, _ = await asyncio.wait(list(self._pending), return_when=asyncio.FIRST_COMPLETED)
+                # Tasks finishing together are handed back in rank order
+                for task in sorted(done, key=self._rank.__getitem__):
+                    url = self._pending.pop(task)
+                    try:
+                        document = task.result()
+                    except Exception as e:
+                        logger.warning("Failed to scrape search result %s: %s", url, e)
+                        self.errors[url] = e
+                        continue
+                    yield document
+                    if self._stop_when is not None and self._stop_when(document):
+                        self.matched = document
+                        return
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Cancel outstanding scrape tasks."""
+        pending = list(self._pending)
+        self._pending = {}
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncSearchScrapeStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+async def search_and_scrape(
+    client: AsyncHttpClient,
+    request: SearchRequest,
+    *,
+    top_k: int = 5,
+    options: Optional[ScrapeOptions] = None,
+    max_concurrency: Optional[int] = None,
+    stop_when: Optional[Callable[[Document], bool]] = None,
+) -> AsyncSearchScrapeStream:
+    """
+    Async search, then scrape the top-K hits concurrently.
+
+    Args:
+        client: Async HTTP client instance
+        request: Search request (its ``scrape_options`` are ignored so the
+            hits come back without waiting on page scrapes)
+        top_k: Number of top result URLs to scrape
+        options: Scrape options applied to each result
+        max_concurrency: Maximum concurrent scrapes (default: top_k)
+        stop_when: Predicate ending the stream once a document matches
+
+    Returns:
+        AsyncSearchScrapeStream exposing ``hits`` and yielding scraped documents
+
+    Raises:
+        FirecrawlError: If the search itself fails
+    """
+    if top_k <= 0:
+        raise ValueError("top_k must be positive")
+    if request.scrape_options is not None:
+        if options is None:
+            options = request.scrape_options
+        request = request.model_copy(update={"scrape_options": None})
+
+    hits = await async_search.search(client, request)
+    return AsyncSearchScrapeStream(
+        client,
+        hits,
+        hit_urls(hits, top_k),
+        options=options,
+        max_concurrency=max_concurrency,
+        stop_when=stop_when,
+    )
@@ -14,9 +14,16 @@ from ..types import (
     PaginationConfig,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.decoder_pool import decode_page
+from ..utils.deadline import deadline_scope, poll_sleep
+from ..utils.projection import FieldProjection, Fields, with_projected_formats
+from ..utils.batch_index import BatchResultIndex
+from ..utils.urls import UrlCanonicalizer, dedupe_urls, group_urls_by_domain
 from ..types import CrawlErrorsResponse
 
+# Maximum number of URLs accepted by a single /v2/batch/scrape request
+MAX_BATCH_URLS = 1000
+
 
 def start_batch_scrape(
     client: HttpClient,
@@ -30,14 +37,20 @@ def start_batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    canonicalize_urls: bool = False,
 ) -> BatchScrapeResponse:
     """
     Start a batch scrape job for multiple URLs.
+
+    Lists longer than ``MAX_BATCH_URLS`` are split into chunks: the first
+    chunk starts the job and the rest are appended to it with
+    ``append_to_id``, so the caller still gets a single job id.
     
     Args:
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        canonicalize_urls: Canonicalize and deduplicate URLs before submitting
         
     Returns:
         BatchScrapeResponse containing job information
@@ -45,6 +58,39 @@ def start_batch_scrape(
     Raises:
         FirecrawlError: If the batch scrape operation fails to start
     """
+    if canonicalize_urls:
+        urls = dedupe_urls(urls)
+    if len(urls) > MAX_BATCH_URLS:
+        chunks = chunk_urls(urls, MAX_BATCH_URLS)
+        first = start_batch_scrape(
+            client,
+            chunks[0],
+            options=options,
+            webhook=webhook,
+            append_to_id=append_to_id,
+            ignore_invalid_urls=ignore_invalid_urls,
+            max_concurrency=max_concurrency,
+            zero_data_retention=zero_data_retention,
+            integration=integration,
+            idempotency_key=idempotency_key,
+        )
+        invalid_urls = list(first.invalid_urls or [])
+        for i, chunk in enumerate(chunks[1:], start=1):
+            appended = start_batch_scrape(
+                client,
+                chunk,
+                options=options,
+                webhook=webhook,
+                append_to_id=first.id,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                idempotency_key=f"{idempotency_key}-{i}" if idempotency_key else None,
+            )
+            invalid_urls.extend(appended.invalid_urls or [])
+        return BatchScrapeResponse(id=first.id, url=first.url, invalid_urls=invalid_urls or None)
+
     # Prepare request data
     request_data = prepare_batch_scrape_request(
         urls,
@@ -79,7 +125,8 @@ def start_batch_scrape(
 def get_batch_scrape_status(
     client: HttpClient,
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -88,6 +135,7 @@ def get_batch_scrape_status(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -108,11 +156,8 @@ def get_batch_scrape_status(
         raise Exception(body.get("error", "Unknown error occurred"))
 
     # Convert documents
-    documents: List[Document] = []
-    for doc in body.get("data", []) or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
+    projection = FieldProjection.of(fields)
+    documents: List[Document] = decode_page(client, body, projection)
 
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -121,10 +166,12 @@ def get_batch_scrape_status(
             client, 
             body.get("next"), 
             documents, 
-            pagination_config
+            pagination_config,
+            projection,
         )
 
     return BatchScrapeJob(
+        id=job_id,
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
@@ -139,7 +186,8 @@ def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results.
@@ -149,12 +197,14 @@ def _fetch_all_batch_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         List of all documents from all pages
     """
     documents = initial_documents.copy()
     current_url = next_url
+    fields = FieldProjection.of(fields)
     page_count = 0
     
     # Apply pagination limits
@@ -188,13 +238,9 @@ def _fetch_all_batch_pages(
             break
         
         # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+        # Only what is left of max_results gets decoded
+        limit = max(0, max_results - len(documents)) if max_results is not None else None
+        documents.extend(decode_page(client, page_data, fields, limit))
         
         # Check if we hit max_results limit after adding all docs from this page
         if max_results is not None and len(documents) >= max_results:
@@ -240,7 +286,8 @@ def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    fields: Optional[Fields] = None,
 ) -> BatchScrapeJob:
     """
     Wait for a batch scrape job to complete, polling for status updates.
@@ -250,6 +297,7 @@ def wait_for_batch_completion(
         job_id: ID of the batch scrape job
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -259,9 +307,10 @@ def wait_for_batch_completion(
         TimeoutError: If timeout is reached
     """
     start_time = time.monotonic()
+    fields = FieldProjection.of(fields)
     
     while True:
-        status_job = get_batch_scrape_status(client, job_id)
+        status_job = get_batch_scrape_status(client, job_id, fields=fields)
         
         # Check if job is complete
         if status_job.status in ["completed", "failed", "cancelled"]:
@@ -272,7 +321,7 @@ def wait_for_batch_completion(
             raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        poll_sleep(poll_interval, f"wait for batch scrape job {job_id}")
 
 
 def batch_scrape(
@@ -287,8 +336,10 @@ def batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    canonicalize_urls: bool = False,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    fields: Optional[Fields] = None,
 ) -> BatchScrapeJob:
     """
     Start a batch scrape job and wait for it to complete.
@@ -297,8 +348,12 @@ def batch_scrape(
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        canonicalize_urls: Canonicalize and deduplicate URLs before submitting
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds for the whole call, including starting the
+            job, polling and paginating results (None for no timeout)
+        fields: Document fields to keep; also requests only the formats they
+            need unless ``options.formats`` is set
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -307,26 +362,30 @@ def batch_scrape(
         FirecrawlError: If the batch scrape fails to start or complete
         TimeoutError: If timeout is reached
     """
-    # Start the batch scrape
-    start = start_batch_scrape(
-        client,
-        urls,
-        options=options,
-        webhook=webhook,
-        append_to_id=append_to_id,
-        ignore_invalid_urls=ignore_invalid_urls,
-        max_concurrency=max_concurrency,
-        zero_data_retention=zero_data_retention,
-        integration=integration,
-        idempotency_key=idempotency_key,
-    )
+    fields = FieldProjection.of(fields)
+    options = with_projected_formats(options, fields)
+    with deadline_scope(timeout):
+        # Start the batch scrape
+        start = start_batch_scrape(
+            client,
+            urls,
+            options=options,
+            webhook=webhook,
+            append_to_id=append_to_id,
+            ignore_invalid_urls=ignore_invalid_urls,
+            max_concurrency=max_concurrency,
+            zero_data_retention=zero_data_retention,
+            integration=integration,
+            idempotency_key=idempotency_key,
+            canonicalize_urls=canonicalize_urls,
+        )
 
-    job_id = start.id
+        job_id = start.id
 
-    # Wait for completion
-    return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
-    )
+        # Wait for completion
+        return wait_for_batch_completion(
+            client, job_id, poll_interval, timeout, fields
+        )
 
 
 def validate_batch_urls(urls: List[str]) -> List[str]:
@@ -345,8 +404,8 @@ def validate_batch_urls(urls: List[str]) -> List[str]:
     if not urls:
         raise ValueError("URLs list cannot be empty")
     
-    if len(urls) > 1000:  # Assuming API limit
-        raise ValueError("Too many URLs (maximum 1000)")
+    if len(urls) > MAX_BATCH_URLS:
+        raise ValueError(f"Too many URLs (maximum {MAX_BATCH_URLS})")
     
     validated_urls = []
     for url in urls:
@@ -429,13 +488,47 @@ def chunk_urls(urls: List[str], chunk_size: int = 100) -> List[List[str]]:
     return chunks
 
 
+def prepare_batch_urls(
+    urls: List[str],
+    *,
+    canonicalizer: Optional[UrlCanonicalizer] = None,
+    group_by_domain: bool = False,
+    chunk_size: int = MAX_BATCH_URLS,
+) -> List[List[str]]:
+    """
+    Canonicalize, deduplicate and chunk a large URL list for submission.
+
+    Invalid and non-http(s) URLs are dropped instead of failing the batch.
+
+    Args:
+        urls: URLs to prepare (e.g. sitemap or ``map()`` output)
+        canonicalizer: Canonicalization rules (default rules if None)
+        group_by_domain: Keep each host's URLs contiguous so chunks touch as
+            few hosts as possible
+        chunk_size: Maximum URLs per chunk (at most ``MAX_BATCH_URLS``)
+
+    Returns:
+        List of URL chunks ready for ``start_batch_scrape``
+    """
+    if chunk_size <= 0 or chunk_size > MAX_BATCH_URLS:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_BATCH_URLS}")
+    if group_by_domain:
+        unique = [url for group in group_urls_by_domain(urls, canonicalizer).values() for url in group]
+    else:
+        unique = dedupe_urls(urls, canonicalizer)
+    return chunk_urls(unique, chunk_size)
+
+
 def process_large_batch(
     client: HttpClient,
     urls: List[str],
     options: Optional[ScrapeOptions] = None,
     chunk_size: int = 100,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    index: Optional[BatchResultIndex] = None,
+    canonicalize_urls: bool = False,
+    group_by_domain: bool = False,
 ) -> List[Document]:
     """
     Process a large batch of URLs by splitting into smaller chunks.
@@ -447,6 +540,9 @@ def process_large_batch(
         chunk_size: Size of each batch chunk
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait per chunk
+        index: Optional index filled with each chunk's documents and errors
+        canonicalize_urls: Canonicalize and deduplicate URLs before chunking
+        group_by_domain: Keep each host's URLs in as few chunks as possible
         
     Returns:
         List of all scraped documents
@@ -454,7 +550,10 @@ def process_large_batch(
     Raises:
         FirecrawlError: If any chunk fails
     """
-    url_chunks = chunk_urls(urls, chunk_size)
+    if canonicalize_urls or group_by_domain:
+        url_chunks = prepare_batch_urls(urls, group_by_domain=group_by_domain, chunk_size=chunk_size)
+    else:
+        url_chunks = chunk_urls(urls, chunk_size)
     all_documents = []
     completed_chunks = 0
     
@@ -471,6 +570,10 @@ def process_large_batch(
         # Add documents from this chunk
         if result.data:
             all_documents.extend(result.data)
+        if index is not None:
+            index.add_documents(result.data)
+            if result.id:
+                index.add_errors(get_batch_scrape_errors(client, result.id))
         
         completed_chunks += 1
     
@@ -499,4 +602,28 @@ def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsRespo
         "errors": payload.get("errors", []),
         "robots_blocked": payload.get("robotsBlocked", payload.get("robots_blocked", [])),
     }
-    return CrawlErrorsResponse(**normalized)
\ No newline at end of file
+    return CrawlErrorsResponse(**normalized)
+
+def index_batch_results(
+    client: HttpClient,
+    job: BatchScrapeJob,
+    urls: List[str],
+    *,
+    include_errors: bool = True,
+) -> BatchResultIndex:
+    """
+    Build a URL-to-document index for a finished batch, joined with its errors.
+
+    Args:
+        client: HTTP client instance
+        job: Batch scrape job (from ``batch_scrape`` or ``get_batch_scrape_status``)
+        urls: URLs that were submitted
+        include_errors: Fetch ``get_batch_scrape_errors`` to populate ``failed``
+
+    Returns:
+        BatchResultIndex with ``get``, ``missing``, ``failed`` and ``gaps``
+    """
+    index = BatchResultIndex(urls, job.data)
+    if include_errors and job.id:
+        index.add_errors(get_batch_scrape_errors(client, job.id))
+    return index
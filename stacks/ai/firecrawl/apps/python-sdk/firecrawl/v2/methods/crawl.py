@@ -11,7 +11,9 @@ from ..types import (
     WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.decoder_pool import decode_page
+from ..utils.deadline import deadline_scope, poll_sleep
+from ..utils.projection import FieldProjection, Fields, with_projected_formats
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -144,7 +146,8 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
 def get_crawl_status(
     client: HttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -153,6 +156,7 @@ def get_crawl_status(
         client: HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination behavior
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         CrawlJob with current status and data
@@ -173,16 +177,9 @@ def get_crawl_status(
     if response_data.get("success"):
         # The API returns status fields at the top level, not in a data field
         
-        # Convert documents
-        documents = []
-        data_list = response_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                # Handle case where API returns just URLs - this shouldn't happen for crawl
-                # but we'll handle it gracefully
-                continue
-            else:
-                documents.append(Document(**normalize_document_input(doc_data)))
+        # Convert documents (plain URL strings are skipped)
+        projection = FieldProjection.of(fields)
+        documents = decode_page(client, response_data, projection)
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -191,7 +188,8 @@ def get_crawl_status(
                 client, 
                 response_data.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                projection,
             )
         
         # Create CrawlJob with current status and data
@@ -212,7 +210,8 @@ def _fetch_all_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    fields: Optional[Fields] = None,
 ) -> List[Document]:
     """
     Fetch all pages of crawl results.
@@ -222,12 +221,14 @@ def _fetch_all_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         List of all documents from all pages
     """
     documents = initial_documents.copy()
     current_url = next_url
+    fields = FieldProjection.of(fields)
     page_count = 0
     
     # Apply pagination limits
@@ -261,15 +262,9 @@ def _fetch_all_pages(
             break
         
         # Add documents from this page
-        data_list = page_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                continue
-            else:
-                # Check max_results limit BEFORE adding each document
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                documents.append(Document(**normalize_document_input(doc_data)))
+        # Only what is left of max_results gets decoded
+        limit = max(0, max_results - len(documents)) if max_results is not None else None
+        documents.extend(decode_page(client, page_data, fields, limit))
         
         # Check if we hit max_results limit
         if max_results is not None and len(documents) >= max_results:
@@ -309,7 +304,8 @@ def wait_for_crawl_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    fields: Optional[Fields] = None,
 ) -> CrawlJob:
     """
     Wait for a crawl job to complete, polling for status updates.
@@ -319,6 +315,7 @@ def wait_for_crawl_completion(
         job_id: ID of the crawl job
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        fields: Document fields to keep; others are dropped while decoding
         
     Returns:
         CrawlJob when job completes
@@ -328,9 +325,10 @@ def wait_for_crawl_completion(
         TimeoutError: If timeout is reached
     """
     start_time = time.monotonic()
+    fields = FieldProjection.of(fields)
     
     while True:
-        crawl_job = get_crawl_status(client, job_id)
+        crawl_job = get_crawl_status(client, job_id, fields=fields)
         
         # Check if job is complete
         if crawl_job.status in ["completed", "failed"]:
@@ -341,14 +339,15 @@ def wait_for_crawl_completion(
             raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        poll_sleep(poll_interval, f"wait for crawl job {job_id}")
 
 
 def crawl(
     client: HttpClient,
     request: CrawlRequest,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    fields: Optional[Fields] = None,
 ) -> CrawlJob:
     """
     Start a crawl job and wait for it to complete.
@@ -357,7 +356,10 @@ def crawl(
         client: HTTP client instance
         request: CrawlRequest containing URL and options
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds for the whole call, including starting the
+            job, polling and paginating results (None for no timeout)
+        fields: Document fields to keep; also requests only the formats they
+            need unless ``request.scrape_options.formats`` is set
         
     Returns:
         CrawlJob when job completes
@@ -367,14 +369,20 @@ def crawl(
         Exception: If the crawl fails to start or complete
         TimeoutError: If timeout is reached
     """
-    # Start the crawl
-    crawl_job = start_crawl(client, request)
-    job_id = crawl_job.id
-    
-    # Wait for completion
-    return wait_for_crawl_completion(
-        client, job_id, poll_interval, timeout
-    )
+    fields = FieldProjection.of(fields)
+    if fields is not None:
+        request = request.model_copy(
+            update={"scrape_options": with_projected_formats(request.scrape_options, fields)}
+        )
+    with deadline_scope(timeout):
+        # Start the crawl
+        crawl_job = start_crawl(client, request)
+        job_id = crawl_job.id
+
+        # Wait for completion
+        return wait_for_crawl_completion(
+            client, job_id, poll_interval, timeout, fields
+        )
 
 
 def crawl_params_preview(client: HttpClient, request: CrawlParamsRequest) -> CrawlParamsData:
@@ -0,0 +1,384 @@
+"""
+Map-driven sharded crawl planner for Firecrawl v2 API.
+
+Instead of a single server-side crawl job, the site is listed with ``map()``,
+the crawl's include/exclude rules are applied locally and the resulting URL
+set is split by path prefix into shards. Each shard is scraped as its own
+batch job; shards run in parallel and their documents are merged into one
+stream as they complete.
+"""
+
+import contextvars
+import logging
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Pattern, Set
+from urllib.parse import urlparse
+
+from ..types import CrawlShard, Document, MapOptions, ScrapeOptions
+from ..utils import HttpClient
+from ..utils.deadline import deadline_scope
+from . import batch as batch_module
+from . import map as map_module
+from . import usage as usage_module
+
+logger = logging.getLogger("firecrawl")
+
+# Largest number of URLs accepted by a single batch scrape submission
+_MAX_BATCH_SIZE = 1000
+
+
+def _compile(patterns: Optional[List[str]]) -> List[Pattern[str]]:
+    return [re.compile(p) for p in (patterns or []) if p]
+
+
+def _url_depth(path: str) -> int:
+    return len([segment for segment in path.split("/") if segment])
+
+
+def _host_allowed(host: str, root_host: str, allow_subdomains: bool) -> bool:
+    host = host.lower()
+    root_host = root_host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if root_host.startswith("www."):
+        root_host = root_host[4:]
+    if host == root_host:
+        return True
+    return allow_subdomains and host.endswith("." + root_host)
+
+
+def filter_urls(
+    urls: List[str],
+    root_url: str,
+    *,
+    include_paths: Optional[List[str]] = None,
+    exclude_paths: Optional[List[str]] = None,
+    max_discovery_depth: Optional[int] = None,
+    allow_subdomains: bool = False,
+    allow_external_links: bool = False,
+    limit: Optional[int] = None,
+) -> List[str]:
+    """
+    Apply crawl include/exclude rules locally, mirroring the crawler.
+
+    Patterns are regular expressions searched against the URL path, as the
+    server-side crawler does. Duplicates are dropped and order is preserved.
+
+    Args:
+        urls: Candidate URLs (typically from ``map()``)
+        root_url: Crawl root URL used for host checks
+        include_paths: Regex patterns a path must match (any)
+        exclude_paths: Regex patterns that reject a path (any)
+        max_discovery_depth: Maximum number of path segments
+        allow_subdomains: Keep URLs on subdomains of the root host
+        allow_external_links: Keep URLs on other hosts
+        limit: Maximum number of URLs to keep
+
+    Returns:
+        Filtered list of URLs
+    """
+    includes = _compile(include_paths)
+    excludes = _compile(exclude_paths)
+    root_host = urlparse(root_url).hostname or ""
+
+    kept: List[str] = []
+    seen: Set[str] = set()
+    for url in urls:
+        if url in seen:
+            continue
+        seen.add(url)
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        if not allow_external_links and not _host_allowed(parsed.hostname or "", root_host, allow_subdomains):
+            continue
+        path = parsed.path or "/"
+        if max_discovery_depth is not None and _url_depth(path) > max_discovery_depth:
+            continue
+        if excludes and any(p.search(path) for p in excludes):
+            continue
+        if includes and not any(p.search(path) for p in includes):
+            continue
+        kept.append(url)
+        if limit is not None and len(kept) >= limit:
+            break
+    return kept
+
+
+def _prefix(url: str, shard_depth: int) -> str:
+    segments = [s for s in (urlparse(url).path or "/").split("/") if s]
+    return "/" + "/".join(segments[:shard_depth])
+
+
+def plan_shards(
+    urls: List[str],
+    *,
+    shard_depth: int = 1,
+    max_shard_size: int = _MAX_BATCH_SIZE,
+) -> List[CrawlShard]:
+    """
+    Group URLs into shards by path prefix.
+
+    URLs are bucketed by their first ``shard_depth`` path segments. Buckets
+    larger than ``max_shard_size`` are split into full shards; the remaining
+    small buckets are packed together so that tiny sections do not each cost
+    a separate job.
+
+    Args:
+        urls: URLs to shard
+        shard_depth: Number of leading path segments forming the prefix
+        max_shard_size: Maximum URLs per shard (at most 1000)
+
+    Returns:
+        List of CrawlShard objects
+    """
+    if shard_depth < 0:
+        raise ValueError("shard_depth must be non-negative")
+    if max_shard_size <= 0 or max_shard_size > _MAX_BATCH_SIZE:
+        raise ValueError(f"max_shard_size must be between 1 and {_MAX_BATCH_SIZE}")
+
+    buckets: Dict[str, List[str]] = {}
+    for url in urls:
+        buckets.setdefault(_prefix(url, shard_depth), []).append(url)
+
+    shards: List[CrawlShard] = []
+    pending: Optional[CrawlShard] = None
+    # Largest buckets first keeps big sections contiguous and packs the tail
+    for prefix, bucket in sorted(buckets.items(), key=lambda kv: (-len(kv[1]), kv[0])):
+        full = len(bucket) - len(bucket) % max_shard_size
+        for chunk in batch_module.chunk_urls(bucket[:full], max_shard_size):
+            shards.append(CrawlShard(prefixes=[prefix], urls=chunk))
+        bucket = bucket[full:]
+        if not bucket:
+            continue
+        if pending is not None and len(pending.urls) + len(bucket) <= max_shard_size:
+            pending.prefixes.append(prefix)
+            pending.urls.extend(bucket)
+            continue
+        if pending is not None:
+            shards.append(pending)
+        pending = CrawlShard(prefixes=[prefix], urls=list(bucket))
+    if pending is not None:
+        shards.append(pending)
+    return shards
+
+
+def plan_crawl(
+    client: HttpClient,
+    url: str,
+    *,
+    map_options: Optional[MapOptions] = None,
+    include_paths: Optional[List[str]] = None,
+    exclude_paths: Optional[List[str]] = None,
+    max_discovery_depth: Optional[int] = None,
+    allow_subdomains: bool = False,
+    allow_external_links: bool = False,
+    limit: Optional[int] = None,
+    shard_depth: int = 1,
+    max_shard_size: int = _MAX_BATCH_SIZE,
+) -> List[CrawlShard]:
+    """
+    Map a site and plan the shards a sharded crawl would scrape.
+
+    Args:
+        client: HTTP client instance
+        url: Root URL to map
+        map_options: Options for the discovery ``map()`` call
+        include_paths: Regex patterns a path must match
+        exclude_paths: Regex patterns that reject a path
+        max_discovery_depth: Maximum number of path segments
+        allow_subdomains: Keep URLs on subdomains of the root host
+        allow_external_links: Keep URLs on other hosts
+        limit: Maximum number of URLs to scrape
+        shard_depth: Number of leading path segments forming the prefix
+        max_shard_size: Maximum URLs per shard
+
+    Returns:
+        List of CrawlShard objects
+    """
+    map_data = map_module.map(client, url, map_options)
+    urls = filter_urls(
+        [link.url for link in map_data.links],
+        url,
+        include_paths=include_paths,
+        exclude_paths=exclude_paths,
+        max_discovery_depth=max_discovery_depth,
+        allow_subdomains=allow_subdomains,
+        allow_external_links=allow_external_links,
+        limit=limit,
+    )
+    return plan_shards(urls, shard_depth=shard_depth, max_shard_size=max_shard_size)
+
+
+def _team_max_concurrency(client: HttpClient) -> Optional[int]:
+    try:
+        return usage_module.get_concurrency(client).max_concurrency
+    except Exception as e:
+        logger.debug("Could not read team concurrency limit: %s", e)
+        return None
+
+
+def run_shards(
+    client: HttpClient,
+    shards: List[CrawlShard],
+    *,
+    options: Optional[ScrapeOptions] = None,
+    max_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+) -> Iterator[Document]:
+    """
+    Scrape shards as parallel batch jobs and stream their documents.
+
+    Documents are yielded shard by shard, in completion order. Closing the
+    iterator early (or a shard failing) cancels shards that have not started
+    yet and cancels the batch jobs of shards still running.
+
+    Args:
+        client: HTTP client instance
+        shards: Shards to scrape (see ``plan_shards``)
+        options: Scraping options applied to every shard
+        max_workers: Maximum number of shard jobs in flight (default 4)
+        max_concurrency: Per-job scrape concurrency; defaults to an even
+            split of the team's concurrency limit across workers
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait per shard (None for no timeout)
+
+    Yields:
+        Document objects from every shard
+
+    Raises:
+        FirecrawlError: If a shard fails to start or complete
+    """
+    if not shards:
+        return
+
+    workers = max(1, min(len(shards), max_workers or 4))
+    if max_concurrency is None:
+        team_max = _team_max_concurrency(client)
+        if team_max:
+            max_concurrency = max(1, team_max // workers)
+
+    running: Set[str] = set()
+    closed = False
+    lock = threading.Lock()
+
+    def cancel(job_id: str) -> None:
+        try:
+            batch_module.cancel_batch_scrape(client, job_id)
+        except Exception as e:
+            logger.warning("Could not cancel shard job %s: %s", job_id, e)
+
+    def run(shard: CrawlShard):
+        # Started and awaited separately so the job id is known while it runs
+        with deadline_scope(timeout):
+            job_id = batch_module.start_batch_scrape(
+                client,
+                shard.urls,
+                options=options,
+                max_concurrency=max_concurrency,
+            ).id
+            with lock:
+                orphaned = closed
+                if not orphaned:
+                    running.add(job_id)
+            if orphaned:
+                # The iterator was closed while this job was being started
+                cancel(job_id)
+                return None
+            try:
+                return batch_module.wait_for_batch_completion(client, job_id, poll_interval, timeout)
+            finally:
+                with lock:
+                    running.discard(job_id)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: Set[Future] = set()
+    try:
+        # Workers run in the caller's context so an active Deadline applies
+        pending = {executor.submit(contextvars.copy_context().run, run, shard) for shard in shards}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = future.result()
+                for document in job.data:
+                    yield document
+    finally:
+        for future in pending:
+            future.cancel()
+        with lock:
+            closed = True
+            started = list(running)
+        for job_id in started:
+            cancel(job_id)
+        executor.shutdown(wait=False)
+
+
+def sharded_crawl(
+    client: HttpClient,
+    url: str,
+    *,
+    map_options: Optional[MapOptions] = None,
+    include_paths: Optional[List[str]] = None,
+    exclude_paths: Optional[List[str]] = None,
+    max_discovery_depth: Optional[int] = None,
+    allow_subdomains: bool = False,
+    allow_external_links: bool = False,
+    limit: Optional[int] = None,
+    scrape_options: Optional[ScrapeOptions] = None,
+    shard_depth: int = 1,
+    max_shard_size: int = _MAX_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+) -> Iterator[Document]:
+    """
+    Crawl a large site as many parallel batch jobs planned from ``map()``.
+
+    Args:
+        client: HTTP client instance
+        url: Root URL to map
+        map_options: Options for the discovery ``map()`` call
+        include_paths: Regex patterns a path must match
+        exclude_paths: Regex patterns that reject a path
+        max_discovery_depth: Maximum number of path segments
+        allow_subdomains: Keep URLs on subdomains of the root host
+        allow_external_links: Keep URLs on other hosts
+        limit: Maximum number of URLs to scrape
+        scrape_options: Page scraping configuration
+        shard_depth: Number of leading path segments forming the prefix
+        max_shard_size: Maximum URLs per shard
+        max_workers: Maximum number of shard jobs in flight
+        max_concurrency: Per-job scrape concurrency
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait per shard (None for no timeout)
+
+    Returns:
+        Iterator over documents from all shards, in completion order
+    """
+    shards = plan_crawl(
+        client,
+        url,
+        map_options=map_options,
+        include_paths=include_paths,
+        exclude_paths=exclude_paths,
+        max_discovery_depth=max_discovery_depth,
+        allow_subdomains=allow_subdomains,
+        allow_external_links=allow_external_links,
+        limit=limit,
+        shard_depth=shard_depth,
+        max_shard_size=max_shard_size,
+    )
+    return run_shards(
+        client,
+        shards,
+        options=scrape_options,
+        max_workers=max_workers,
+        max_concurrency=max_concurrency,
+        poll_interval=poll_interval,
+        timeout=timeout,
+    )
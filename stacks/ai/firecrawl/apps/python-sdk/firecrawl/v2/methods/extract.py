@@ -1,11 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
 import time
 
-from ..types import ExtractResponse, ScrapeOptions
+from ..types import ExtractPartitionResult, ExtractResponse, ScrapeOptions
 from ..types import AgentOptions
 from ..utils.http_client import HttpClient
 from ..utils.validation import prepare_scrape_options
 from ..utils.error_handler import handle_response_error
+from ..utils.deadline import poll_sleep
 
 
 def _prepare_extract_request(
@@ -108,7 +112,7 @@ def wait_extract(
             return status
         if timeout is not None and (time.time() - start_ts) > timeout:
             return status
-        time.sleep(max(1, poll_interval))
+        poll_sleep(max(1, poll_interval), f"wait for extract job {job_id}")
 
 
 def extract(
@@ -145,4 +149,182 @@ def extract(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
\ No newline at end of file
+    return wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+
+
+# Partitioned extraction
+
+PartitionBy = Literal["domain", "size"]
+
+
+def partition_urls(
+    urls: List[str],
+    *,
+    by: PartitionBy = "domain",
+    max_urls_per_job: int = 25,
+) -> List[Tuple[str, List[str]]]:
+    """
+    Split URLs into extract job partitions.
+
+    With ``by="domain"`` every partition holds URLs of one host, chunked to
+    ``max_urls_per_job``; with ``by="size"`` URLs are chunked in order.
+    Wildcard URLs (``https://example.com/*``) are kept as given.
+
+    Returns:
+        (key, urls) pairs, e.g. ``("example.com#2", [...])`` or ``("chunk-0", [...])``
+    """
+    if max_urls_per_job < 1:
+        raise ValueError("max_urls_per_job must be at least 1")
+    if by == "size":
+        return [
+            (f"chunk-{i}", urls[start:start + max_urls_per_job])
+            for i, start in enumerate(range(0, len(urls), max_urls_per_job))
+        ]
+    if by != "domain":
+        raise ValueError(f"Unknown partitioning: {by}")
+    groups: Dict[str, List[str]] = {}
+    for url in urls:
+        groups.setdefault((urlparse(url).hostname or url).lower(), []).append(url)
+    partitions: List[Tuple[str, List[str]]] = []
+    for host, group in groups.items():
+        chunks = [group[i:i + max_urls_per_job] for i in range(0, len(group), max_urls_per_job)]
+        for i, chunk in enumerate(chunks):
+            partitions.append((host if len(chunks) == 1 else f"{host}#{i}", chunk))
+    return partitions
+
+
+def _merge_values(current: Any, new: Any, schema: Optional[Dict[str, Any]]) -> Any:
+    if new is None:
+        return current
+    if current is None:
+        return new
+    kind = (schema or {}).get("type")
+    if isinstance(current, list) and isinstance(new, list) and kind in (None, "array"):
+        return current + new
+    if isinstance(current, dict) and isinstance(new, dict) and kind in (None, "object"):
+        properties = (schema or {}).get("properties") or {}
+        merged = dict(current)
+        for key, value in new.items():
+            merged[key] = _merge_values(merged.get(key), value, properties.get(key))
+        return merged
+    # Scalars: the first partition that produced a value wins
+    return current
+
+
+def _partition_error(response: ExtractResponse) -> Optional[str]:
+    """Why a partition has no usable data, or None if its job completed."""
+    if response.status == "completed":
+        return None
+    if response.error:
+        return response.error
+    if response.status in ("failed", "cancelled"):
+        return f"Extract job {response.status}"
+    # wait_extract hands back the last status when its timeout is reached
+    return f"Extract job timed out in status {response.status}"
+
+
+def merge_extract_data(
+    results: Iterable[ExtractPartitionResult],
+    schema: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Merge the data of completed partitions into one result.
+
+    Arrays are concatenated and objects merged key by key (following the
+    schema's ``type``/``properties`` when given); for scalars the first
+    non-null value wins. Failed partitions are skipped.
+    """
+    merged: Any = None
+    for result in results:
+        response = result.response
+        if response is None or response.status != "completed":
+            continue
+        merged = _merge_values(merged, response.data, schema)
+    return merged
+
+
+def extract_many(
+    client: HttpClient,
+    urls: List[str],
+    *,
+    partition_by: PartitionBy = "domain",
+    max_urls_per_job: int = 25,
+    max_workers: Optional[int] = None,
+    prompt: Optional[str] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    system_prompt: Optional[str] = None,
+    allow_external_links: Optional[bool] = None,
+    enable_web_search: Optional[bool] = None,
+    show_sources: Optional[bool] = None,
+    scrape_options: Optional[ScrapeOptions] = None,
+    ignore_invalid_urls: Optional[bool] = None,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    integration: Optional[str] = None,
+    agent: Optional[AgentOptions] = None,
+) -> Iterator[ExtractPartitionResult]:
+    """
+    Extract from many URLs as concurrent jobs, one per partition.
+
+    Results are yielded per partition in completion order. A partition that
+    fails to start or complete is reported with ``error`` set and does not
+    stop the others. Closing the iterator early cancels partitions that have
+    not started yet.
+
+    Args:
+        client: HTTP client instance
+        urls: URLs to extract from
+        partition_by: ``"domain"`` or ``"size"`` (see ``partition_urls``)
+        max_urls_per_job: Maximum URLs per extract job
+        max_workers: Maximum number of extract jobs in flight (default 4)
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait per partition (None for no timeout)
+
+    Yields:
+        ExtractPartitionResult for every partition
+    """
+    partitions = partition_urls(urls, by=partition_by, max_urls_per_job=max_urls_per_job)
+    if not partitions:
+        return
+
+    def run(chunk: List[str]) -> ExtractResponse:
+        return extract(
+            client,
+            chunk,
+            prompt=prompt,
+            schema=schema,
+            system_prompt=system_prompt,
+            allow_external_links=allow_external_links,
+            enable_web_search=enable_web_search,
+            show_sources=show_sources,
+            scrape_options=scrape_options,
+            ignore_invalid_urls=ignore_invalid_urls,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            integration=integration,
+            agent=agent,
+        )
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(len(partitions), max_workers or 4)))
+    pending: Set[Future] = set()
+    try:
+        keys: Dict[Future, Tuple[str, List[str]]] = {}
+        for key, chunk in partitions:
+            # Workers run in the caller's context so an active Deadline applies
+            future = executor.submit(contextvars.copy_context().run, run, chunk)
+            keys[future] = (key, chunk)
+        pending = set(keys)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, chunk = keys[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    yield ExtractPartitionResult(key=key, urls=chunk, error=str(e))
+                    continue
+                yield ExtractPartitionResult(key=key, urls=chunk, response=response, error=_partition_error(response))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
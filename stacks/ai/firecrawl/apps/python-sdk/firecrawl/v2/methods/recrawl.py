@@ -0,0 +1,309 @@
+"""
+Incremental recrawl functionality for Firecrawl v2 API.
+
+Keeps a local JSON manifest of previously seen URLs (content hash, ETag and
+timestamps) and only scrapes pages that are new or may have changed since the
+last run. Discovery uses ``map()``; modification detection combines the
+server-side ``changeTracking`` format with a local content hash.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from ..types import (
+    Document,
+    MapOptions,
+    RecrawlManifest,
+    RecrawlManifestEntry,
+    RecrawlResult,
+    ScrapeOptions,
+)
+from ..utils import HttpClient
+from ..utils.batch_index import BatchResultIndex
+from ..utils.deadline import request_timeout
+from . import batch as batch_module
+from . import map as map_module
+
+# Largest number of URLs accepted by a single batch scrape submission
+_MAX_BATCH_SIZE = 1000
+
+
+def load_manifest(manifest_path: str) -> RecrawlManifest:
+    """
+    Load a recrawl manifest from disk.
+
+    Args:
+        manifest_path: Path to the manifest JSON file
+
+    Returns:
+        RecrawlManifest (empty if the file does not exist yet)
+    """
+    if not os.path.exists(manifest_path):
+        return RecrawlManifest()
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return RecrawlManifest(**json.load(f))
+
+
+def save_manifest(manifest_path: str, manifest: RecrawlManifest) -> None:
+    """
+    Atomically write a recrawl manifest to disk.
+
+    Args:
+        manifest_path: Path to the manifest JSON file
+        manifest: Manifest to persist
+    """
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".manifest-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest.model_dump(mode="json"), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def content_hash(document: Document) -> Optional[str]:
+    """Return a stable SHA-256 of the document's primary content, if any."""
+    content = document.markdown or document.html or document.raw_html
+    if content is None:
+        return None
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _format_type(fmt: Any) -> Optional[str]:
+    """Return the type of a format given as a string, dict or format model."""
+    if isinstance(fmt, str):
+        return fmt
+    if isinstance(fmt, dict):
+        return fmt.get("type")
+    return getattr(fmt, "type", None)
+
+
+def _prepare_recrawl_options(scrape_options: Optional[ScrapeOptions], tag: Optional[str]) -> ScrapeOptions:
+    """Ensure markdown and changeTracking formats are requested."""
+    change_tracking: Dict[str, Any] = {"type": "changeTracking", "modes": ["git-diff"]}
+    if tag:
+        change_tracking["tag"] = tag
+
+    formats: List[Any] = []
+    existing = scrape_options.formats if scrape_options is not None else None
+    if isinstance(existing, list):
+        formats = [f for f in existing if _format_type(f) not in ("changeTracking", "change_tracking")]
+    if not any(_format_type(f) == "markdown" for f in formats):
+        formats.insert(0, "markdown")
+    formats.append(change_tracking)
+
+    if scrape_options is None:
+        return ScrapeOptions(formats=formats)
+    return scrape_options.model_copy(update={"formats": formats})
+
+
+def _is_fresh(entry: RecrawlManifestEntry, min_age: Optional[int], now: datetime) -> bool:
+    if min_age is None or entry.last_seen is None:
+        return False
+    last_seen = entry.last_seen
+    if last_seen.tzinfo is None:
+        last_seen = last_seen.replace(tzinfo=timezone.utc)
+    return (now - last_seen).total_seconds() < min_age
+
+
+def _probe_etags(
+    urls: List[str],
+    entries: Dict[str, RecrawlManifestEntry],
+    max_workers: int = 8,
+    timeout: float = 10.0,
+) -> Dict[str, Optional[str]]:
+    """
+    Issue conditional HEAD requests against the origin for each URL.
+
+    Returns a mapping of URL to its current ETag. URLs answering ``304 Not
+    Modified`` keep their stored ETag. Probe failures map to ``None`` so the
+    page is scraped normally.
+    """
+    session = requests.Session()
+
+    def probe(url: str) -> Optional[str]:
+        headers = {}
+        previous = entries.get(url)
+        if previous is not None and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        try:
+            response = session.head(url, headers=headers, timeout=request_timeout(timeout), allow_redirects=True)
+        except requests.RequestException:
+            return None
+        if response.status_code == 304 and previous is not None:
+            return previous.etag
+        return response.headers.get("ETag")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Workers run in the caller's context so an active Deadline applies
+            futures = [executor.submit(contextvars.copy_context().run, probe, url) for url in urls]
+            return {url: future.result() for url, future in zip(urls, futures)}
+    finally:
+        session.close()
+
+
+def recrawl(
+    client: HttpClient,
+    url: str,
+    manifest_path: str,
+    *,
+    map_options: Optional[MapOptions] = None,
+    scrape_options: Optional[ScrapeOptions] = None,
+    tag: Optional[str] = None,
+    min_age: Optional[int] = None,
+    probe_etags: bool = False,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+) -> RecrawlResult:
+    """
+    Re-crawl a site incrementally, scraping only new or modified pages.
+
+    The site is mapped, compared against the local manifest and only pages
+    that are new, stale or (optionally) have a changed ETag are batch scraped
+    with the ``changeTracking`` format. Results are merged back into the
+    manifest, keyed by the mapped URL, which is saved after every batch and
+    again before returning (also when a batch fails). Pages that return no
+    document are listed as failed and keep their previous manifest entry, so
+    the next run retries them.
+
+    Args:
+        client: HTTP client instance
+        url: Root URL to map
+        manifest_path: Path to the local manifest JSON file
+        map_options: Options for the discovery ``map()`` call
+        scrape_options: Scrape options for changed pages (markdown and
+            changeTracking formats are always requested)
+        tag: Change tracking tag to separate independent recrawl histories
+        min_age: Skip pages checked less than this many seconds ago
+        probe_etags: Send conditional HEAD requests to the origin first and
+            skip pages whose ETag is unchanged
+        poll_interval: Seconds between batch status checks
+        timeout: Maximum seconds to wait per batch (None for no timeout)
+
+    Returns:
+        RecrawlResult listing new, changed, unchanged, removed, skipped and failed URLs
+        along with the documents of new and changed pages
+
+    Raises:
+        FirecrawlError: If mapping or scraping fails
+    """
+    manifest = load_manifest(manifest_path)
+    now = datetime.now(timezone.utc)
+    result = RecrawlResult()
+
+    map_data = map_module.map(client, url, map_options)
+    current: List[str] = []
+    seen = set()
+    for link in map_data.links:
+        if link.url and link.url not in seen:
+            seen.add(link.url)
+            current.append(link.url)
+
+    for known_url in list(manifest.entries):
+        if known_url not in seen:
+            result.removed.append(known_url)
+            del manifest.entries[known_url]
+
+    candidates: List[str] = []
+    for page_url in current:
+        entry = manifest.entries.get(page_url)
+        if entry is not None and _is_fresh(entry, min_age, now):
+            result.skipped.append(page_url)
+        else:
+            candidates.append(page_url)
+
+    etags: Dict[str, Optional[str]] = {}
+    if probe_etags and candidates:
+        etags = _probe_etags(candidates, manifest.entries)
+        remaining: List[str] = []
+        for page_url in candidates:
+            entry = manifest.entries.get(page_url)
+            etag = etags.get(page_url)
+            if entry is not None and etag and entry.etag == etag:
+                entry.last_seen = now
+                entry.change_status = "same"
+                result.unchanged.append(page_url)
+            else:
+                remaining.append(page_url)
+        candidates = remaining
+
+    options = _prepare_recrawl_options(scrape_options, tag)
+    manifest.url = url
+    manifest.updated_at = now
+    try:
+        for chunk in batch_module.chunk_urls(candidates, _MAX_BATCH_SIZE):
+            job = batch_module.batch_scrape(
+                client,
+                chunk,
+                options=options,
+                poll_interval=poll_interval,
+                timeout=timeout,
+            )
+            # Documents report the URL they ended up on; match them back to the mapped URL
+            index = BatchResultIndex(chunk, job.data)
+            for page_url in chunk:
+                document = index.get(page_url)
+                if document is None:
+                    result.failed.append(page_url)
+                    continue
+                _merge_document(manifest, result, page_url, document, etags.get(page_url), now)
+            # Finished batches survive a later batch failing or timing out
+            save_manifest(manifest_path, manifest)
+    finally:
+        save_manifest(manifest_path, manifest)
+    return result
+
+
+def _merge_document(
+    manifest: RecrawlManifest,
+    result: RecrawlResult,
+    page_url: str,
+    document: Document,
+    etag: Optional[str],
+    now: datetime,
+) -> None:
+    """Fold a freshly scraped document into the manifest and result."""
+    entry = manifest.entries.get(page_url)
+    new_hash = content_hash(document)
+    server_status = (document.change_tracking or {}).get("changeStatus")
+
+    if entry is None:
+        status = "new"
+        entry = RecrawlManifestEntry(url=page_url)
+        manifest.entries[page_url] = entry
+    elif new_hash is not None and new_hash == entry.content_hash:
+        status = "same"
+    elif server_status == "same" and new_hash is None:
+        status = "same"
+    else:
+        status = "changed"
+
+    entry.change_status = status
+    entry.last_seen = now
+    if etag:
+        entry.etag = etag
+    if status != "same":
+        entry.content_hash = new_hash
+        entry.last_changed = now
+
+    if status == "new":
+        result.new.append(page_url)
+        result.data.append(document)
+    elif status == "changed":
+        result.changed.append(page_url)
+        result.data.append(document)
+    else:
+        result.unchanged.append(page_url)
@@ -33,7 +33,12 @@ def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -
 
     return request_data
 
-def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+def scrape(
+    client: HttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    idempotency_key: Optional[str] = None,
+) -> Document:
     """
     Scrape a single URL and return the document.
     
@@ -44,13 +49,15 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
         client: HTTP client instance
         url: URL to scrape
         options: Scraping options (snake_case)
+        idempotency_key: Header used to deduplicate the request (e.g. hedged duplicates)
         
     Returns:
         Document
     """
     payload = _prepare_scrape_request(url, options)
 
-    response = client.post("/v2/scrape", payload)
+    headers = client._prepare_headers(idempotency_key) if idempotency_key else None
+    response = client.post("/v2/scrape", payload, headers=headers)
 
     if not response.ok:
         handle_response_error(response, "scrape")
@@ -0,0 +1,162 @@
+"""
+Search-then-scrape fan-out for Firecrawl v2 API.
+
+Runs a plain ``search()`` so the hits are available immediately, then scrapes
+the top results concurrently and hands documents back as each one finishes.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from ..types import Document, ScrapeOptions, SearchData, SearchRequest
+from ..utils import HttpClient
+from . import scrape as scrape_module
+from . import search as search_module
+
+logger = logging.getLogger("firecrawl")
+
+
+def hit_urls(hits: SearchData, top_k: int) -> List[str]:
+    """
+    Return the first ``top_k`` unique result URLs, web results before news.
+
+    Args:
+        hits: Search results
+        top_k: Maximum number of URLs to return
+
+    Returns:
+        List of URLs in rank order
+    """
+    urls: List[str] = []
+    seen: Set[str] = set()
+    for item in (hits.web or []) + (hits.news or []):
+        if isinstance(item, Document):
+            url = item.metadata_typed.source_url or item.metadata_typed.url
+        else:
+            url = getattr(item, "url", None)
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        urls.append(url)
+        if len(urls) >= top_k:
+            break
+    return urls
+
+
+class SearchScrapeStream:
+    """
+    Search hits plus a stream of scraped documents for the top results.
+
+    Scrapes start as soon as the stream is created. Iterating yields documents
+    in completion order; URLs that fail to scrape are recorded in ``errors``.
+    If ``stop_when`` matches a document, iteration ends and scrapes that have
+    not started yet are cancelled.
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        hits: SearchData,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_workers: Optional[int] = None,
+        stop_when: Optional[Callable[[Document], bool]] = None,
+    ):
+        self.hits = hits
+        self.urls = urls
+        self.errors: Dict[str, Exception] = {}
+        self.matched: Optional[Document] = None
+        self._stop_when = stop_when
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Future, str] = {}
+        if urls:
+            self._executor = ThreadPoolExecutor(max_workers=max(1, min(len(urls), max_workers or len(urls))))
+            # Workers run in the caller's context so an active Deadline applies
+            self._pending = {
+                self._executor.submit(contextvars.copy_context().run, scrape_module.scrape, client, url, options): url
+                for url in urls
+            }
+        self._rank = {future: i for i, future in enumerate(self._pending)}
+
+    def __iter__(self) -> Iterator[Document]:
+        try:
+            while self._pending:
+                done, _ = wait(list(self._pending), return_when=FIRST_COMPLETED)
+                # Futures finishing together are handed back in rank order
+                for future in sorted(done, key=self._rank.__getitem__):
+                    url = self._pending.pop(future)
+                    try:
+                        document = future.result()
+                    except Exception as e:
+                        logger.warning("Failed to scrape search result %s: %s", url, e)
+                        self.errors[url] = e
+                        continue
+                    yield document
+                    if self._stop_when is not None and self._stop_when(document):
+                        self.matched = document
+                        return
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Cancel scrapes that have not started and release the worker threads."""
+        for future in self._pending:
+            future.cancel()
+        self._pending = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> "SearchScrapeStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def search_and_scrape(
+    client: HttpClient,
+    request: SearchRequest,
+    *,
+    top_k: int = 5,
+    options: Optional[ScrapeOptions] = None,
+    max_workers: Optional[int] = None,
+    stop_when: Optional[Callable[[Document], bool]] = None,
+) -> SearchScrapeStream:
+    """
+    Search, then scrape the top-K hits concurrently.
+
+    Args:
+        client: HTTP client instance
+        request: Search request (its ``scrape_options`` are ignored so the
+            hits come back without waiting on page scrapes)
+        top_k: Number of top result URLs to scrape
+        options: Scrape options applied to each result
+        max_workers: Maximum concurrent scrapes (default: top_k)
+        stop_when: Predicate ending the stream once a document matches
+
+    Returns:
+        SearchScrapeStream exposing ``hits`` and iterating scraped documents
+
+    Raises:
+        FirecrawlError: If the search itself fails
+    """
+    if top_k <= 0:
+        raise ValueError("top_k must be positive")
+    if request.scrape_options is not None:
+        if options is None:
+            options = request.scrape_options
+        request = request.model_copy(update={"scrape_options": None})
+
+    hits = search_module.search(client, request)
+    return SearchScrapeStream(
+        client,
+        hits,
+        hit_urls(hits, top_k),
+        options=options,
+        max_workers=max_workers,
+        stop_when=stop_when,
+    )
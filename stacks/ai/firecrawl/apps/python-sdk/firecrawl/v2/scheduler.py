@@ -0,0 +1,352 @@
+"""
+Central status scheduler for many outstanding jobs.
+
+Instead of one sleeping waiter per job, a single background thread owns every
+pending job and polls them from a priority queue ordered by each job's
+predicted completion time, under a global cap on status requests per second.
+Each tracked job resolves a ``concurrent.futures.Future`` (usable from asyncio
+via ``asyncio.wrap_future``) and optional callbacks.
+
+Usage:
+    scheduler = client.job_scheduler(max_polls_per_second=5)
+    futures = [scheduler.watch_crawl(job_id) for job_id in job_ids]
+    for future in concurrent.futures.as_completed(futures):
+        print(future.result().status)
+    scheduler.close()
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .methods import batch as batch_module
+from .methods import crawl as crawl_module
+from .methods import extract as extract_module
+from .types import PaginationConfig
+from .utils import HttpClient
+
+logger = logging.getLogger("firecrawl")
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Status checks skip result pages while a job is running; the full result set
+# is fetched once, when the job reaches a terminal state.
+_STATUS_ONLY = PaginationConfig(auto_paginate=False)
+
+
+def _field(result: Any, name: str) -> Any:
+    if isinstance(result, dict):
+        return result.get(name)
+    return getattr(result, name, None)
+
+
+def _default_is_done(result: Any) -> bool:
+    return _field(result, "status") in TERMINAL_STATUSES
+
+
+def _default_progress(result: Any) -> Optional[Tuple[int, int]]:
+    completed, total = _field(result, "completed"), _field(result, "total")
+    if isinstance(completed, int) and isinstance(total, int) and total > 0:
+        return completed, total
+    return None
+
+
+class _TrackedJob:
+    def __init__(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        finalize: Optional[Callable[[Any], Any]],
+        is_done: Callable[[Any], bool],
+        progress: Callable[[Any], Optional[Tuple[int, int]]],
+        timeout: Optional[float],
+        now: float,
+    ) -> None:
+        self.key = key
+        self.fetch = fetch
+        self.finalize = finalize
+        self.is_done = is_done
+        self.progress = progress
+        self.deadline = now + timeout if timeout is not None else None
+        self.future: Future = Future()
+        self.callbacks: List[Callable[[Any], None]] = []
+        self.interval: Optional[float] = None
+        self.last_sample: Optional[Tuple[float, int]] = None
+        self.failures = 0
+
+
+class JobScheduler:
+    """
+    Poll many jobs from one thread, soonest predicted completion first.
+
+    The next check for a job is scheduled at its predicted completion time,
+    estimated from the progress rate between polls (``completed``/``total``),
+    clamped to ``[min_interval, max_interval]``. Jobs without progress
+    information back off geometrically. Status requests across all jobs are
+    spaced to at most ``max_polls_per_second``.
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        *,
+        max_polls_per_second: float = 5.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        max_failures: int = 3,
+    ) -> None:
+        if max_polls_per_second <= 0:
+            raise ValueError("max_polls_per_second must be positive")
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        self._client = client
+        self._min_spacing = 1.0 / max_polls_per_second
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._max_failures = max_failures
+
+        self._heap: List[Tuple[float, int, _TrackedJob]] = []
+        self._jobs: Dict[str, _TrackedJob] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._last_poll = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    # Registration
+
+    def watch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        *,
+        finalize: Optional[Callable[[Any], Any]] = None,
+        is_done: Optional[Callable[[Any], bool]] = None,
+        progress: Optional[Callable[[Any], Optional[Tuple[int, int]]]] = None,
+        callback: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Track an arbitrary job by its status function.
+
+        This is the extension point for job kinds without a dedicated helper,
+        e.g. v1 ``check_deep_research_status`` or
+        ``check_generate_llms_text_status``.
+
+        Args:
+            key: Unique job key; watching the same key again returns the same future
+            fetch: Returns the job's current status
+            finalize: Called with the terminal status to produce the result
+            is_done: Whether a status is terminal (default: status in completed/failed/cancelled)
+            progress: Returns (completed, total) from a status, or None
+            callback: Called with the result when the job finishes
+            timeout: Seconds before the future fails with TimeoutError
+
+        Returns:
+            Future resolved with the job's final status
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("JobScheduler is closed")
+            job = self._jobs.get(key)
+            if job is None:
+                now = time.monotonic()
+                job = _TrackedJob(
+                    key,
+                    fetch,
+                    finalize,
+                    is_done or _default_is_done,
+                    progress or _default_progress,
+                    timeout,
+                    now,
+                )
+                self._jobs[key] = job
+                heapq.heappush(self._heap, (now, next(self._seq), job))
+                self._ensure_thread()
+                self._cond.notify()
+            if callback is not None:
+                job.callbacks.append(callback)
+        return job.future
+
+    def watch_crawl(
+        self,
+        job_id: str,
+        *,
+        callback: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Track a v2 crawl job; resolves with the complete CrawlJob."""
+        return self.watch(
+            f"crawl:{job_id}",
+            lambda: crawl_module.get_crawl_status(self._client, job_id, _STATUS_ONLY),
+            finalize=lambda job: self._paginate(job, lambda: crawl_module.get_crawl_status(self._client, job_id)),
+            callback=callback,
+            timeout=timeout,
+        )
+
+    def watch_batch(
+        self,
+        job_id: str,
+        *,
+        callback: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Track a v2 batch scrape job; resolves with the complete BatchScrapeJob."""
+        return self.watch(
+            f"batch:{job_id}",
+            lambda: batch_module.get_batch_scrape_status(self._client, job_id, _STATUS_ONLY),
+            finalize=lambda job: self._paginate(job, lambda: batch_module.get_batch_scrape_status(self._client, job_id)),
+            callback=callback,
+            timeout=timeout,
+        )
+
+    def watch_extract(
+        self,
+        job_id: str,
+        *,
+        callback: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Track a v2 extract job; resolves with the final ExtractResponse."""
+        return self.watch(
+            f"extract:{job_id}",
+            lambda: extract_module.get_extract_status(self._client, job_id),
+            callback=callback,
+            timeout=timeout,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs still being tracked."""
+        with self._cond:
+            return len(self._jobs)
+
+    def close(self, cancel_pending: bool = True) -> None:
+        """
+        Stop the scheduler thread.
+
+        Args:
+            cancel_pending: Cancel futures of jobs that have not finished
+        """
+        with self._cond:
+            self._closed = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if cancel_pending:
+            for job in jobs:
+                job.future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "JobScheduler":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Internals
+
+    def _paginate(self, job: Any, fetch_all: Callable[[], Any]) -> Any:
+        if _field(job, "status") == "completed" and _field(job, "next"):
+            self._throttle()
+            return fetch_all()
+        return job
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="firecrawl-job-scheduler", daemon=True)
+            self._thread.start()
+
+    def _throttle(self) -> None:
+        wait = self._last_poll + self._min_spacing - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_poll = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    due = self._heap[0][0]
+                    delay = due - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(timeout=delay)
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.key not in self._jobs:
+                    continue
+
+            self._throttle()
+            self._poll(job)
+
+    def _poll(self, job: _TrackedJob) -> None:
+        now = time.monotonic()
+        try:
+            status = job.fetch()
+            job.failures = 0
+            if job.is_done(status):
+                result = job.finalize(status) if job.finalize else status
+                self._resolve(job, result=result)
+                return
+        except Exception as e:
+            job.failures += 1
+            if job.failures >= self._max_failures:
+                self._resolve(job, error=e)
+                return
+            logger.debug("Status check for %s failed (%d): %s", job.key, job.failures, e)
+            status = None
+
+        if job.deadline is not None and now >= job.deadline:
+            self._resolve(job, error=TimeoutError(f"Job {job.key} did not complete in time"))
+            return
+
+        next_at = now + self._next_interval(job, status, now)
+        if job.deadline is not None:
+            next_at = min(next_at, job.deadline)
+        with self._cond:
+            if job.key in self._jobs:
+                heapq.heappush(self._heap, (next_at, next(self._seq), job))
+
+    def _next_interval(self, job: _TrackedJob, status: Any, now: float) -> float:
+        progress = job.progress(status) if status is not None else None
+        predicted: Optional[float] = None
+        if progress is not None:
+            completed, total = progress
+            if job.last_sample is not None:
+                then, completed_then = job.last_sample
+                rate = (completed - completed_then) / max(now - then, 1e-6)
+                if rate > 0:
+                    predicted = (total - completed) / rate
+            job.last_sample = (now, completed)
+
+        if predicted is None:
+            # No usable estimate yet: back off geometrically
+            job.interval = self._min_interval if job.interval is None else job.interval * 1.5
+            predicted = job.interval
+        return min(max(predicted, self._min_interval), self._max_interval)
+
+    def _resolve(self, job: _TrackedJob, result: Any = None, error: Optional[BaseException] = None) -> None:
+        with self._cond:
+            self._jobs.pop(job.key, None)
+        if job.future.done():
+            return
+        if error is not None:
+            job.future.set_exception(error)
+            return
+        job.future.set_result(result)
+        for callback in job.callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.warning("Job scheduler callback for %s raised: %s", job.key, e)
@@ -6,10 +6,13 @@ This module contains clean, modern type definitions for the v2 API.
 
 import warnings
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
 import logging
 from pydantic import BaseModel, Field, field_validator, ValidationError
 
+if TYPE_CHECKING:
+    from .utils.batch_index import BatchResultIndex
+
 # Suppress pydantic warnings about schema field shadowing
 # Tested using schema_field alias="schema" but it doesn't work.
 warnings.filterwarnings("ignore", message="Field name \"schema\" in \"Format\" shadows an attribute in parent \"BaseModel\"")
@@ -179,6 +182,25 @@ class WebhookData(BaseModel):
     data: Optional[List[Document]] = None
     error: Optional[str] = None
 
+class WebhookEvent(BaseModel):
+    """An event delivered to a webhook receiver (e.g. ``crawl.page``)."""
+    success: Optional[bool] = None
+    type: str
+    id: str
+    data: List[Any] = []
+    error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def kind(self) -> str:
+        """Job kind prefix: ``crawl``, ``batch_scrape`` or ``extract``."""
+        return self.type.split(".", 1)[0]
+
+    @property
+    def event(self) -> str:
+        """Event suffix: ``started``, ``page``, ``completed`` or ``failed``."""
+        return self.type.split(".", 1)[-1]
+
 class Source(BaseModel):
     """Configuration for a search source."""
     type: str
@@ -446,6 +468,7 @@ class BatchScrapeResponse(BaseModel):
 
 class BatchScrapeJob(BaseModel):
     """Batch scrape job status and results."""
+    id: Optional[str] = None
     status: Literal["scraping", "completed", "failed", "cancelled"]
     completed: int
     total: int
@@ -454,6 +477,42 @@ class BatchScrapeJob(BaseModel):
     next: Optional[str] = None
     data: List[Document] = []
 
+    def index(self, urls: List[str]) -> "BatchResultIndex":
+        """Index this job's documents by the URLs that were submitted."""
+        from .utils.batch_index import BatchResultIndex
+        return BatchResultIndex(urls, self.data)
+
+class CrawlShard(BaseModel):
+    """A group of mapped URLs sharing path prefixes, scraped as one batch job."""
+    prefixes: List[str]
+    urls: List[str]
+
+class RecrawlManifestEntry(BaseModel):
+    """Last known state of a single URL in a recrawl manifest."""
+    url: str
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    change_status: Optional[Literal["new", "same", "changed", "removed"]] = None
+    last_seen: Optional[datetime] = None
+    last_changed: Optional[datetime] = None
+
+class RecrawlManifest(BaseModel):
+    """Local manifest of previously seen URLs for incremental recrawls."""
+    version: int = 1
+    url: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    entries: Dict[str, RecrawlManifestEntry] = {}
+
+class RecrawlResult(BaseModel):
+    """Outcome of an incremental recrawl run."""
+    new: List[str] = []
+    changed: List[str] = []
+    unchanged: List[str] = []
+    removed: List[str] = []
+    skipped: List[str] = []
+    failed: List[str] = []
+    data: List[Document] = []
+
 class BatchScrapeStatusRequest(BaseModel):
     """Request to get batch scrape job status."""
     job_id: str
@@ -514,6 +573,13 @@ class ExtractResponse(BaseModel):
     sources: Optional[Dict[str, Any]] = None
     expires_at: Optional[datetime] = None
 
+class ExtractPartitionResult(BaseModel):
+    """Outcome of one partition of an ``extract_many`` run."""
+    key: str
+    urls: List[str]
+    response: Optional[ExtractResponse] = None
+    error: Optional[str] = None
+
 # Usage/limits types
 class ConcurrencyCheck(BaseModel):
     """Current concurrency and limits for the team/API key."""
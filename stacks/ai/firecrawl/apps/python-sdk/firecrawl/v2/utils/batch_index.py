@@ -0,0 +1,117 @@
+"""
+URL-to-document index for batch scrape results.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..types import CrawlError, CrawlErrorsResponse, Document
+from .urls import normalize_url
+
+
+class BatchResultIndex:
+    """
+    Correlates batch scrape results with the URLs that were submitted.
+
+    Lookups are O(1) and tolerant of trailing slashes, host case, default
+    ports and fragments. A document is matched by its ``source_url`` (the
+    URL as requested) first and by its final ``url`` second, so redirected
+    pages still resolve to the URL that was submitted.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        documents: Iterable[Document] = (),
+        errors: Optional[CrawlErrorsResponse] = None,
+    ) -> None:
+        self.urls: List[str] = []
+        self._requested: Dict[str, str] = {}
+        self._documents: Dict[str, Document] = {}
+        self._errors: Dict[str, CrawlError] = {}
+        self._robots_blocked: Dict[str, str] = {}
+        self.unmatched: List[Document] = []
+        for url in urls:
+            key = normalize_url(url)
+            if key not in self._requested:
+                self._requested[key] = url
+                self.urls.append(url)
+        self.add_documents(documents)
+        if errors is not None:
+            self.add_errors(errors)
+
+    def _resolve(self, url: Optional[str]) -> Optional[str]:
+        if not url:
+            return None
+        return self._requested.get(normalize_url(url))
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        """Index documents; later documents for the same URL replace earlier ones."""
+        for document in documents:
+            md = document.metadata_typed
+            requested = self._resolve(md.source_url) or self._resolve(md.url)
+            if requested is None:
+                self.unmatched.append(document)
+                continue
+            self._documents[requested] = document
+            self._errors.pop(requested, None)
+
+    def add_errors(self, errors: CrawlErrorsResponse) -> None:
+        """Join errors from ``get_batch_scrape_errors`` onto the requested URLs."""
+        for error in errors.errors:
+            requested = self._resolve(error.url)
+            if requested is not None and requested not in self._documents:
+                self._errors[requested] = error
+        for url in errors.robots_blocked:
+            requested = self._resolve(url)
+            if requested is not None and requested not in self._documents:
+                self._robots_blocked[requested] = url
+
+    def get(self, url: str) -> Optional[Document]:
+        """Return the document scraped for a requested URL, if any."""
+        requested = self._resolve(url)
+        return self._documents.get(requested) if requested is not None else None
+
+    def __getitem__(self, url: str) -> Document:
+        document = self.get(url)
+        if document is None:
+            raise KeyError(url)
+        return document
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self.get(url) is not None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def items(self) -> Iterator[Tuple[str, Document]]:
+        """Iterate (requested URL, document) pairs in submission order."""
+        for url in self.urls:
+            document = self._documents.get(url)
+            if document is not None:
+                yield url, document
+
+    @property
+    def failed(self) -> Dict[str, CrawlError]:
+        """Requested URLs that reported a scrape error, with the error."""
+        return dict(self._errors)
+
+    @property
+    def robots_blocked(self) -> List[str]:
+        """Requested URLs blocked by robots.txt."""
+        return [url for url in self.urls if url in self._robots_blocked]
+
+    @property
+    def missing(self) -> List[str]:
+        """Requested URLs with neither a document nor a reported error."""
+        return [
+            url for url in self.urls
+            if url not in self._documents and url not in self._errors and url not in self._robots_blocked
+        ]
+
+    @property
+    def gaps(self) -> List[str]:
+        """Requested URLs without a document that are worth re-submitting (missing and failed)."""
+        return [
+            url for url in self.urls
+            if url not in self._documents and url not in self._robots_blocked
+        ]
@@ -0,0 +1,307 @@
+"""
+Record-and-replay transport for offline benchmarks and regression tests.
+
+:class:`RecordTransport` lets real requests through and stores each exchange
+in a :class:`Cassette`; :class:`ReplayTransport` answers requests from a
+cassette without touching the network, optionally sleeping for the recorded
+(or a fixed) latency so pagination, polling and watchers behave as they would
+against the live API.
+
+Cassettes are gzip-compressed JSON. Response bodies are content-addressed
+(keyed by SHA-256), so the identical status pages a poll loop produces are
+stored once. Request headers are never stored, so API keys stay out of
+cassette files.
+
+Requests are matched on method, path and query, and the JSON body (minus the
+SDK's ``origin`` field). Repeated identical requests, such as a status poll,
+replay their recorded responses in order, then keep returning the last one.
+
+Usage:
+    cassette = Cassette()
+    client = Firecrawl(api_key="...", transport=RecordTransport(cassette))
+    client.crawl("https://example.com", limit=50)
+    cassette.save("crawl.cassette")
+
+    replay = ReplayTransport(Cassette.load("crawl.cassette"), latency="recorded")
+    client = Firecrawl(api_key="offline", transport=replay)
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .deadline import async_backoff_sleep, backoff_sleep
+from .error_handler import CassetteMissError
+
+CASSETTE_VERSION = 1
+
+# Hop-by-hop or encoding headers that no longer describe the stored (decoded) body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def request_key(method: str, url: str, body: Optional[Dict[str, Any]] = None) -> str:
+    """Return the match key for a request, ignoring host and the ``origin`` field."""
+    parsed = urlparse(url)
+    path = "/" + parsed.path.lstrip("/")
+    target = f"{path}?{parsed.query}" if parsed.query else path
+    if body is None:
+        return f"{method.upper()} {target}"
+    payload = {k: v for k, v in body.items() if k != "origin"}
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{method.upper()} {target} {digest[:16]}"
+
+
+class Cassette:
+    """Recorded exchanges plus a content-addressed store of response bodies."""
+
+    def __init__(self) -> None:
+        self.interactions: List[Dict[str, Any]] = []
+        self.bodies: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        latency: float,
+    ) -> None:
+        """Store one exchange."""
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self.bodies.setdefault(digest, content)
+            self.interactions.append({
+                "key": request_key(method, url, body),
+                "status": status_code,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+                "body": digest,
+                "latency": round(latency, 6),
+            })
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def save(self, path: str) -> None:
+        """Write the cassette as gzip-compressed JSON (byte-identical for identical content)."""
+        bodies = {}
+        for digest, content in self.bodies.items():
+            try:
+                bodies[digest] = {"text": content.decode("utf-8")}
+            except UnicodeDecodeError:
+                bodies[digest] = {"base64": base64.b64encode(content).decode("ascii")}
+        data = {"version": CASSETTE_VERSION, "interactions": self.interactions, "bodies": bodies}
+        raw = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        with open(path, "wb") as f:
+            with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                gz.write(raw)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Read a cassette written by :meth:`save`."""
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read())
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        cassette = cls()
+        cassette.interactions = data["interactions"]
+        for digest, stored in data["bodies"].items():
+            if "text" in stored:
+                cassette.bodies[digest] = stored["text"].encode("utf-8")
+            else:
+                cassette.bodies[digest] = base64.b64decode(stored["base64"])
+        return cassette
+
+
+class RecordTransport:
+    """Transport that performs real requests and records them into a cassette."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        self.cassette = cassette
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        started = time.monotonic()
+        response = send()
+        self.cassette.add(
+            method, url, body, response.status_code, dict(response.headers), response.content,
+            time.monotonic() - started,
+        )
+        return response
+
+    async def asend(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        started = time.monotonic()
+        response = await send()
+        self.cassette.add(
+            method, url, body, response.status_code, dict(response.headers), response.content,
+            time.monotonic() - started,
+        )
+        return response
+
+
+class ReplayTransport:
+    """
+    Transport answering requests from a cassette.
+
+    Replay is thread- and task-safe: concurrent requests are served in
+    parallel, each sleeping its own injected latency, unless
+    ``max_concurrency`` limits how many are in flight (1 replays serially).
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        latency: Union[None, float, str] = None,
+        latency_scale: float = 1.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = 0,
+        max_concurrency: Optional[int] = None,
+        strict: bool = True,
+    ) -> None:
+        """
+        Args:
+            cassette: Recorded exchanges to serve
+            latency: None for instant responses, "recorded" for each exchange's recorded latency,
+                or a fixed number of seconds
+            latency_scale: Multiplier applied to the injected latency (e.g. 0.1 for a 10x faster run)
+            jitter: Random extra latency as a fraction of the injected latency (0.2 = up to +20%)
+            seed: Seed for the jitter, so runs are reproducible (None: unseeded)
+            max_concurrency: Requests replayed at once (None: unlimited)
+            strict: Raise CassetteMissError for unrecorded requests instead of sending them
+        """
+        if isinstance(latency, str) and latency != "recorded":
+            raise ValueError("latency must be None, a number of seconds, or 'recorded'")
+        self.cassette = cassette
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.strict = strict
+        self.replayed = 0
+        self.misses = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cursors: Dict[str, int] = {}
+        self._by_key: Dict[str, List[Dict[str, Any]]] = {}
+        for interaction in cassette.interactions:
+            self._by_key.setdefault(interaction["key"], []).append(interaction)
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._async_slots: Optional[asyncio.Semaphore] = None
+
+    def _next(self, method: str, url: str, body: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Pick the next recorded exchange for this request and its injected latency."""
+        key = request_key(method, url, body)
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                self.misses += 1
+                return None, 0.0
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            interaction = recorded[min(cursor, len(recorded) - 1)]
+            self.replayed += 1
+            if self.latency is None:
+                delay = 0.0
+            elif self.latency == "recorded":
+                delay = float(interaction.get("latency", 0.0))
+            else:
+                delay = float(self.latency)
+            delay *= self.latency_scale
+            if self.jitter and delay:
+                delay += delay * self.jitter * self._random.random()
+        return interaction, delay
+
+    def _content(self, interaction: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        return interaction["status"], interaction["headers"], self.cassette.bodies[interaction["body"]]
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        interaction, delay = self._next(method, url, body)
+        if interaction is None:
+            if self.strict:
+                raise CassetteMissError(method, url)
+            return send()
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            if delay:
+                backoff_sleep(delay, "replay the request")
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        status_code, headers, content = self._content(interaction)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+    async def asend(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        interaction, delay = self._next(method, url, body)
+        if interaction is None:
+            if self.strict:
+                raise CassetteMissError(method, url)
+            return await send()
+        if self.max_concurrency:
+            if self._async_slots is None:
+                self._async_slots = asyncio.Semaphore(self.max_concurrency)
+            async with self._async_slots:
+                if delay:
+                    await async_backoff_sleep(delay, "replay the request")
+        elif delay:
+            await async_backoff_sleep(delay, "replay the request")
+        status_code, headers, content = self._content(interaction)
+        return httpx.Response(
+            status_code,
+            headers=headers,
+            content=content,
+            request=httpx.Request(method, url),
+        )
+
+    def rewind(self) -> None:
+        """Start replaying every request's recorded sequence from the beginning."""
+        with self._lock:
+            self._cursors.clear()
+            self.replayed = 0
+            self.misses = 0
+
+
+Transport = Union[RecordTransport, ReplayTransport]
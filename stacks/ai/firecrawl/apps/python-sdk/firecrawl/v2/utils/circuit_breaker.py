@@ -0,0 +1,211 @@
+"""
+Per-endpoint-family circuit breakers for the HTTP transport.
+
+Requests are grouped into families (``scrape``, ``crawl``, ``status``,
+``extract``, ``other``), each with its own breaker. A breaker opens when the
+error rate or the share of slow calls in its recent window crosses a
+threshold; while open, calls fail immediately with :class:`CircuitOpenError`
+instead of waiting out timeouts and retries. After ``reset_timeout`` a few
+probe calls are let through (half-open) and their outcome closes or re-opens
+the circuit.
+
+Usage:
+    breakers = CircuitBreakerRegistry(failure_threshold=0.5, slow_call_threshold=20)
+    breakers.on_state_change(lambda family, old, new: metrics.gauge(family, new))
+    client = Firecrawl(api_key="...", circuit_breakers=breakers)
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Literal, Optional, Tuple
+
+from .error_handler import CircuitOpenError
+
+logger = logging.getLogger("firecrawl")
+
+CircuitState = Literal["closed", "open", "half_open"]
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+# (method or None for any, path pattern, family); first match wins
+_FAMILIES: List[Tuple[Optional[str], "re.Pattern[str]", str]] = [
+    ("GET", re.compile(r"/v\d+/(crawl|batch/scrape|extract|deep-research|llmstxt)/[^/]+"), "status"),
+    (None, re.compile(r"/v\d+/extract"), "extract"),
+    (None, re.compile(r"/v\d+/(crawl|map)"), "crawl"),
+    (None, re.compile(r"/v\d+/(scrape|batch/scrape|search)"), "scrape"),
+]
+
+
+def endpoint_family(method: str, path: str) -> str:
+    """Return the breaker family for a request, e.g. ``("GET", "/v2/crawl/abc") -> "status"``."""
+    method = method.upper()
+    for family_method, pattern, family in _FAMILIES:
+        if (family_method is None or family_method == method) and pattern.search(path):
+            return family
+    return "other"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a sliding window of recent calls."""
+
+    def __init__(
+        self,
+        family: str,
+        *,
+        failure_threshold: float = 0.5,
+        slow_call_threshold: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 2,
+        listeners: Optional[List[StateListener]] = None,
+    ) -> None:
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state: CircuitState = "closed"
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self._listeners = listeners if listeners is not None else []
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError."""
+        with self._lock:
+            if self.state == "open":
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.family, remaining)
+                self._transition("half_open")
+            if self.state == "half_open":
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.family, self.reset_timeout)
+                self._probes += 1
+
+    def release(self) -> None:
+        """Return an admitted call that never reached the server, without an outcome."""
+        with self._lock:
+            if self.state == "half_open" and self._probes > 0:
+                self._probes -= 1
+
+    def record(self, success: bool, latency: float) -> None:
+        """Record the outcome of an admitted call."""
+        slow = self.slow_call_threshold is not None and latency >= self.slow_call_threshold
+        with self._lock:
+            if self.state == "half_open":
+                if not success or slow:
+                    self._transition("open")
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition("closed")
+                return
+            if self.state != "closed":
+                return
+            self._outcomes.append((success, slow))
+            if len(self._outcomes) < self.min_calls:
+                return
+            failures = sum(1 for ok, _ in self._outcomes if not ok)
+            slow_calls = sum(1 for _, is_slow in self._outcomes if is_slow)
+            if (
+                failures / len(self._outcomes) >= self.failure_threshold
+                or slow_calls / len(self._outcomes) >= self.slow_call_rate
+            ):
+                self._transition("open")
+
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        with self._lock:
+            self._transition("closed")
+
+    def _transition(self, new: CircuitState) -> None:
+        old, self.state = self.state, new
+        self._probes = 0
+        self._probe_successes = 0
+        if new == "open":
+            self._opened_at = time.monotonic()
+        elif new == "closed":
+            self._outcomes.clear()
+        if old == new:
+            return
+        logger.info("Circuit for %s requests %s -> %s", self.family, old, new)
+        for listener in list(self._listeners):
+            try:
+                listener(self.family, old, new)
+            except Exception as e:
+                logger.warning("Circuit state listener raised: %s", e)
+
+
+class CircuitBreakerRegistry:
+    """
+    One breaker per endpoint family, created on first use with shared settings.
+
+    A call is counted as failed when it raises (connection errors, timeouts)
+    or returns a 5xx status; 4xx responses are the caller's problem and count
+    as successes. Calls slower than ``slow_call_threshold`` seconds count as
+    slow.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        slow_call_threshold: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 2,
+    ) -> None:
+        """
+        Args:
+            failure_threshold: Failure rate (0-1) in the window that opens the circuit
+            slow_call_threshold: Seconds after which a call counts as slow (None: ignore latency)
+            slow_call_rate: Slow-call rate (0-1) in the window that opens the circuit
+            window: Number of recent calls considered
+            min_calls: Calls needed in the window before the circuit can open
+            reset_timeout: Seconds an open circuit waits before probing
+            half_open_max_calls: Successful probes needed to close the circuit again
+        """
+        self._settings = dict(
+            failure_threshold=failure_threshold,
+            slow_call_threshold=slow_call_threshold,
+            slow_call_rate=slow_call_rate,
+            window=window,
+            min_calls=min_calls,
+            reset_timeout=reset_timeout,
+            half_open_max_calls=half_open_max_calls,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listeners: List[StateListener] = []
+        self._lock = threading.Lock()
+
+    def on_state_change(self, callback: StateListener) -> None:
+        """Register ``callback(family, old_state, new_state)`` for every breaker."""
+        self._listeners.append(callback)
+
+    def get(self, family: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(family, listeners=self._listeners, **self._settings)
+                self._breakers[family] = breaker
+            return breaker
+
+    def for_request(self, method: str, path: str) -> CircuitBreaker:
+        return self.get(endpoint_family(method, path))
+
+    @property
+    def states(self) -> Dict[str, CircuitState]:
+        """Current state of every breaker created so far."""
+        with self._lock:
+            return {family: breaker.state for family, breaker in self._breakers.items()}
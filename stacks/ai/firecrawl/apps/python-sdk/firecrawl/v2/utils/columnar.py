@@ -0,0 +1,346 @@
+"""
+Columnar container for crawl and batch results.
+
+:class:`ColumnarResults` is filled straight from raw result pages, one page
+(chunk) at a time, without building ``Document``/``DocumentMetadata`` models.
+Each column (``markdown``, ``source_url``, ``status_code``, ``title``, ...) is
+kept as an array per chunk. When pyarrow is installed every chunk is stored
+as an Arrow ``RecordBatch`` as soon as it is appended, so :meth:`to_arrow` just
+stacks the batches without copying and :meth:`to_pandas` converts from Arrow
+in one pass. Without pyarrow the columns are plain Python lists.
+
+Usage:
+    results = client.get_crawl_columns(job_id, columns=["source_url", "title", "markdown"])
+    results.to_parquet("crawl.parquet")
+    df = results.to_pandas()
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from ..types import Document, PaginationConfig
+from .error_handler import handle_response_error
+from .normalize import _METADATA_KEY_MAP
+
+DEFAULT_COLUMNS = (
+    "source_url",
+    "url",
+    "status_code",
+    "title",
+    "description",
+    "language",
+    "content_type",
+    "scrape_id",
+    "credits_used",
+    "cache_state",
+    "error",
+    "markdown",
+)
+
+# Top-level document fields (raw API key); every other column is read from metadata
+_DOCUMENT_FIELDS = {
+    "markdown": "markdown",
+    "html": "html",
+    "raw_html": "rawHtml",
+    "summary": "summary",
+    "links": "links",
+    "images": "images",
+    "screenshot": "screenshot",
+    "warning": "warning",
+    "json": "json",
+    "actions": "actions",
+    "change_tracking": "changeTracking",
+}
+_INT_COLUMNS = {"status_code", "credits_used", "num_pages"}
+_LIST_COLUMNS = {"links", "images", "og_locale_alternate"}
+# Nested values are stored as JSON text
+_JSON_COLUMNS = {"json", "actions", "change_tracking"}
+
+_SNAKE_TO_CAMEL = {snake: camel for camel, snake in _METADATA_KEY_MAP.items()}
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _require_pyarrow() -> Any:
+    pa = _pyarrow()
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow/Parquet/pandas export: pip install pyarrow")
+    return pa
+
+
+def _coerce(column: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if column in _INT_COLUMNS:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    if column in _LIST_COLUMNS:
+        return [str(v) for v in value] if isinstance(value, list) else [str(value)]
+    if column in _JSON_COLUMNS:
+        return json.dumps(value)
+    if isinstance(value, list):
+        # Same rule as normalize_document_input for single-valued metadata
+        return ", ".join(str(v) for v in value)
+    return value if isinstance(value, str) else str(value)
+
+
+class ColumnarResults:
+    """Column arrays for result documents, appended page by page."""
+
+    def __init__(self, columns: Optional[Sequence[str]] = None) -> None:
+        """
+        Args:
+            columns: Column names (snake_case document or metadata fields); defaults to DEFAULT_COLUMNS
+        """
+        self.columns: List[str] = list(columns or DEFAULT_COLUMNS)
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("Duplicate column names")
+        self._getters = [self._getter(name) for name in self.columns]
+        self._chunks: List[Any] = []
+        self._rows = 0
+        self._schema: Any = None
+        # Job-level fields from the most recent page
+        self.status: Optional[str] = None
+        self.completed: Optional[int] = None
+        self.total: Optional[int] = None
+        self.credits_used: Optional[int] = None
+        self.next: Optional[str] = None
+
+    @staticmethod
+    def _getter(column: str):
+        if column in _DOCUMENT_FIELDS:
+            key = _DOCUMENT_FIELDS[column]
+            return lambda item, md: item.get(key, item.get(column))
+        camel = _SNAKE_TO_CAMEL.get(column, column)
+        return lambda item, md: md.get(camel, md.get(column))
+
+    # Filling
+
+    def append_items(self, items: Iterable[Any]) -> int:
+        """
+        Append raw document dicts (API shape) as one chunk.
+
+        Returns:
+            Number of rows appended (non-dict items are skipped)
+        """
+        data: Dict[str, List[Any]] = {name: [] for name in self.columns}
+        arrays = [data[name] for name in self.columns]
+        count = 0
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            md = item.get("metadata")
+            if not isinstance(md, dict):
+                md = {}
+            for name, getter, array in zip(self.columns, self._getters, arrays):
+                array.append(_coerce(name, getter(item, md)))
+            count += 1
+        if count:
+            self._add_chunk(data, count)
+        return count
+
+    def append_page(self, page: Union[bytes, str, Dict[str, Any]]) -> int:
+        """
+        Append the documents of a raw crawl/batch result page.
+
+        Args:
+            page: Response body (bytes/str) or the parsed page dict
+
+        Returns:
+            Number of rows appended
+        """
+        body = json.loads(page) if isinstance(page, (bytes, str)) else page
+        for field, key in (
+            ("status", "status"),
+            ("completed", "completed"),
+            ("total", "total"),
+            ("credits_used", "creditsUsed"),
+        ):
+            if key in body:
+                setattr(self, field, body[key])
+        # A page without a cursor is the last one
+        self.next = body.get("next")
+        return self.append_items(body.get("data") or [])
+
+    def append_documents(self, documents: Iterable[Document]) -> int:
+        """Append already-built Document models as one chunk."""
+        items = []
+        for doc in documents:
+            item = doc.model_dump(exclude_none=True)
+            item["metadata"] = item.get("metadata") or {}
+            items.append(item)
+        return self.append_items(items)
+
+    def _add_chunk(self, data: Dict[str, List[Any]], count: int) -> None:
+        pa = _pyarrow()
+        if pa is not None:
+            data = pa.RecordBatch.from_pydict(data, schema=self._arrow_schema(pa))
+        self._chunks.append(data)
+        self._rows += count
+
+    def _arrow_schema(self, pa: Any) -> Any:
+        if self._schema is None:
+            fields = []
+            for name in self.columns:
+                if name in _INT_COLUMNS:
+                    fields.append(pa.field(name, pa.int64()))
+                elif name in _LIST_COLUMNS:
+                    fields.append(pa.field(name, pa.list_(pa.string())))
+                else:
+                    fields.append(pa.field(name, pa.large_string()))
+            self._schema = pa.schema(fields)
+        return self._schema
+
+    # Access
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self._chunks)
+
+    def column(self, name: str) -> List[Any]:
+        """Return one column as a Python list."""
+        if name not in self.columns:
+            raise KeyError(name)
+        values: List[Any] = []
+        for chunk in self._chunks:
+            if isinstance(chunk, dict):
+                values.extend(chunk[name])
+            else:
+                values.extend(chunk.column(name).to_pylist())
+        return values
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate rows as dicts (for small results; prefer column access)."""
+        for chunk in self._chunks:
+            if isinstance(chunk, dict):
+                yield from (dict(zip(self.columns, values)) for values in zip(*(chunk[n] for n in self.columns)))
+            else:
+                yield from chunk.to_pylist()
+
+    # Export
+
+    def to_arrow(self) -> Any:
+        """Return a ``pyarrow.Table`` backed by the stored chunks (no copy)."""
+        pa = _require_pyarrow()
+        schema = self._arrow_schema(pa)
+        batches = [
+            chunk if not isinstance(chunk, dict) else pa.RecordBatch.from_pydict(chunk, schema=schema)
+            for chunk in self._chunks
+        ]
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """Write the results to a Parquet file; ``kwargs`` go to ``pyarrow.parquet.write_table``."""
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+    def to_pandas(self, **kwargs: Any) -> Any:
+        """Return a pandas DataFrame; ``kwargs`` go to ``pyarrow.Table.to_pandas``."""
+        return self.to_arrow().to_pandas(**kwargs)
+
+
+def _limits(pagination_config: Optional[PaginationConfig]):
+    if pagination_config is None:
+        return True, None, None
+    return pagination_config.auto_paginate, pagination_config.max_pages, pagination_config.max_results
+
+
+def fetch_columns(
+    client: Any,
+    endpoint: str,
+    action: str,
+    columns: Optional[Sequence[str]] = None,
+    pagination_config: Optional[PaginationConfig] = None,
+) -> ColumnarResults:
+    """
+    Fill a ColumnarResults from a crawl/batch status endpoint, following ``next`` pages.
+
+    Args:
+        client: HTTP client instance
+        endpoint: Status endpoint (e.g. ``/v2/crawl/{id}``)
+        action: Action name used in error messages
+        columns: Column names (defaults to DEFAULT_COLUMNS)
+        pagination_config: Optional limits (auto_paginate, max_pages, max_results)
+
+    Returns:
+        ColumnarResults with one chunk per page
+    """
+    results = ColumnarResults(columns)
+    auto_paginate, max_pages, max_results = _limits(pagination_config)
+    response = client.get(endpoint)
+    if not response.ok:
+        handle_response_error(response, action)
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    _append_limited(results, body, max_results)
+
+    pages = 0
+    while auto_paginate and results.next and not _full(results, max_results):
+        if max_pages is not None and pages >= max_pages:
+            break
+        response = client.get(results.next)
+        if not response.ok:
+            break
+        body = response.json()
+        if not body.get("success"):
+            break
+        _append_limited(results, body, max_results)
+        pages += 1
+    return results
+
+
+async def afetch_columns(
+    client: Any,
+    endpoint: str,
+    action: str,
+    columns: Optional[Sequence[str]] = None,
+    pagination_config: Optional[PaginationConfig] = None,
+) -> ColumnarResults:
+    """Async variant of :func:`fetch_columns` for ``AsyncHttpClient``."""
+    results = ColumnarResults(columns)
+    auto_paginate, max_pages, max_results = _limits(pagination_config)
+    response = await client.get(endpoint)
+    if response.status_code >= 400:
+        handle_response_error(response, action)
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    _append_limited(results, body, max_results)
+
+    pages = 0
+    while auto_paginate and results.next and not _full(results, max_results):
+        if max_pages is not None and pages >= max_pages:
+            break
+        response = await client.get(results.next)
+        if response.status_code >= 400:
+            break
+        body = response.json()
+        if not body.get("success"):
+            break
+        _append_limited(results, body, max_results)
+        pages += 1
+    return results
+
+
+def _full(results: ColumnarResults, max_results: Optional[int]) -> bool:
+    return max_results is not None and len(results) >= max_results
+
+
+def _append_limited(results: ColumnarResults, body: Dict[str, Any], max_results: Optional[int]) -> None:
+    if max_results is not None:
+        body = dict(body, data=(body.get("data") or [])[: max(0, max_results - len(results))])
+    results.append_page(body)
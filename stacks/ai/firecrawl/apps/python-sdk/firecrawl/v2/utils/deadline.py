@@ -0,0 +1,181 @@
+"""
+End-to-end deadlines for SDK calls.
+
+A :class:`Deadline` is an absolute point on the monotonic clock. Entering it
+as a context manager makes it the active deadline for everything called
+inside: each HTTP request gets the remaining budget as its timeout, retry
+backoffs and polling sleeps are cut short, pagination stops issuing requests,
+and a :class:`DeadlineExceededError` is raised once the budget is spent.
+Nested deadlines never extend an outer one.
+
+The active deadline lives in a ``contextvars.ContextVar``, so it follows
+asyncio tasks automatically. Plain threads start with an empty context; the
+watchers copy the caller's context into their background thread.
+
+Usage:
+    with Deadline(5.0):
+        job = firecrawl.crawl("https://example.com", limit=50)
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from typing import List, Optional, Union
+
+from .error_handler import DeadlineExceededError
+
+# Budget a deadline-capped sleep leaves for the caller's last check (seconds)
+_LAST_CHECK_RESERVE = 1.0
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("firecrawl_deadline", default=None)
+
+
+class Deadline:
+    """Absolute time budget shared by every layer of a call."""
+
+    def __init__(self, seconds: float) -> None:
+        """
+        Args:
+            seconds: Budget from now, in seconds
+        """
+        self.expires_at = time.monotonic() + max(0.0, seconds)
+        self._tokens: List[Token] = []
+        self._last_check_reserved = False
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self, action: str = "complete the request") -> None:
+        """Raise DeadlineExceededError if the budget is spent."""
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline exceeded: failed to {action} in time")
+
+    def cap(self, timeout: Optional[float] = None) -> float:
+        """Return ``timeout`` limited to the remaining budget (the budget itself if None)."""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def sleep(self, seconds: float, action: str = "complete the request") -> None:
+        """
+        Sleep for ``seconds`` or until shortly before the deadline, whichever is sooner.
+
+        The first sleep that would reach the deadline wakes up early, leaving
+        part of the budget for the caller's last check; a later one sleeps out
+        the rest. Raises DeadlineExceededError if no budget is left afterwards.
+        """
+        time.sleep(self._plan_sleep(seconds))
+        self.check(action)
+
+    async def asleep(self, seconds: float, action: str = "complete the request") -> None:
+        """Async variant of :meth:`sleep`."""
+        await asyncio.sleep(self._plan_sleep(seconds))
+        self.check(action)
+
+    def _plan_sleep(self, seconds: float) -> float:
+        remaining = self.remaining()
+        if seconds < remaining:
+            return max(0.0, seconds)
+        if self._last_check_reserved:
+            return remaining
+        self._last_check_reserved = True
+        return remaining - min(remaining / 2, _LAST_CHECK_RESERVE)
+
+    def __enter__(self) -> "Deadline":
+        outer = _current.get()
+        # A nested deadline can only tighten the budget
+        if outer is not None and outer.expires_at < self.expires_at:
+            self.expires_at = outer.expires_at
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._tokens.pop())
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in this context, if any."""
+    return _current.get()
+
+
+def deadline_scope(seconds: Optional[float]) -> Union[Deadline, "_NoDeadline"]:
+    """
+    Context manager activating a deadline ``seconds`` from now.
+
+    ``None`` keeps whatever deadline is already active, so functions taking an
+    optional ``timeout`` can always wrap their work in ``with deadline_scope(timeout):``.
+    """
+    return Deadline(seconds) if seconds is not None else _NoDeadline()
+
+
+class _NoDeadline:
+    def __enter__(self) -> Optional[Deadline]:
+        return _current.get()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+def request_timeout(timeout: Optional[float], action: str = "complete the request") -> Optional[float]:
+    """
+    Timeout for one HTTP request under the active deadline.
+
+    Raises DeadlineExceededError if the deadline has already passed.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return timeout
+    deadline.check(action)
+    return deadline.cap(timeout)
+
+
+def backoff_sleep(seconds: float, action: str = "complete the request") -> None:
+    """
+    Retry backoff that respects the active deadline.
+
+    A retry that could only start after the deadline is pointless, so this
+    raises DeadlineExceededError instead of sleeping when the backoff would
+    outlast the budget.
+    """
+    deadline = _current.get()
+    if deadline is not None and seconds >= deadline.remaining():
+        raise DeadlineExceededError(f"Deadline exceeded: failed to {action} in time")
+    time.sleep(seconds)
+
+
+async def async_backoff_sleep(seconds: float, action: str = "complete the request") -> None:
+    """Async variant of :func:`backoff_sleep`."""
+    deadline = _current.get()
+    if deadline is not None and seconds >= deadline.remaining():
+        raise DeadlineExceededError(f"Deadline exceeded: failed to {action} in time")
+    await asyncio.sleep(seconds)
+
+
+def poll_sleep(seconds: float, action: str = "complete the request") -> None:
+    """
+    Polling interval that respects the active deadline.
+
+    Unlike :func:`backoff_sleep` the wait is cut short near the deadline, so
+    the poll that might see the job finish still happens (see Deadline.sleep).
+    """
+    deadline = _current.get()
+    if deadline is None:
+        time.sleep(seconds)
+    else:
+        deadline.sleep(seconds, action)
+
+
+async def async_poll_sleep(seconds: float, action: str = "complete the request") -> None:
+    """Async variant of :func:`poll_sleep`."""
+    deadline = _current.get()
+    if deadline is None:
+        await asyncio.sleep(seconds)
+    else:
+        await deadline.asleep(seconds, action)
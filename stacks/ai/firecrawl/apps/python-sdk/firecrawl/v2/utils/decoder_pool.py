@@ -0,0 +1,161 @@
+"""
+Process pool for decoding large result pages.
+
+Normalizing raw result items and validating them into ``Document`` models is
+pure CPU work that holds the GIL. For crawl and batch pages carrying thousands
+of documents, :class:`DecoderPool` spreads that work across processes.
+
+The page is parsed once in the parent. Each worker receives only its own
+slice of items, re-encoded as compact JSON bytes: one ``bytes`` object
+pickles far faster than a list of nested dicts, and the C JSON encoder and
+parser cost little next to validation. Slices are reassembled in order.
+Items beyond a caller's ``limit`` are dropped before any encoding or
+decoding. Pages smaller than ``min_parallel_items`` are decoded inline.
+
+Usage:
+    with DecoderPool(max_workers=16) as pool:
+        client = Firecrawl(api_key="...", decoder_pool=pool)
+        job = client.get_batch_scrape_status(job_id)
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..types import Document
+from .normalize import normalize_document_input
+from .projection import FieldProjection, Fields
+
+
+def decode_documents(items: List[Any], projection: Optional[FieldProjection] = None) -> List[Document]:
+    """Normalize and validate raw result items, skipping non-dict entries.
+
+    With a projection, unrequested keys are dropped before normalization.
+    """
+    if projection is not None:
+        return [
+            Document(**normalize_document_input(projection.apply(item))) for item in items if isinstance(item, dict)
+        ]
+    return [Document(**normalize_document_input(item)) for item in items if isinstance(item, dict)]
+
+
+def _decode_slice(raw: bytes, projection: Optional[FieldProjection] = None) -> List[Document]:
+    return decode_documents(json.loads(raw), projection)
+
+
+def _page_items(body: Dict[str, Any], limit: Optional[int]) -> List[Any]:
+    items = body.get("data") or []
+    if limit is None:
+        return items
+    # Non-dict items never become documents, so they do not count towards the limit
+    return [item for item in items if isinstance(item, dict)][: max(0, limit)]
+
+
+class DecoderPool:
+    """
+    Opt-in multi-process decoder for result pages.
+
+    The pool is created lazily on the first large page and reused until
+    :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        min_parallel_items: int = 500,
+        min_slice_items: int = 250,
+        mp_context: Any = None,
+    ) -> None:
+        """
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            min_parallel_items: Pages with fewer items are decoded inline
+            min_slice_items: Smallest number of items sent to one worker
+            mp_context: Multiprocessing context (e.g. ``multiprocessing.get_context("spawn")``)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_items = min_parallel_items
+        self.min_slice_items = max(1, min_slice_items)
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._mp_context)
+        return self._executor
+
+    def decode(
+        self,
+        body: Dict[str, Any],
+        projection: Optional[FieldProjection] = None,
+        limit: Optional[int] = None,
+    ) -> List[Document]:
+        """
+        Decode the ``data`` items of a result page.
+
+        Args:
+            body: Parsed response body
+            projection: Optional fields to keep
+            limit: Decode at most this many documents
+
+        Returns:
+            Documents in page order
+        """
+        items = _page_items(body, limit)
+        if len(items) < self.min_parallel_items or self.max_workers <= 1:
+            return decode_documents(items, projection)
+
+        slices = min(self.max_workers, max(1, len(items) // self.min_slice_items))
+        step = -(-len(items) // slices)
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _decode_slice,
+                json.dumps(items[start:start + step], separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+                projection,
+            )
+            for start in range(0, len(items), step)
+        ]
+        documents: List[Document] = []
+        for future in futures:
+            documents.extend(future.result())
+        return documents
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DecoderPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def decode_page(
+    client: Any,
+    body: Dict[str, Any],
+    fields: Optional[Fields] = None,
+    limit: Optional[int] = None,
+) -> List[Document]:
+    """
+    Decode a page's documents with the client's decoder pool, if it has one.
+
+    Args:
+        client: HTTP client (its ``decoder_pool`` attribute is used when set)
+        body: Parsed response body
+        fields: Optional fields to keep (see FieldProjection)
+        limit: Decode at most this many documents (e.g. what is left of max_results)
+
+    Returns:
+        Documents in page order
+    """
+    projection = FieldProjection.of(fields)
+    pool = getattr(client, "decoder_pool", None)
+    if not isinstance(pool, DecoderPool):
+        return decode_documents(_page_items(body, limit), projection)
+    return pool.decode(body, projection, limit)
@@ -46,6 +46,33 @@ class RateLimitError(FirecrawlError):
     pass
 
 
+class DeadlineExceededError(FirecrawlError, TimeoutError):
+    """Raised when an operation runs past its Deadline (client-side)."""
+    pass
+
+
+class CircuitOpenError(FirecrawlError):
+    """Raised without calling the API when the endpoint's circuit breaker is open."""
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"Circuit open for '{family}' requests; retry in {retry_after:.1f}s")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class CassetteMissError(FirecrawlError):
+    """Raised when a replayed request has no recorded response in the cassette."""
+
+    def __init__(self, method: str, url: str):
+        super().__init__(f"No recorded response for {method} {url}")
+        self.method = method
+        self.url = url
+
+
+# Raised on the client before a request reaches the server; never a breaker outcome
+CLIENT_SIDE_ERRORS = (DeadlineExceededError, CassetteMissError)
+
+
 class InternalServerError(FirecrawlError):
     """Raised when there's an internal server error (500)."""
     pass
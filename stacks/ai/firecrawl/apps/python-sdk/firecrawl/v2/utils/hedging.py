@@ -0,0 +1,256 @@
+"""
+Hedged requests for single-URL scrapes.
+
+When a request has not answered within a chosen percentile of recently
+observed latency, a duplicate is sent (with the same idempotency key) and the
+first successful response wins. A budget caps hedges to a fraction of all
+requests, so hedging never adds more than that share of load.
+
+Usage:
+    policy = HedgePolicy(percentile=95, budget=0.05)
+    client = Firecrawl(api_key="...", hedge_policy=policy)
+    doc = client.scrape("https://example.com")
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger("firecrawl")
+
+T = TypeVar("T")
+
+
+class LatencyHistogram:
+    """Sliding window of recent latencies with percentile lookups."""
+
+    def __init__(self, window: int = 500) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the ``p``-th percentile (0-100), or None without samples."""
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class HedgePolicy:
+    """
+    Adaptive hedging policy shared by the sync and async clients.
+
+    The hedge delay is the ``percentile`` of the latency window, clamped to
+    ``[min_delay, max_delay]``; until ``min_samples`` latencies have been
+    observed, ``initial_delay`` is used (or no hedging if it is None).
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        initial_delay: Optional[float] = None,
+        min_delay: float = 0.05,
+        max_delay: Optional[float] = None,
+        window: int = 500,
+        max_workers: int = 32,
+    ) -> None:
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            budget: Maximum hedges as a fraction of requests (0.05 = at most 5% extra load)
+            min_samples: Latencies to observe before the percentile is trusted
+            initial_delay: Hedge delay used before ``min_samples`` (None disables hedging until then)
+            min_delay: Lower bound for the hedge delay in seconds
+            max_delay: Upper bound for the hedge delay in seconds
+            window: Number of recent latencies kept
+            max_workers: Threads available to sync primaries, and as many again to their hedges
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.histogram = LatencyHistogram(window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._primary_executor: Optional[ThreadPoolExecutor] = None
+
+    # Policy
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if no hedge should be sent."""
+        if len(self.histogram) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = self.histogram.percentile(self.percentile)
+        if delay is None:
+            return None
+        delay = max(delay, self.min_delay)
+        return min(delay, self.max_delay) if self.max_delay is not None else delay
+
+    def _begin(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _hedge_allowed(self) -> bool:
+        with self._lock:
+            return self.hedges + 1 <= self.budget * self.requests
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _won(self, rank: int) -> None:
+        if rank > 0:
+            with self._lock:
+                self.hedge_wins += 1
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Request, hedge and hedge-win counters plus the current delay."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "delay": self.hedge_delay() or 0.0,
+            }
+
+    # Sync
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="firecrawl-hedge")
+            return self._executor
+
+    def _get_primary_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._primary_executor is None:
+                self._primary_executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="firecrawl-primary"
+                )
+            return self._primary_executor
+
+    def _timed(self, call: Callable[[], T]) -> Callable[[], T]:
+        def run() -> T:
+            started = time.monotonic()
+            result = call()
+            self.histogram.record(time.monotonic() - started)
+            return result
+        return run
+
+    def _start_primary(self, call: Callable[[], T]) -> "Future[T]":
+        # A pool of its own, so primaries never queue behind other requests' hedges
+        # Runs in the caller's context so an active Deadline applies
+        return self._get_primary_executor().submit(contextvars.copy_context().run, self._timed(call))
+
+    def run(self, call: Callable[[], T]) -> T:
+        """
+        Run ``call``, hedging it once if it is slow.
+
+        ``call`` must be safe to invoke twice concurrently (e.g. it carries an
+        idempotency key). A losing request keeps running in the background and
+        its result is discarded. When no hedge can be sent, ``call`` runs on
+        the calling thread; otherwise the primary and its hedge run on
+        separate worker pools.
+        """
+        self._begin()
+        delay = self.hedge_delay()
+        if delay is None or not self._hedge_allowed():
+            return self._timed(call)()
+
+        attempts: List[Future] = [self._start_primary(call)]
+        done, _ = wait(attempts, timeout=delay)
+        if not done and self._take_hedge():
+            logger.debug("Hedging request after %.3fs", delay)
+            # Workers run in the caller's context so an active Deadline applies
+            attempts.append(self._get_executor().submit(contextvars.copy_context().run, self._timed(call)))
+
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary when both finish together
+            for future in sorted(done, key=attempts.index):
+                if future.exception() is None:
+                    self._won(attempts.index(future))
+                    return future.result()
+                error = error or future.exception()
+        assert error is not None
+        raise error
+
+    # Async
+
+    async def arun(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`run`; the losing request is cancelled."""
+        self._begin()
+
+        async def timed() -> T:
+            started = time.monotonic()
+            result = await call()
+            self.histogram.record(time.monotonic() - started)
+            return result
+
+        attempts: List["asyncio.Task[T]"] = [asyncio.ensure_future(timed())]
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done and self._take_hedge():
+                    logger.debug("Hedging request after %.3fs", delay)
+                    attempts.append(asyncio.ensure_future(timed()))
+
+            pending = set(attempts)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=attempts.index):
+                    if task.exception() is None:
+                        self._won(attempts.index(task))
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+    def close(self) -> None:
+        """Release the worker threads used by sync primaries and hedges."""
+        with self._lock:
+            executors = [self._executor, self._primary_executor]
+            self._executor = self._primary_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
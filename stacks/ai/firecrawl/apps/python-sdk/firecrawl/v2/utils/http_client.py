@@ -3,10 +3,12 @@ HTTP client utilities for v2 API.
 """
 
 import time
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
 from .get_version import get_version
+from .deadline import backoff_sleep, request_timeout
+from .error_handler import CLIENT_SIDE_ERRORS
 
 version = get_version()
 
@@ -16,6 +18,45 @@ class HttpClient:
     def __init__(self, api_key: str, api_url: str):
         self.api_key = api_key
         self.api_url = api_url
+        # Optional DecoderPool used to decode large crawl/batch result pages
+        self.decoder_pool = None
+        # Optional CircuitBreakerRegistry guarding each request attempt
+        self.circuit_breakers = None
+        # Optional RecordTransport/ReplayTransport (see utils.cassette)
+        self.transport = None
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[Optional[float]], requests.Response],
+        body: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send one attempt through the transport and the endpoint's circuit breaker, if configured."""
+        # Raises before the breaker admits the call when the deadline has passed
+        attempt_timeout = request_timeout(timeout)
+        network_send = lambda: send(attempt_timeout)
+        if self.transport is not None:
+            do_send = lambda: self.transport.send(method, url, body, network_send)
+        else:
+            do_send = network_send
+        if self.circuit_breakers is None:
+            return do_send()
+        breaker = self.circuit_breakers.for_request(method, urlparse(url).path)
+        breaker.before_call()
+        started = time.monotonic()
+        try:
+            response = do_send()
+        except CLIENT_SIDE_ERRORS:
+            # Nothing reached the server, so there is no outcome to record
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record(False, time.monotonic() - started)
+            raise
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        return response
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -72,16 +113,16 @@ class HttpClient:
         
         for attempt in range(retries):
             try:
-                response = requests.post(
+                response = self._send("POST", url, lambda attempt_timeout: requests.post(
                     url,
                     headers=headers,
                     json=data,
-                    timeout=timeout
-                )
+                    timeout=attempt_timeout
+                ), data, timeout)
 
                 if response.status_code == 502:
                     if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
+                        backoff_sleep(backoff_factor * (2 ** attempt))
                         continue
                 
                 return response
@@ -90,7 +131,7 @@ class HttpClient:
                 last_exception = e
                 if attempt == retries - 1:
                     raise e
-                time.sleep(backoff_factor * (2 ** attempt))
+                backoff_sleep(backoff_factor * (2 ** attempt))
         
         # This should never be reached due to the exception handling above
         raise last_exception or Exception("Unexpected error in POST request")
@@ -113,15 +154,15 @@ class HttpClient:
         
         for attempt in range(retries):
             try:
-                response = requests.get(
+                response = self._send("GET", url, lambda attempt_timeout: requests.get(
                     url,
                     headers=headers,
-                    timeout=timeout
-                )
+                    timeout=attempt_timeout
+                ), timeout=timeout)
                 
                 if response.status_code == 502:
                     if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
+                        backoff_sleep(backoff_factor * (2 ** attempt))
                         continue
                 
                 return response
@@ -130,7 +171,7 @@ class HttpClient:
                 last_exception = e
                 if attempt == retries - 1:
                     raise e
-                time.sleep(backoff_factor * (2 ** attempt))
+                backoff_sleep(backoff_factor * (2 ** attempt))
         
         # This should never be reached due to the exception handling above
         raise last_exception or Exception("Unexpected error in GET request")
@@ -153,15 +194,15 @@ class HttpClient:
         
         for attempt in range(retries):
             try:
-                response = requests.delete(
+                response = self._send("DELETE", url, lambda attempt_timeout: requests.delete(
                     url,
                     headers=headers,
-                    timeout=timeout
-                )
+                    timeout=attempt_timeout
+                ), timeout=timeout)
                 
                 if response.status_code == 502:
                     if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
+                        backoff_sleep(backoff_factor * (2 ** attempt))
                         continue
                 
                 return response
@@ -170,7 +211,7 @@ class HttpClient:
                 last_exception = e
                 if attempt == retries - 1:
                     raise e
-                time.sleep(backoff_factor * (2 ** attempt))
+                backoff_sleep(backoff_factor * (2 ** attempt))
         
         # This should never be reached due to the exception handling above
         raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
@@ -1,6 +1,11 @@
+import time
+from urllib.parse import urlparse
+
 import httpx
-from typing import Optional, Dict, Any
+from typing import Awaitable, Callable, Optional, Dict, Any
 from .get_version import get_version
+from .deadline import request_timeout
+from .error_handler import CLIENT_SIDE_ERRORS
 
 version = get_version()
 
@@ -17,6 +22,43 @@ class AsyncHttpClient:
             },
             limits=httpx.Limits(max_keepalive_connections=0),
         )
+        # Optional CircuitBreakerRegistry guarding each request
+        self.circuit_breakers = None
+        # Optional RecordTransport/ReplayTransport (see utils.cassette)
+        self.transport = None
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[Optional[float]], Awaitable[httpx.Response]],
+        body: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request through the transport and the endpoint's circuit breaker, if configured."""
+        # Raises before the breaker admits the call when the deadline has passed
+        attempt_timeout = request_timeout(timeout)
+        network_send = lambda: send(attempt_timeout)
+        if self.transport is not None:
+            do_send = lambda: self.transport.asend(method, endpoint, body, network_send)
+        else:
+            do_send = network_send
+        if self.circuit_breakers is None:
+            return await do_send()
+        breaker = self.circuit_breakers.for_request(method, urlparse(endpoint).path)
+        breaker.before_call()
+        started = time.monotonic()
+        try:
+            response = await do_send()
+        except CLIENT_SIDE_ERRORS:
+            # Nothing reached the server, so there is no outcome to record
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record(False, time.monotonic() - started)
+            raise
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        return response
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -36,12 +78,12 @@ class AsyncHttpClient:
     ) -> httpx.Response:
         payload = dict(data)
         payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
+        return await self._send("POST", endpoint, lambda attempt_timeout: self._client.post(
             endpoint,
             json=payload,
             headers={**self._headers(), **(headers or {})},
-            timeout=timeout,
-        )
+            timeout=attempt_timeout,
+        ), payload, timeout)
 
     async def get(
         self,
@@ -49,9 +91,9 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        return await self._send("GET", endpoint, lambda attempt_timeout: self._client.get(
+            endpoint, headers={**self._headers(), **(headers or {})}, timeout=attempt_timeout
+        ), timeout=timeout)
 
     async def delete(
         self,
@@ -59,7 +101,7 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        return await self._send("DELETE", endpoint, lambda attempt_timeout: self._client.delete(
+            endpoint, headers={**self._headers(), **(headers or {})}, timeout=attempt_timeout
+        ), timeout=timeout)
 
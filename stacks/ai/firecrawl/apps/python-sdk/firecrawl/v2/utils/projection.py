@@ -0,0 +1,145 @@
+"""
+Field projection for decoded documents.
+
+A :class:`FieldProjection` names the document fields a caller needs, e.g.
+``["markdown", "title", "source_url"]``. Unrequested keys are dropped from
+each raw result item before normalization and model validation, so they are
+neither validated nor retained by the job object. The projection can also
+derive the minimal ``formats`` to request from the API.
+
+Field names are ``Document`` fields (``markdown``, ``links``, ...),
+``DocumentMetadata`` fields (``title``, ``source_url``, ...), explicit
+``metadata.<key>`` names (snake_case or the API's camelCase), or
+``metadata`` for all metadata.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
+
+from ..types import DocumentMetadata, ScrapeOptions
+from .normalize import _METADATA_KEY_MAP
+
+# Document field -> raw API key
+_DOCUMENT_KEYS = {
+    "markdown": "markdown",
+    "html": "html",
+    "raw_html": "rawHtml",
+    "json": "json",
+    "summary": "summary",
+    "links": "links",
+    "images": "images",
+    "screenshot": "screenshot",
+    "actions": "actions",
+    "warning": "warning",
+    "change_tracking": "changeTracking",
+}
+
+# Document field -> format that makes the API return it
+_FIELD_FORMATS = {
+    "markdown": "markdown",
+    "html": "html",
+    "raw_html": "rawHtml",
+    "summary": "summary",
+    "links": "links",
+    "images": "images",
+    "screenshot": "screenshot",
+    "change_tracking": "changeTracking",
+}
+
+_SNAKE_TO_CAMEL = {snake: camel for camel, snake in _METADATA_KEY_MAP.items()}
+_CAMEL_TO_SNAKE = dict(_METADATA_KEY_MAP)
+
+Fields = Union["FieldProjection", Iterable[str]]
+
+
+class FieldProjection:
+    """Set of document fields to keep while decoding."""
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """
+        Args:
+            fields: Field names to keep (see module docstring)
+
+        Raises:
+            ValueError: If a field name is unknown
+        """
+        self.fields: List[str] = list(dict.fromkeys(fields))
+        document: List[str] = []
+        metadata: List[str] = []
+        all_metadata = False
+        for name in self.fields:
+            if name == "metadata":
+                all_metadata = True
+            elif name.startswith("metadata."):
+                metadata.append(name[len("metadata."):])
+            elif name in _DOCUMENT_KEYS:
+                document.append(name)
+            elif name in DocumentMetadata.model_fields or name in _CAMEL_TO_SNAKE:
+                metadata.append(name)
+            else:
+                raise ValueError(f"Unknown document field: {name}")
+
+        self.document_fields: FrozenSet[str] = frozenset(document)
+        self.all_metadata = all_metadata
+        # Accept either spelling in raw items
+        self._raw_keys: FrozenSet[str] = frozenset(
+            key for name in document for key in (name, _DOCUMENT_KEYS[name])
+        )
+        self._metadata_keys: FrozenSet[str] = frozenset(
+            key
+            for name in metadata
+            for key in (name, _SNAKE_TO_CAMEL.get(name, name), _CAMEL_TO_SNAKE.get(name, name))
+        )
+
+    @classmethod
+    def of(cls, fields: Optional[Fields]) -> Optional["FieldProjection"]:
+        """Return ``fields`` as a FieldProjection (None stays None)."""
+        if fields is None or isinstance(fields, FieldProjection):
+            return fields
+        if isinstance(fields, str):
+            fields = [fields]
+        return cls(fields)
+
+    def apply(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the raw item with only the requested keys."""
+        out = {key: value for key, value in item.items() if key in self._raw_keys}
+        md = item.get("metadata")
+        if self.all_metadata:
+            if md is not None:
+                out["metadata"] = md
+        elif self._metadata_keys and isinstance(md, dict):
+            out["metadata"] = {key: value for key, value in md.items() if key in self._metadata_keys}
+        return out
+
+    @property
+    def formats(self) -> Optional[List[str]]:
+        """
+        Minimal formats to request for these fields.
+
+        None when no requested field depends on a format (metadata only, or
+        ``json``, which needs a schema), meaning the API default applies.
+        """
+        formats = [_FIELD_FORMATS[name] for name in self.fields if name in _FIELD_FORMATS]
+        if "changeTracking" in formats and "markdown" not in formats:
+            # Change tracking is computed from markdown
+            formats.insert(0, "markdown")
+        return formats or None
+
+    def __repr__(self) -> str:
+        return f"FieldProjection({self.fields!r})"
+
+
+
+def with_projected_formats(options: Optional[ScrapeOptions], fields: Optional[Fields]) -> Optional[ScrapeOptions]:
+    """
+    Return ``options`` requesting only the formats ``fields`` need.
+
+    Formats the caller set explicitly are left alone.
+    """
+    projection = FieldProjection.of(fields)
+    if projection is None or projection.formats is None:
+        return options
+    if options is None:
+        return ScrapeOptions(formats=projection.formats)
+    if options.formats is not None:
+        return options
+    return options.model_copy(update={"formats": ScrapeOptions(formats=projection.formats).formats})
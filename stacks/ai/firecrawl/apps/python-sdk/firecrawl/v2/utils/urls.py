@@ -0,0 +1,236 @@
+"""
+URL helpers shared by batch and crawl utilities.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for matching results back to requested URLs.
+
+    Lowercases the scheme and host, drops default ports and the fragment, and
+    strips a trailing slash from non-root paths. The query string is kept
+    as-is.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL (the input unchanged if it cannot be parsed)
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+# Query parameters that only carry click/campaign tracking and never change page content
+TRACKING_PARAMS: Tuple[str, ...] = (
+    r"utm_[a-z0-9_]+",
+    r"gclid",
+    r"gclsrc",
+    r"dclid",
+    r"gbraid",
+    r"wbraid",
+    r"fbclid",
+    r"msclkid",
+    r"yclid",
+    r"twclid",
+    r"ttclid",
+    r"igshid",
+    r"li_fat_id",
+    r"mc_cid",
+    r"mc_eid",
+    r"_ga",
+    r"_gl",
+    r"_hsenc",
+    r"_hsmi",
+    r"mkt_tok",
+    r"ref_src",
+    r"s_cid",
+    r"vero_id",
+)
+
+
+class UrlCanonicalizer:
+    """
+    Canonicalize and deduplicate large URL lists.
+
+    Rules are compiled once. Host normalization is memoized per canonicalizer,
+    and URLs without a query string or fragment skip query processing, so
+    lists of millions of URLs (sitemaps, ``map()`` output) are handled in a
+    single pass.
+
+    The canonical form lowercases scheme and host, drops default ports,
+    fragments and tracking parameters, sorts the remaining query parameters
+    and strips trailing slashes from non-root paths. Path case is preserved
+    unless ``lowercase_path`` is set, since most servers treat it as
+    significant.
+    """
+
+    def __init__(
+        self,
+        *,
+        strip_params: Iterable[str] = TRACKING_PARAMS,
+        domain_params: Optional[Dict[str, Iterable[str]]] = None,
+        strip_www: bool = False,
+        sort_query: bool = True,
+        lowercase_path: bool = False,
+        strip_trailing_slash: bool = True,
+    ) -> None:
+        """
+        Args:
+            strip_params: Regex patterns of query parameter names to drop everywhere
+            domain_params: Extra parameter patterns to drop, keyed by host (e.g. session ids)
+            strip_www: Treat ``www.example.com`` and ``example.com`` as the same host
+            sort_query: Sort query parameters so their order does not matter
+            lowercase_path: Lowercase the path (for case-insensitive servers)
+            strip_trailing_slash: Remove the trailing slash of non-root paths
+        """
+        self._strip = _compile_params(strip_params)
+        self._domain_strip = {
+            host.lower(): _compile_params(patterns) for host, patterns in (domain_params or {}).items()
+        }
+        self._strip_www = strip_www
+        self._sort_query = sort_query
+        self._lowercase_path = lowercase_path
+        self._strip_trailing_slash = strip_trailing_slash
+        self._hosts: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def _host(self, scheme: str, netloc: str) -> Optional[str]:
+        key = (scheme, netloc)
+        cached = self._hosts.get(key, False)
+        if cached is not False:
+            return cached  # type: ignore[return-value]
+        host: Optional[str]
+        try:
+            parts = urlsplit(f"{scheme}://{netloc}")
+            hostname = (parts.hostname or "").lower()
+            port = parts.port
+        except ValueError:
+            hostname, port = "", None
+        if not hostname:
+            host = None
+        else:
+            if self._strip_www and hostname.startswith("www."):
+                hostname = hostname[4:]
+            if ":" in hostname:
+                hostname = f"[{hostname}]"
+            host = hostname if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{hostname}:{port}"
+        self._hosts[key] = host
+        return host
+
+    def _query(self, query: str, host: str) -> str:
+        if not query:
+            return ""
+        domain_rule = self._domain_strip.get(host)
+        kept = []
+        for pair in query.split("&"):
+            if not pair:
+                continue
+            name = pair.split("=", 1)[0]
+            if self._strip.match(name) or (domain_rule is not None and domain_rule.match(name)):
+                continue
+            kept.append(pair)
+        if self._sort_query:
+            kept.sort()
+        return "&".join(kept)
+
+    def canonicalize(self, url: str) -> Optional[str]:
+        """
+        Return the canonical form of a URL, or None if it is not a valid http(s) URL.
+        """
+        if not url or not isinstance(url, str):
+            return None
+        try:
+            scheme, netloc, path, query, _ = urlsplit(url.strip())
+        except ValueError:
+            return None
+        scheme = scheme.lower()
+        if scheme not in _DEFAULT_PORTS:
+            return None
+        host = self._host(scheme, netloc)
+        if host is None:
+            return None
+        if not path:
+            path = "/"
+        elif self._strip_trailing_slash and len(path) > 1 and path[-1] == "/":
+            path = path.rstrip("/") or "/"
+        if self._lowercase_path:
+            path = path.lower()
+        query = self._query(query, host) if query else ""
+        return f"{scheme}://{host}{path}?{query}" if query else f"{scheme}://{host}{path}"
+
+    __call__ = canonicalize
+
+    def canonicalize_many(self, urls: Iterable[str]) -> List[Optional[str]]:
+        """Canonicalize every URL; invalid entries map to None."""
+        canonicalize = self.canonicalize
+        return [canonicalize(url) for url in urls]
+
+    def dedupe(self, urls: Iterable[str], *, keep_original: bool = False) -> List[str]:
+        """
+        Drop invalid URLs and duplicates, preserving first-seen order.
+
+        Args:
+            urls: URLs to deduplicate
+            keep_original: Return the first original spelling instead of the canonical form
+
+        Returns:
+            Unique URLs
+        """
+        canonicalize = self.canonicalize
+        seen: Dict[str, str] = {}
+        for url in urls:
+            canonical = canonicalize(url)
+            if canonical is not None and canonical not in seen:
+                seen[canonical] = url.strip() if keep_original else canonical
+        return list(seen.values())
+
+    def group_by_domain(self, urls: Iterable[str]) -> Dict[str, List[str]]:
+        """Deduplicate URLs and group them by host, preserving order within each host."""
+        groups: Dict[str, List[str]] = {}
+        for url in self.dedupe(urls):
+            host = url.split("/", 3)[2]
+            groups.setdefault(host, []).append(url)
+        return groups
+
+
+def _compile_params(patterns: Iterable[str]) -> Pattern[str]:
+    joined = "|".join(f"(?:{p})" for p in patterns)
+    # A pattern that can never match keeps the hot path branch-free
+    return re.compile(f"^(?:{joined})$" if joined else r"(?!)", re.IGNORECASE)
+
+
+_default_canonicalizer = UrlCanonicalizer()
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """Canonicalize a URL with the default rules (see UrlCanonicalizer)."""
+    return _default_canonicalizer.canonicalize(url)
+
+
+def dedupe_urls(urls: Iterable[str], canonicalizer: Optional[UrlCanonicalizer] = None) -> List[str]:
+    """Canonicalize and deduplicate URLs, preserving first-seen order."""
+    return (canonicalizer or _default_canonicalizer).dedupe(urls)
+
+
+def group_urls_by_domain(urls: Iterable[str], canonicalizer: Optional[UrlCanonicalizer] = None) -> Dict[str, List[str]]:
+    """Canonicalize, deduplicate and group URLs by host."""
+    return (canonicalizer or _default_canonicalizer).group_by_domain(urls)
@@ -8,6 +8,7 @@ Usage:
 """
 
 import asyncio
+import contextvars
 import json
 import threading
 from typing import Callable, List, Optional, Literal, Union, Dict, Any
@@ -16,6 +17,9 @@ import websockets
 
 from .types import CrawlJob, BatchScrapeJob, Document
 from .utils.normalize import normalize_document_input
+from .utils.projection import FieldProjection, Fields
+from .utils.cassette import ReplayTransport
+from .utils.deadline import current_deadline
 
 
 JobKind = Literal["crawl", "batch"]
@@ -30,12 +34,15 @@ class Watcher:
         kind: JobKind = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        fields: Optional[Fields] = None,
     ) -> None:
         self._client = client
         self._job_id = job_id
         self._kind = kind
         self._timeout = timeout
         self._poll_interval = poll_interval
+        # Unrequested document keys are dropped as documents arrive
+        self._projection = FieldProjection.of(fields)
         self._listeners: List[Callable[[JobType], None]] = []
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
@@ -78,6 +85,9 @@ class Watcher:
                 except Exception:
                     pass
 
+    def _project(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        return self._projection.apply(doc) if self._projection is not None else doc
+
     def _build_ws_url(self) -> str:
         if not self._api_url:
             raise ValueError("API URL is required for WebSocket watcher")
@@ -88,13 +98,20 @@ class Watcher:
 
     async def _run_ws(self) -> None:
         uri = self._build_ws_url()
+        session_timeout = self._effective_timeout()
         headers_list = []
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
+        deadline = asyncio.get_event_loop().time() + session_timeout if session_timeout else None
+        connected = False
         try:
+            if self._replaying():
+                # Cassettes hold no WebSocket traffic; replay the recorded status polls
+                await self._poll_until_terminal(deadline)
+                return
             async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
+                connected = True
                 while not self._stop.is_set():
                     # Use short recv timeouts to allow HTTP polling fallback
                     if deadline is not None:
@@ -114,12 +131,7 @@ class Watcher:
                         break
                     except Exception:
                         # Connection error: switch to HTTP polling until terminal or timeout
-                        while not self._stop.is_set():
-                            if await self._poll_status_once():
-                                return
-                            if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                                return
-                            await asyncio.sleep(self._poll_interval or 2)
+                        await self._poll_until_terminal(deadline)
                         return
 
                     try:
@@ -148,13 +160,14 @@ class Watcher:
                     elif msg_type == "catchup":
                         d = body.get("data", {})
                         self.status = d.get("status", self.status)
-                        docs_in = d.get("data", [])
+                        docs_in = [self._project(doc) if isinstance(doc, dict) else doc for doc in d.get("data", [])]
                         self.data.extend(docs_in)
                         for doc in docs_in:
                             self.dispatch_event("document", {"data": doc, "id": self._job_id})
                     elif msg_type == "document":
                         doc = body.get("data")
                         if isinstance(doc, dict):
+                            doc = self._project(doc)
                             self.data.append(doc)
                             self.dispatch_event("document", {"data": doc, "id": self._job_id})
                     elif msg_type == "done":
@@ -165,7 +178,7 @@ class Watcher:
                         if isinstance(docs_in, list) and docs_in:
                             for doc in docs_in:
                                 if isinstance(doc, dict):
-                                    self.data.append(doc)
+                                    self.data.append(self._project(doc))
                         # Dispatch done event first
                         self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
                         self._sent_done = True
@@ -209,7 +222,7 @@ class Watcher:
                         docs = []
                         for doc in payload.get("data", []):
                             if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
+                                d = normalize_document_input(self._project(doc))
                                 docs.append(Document(**d))
                         job = CrawlJob(
                             status=status_str,
@@ -234,7 +247,7 @@ class Watcher:
                         docs = []
                         for doc in payload.get("data", []):
                             if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
+                                d = normalize_document_input(self._project(doc))
                                 docs.append(Document(**d))
                         job = BatchScrapeJob(
                             status=status_str,
@@ -255,20 +268,36 @@ class Watcher:
                                 self._sent_error = True
                             break
         except Exception:
-            pass
+            if not connected:
+                # Could not open the WebSocket: fall back to HTTP polling
+                await self._poll_until_terminal(deadline)
         finally:
             # Ensure terminal event parity with v1 even on abrupt disconnects
             if self.status == "completed" and not self._sent_done:
                 self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
                 self._sent_done = True
 
+    async def _poll_until_terminal(self, deadline: Optional[float]) -> None:
+        """Poll job status over HTTP until terminal, stopped or past the deadline (loop time)."""
+        while not self._stop.is_set():
+            if await self._poll_status_once():
+                return
+            if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+                return
+            await asyncio.sleep(self._poll_interval or 2)
+
+    def _replaying(self) -> bool:
+        http_client = getattr(self._client, "http_client", None)
+        return isinstance(getattr(http_client, "transport", None), ReplayTransport)
+
     async def _poll_status_once(self) -> bool:
         """Poll job status over HTTP once. Returns True if terminal."""
+        kwargs = {"fields": self._projection} if self._projection is not None else {}
         try:
             if self._kind == "crawl":
-                job: CrawlJob = await asyncio.to_thread(self._client.get_crawl_status, self._job_id)
+                job: CrawlJob = await asyncio.to_thread(self._client.get_crawl_status, self._job_id, **kwargs)
             else:
-                job: BatchScrapeJob = await asyncio.to_thread(self._client.get_batch_scrape_status, self._job_id)
+                job: BatchScrapeJob = await asyncio.to_thread(self._client.get_batch_scrape_status, self._job_id, **kwargs)
         except Exception:
             return False
 
@@ -284,6 +313,15 @@ class Watcher:
             return True
         return False
 
+    def _effective_timeout(self) -> Optional[float]:
+        # An active Deadline bounds the WS session and the HTTP polling fallback;
+        # computed per run so a restarted watcher does not inherit an old budget
+        deadline = current_deadline()
+        if deadline is None:
+            return self._timeout
+        # A zero timeout means "no timeout" below
+        return max(deadline.cap(self._timeout), 0.001)
+
     def _loop(self) -> None:
         asyncio.run(self._run_ws())
 
@@ -291,7 +329,9 @@ class Watcher:
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
-        self._thread = threading.Thread(target=self._loop, daemon=True)
+        # Run in a copy of the caller's context so an active Deadline applies
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(target=context.run, args=(self._loop,), daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
@@ -17,6 +17,9 @@ from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, Connecti
 
 from .types import BatchScrapeJob, CrawlJob, Document
 from .utils.normalize import normalize_document_input
+from .utils.projection import FieldProjection, Fields
+from .utils.deadline import current_deadline
+from .utils.cassette import ReplayTransport
 
 JobKind = Literal["crawl", "batch"]
 
@@ -29,12 +32,16 @@ class AsyncWatcher:
         *,
         kind: JobKind = "crawl",
         timeout: Optional[int] = None,
+        poll_interval: float = 2.0,
+        fields: Optional[Fields] = None,
     ) -> None:
         self._client = client
         self._job_id = job_id
         self._kind = kind
         self._timeout = timeout
-        self._poll_interval: float = 2.0
+        self._poll_interval: float = poll_interval
+        # Unrequested document keys are dropped as documents arrive
+        self._projection = FieldProjection.of(fields)
 
         http_client = getattr(client, "http_client", None)
         if http_client is not None:
@@ -61,14 +68,21 @@ class AsyncWatcher:
 
     async def _iterate(self) -> AsyncIterator[object]:
         uri = self._build_ws_url()
+        session_timeout = self._effective_timeout()
         headers_list = []
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
+        if self._replaying():
+            # Cassettes hold no WebSocket traffic; replay the recorded status polls
+            async for job in self._poll_until_terminal(session_timeout):
+                yield job
+            return
+
         # Attempt to establish WS; on failure, fall back to HTTP polling immediately
         try:
             async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
+                deadline = asyncio.get_event_loop().time() + session_timeout if session_timeout else None
                 # Pre-yield a snapshot if available to ensure progress is visible
                 try:
                     pre = await self._fetch_job_status()
@@ -98,18 +112,9 @@ class AsyncWatcher:
                         continue
                     except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
                         # Graceful/abrupt close: poll HTTP until terminal (bounded by timeout)
-                        deadline = time.time() + (self._timeout or 30)
-                        while True:
-                            try:
-                                job = await self._fetch_job_status()
-                                yield job
-                                if job.status in ("completed", "failed", "cancelled"):
-                                    return
-                            except Exception:
-                                return
-                            if time.time() >= deadline:
-                                return
-                            await asyncio.sleep(1)
+                        async for job in self._poll_until_terminal(session_timeout or 30):
+                            yield job
+                        return
                     try:
                         body = json.loads(msg)
                     except Exception:
@@ -128,12 +133,12 @@ class AsyncWatcher:
                         d = body.get("data", {})
                         self._status = d.get("status", self._status)
                         docs_in = d.get("data", []) or []
-                        self._data.extend(docs_in)
+                        self._data.extend(self._project(doc) if isinstance(doc, dict) else doc for doc in docs_in)
                         # Fall through to emit a snapshot below
                     elif msg_type == "document":
                         doc = body.get("data")
                         if isinstance(doc, dict):
-                            self._data.append(doc)
+                            self._data.append(self._project(doc))
                         # Fall through to emit a snapshot below
                     elif msg_type == "done":
                         self._status = "completed"
@@ -142,7 +147,7 @@ class AsyncWatcher:
                         if isinstance(docs_in, list) and docs_in:
                             for doc in docs_in:
                                 if isinstance(doc, dict):
-                                    self._data.append(doc)
+                                    self._data.append(self._project(doc))
                         # Emit final snapshot then end
                         yield self._make_snapshot(status="completed", payload=raw_payload, docs_override=self._data)
                         return
@@ -156,18 +161,38 @@ class AsyncWatcher:
                         return
         except Exception:
             # WS connect failure: fallback to HTTP polling loop until terminal/timeout
-            deadline = time.time() + (self._timeout or 30)
-            while True:
-                try:
-                    job = await self._fetch_job_status()
-                    yield job
-                    if job.status in ("completed", "failed", "cancelled"):
-                        return
-                except Exception:
-                    return
-                if time.time() >= deadline:
-                    return
-                await asyncio.sleep(1)
+            async for job in self._poll_until_terminal(session_timeout or 30):
+                yield job
+
+    async def _poll_until_terminal(self, limit: Optional[float]) -> AsyncIterator[object]:
+        """Poll job status over HTTP, yielding snapshots until terminal, a failed poll or ``limit`` seconds."""
+        deadline = time.time() + limit if limit is not None else None
+        while True:
+            try:
+                job = await self._fetch_job_status()
+            except Exception:
+                return
+            yield job
+            if job.status in ("completed", "failed", "cancelled"):
+                return
+            if deadline is not None and time.time() >= deadline:
+                return
+            await asyncio.sleep(self._poll_interval)
+
+    def _replaying(self) -> bool:
+        for name in ("async_http_client", "http_client"):
+            if isinstance(getattr(getattr(self._client, name, None), "transport", None), ReplayTransport):
+                return True
+        return False
+
+    def _effective_timeout(self) -> Optional[float]:
+        # An active Deadline bounds the WS session and the HTTP polling fallback;
+        # computed per iteration so a reused watcher does not inherit an old budget
+        deadline = current_deadline()
+        if deadline is None:
+            return self._timeout
+        # A zero timeout means "no timeout" below
+        return max(deadline.cap(self._timeout), 0.001)
 
     async def _fetch_job_status(self):
         if self._kind == "crawl":
@@ -175,11 +200,12 @@ class AsyncWatcher:
         return await self._call_status_method("get_batch_scrape_status")
 
     async def _call_status_method(self, method_name: str):
+        kwargs = {"fields": self._projection} if self._projection is not None else {}
         # Try on client directly
         meth = getattr(self._client, method_name, None)
         if meth is not None:
             try:
-                result = meth(self._job_id)
+                result = meth(self._job_id, **kwargs)
             except TypeError:
                 result = None
             if result is not None:
@@ -187,7 +213,7 @@ class AsyncWatcher:
                     return await result
                 return result
             # Fallback: if we couldn't call directly, try to_thread
-            return await asyncio.to_thread(meth, self._job_id)
+            return await asyncio.to_thread(meth, self._job_id, **kwargs)
 
         # Try on client.v2
         v2 = getattr(self._client, "v2", None)
@@ -195,14 +221,14 @@ class AsyncWatcher:
             meth = getattr(v2, method_name, None)
             if meth is not None:
                 try:
-                    result = meth(self._job_id)
+                    result = meth(self._job_id, **kwargs)
                 except TypeError:
                     result = None
                 if result is not None:
                     if inspect.isawaitable(result):
                         return await result
                     return result
-                return await asyncio.to_thread(meth, self._job_id)
+                return await asyncio.to_thread(meth, self._job_id, **kwargs)
 
         raise RuntimeError(f"Client does not expose {method_name}")
 
@@ -212,12 +238,15 @@ class AsyncWatcher:
         except Exception:
             return None
 
+    def _project(self, doc: Dict) -> Dict:
+        return self._projection.apply(doc) if self._projection is not None else doc
+
     def _make_snapshot(self, *, status: str, payload: Dict, docs_override: Optional[List[Dict]] = None):
         docs = []
         source_docs = docs_override if docs_override is not None else payload.get("data", []) or []
         for doc in source_docs:
             if isinstance(doc, dict):
-                d = normalize_document_input(doc)
+                d = normalize_document_input(self._project(doc))
                 docs.append(Document(**d))
 
         if self._kind == "crawl":
@@ -0,0 +1,346 @@
+"""
+Embeddable asyncio webhook receiver for v2 jobs.
+
+A single local server accepts Firecrawl webhook deliveries for any number of
+crawl, batch scrape and extract jobs, verifies their ``X-Firecrawl-Signature``
+and routes ``page``/``completed``/``failed`` events to per-job handles exposing
+the same listener interface as :class:`~firecrawl.v2.watcher.Watcher`.
+
+Usage:
+    async with WebhookSink(secret="whsec", port=8787, public_url="https://hooks.example.com") as sink:
+        job = client.start_crawl(url, webhook=sink.webhook())
+        handle = sink.watch(job.id, kind="crawl")
+        handle.add_event_listener("document", lambda d: print(d["data"]["metadata"]["sourceURL"]))
+        await handle.wait()
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+from aiohttp import web
+
+from .types import BatchScrapeJob, CrawlJob, Document, ExtractResponse, WebhookConfig, WebhookEvent
+from .utils.normalize import normalize_document_input
+
+logger = logging.getLogger("firecrawl")
+
+SIGNATURE_HEADER = "X-Firecrawl-Signature"
+
+JobKind = Literal["crawl", "batch", "extract"]
+JobType = Union[CrawlJob, BatchScrapeJob, ExtractResponse]
+
+_KIND_BY_PREFIX = {"crawl": "crawl", "batch_scrape": "batch", "extract": "extract"}
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """Return the ``X-Firecrawl-Signature`` value for a raw request body."""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """
+    Check a webhook body against its ``X-Firecrawl-Signature`` header.
+
+    Args:
+        body: Raw request body, exactly as received
+        signature: Header value (``sha256=<hex>``)
+        secret: Team webhook secret
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_payload(body, secret), signature.strip())
+
+
+def parse_event(payload: Dict[str, Any]) -> WebhookEvent:
+    """Parse a decoded webhook payload (v1/v2, or legacy ``jobId``) into a WebhookEvent."""
+    data = payload.get("data")
+    return WebhookEvent(
+        success=payload.get("success"),
+        type=payload.get("type", ""),
+        id=payload.get("id") or payload.get("jobId") or "",
+        data=data if isinstance(data, list) else ([] if data is None else [data]),
+        error=payload.get("error"),
+        metadata=payload.get("metadata"),
+    )
+
+
+class WebhookJob:
+    """
+    Per-job handle fed by a :class:`WebhookSink`.
+
+    Mirrors the watcher interface: ``add_listener`` receives a final job
+    snapshot, ``add_event_listener`` receives ``document``, ``done`` and
+    ``error`` events with the same payload shapes as the watchers, plus
+    ``started``.
+    """
+
+    def __init__(self, job_id: str, kind: JobKind = "crawl", retain_documents: bool = True) -> None:
+        self.id = job_id
+        self.kind = kind
+        self.status: str = "scraping"
+        self.data: List[Dict[str, Any]] = []
+        self.pages_received = 0
+        self.page_errors: List[str] = []
+        self._retain_documents = retain_documents
+        self._listeners: List[Callable[[JobType], None]] = []
+        self._event_handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {
+            "started": [],
+            "document": [],
+            "done": [],
+            "error": [],
+        }
+        self._finished = False
+        # Created by wait() so it binds to the sink's running loop; before Python 3.10
+        # an Event binds to whatever loop is current when it is constructed
+        self._done: Optional[asyncio.Event] = None
+
+    def add_listener(self, callback: Callable[[JobType], None]) -> None:
+        self._listeners.append(callback)
+
+    def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+        if event_type in self._event_handlers:
+            self._event_handlers[event_type].append(handler)
+
+    def dispatch_event(self, event_type: str, detail: Dict[str, Any]) -> None:
+        for handler in self._event_handlers.get(event_type, []):
+            try:
+                handler(detail)
+            except Exception as e:
+                logger.warning("Webhook %s handler for %s raised: %s", event_type, self.id, e)
+
+    @property
+    def done(self) -> bool:
+        return self._finished
+
+    async def wait(self, timeout: Optional[float] = None) -> str:
+        """Wait until a ``completed`` or ``failed`` event arrives; returns the final status."""
+        if not self._finished:
+            if self._done is None:
+                self._done = asyncio.Event()
+            await asyncio.wait_for(self._done.wait(), timeout)
+        return self.status
+
+    def _finish(self) -> None:
+        self._finished = True
+        if self._done is not None:
+            self._done.set()
+
+    def _emit(self, job: JobType) -> None:
+        for cb in list(self._listeners):
+            try:
+                cb(job)
+            except Exception as e:
+                logger.warning("Webhook listener for %s raised: %s", self.id, e)
+
+    def _snapshot(self, event: WebhookEvent) -> JobType:
+        if self.kind == "extract":
+            return ExtractResponse(
+                success=event.success,
+                id=self.id,
+                status=self.status,
+                data=event.data[0] if len(event.data) == 1 else (event.data or None),
+                error=event.error,
+            )
+        docs = [Document(**normalize_document_input(doc)) for doc in self.data if isinstance(doc, dict)]
+        job_cls = CrawlJob if self.kind == "crawl" else BatchScrapeJob
+        return job_cls(
+            status=self.status,
+            completed=self.pages_received,
+            total=self.pages_received,
+            data=docs,
+        )
+
+    def _handle(self, event: WebhookEvent) -> None:
+        if event.event == "started":
+            self.dispatch_event("started", {"id": self.id})
+        elif event.event == "page":
+            if event.success is False:
+                self.page_errors.append(event.error or "unknown error")
+                return
+            for doc in event.data:
+                if not isinstance(doc, dict):
+                    continue
+                self.pages_received += 1
+                if self._retain_documents:
+                    self.data.append(doc)
+                self.dispatch_event("document", {"data": doc, "id": self.id})
+        elif event.event == "completed":
+            self.status = "completed"
+            self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self.id})
+            self._emit(self._snapshot(event))
+            self._finish()
+        elif event.event == "failed":
+            self.status = "failed"
+            self.dispatch_event("error", {"status": self.status, "data": self.data, "error": event.error, "id": self.id})
+            self._emit(self._snapshot(event))
+            self._finish()
+
+
+class WebhookSink:
+    """
+    Local aiohttp server receiving Firecrawl webhook deliveries.
+
+    Events for jobs that were not registered with :meth:`watch` get a handle
+    created on first delivery, so no event is dropped while ``start_crawl``
+    is still returning. Use :meth:`on_event` to observe every event.
+    """
+
+    def __init__(
+        self,
+        secret: Optional[str] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        path: str = "/firecrawl/webhook",
+        public_url: Optional[str] = None,
+        spool_dir: Optional[str] = None,
+        retain_documents: bool = True,
+    ) -> None:
+        """
+        Args:
+            secret: Webhook secret used to verify signatures (None disables verification)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            path: URL path accepting deliveries
+            public_url: Externally reachable URL of this sink (e.g. a tunnel);
+                defaults to the local address
+            spool_dir: Directory receiving one ``<job_id>.jsonl`` file of page documents per job
+            retain_documents: Keep page documents in memory on each handle
+        """
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.path = path
+        self.public_url = public_url
+        self.spool_dir = spool_dir
+        self.retain_documents = retain_documents
+        self._jobs: Dict[str, WebhookJob] = {}
+        self._event_listeners: List[Callable[[WebhookEvent], None]] = []
+        self._runner: Optional[web.AppRunner] = None
+
+        if spool_dir:
+            os.makedirs(spool_dir, exist_ok=True)
+
+    # Registration
+
+    def watch(self, job_id: str, kind: JobKind = "crawl") -> WebhookJob:
+        """Return the handle for a job, creating it if needed."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = WebhookJob(job_id, kind=kind, retain_documents=self.retain_documents)
+            self._jobs[job_id] = job
+        return job
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job's handle."""
+        self._jobs.pop(job_id, None)
+
+    def on_event(self, callback: Callable[[WebhookEvent], None]) -> None:
+        """Register a callback receiving every verified event."""
+        self._event_listeners.append(callback)
+
+    @property
+    def url(self) -> str:
+        """URL Firecrawl should deliver to."""
+        if self.public_url:
+            return self.public_url
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def webhook(
+        self,
+        *,
+        events: Optional[List[Literal["completed", "failed", "page", "started"]]] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> WebhookConfig:
+        """Build a WebhookConfig pointing at this sink for ``start_crawl``/``start_batch_scrape``."""
+        return WebhookConfig(url=self.url, events=events, metadata=metadata, headers=headers)
+
+    # Delivery
+
+    def handle_delivery(self, body: bytes, signature: Optional[str] = None) -> int:
+        """
+        Verify, parse and route one delivery.
+
+        Args:
+            body: Raw request body
+            signature: ``X-Firecrawl-Signature`` header value
+
+        Returns:
+            HTTP status code for the response
+        """
+        if self.secret is not None and not verify_signature(body, signature, self.secret):
+            logger.warning("Rejected webhook delivery with an invalid signature")
+            return 401
+        try:
+            payload = json.loads(body)
+            event = parse_event(payload)
+        except Exception as e:
+            logger.warning("Rejected malformed webhook delivery: %s", e)
+            return 400
+        if not event.id or not event.type:
+            return 400
+
+        kind = _KIND_BY_PREFIX.get(event.kind, "crawl")
+        job = self.watch(event.id, kind=kind)  # type: ignore[arg-type]
+        if self.spool_dir and event.event == "page" and event.success is not False:
+            self._spool(event)
+        job._handle(event)
+        for cb in list(self._event_listeners):
+            try:
+                cb(event)
+            except Exception as e:
+                logger.warning("Webhook event listener raised: %s", e)
+        return 200
+
+    def _spool(self, event: WebhookEvent) -> None:
+        safe_id = "".join(c for c in event.id if c.isalnum() or c in "-_")
+        path = os.path.join(self.spool_dir, f"{safe_id}.jsonl")
+        with open(path, "a", encoding="utf-8") as f:
+            for doc in event.data:
+                f.write(json.dumps(doc, ensure_ascii=False))
+                f.write("\n")
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        status = self.handle_delivery(body, request.headers.get(SIGNATURE_HEADER))
+        return web.Response(status=status)
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Start listening."""
+        if self._runner is not None:
+            return
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post(self.path, self._handle_request)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            server = getattr(site, "_server", None)
+            if server is not None and server.sockets:
+                self.port = server.sockets[0].getsockname()[1]
+        self._runner = runner
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "WebhookSink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
@@ -36,6 +36,9 @@ setup(
         'pydantic>=2.0',
         'aiohttp'
     ],
+    extras_require={
+        'arrow': ['pyarrow>=10', 'pandas'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -1,40 +1,16 @@
 import asyncio
-import time
-from firecrawl_scraper import save_firecrawl_news_data
-
-
-async def schedule_scraper(interval_hours: float = 1):
-    """
-    Schedule the scraper to run at specified intervals
-
-    Args:
-        interval_hours (float): Hours between each scrape (can be decimal for shorter periods)
-    """
-    while True:
-        try:
-            print(f"Starting scrape at {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            # Run the scraper
-            filename = save_firecrawl_news_data()
-            print(f"Data saved to {filename}")
-
-        except Exception as e:
-            print(f"Error during scraping: {e}")
-
-        # Wait for the specified interval
-        await asyncio.sleep(interval_hours * 20)  # Convert hours to seconds
+from change_scheduler import default_targets, run_scheduler
 
 
 async def main():
-    # Create tasks for different scheduling intervals
-    tasks = [
-        schedule_scraper(interval_hours=1),  # Run every hour
-        # Add more tasks with different intervals if needed
-        # schedule_scraper(interval_hours=0.5),  # Run every 30 minutes
-        # schedule_scraper(interval_hours=2),    # Run every 2 hours
-    ]
-
-    # Run all tasks concurrently
-    await asyncio.gather(*tasks)
+    # Every target runs on its own interval (ScrapeTarget.interval_hours), all
+    # on this one event loop. Unchanged pages are skipped and only diffs are
+    # appended to scrape_store/changes.jsonl.
+    targets = default_targets()
+    # Add more targets with different intervals if needed
+    # targets.append(change_scheduler.ScrapeTarget(name="docs", fetch=..., interval_hours=0.5))  # Run every 30 minutes
+
+    await run_scheduler(targets)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,241 @@
+# change_scheduler.py
+"""
+Change-detecting scheduler for many scrape targets.
+
+Every target runs on its own interval, all on one asyncio loop. Each run
+hashes the scraped content and skips the write when nothing changed (or when
+Firecrawl's change tracking reports the page as "same"). Changed content is
+appended to a compact JSON Lines store as a diff against the previous
+snapshot rather than as a new full file, and every run's latency and payload
+size are appended to a metrics log.
+
+Usage:
+    python change_scheduler.py            # run forever
+    python change_scheduler.py --once     # one pass over all targets (for cron)
+"""
+
+import argparse
+import asyncio
+import difflib
+import hashlib
+import inspect
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class ScrapeTarget:
+    """A page to scrape on a schedule."""
+
+    name: str
+    fetch: Callable[[], Any]  # sync or async; returns JSON-serializable content
+    interval_hours: float = 1
+
+
+@dataclass
+class RunResult:
+    target: str
+    started: str
+    latency_s: float
+    bytes: int = 0
+    changed: bool = False
+    error: Optional[str] = None
+
+
+def canonical_json(content: Any) -> str:
+    return json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(encoded: str) -> str:
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def unchanged_by_change_tracking(content: Any) -> bool:
+    """True if the content is a Firecrawl result whose change tracking says "same"."""
+    if not isinstance(content, dict):
+        return False
+    tracking = content.get("changeTracking") or content.get("change_tracking") or {}
+    status = tracking.get("changeStatus") or tracking.get("change_status")
+    return status == "same"
+
+
+def _edits(old_keys: List[str], new_keys: List[str], new_items: List[Any]) -> List[list]:
+    """Ordered [i1, i2, replacement] edits turning old into new, matched by key."""
+    matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+    return [[i1, i2, new_items[j1:j2]] for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def _apply_edits(old_items: List[Any], edits: List[list]) -> List[Any]:
+    items = list(old_items)
+    # Apply from the end so earlier offsets stay valid
+    for i1, i2, replacement in reversed(edits):
+        items[i1:i2] = replacement
+    return items
+
+
+def make_diff(old: Any, new: Any) -> Dict[str, Any]:
+    """
+    Describe how to turn old into new, as compactly as the content allows.
+
+    Lists are diffed record by record (matched on their canonical JSON) and
+    strings line by line, both keeping order and duplicates. Dicts are diffed
+    by top-level key. Anything else is stored as a full snapshot.
+    """
+    if isinstance(old, list) and isinstance(new, list):
+        old_keys = [canonical_json(item) for item in old]
+        new_keys = [canonical_json(item) for item in new]
+        return {"items": _edits(old_keys, new_keys, new)}
+    if isinstance(old, dict) and isinstance(new, dict):
+        return {
+            "set": {k: v for k, v in new.items() if k not in old or old[k] != v},
+            "unset": [k for k in old if k not in new],
+        }
+    if isinstance(old, str) and isinstance(new, str):
+        new_lines = new.splitlines(keepends=True)
+        return {"lines": _edits(old.splitlines(keepends=True), new_lines, new_lines)}
+    return {"snapshot": new}
+
+
+def apply_diff(old: Any, diff: Dict[str, Any]) -> Any:
+    """Inverse of make_diff: rebuild the new content from old and the diff."""
+    if "snapshot" in diff:
+        return diff["snapshot"]
+    if "items" in diff:
+        return _apply_edits(old, diff["items"])
+    if "set" in diff:
+        new = {k: v for k, v in old.items() if k not in diff["unset"]}
+        new.update(diff["set"])
+        return new
+    return "".join(_apply_edits(old.splitlines(keepends=True), diff["lines"]))
+
+
+class ChangeStore:
+    """
+    Append-only store of content diffs plus a per-run metrics log.
+
+    ``changes.jsonl`` holds one line per change: the first line for a target
+    is a full snapshot, later lines are diffs. The latest snapshot of every
+    target is rebuilt by replaying the file on startup.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.changes_path = self.directory / "changes.jsonl"
+        self.runs_path = self.directory / "runs.jsonl"
+        self.snapshots: Dict[str, Any] = {}
+        self.hashes: Dict[str, str] = {}
+        self._replay()
+
+    def _replay(self):
+        if not self.changes_path.exists():
+            return
+        with open(self.changes_path) as f:
+            for line in f:
+                record = json.loads(line)
+                name = record["target"]
+                self.snapshots[name] = apply_diff(self.snapshots.get(name), record["diff"])
+                self.hashes[name] = record["hash"]
+
+    def is_unchanged(self, name: str, digest: str) -> bool:
+        return self.hashes.get(name) == digest
+
+    def append_change(self, name: str, content: Any, digest: str):
+        if name in self.snapshots:
+            diff = make_diff(self.snapshots[name], content)
+        else:
+            diff = {"snapshot": content}
+        record = {"target": name, "time": datetime.now().isoformat(timespec="seconds"), "hash": digest, "diff": diff}
+        with open(self.changes_path, "a") as f:
+            f.write(canonical_json(record) + "\n")
+        self.snapshots[name] = content
+        self.hashes[name] = digest
+
+    def record_run(self, result: RunResult):
+        with open(self.runs_path, "a") as f:
+            f.write(canonical_json(result.__dict__) + "\n")
+
+
+async def fetch_content(target: ScrapeTarget) -> Any:
+    if inspect.iscoroutinefunction(target.fetch):
+        return await target.fetch()
+    # Blocking SDK calls run on worker threads so targets do not wait on each other
+    return await asyncio.to_thread(target.fetch)
+
+
+async def run_target_once(target: ScrapeTarget, store: ChangeStore, semaphore: asyncio.Semaphore) -> RunResult:
+    """Scrape one target and append a diff if its content changed."""
+    result = RunResult(target=target.name, started=datetime.now().isoformat(timespec="seconds"), latency_s=0.0)
+    start = time.perf_counter()
+    try:
+        async with semaphore:
+            content = await fetch_content(target)
+        result.latency_s = round(time.perf_counter() - start, 3)
+        encoded = canonical_json(content)
+        result.bytes = len(encoded.encode("utf-8"))
+        digest = content_hash(encoded)
+        if not unchanged_by_change_tracking(content) and not store.is_unchanged(target.name, digest):
+            store.append_change(target.name, content, digest)
+            result.changed = True
+    except Exception as e:
+        result.latency_s = round(time.perf_counter() - start, 3)
+        result.error = str(e)
+    store.record_run(result)
+    status = "error: " + result.error if result.error else ("changed" if result.changed else "unchanged")
+    print(f"[{result.started}] {target.name}: {status} ({result.latency_s}s, {result.bytes} bytes)")
+    return result
+
+
+async def schedule_target(target: ScrapeTarget, store: ChangeStore, semaphore: asyncio.Semaphore):
+    """Run a target forever, every interval_hours, without drifting."""
+    interval = target.interval_hours * 3600  # Convert hours to seconds
+    next_run = time.monotonic()
+    while True:
+        await run_target_once(target, store, semaphore)
+        next_run += interval
+        await asyncio.sleep(max(0.0, next_run - time.monotonic()))
+
+
+async def run_once(targets: List[ScrapeTarget], store_dir: Path = Path("scrape_store"), max_concurrency: int = 8) -> List[RunResult]:
+    """Scrape every target once, concurrently."""
+    store = ChangeStore(store_dir)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*(run_target_once(t, store, semaphore) for t in targets))
+
+
+async def run_scheduler(targets: List[ScrapeTarget], store_dir: Path = Path("scrape_store"), max_concurrency: int = 8):
+    """Run every target on its own interval, concurrently, until cancelled."""
+    store = ChangeStore(store_dir)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(*(schedule_target(t, store, semaphore) for t in targets))
+
+
+def default_targets() -> List[ScrapeTarget]:
+    from firecrawl_scraper import get_firecrawl_news_data
+
+    return [
+        ScrapeTarget(
+            name="hacker_news",
+            fetch=lambda: get_firecrawl_news_data()["extract"]["news_items"],
+            interval_hours=1,
+        ),
+        # Add more targets with their own intervals if needed
+        # ScrapeTarget(name="docs", fetch=lambda: app.scrape_url(url)["markdown"], interval_hours=0.5),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape targets on a schedule and store only changes")
+    parser.add_argument("--once", action="store_true", help="Scrape every target once and exit")
+    parser.add_argument("--store", type=Path, default=Path("scrape_store"), help="Directory for changes.jsonl and runs.jsonl")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Targets scraped at the same time")
+    args = parser.parse_args()
+
+    if args.once:
+        asyncio.run(run_once(default_targets(), args.store, args.max_concurrency))
+    else:
+        asyncio.run(run_scheduler(default_targets(), args.store, args.max_concurrency))
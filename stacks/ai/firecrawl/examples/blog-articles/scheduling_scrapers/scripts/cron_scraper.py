@@ -1,9 +1,10 @@
 # cron_scraper.py
 import sys
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from firecrawl_scraper import save_firecrawl_news_data
+from change_scheduler import default_targets, run_once
 
 # Set up logging
 log_dir = Path("logs")
@@ -20,8 +21,13 @@ logging.basicConfig(
 def main():
     try:
         logging.info("Starting scraping job")
-        filename = save_firecrawl_news_data()
-        logging.info(f"Successfully saved data to {filename}")
+        results = asyncio.run(run_once(default_targets()))
+        for result in results:
+            if result.error:
+                logging.error(f"Scraping {result.target} failed: {result.error}")
+            else:
+                status = "changed, diff appended" if result.changed else "unchanged, skipped"
+                logging.info(f"{result.target}: {status} ({result.latency_s}s, {result.bytes} bytes)")
     except Exception as e:
         logging.error(f"Scraping failed: {str(e)}", exc_info=True)
 
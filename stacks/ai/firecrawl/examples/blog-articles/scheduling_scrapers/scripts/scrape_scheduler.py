@@ -1,9 +1,16 @@
+import asyncio
 import schedule
 import time
-from firecrawl_scraper import save_firecrawl_news_data
+from change_scheduler import default_targets, run_once
+
+
+def scrape_changes():
+    # Scrapes all targets concurrently and stores only what changed
+    asyncio.run(run_once(default_targets()))
+
 
 # Schedule the scraper to run every hour
-schedule.every().hour.do(save_firecrawl_news_data)
+schedule.every().hour.do(scrape_changes)
 
 while True:
     schedule.run_pending()
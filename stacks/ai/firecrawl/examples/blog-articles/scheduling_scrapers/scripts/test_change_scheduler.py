@@ -0,0 +1,31 @@
+# test_change_scheduler.py
+"""
+Round-trip checks for the change store's diffs.
+
+Run with: python -m pytest test_change_scheduler.py
+"""
+
+import pytest
+
+from change_scheduler import apply_diff, make_diff
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        (["a", "b", "c"], ["c", "a", "b"]),
+        (["a", "b", "c"], ["a", "a", "d"]),
+        ([{"title": "x", "points": 1}, {"title": "y"}], [{"title": "y"}, {"title": "x", "points": 2}, {"title": "y"}]),
+        ([], [{"title": "x"}]),
+        ({"a": 1, "b": [1, 2]}, {"b": [2, 1], "c": None}),
+        ("one\ntwo\nthree\n", "three\none\none\n"),
+        ("same", "same"),
+        ([1, 2], {"now": "a dict"}),
+    ],
+)
+def test_apply_diff_rebuilds_new(old, new):
+    assert apply_diff(old, make_diff(old, new)) == new
+
+
+def test_reordered_list_records_a_change():
+    assert make_diff(["a", "b", "c"], ["c", "a", "b"])["items"]
@@ -1,57 +1,166 @@
+import argparse
 import json
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from openai import OpenAI
-from hubspot import HubSpot
 from firecrawl import FirecrawlApp
 
 # Load environment variables
 load_dotenv()
 
-# Initialize clients
-def initialize_clients():
+# Pipeline:
+#   HubSpot pages -> one growing batch_scrape job -> concurrent, rate-limited LLM extraction -> HubSpot batch updates
+# Every stage streams into the next, so memory stays flat no matter how many companies the CRM holds.
+
+# HubSpot accepts at most 100 records per page and per batch update
+HUBSPOT_PAGE_SIZE = 100
+HUBSPOT_BATCH_SIZE = 100
+
+# Initialize clients (HubSpot and OpenAI are replaced by local stubs with --stub)
+def initialize_clients(use_stubs=False, stub_companies=50):
     firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
+    firecrawl_client = FirecrawlApp(api_key=firecrawl_api_key)
+
+    if use_stubs:
+        from stubs import StubHubSpot, StubOpenAI
+        return StubOpenAI(), StubHubSpot(stub_companies), firecrawl_client
+
+    from openai import OpenAI
+    from hubspot import HubSpot
+
     openai_api_key = os.getenv("OPENAI_API_KEY")
     hubspot_api_key = os.getenv("HUBSPOT_API_KEY")
-    
+
     openai_client = OpenAI(api_key=openai_api_key)
     hubspot_client = HubSpot(access_token=hubspot_api_key)
-    firecrawl_client = FirecrawlApp(api_key=firecrawl_api_key)
-    
+
     return openai_client, hubspot_client, firecrawl_client
 
-# Get list of companies from HubSpot
-def get_companies_from_hubspot(hubspot_client):
-    companies = []
+# Count items per stage and report throughput
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def record(self, n=1):
+        with self._lock:
+            if self.started is None:
+                self.started = time.monotonic()
+            self.count += n
+
+    def fail(self, n=1):
+        with self._lock:
+            self.errors += n
+
+    def finish(self):
+        with self._lock:
+            self.finished = time.monotonic()
+
+    def rate(self):
+        with self._lock:
+            if self.started is None:
+                return 0.0
+            elapsed = (self.finished or time.monotonic()) - self.started
+            return self.count / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return f"{self.name}: {self.count} ok, {self.errors} failed, {self.rate():.1f}/s"
+
+def report_throughput(stages, stop, interval):
+    while not stop.wait(interval):
+        print(" | ".join(str(stage) for stage in stages))
+
+# Space out calls to stay under a requests-per-minute limit, shared across threads
+class RateLimiter:
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute
+        self.next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+# Companies waiting for their website to be scraped, keyed by URL
+class PendingCompanies:
+    def __init__(self):
+        self._by_url = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url):
+        return url.strip().rstrip("/").lower()
+
+    def add(self, url, company):
+        """Returns True if the URL is new and still needs to be scraped."""
+        with self._lock:
+            companies = self._by_url.setdefault(self.key(url), [])
+            companies.append(company)
+            return len(companies) == 1
+
+    def pop(self, url):
+        with self._lock:
+            return self._by_url.pop(self.key(url), [])
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(companies) for companies in self._by_url.values())
+
+def normalize_website(website):
+    website = website.strip()
+    if not website.startswith(("http://", "https://")):
+        website = f"https://{website}"
+    return website
+
+# Stage 1: page through HubSpot companies and feed their websites into the batch scrape job
+def feed_companies_from_hubspot(hubspot_client, feeder, pending, stats):
     after = None
-    while True:
-        try:
+    try:
+        while True:
             response = hubspot_client.crm.companies.basic_api.get_page(
-                limit=100, 
+                limit=HUBSPOT_PAGE_SIZE,
                 properties=["name", "website"],
                 after=after
             )
-            companies.extend(response.results)
+            for company in response.results:
+                website = company.properties.get("website")
+                if not website:
+                    continue
+                url = normalize_website(website)
+                try:
+                    if pending.add(url, company):
+                        # Blocks while too many URLs are waiting to be scraped
+                        feeder.add(url)
+                    stats.record()
+                except ValueError as e:
+                    pending.pop(url)
+                    stats.fail()
+                    print(f"Skipping {company.properties.get('name', 'Unknown')}: {str(e)}")
             if not response.paging:
                 break
             after = response.paging.next.after
-        except Exception as e:
-            print(f"Error fetching companies from HubSpot: {str(e)}")
-            break
-    return [company for company in companies if company.properties.get("website")]
-
-# Scrape URL using Firecrawl
-def scrape_url(firecrawl_client, url):
-    try:
-        return firecrawl_client.scrape_url(url, params={'formats': ['markdown']})
     except Exception as e:
-        print(f"Error scraping URL {url}: {str(e)}")
-        return None
+        print(f"Error fetching companies from HubSpot: {str(e)}")
+    finally:
+        # Let already submitted websites finish scraping
+        stats.finish()
+        feeder.close()
 
 # Extract information using OpenAI
 def extract_info(openai_client, content):
     prompt = f"""
-    Based on the markdown content, extract the following information in JSON format: 
+    Based on the markdown content, extract the following information in JSON format:
     {{
         "is_open_source": boolean,
         "value_proposition": "string",
@@ -69,7 +178,8 @@ def extract_info(openai_client, content):
 
     Respond only with the JSON object, ensuring all fields are present even if the information is not found (use null in that case). Do not include the markdown code snippet like ```json or ``` at all in the response.
     """
-    
+
+    completion = None
     try:
         completion = openai_client.chat.completions.create(
             model="gpt-4o",
@@ -78,59 +188,153 @@ def extract_info(openai_client, content):
         return json.loads(completion.choices[0].message.content)
     except Exception as e:
         print(f"Error extracting information: {str(e)}")
-        print(completion.choices[0].message.content)
+        if completion is not None:
+            print(completion.choices[0].message.content)
         return None
 
-# Update company properties in HubSpot
-def update_hubspot(hubspot_client, company, extracted_info):
-    try:
-        hubspot_client.crm.companies.basic_api.update(
-            company_id=company.id,
-            simple_public_object_input={
-                "properties": {
-                    "is_open_source": str(extracted_info["is_open_source"]).lower(),
-                    "value_prop": extracted_info["value_proposition"],
-                    "main_products_offered": extracted_info["main_product"],
-                    "how_they_can_use_scraping": extracted_info["potential_scraping_use"]
-                }
-            }
-        )
-        print(f"Successfully updated HubSpot for company {company.properties['name']}")
-    except Exception as e:
-        print(f"Error updating HubSpot for company {company.properties['name']}: {str(e)}")
+def hubspot_properties(extracted_info):
+    return {
+        "is_open_source": str(extracted_info["is_open_source"]).lower(),
+        "value_prop": extracted_info["value_proposition"],
+        "main_products_offered": extracted_info["main_product"],
+        "how_they_can_use_scraping": extracted_info["potential_scraping_use"]
+    }
+
+# Stage 4: collect updates and write them through the HubSpot batch update API
+def write_updates_to_hubspot(hubspot_client, updates, stats, flush_interval):
+    batch = []
+    deadline = None
+
+    def flush():
+        if not batch:
+            return
+        try:
+            hubspot_client.crm.companies.batch_api.update(
+                batch_input_simple_public_object_batch_input={"inputs": list(batch)}
+            )
+            stats.record(len(batch))
+        except Exception as e:
+            stats.fail(len(batch))
+            print(f"Error updating {len(batch)} companies in HubSpot: {str(e)}")
+        batch.clear()
+
+    while True:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            update = updates.get(timeout=timeout)
+        except queue.Empty:
+            flush()
+            deadline = None
+            continue
+        if update is None:
+            flush()
+            stats.finish()
+            return
+        batch.append(update)
+        if deadline is None:
+            deadline = time.monotonic() + flush_interval
+        if len(batch) >= HUBSPOT_BATCH_SIZE:
+            flush()
+            deadline = None
 
 # Main process
 def main():
-    openai_client, hubspot_client, firecrawl_client = initialize_clients()
-    companies = get_companies_from_hubspot(hubspot_client)
-    
-    scraped_data = []
-    for company in companies:
-        company_name = company.properties.get("name", "Unknown")
-        url = company.properties["website"]
-        print(f"Processing {company_name} at {url}...")
-        
-        scrape_status = scrape_url(firecrawl_client, url)
-        if not scrape_status:
-            continue
-        
-        extracted_info = extract_info(openai_client, scrape_status["content"])
-        if not extracted_info:
-            continue
-        
-        update_hubspot(hubspot_client, company, extracted_info)
-        
-        scraped_data.append({
-            "company": company_name,
-            "url": url,
-            "markdown": scrape_status["content"],
-            "extracted_info": extracted_info
-        })
-        
-        print(f"Successfully processed {company_name}")
-        print(json.dumps(extracted_info, indent=2))
-
-    print(f"Scraped, analyzed, and updated {len(scraped_data)} companies")
+    parser = argparse.ArgumentParser(description="Enrich HubSpot companies with website data")
+    parser.add_argument("--stub", action="store_true", help="Use local HubSpot and OpenAI stubs instead of the real services")
+    parser.add_argument("--stub-companies", type=int, default=50, help="Number of fake companies served by the HubSpot stub")
+    parser.add_argument("--scrape-in-flight", type=int, default=500, help="Maximum websites waiting to be scraped")
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="Concurrent LLM extraction calls")
+    parser.add_argument("--llm-rpm", type=int, default=500, help="LLM requests per minute")
+    parser.add_argument("--update-flush-interval", type=float, default=5.0, help="Seconds before a partial HubSpot batch update is written")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="Seconds between throughput reports")
+    args = parser.parse_args()
+
+    openai_client, hubspot_client, firecrawl_client = initialize_clients(args.stub, args.stub_companies)
+
+    read_stats = StageStats("hubspot_read")
+    scrape_stats = StageStats("scrape")
+    extract_stats = StageStats("extract")
+    write_stats = StageStats("hubspot_write")
+    stages = [read_stats, scrape_stats, extract_stats, write_stats]
+
+    stop_reporting = threading.Event()
+    threading.Thread(
+        target=report_throughput, args=(stages, stop_reporting, args.report_interval), daemon=True
+    ).start()
+
+    # Stage 2: one batch scrape job that grows as HubSpot pages arrive
+    pending = PendingCompanies()
+    feeder = firecrawl_client.batch_feeder(
+        max_batch_size=100,
+        max_in_flight=args.scrape_in_flight,
+        fields=["markdown", "source_url", "url"],
+    )
+    reader = threading.Thread(
+        target=feed_companies_from_hubspot, args=(hubspot_client, feeder, pending, read_stats), daemon=True
+    )
+    reader.start()
+
+    updates = queue.Queue()
+    writer = threading.Thread(
+        target=write_updates_to_hubspot, args=(hubspot_client, updates, write_stats, args.update_flush_interval), daemon=True
+    )
+    writer.start()
+
+    # Stage 3: concurrent, rate-limited LLM extraction
+    limiter = RateLimiter(args.llm_rpm)
+    # Bound scraped pages held in memory while they wait for the LLM
+    slots = threading.BoundedSemaphore(args.llm_concurrency * 2)
+
+    def enrich(companies, markdown):
+        try:
+            limiter.acquire()
+            extracted_info = extract_info(openai_client, markdown)
+            if not extracted_info:
+                extract_stats.fail(len(companies))
+                return
+            properties = hubspot_properties(extracted_info)
+            for company in companies:
+                updates.put({"id": company.id, "properties": properties})
+            extract_stats.record(len(companies))
+        except Exception as e:
+            extract_stats.fail(len(companies))
+            print(f"Error enriching {companies[0].properties.get('name', 'Unknown')}: {str(e)}")
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=args.llm_concurrency) as executor:
+        try:
+            for doc in feeder:
+                url = (doc.metadata.source_url or doc.metadata.url) if doc.metadata else None
+                companies = pending.pop(url) if url else []
+                if not companies:
+                    scrape_stats.fail()
+                    print(f"Scraped {url} but no company is waiting for it")
+                    continue
+                if not doc.markdown:
+                    scrape_stats.fail(len(companies))
+                    print(f"No markdown returned for {url}, skipping...")
+                    continue
+                scrape_stats.record(len(companies))
+                slots.acquire()
+                executor.submit(enrich, companies, doc.markdown)
+        except Exception as e:
+            print(f"Error scraping company websites: {str(e)}")
+            feeder.cancel()
+    scrape_stats.finish()
+    extract_stats.finish()
+
+    reader.join()
+    updates.put(None)
+    writer.join()
+    stop_reporting.set()
+
+    unscraped = len(pending)
+    if unscraped:
+        scrape_stats.fail(unscraped)
+    for stage in stages:
+        print(stage)
+    print(f"Scraped, analyzed, and updated {write_stats.count} companies")
 
 if __name__ == "__main__":
     main()
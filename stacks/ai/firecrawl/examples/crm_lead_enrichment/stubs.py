@@ -0,0 +1,84 @@
+"""
+Local stand-ins for HubSpot and OpenAI used by `crm_lead_enrichment.py --stub`.
+
+They implement only the client calls the pipeline makes, with the same
+shapes as the real SDKs, so the pipeline can be exercised end to end (and
+its throughput measured) without CRM credentials or LLM spend. Firecrawl is
+still called for real.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+# Several companies share a website, so the pipeline's de-duplication is exercised too
+STUB_WEBSITES = [
+    "https://firecrawl.dev",
+    "https://docs.firecrawl.dev",
+    "https://example.com",
+    "https://www.iana.org",
+    "",
+]
+
+
+class StubHubSpot:
+    """Serves fake companies page by page and records batch updates."""
+
+    def __init__(self, companies=50, websites=None, latency=0.05):
+        websites = websites or STUB_WEBSITES
+        self.latency = latency
+        self.companies = [
+            SimpleNamespace(
+                id=str(i + 1),
+                properties={"name": f"Company {i + 1}", "website": websites[i % len(websites)]},
+            )
+            for i in range(companies)
+        ]
+        self.updated = {}
+        self.batch_calls = 0
+        self._lock = threading.Lock()
+        basic_api = SimpleNamespace(get_page=self._get_page)
+        batch_api = SimpleNamespace(update=self._batch_update)
+        self.crm = SimpleNamespace(companies=SimpleNamespace(basic_api=basic_api, batch_api=batch_api))
+
+    def _get_page(self, limit=10, properties=None, after=None):
+        time.sleep(self.latency)
+        start = int(after or 0)
+        end = start + limit
+        paging = SimpleNamespace(next=SimpleNamespace(after=str(end))) if end < len(self.companies) else None
+        return SimpleNamespace(results=self.companies[start:end], paging=paging)
+
+    def _batch_update(self, batch_input_simple_public_object_batch_input):
+        inputs = batch_input_simple_public_object_batch_input["inputs"]
+        if len(inputs) > 100:
+            raise ValueError("HubSpot batch updates accept at most 100 inputs")
+        time.sleep(self.latency)
+        with self._lock:
+            self.batch_calls += 1
+            for item in inputs:
+                self.updated[item["id"]] = item["properties"]
+        return SimpleNamespace(status="COMPLETE", results=inputs)
+
+
+class StubOpenAI:
+    """Answers chat completions with a fixed extraction after a simulated delay."""
+
+    def __init__(self, latency=0.5):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages):
+        time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+        prompt = messages[-1]["content"]
+        content = json.dumps({
+            "is_open_source": "open source" in prompt.lower(),
+            "value_proposition": f"Stub value proposition ({len(prompt)} prompt characters)",
+            "main_product": "Stub product",
+            "potential_scraping_use": "Stub scraping use",
+        })
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
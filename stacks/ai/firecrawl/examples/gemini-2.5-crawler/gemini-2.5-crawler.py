@@ -1,4 +1,5 @@
 import os
+import sys
 from firecrawl import FirecrawlApp
 import json
 import re
@@ -6,6 +7,11 @@ import requests
 from requests.exceptions import RequestException
 from dotenv import load_dotenv
 import google.genai as genai
+
+# The shared explorer lives one directory up, next to the other examples
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from objective_explorer import explore_top_pages
+
 # Load environment variables
 load_dotenv()
 
@@ -258,21 +264,21 @@ def find_objective_in_top_pages(map_website, objective, app):
 
         top_links = map_website[:3]
         print(
-            f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links: {top_links}{Colors.RESET}")
+            f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links in parallel: {top_links}{Colors.RESET}")
 
-        for link in top_links:
+        def scrape_page(link):
             print(f"{Colors.YELLOW}Initiating scrape of page: {link}{Colors.RESET}")
             scrape_result = app.scrape_url(
                 link, params={'formats': ['markdown']})
             print(
-                f"{Colors.GREEN}Page scraping completed successfully.{Colors.RESET}")
+                f"{Colors.GREEN}Page scraping completed successfully: {link}{Colors.RESET}")
 
             # Now detect any PDF or image URLs in the Markdown text
             page_markdown = scrape_result.get('markdown', '')
             if not page_markdown:
                 print(
                     f"{Colors.RED}No markdown returned for {link}, skipping...{Colors.RESET}")
-                continue
+                return None
 
             found_urls = extract_urls_from_markdown(page_markdown)
             pdf_image_append = ""
@@ -282,7 +288,7 @@ def find_objective_in_top_pages(map_website, objective, app):
                 if mime_type_short == 'pdf':
                     print(
                         f"{Colors.YELLOW} Detected PDF: {sub_url}. Extracting content...{Colors.RESET}")
-                    pdf_content = gemini_extract_pdf_content(sub_url)
+                    pdf_content = gemini_extract_pdf_content(sub_url, objective)
                     if pdf_content:
                         pdf_image_append += f"\n\n---\n[PDF from {sub_url}]:\n{pdf_content}"
                 elif mime_type_short == 'image':
@@ -294,15 +300,16 @@ def find_objective_in_top_pages(map_website, objective, app):
 
             # Append extracted PDF/image text to the main markdown for the page
             if pdf_image_append:
-                scrape_result[
-                    'markdown'] += f"\n\n---\n**Additional Gemini Extraction:**\n{pdf_image_append}\n"
+                page_markdown += f"\n\n---\n**Additional Gemini Extraction:**\n{pdf_image_append}\n"
+            return page_markdown
 
+        def check_page(link, page_markdown):
             check_prompt = f"""
             Analyze this content to find: {objective}
             If found, return ONLY a JSON object with information related to the objective. If not found, respond EXACTLY with: Objective not met
             
             Content to analyze:
-            {scrape_result['markdown']}
+            {page_markdown}
             
             Remember:
             - Return valid JSON if information is found
@@ -317,12 +324,12 @@ def find_objective_in_top_pages(map_website, objective, app):
 
             result = response.text.strip()
 
-            print(f"{Colors.MAGENTA}Debug - Check response:{Colors.RESET}")
+            print(f"{Colors.MAGENTA}Debug - Check response for {link}:{Colors.RESET}")
             print(result)
 
             if result != "Objective not met":
                 print(
-                    f"{Colors.GREEN}Objective potentially fulfilled. Relevant information identified.{Colors.RESET}")
+                    f"{Colors.GREEN}Objective potentially fulfilled on {link}. Relevant information identified.{Colors.RESET}")
                 try:
                     if '{' in result and '}' in result:
                         start_idx = result.find('{')
@@ -334,10 +341,21 @@ def find_objective_in_top_pages(map_website, objective, app):
                             f"{Colors.RED}No JSON object found in response{Colors.RESET}")
                 except json.JSONDecodeError:
                     print(
-                        f"{Colors.RED}Error in parsing response. Proceeding to next page...{Colors.RESET}")
+                        f"{Colors.RED}Error in parsing response for {link}. Waiting for the other pages...{Colors.RESET}")
             else:
                 print(
-                    f"{Colors.YELLOW}Objective not met on this page. Proceeding to next link...{Colors.RESET}")
+                    f"{Colors.YELLOW}Objective not met on {link}. Waiting for the other pages...{Colors.RESET}")
+            return None
+
+        def report_error(link, error):
+            print(
+                f"{Colors.RED}Error encountered while analyzing {link}: {str(error)}{Colors.RESET}")
+
+        # Pages are scraped, enriched and checked in parallel; outstanding work is cancelled once one page answers
+        found = explore_top_pages(
+            top_links, scrape_page, check_page, top_k=len(top_links), on_error=report_error)
+        if found:
+            return found[1]
 
         print(f"{Colors.RED}All available pages analyzed. Objective not fulfilled in examined content.{Colors.RESET}")
         return None
@@ -1,9 +1,14 @@
 import os
+import sys
 from firecrawl import FirecrawlApp
 import json
 from dotenv import load_dotenv
 from openai import OpenAI
 
+# The shared explorer lives one directory up, next to the other examples
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from objective_explorer import explore_top_pages
+
 # ANSI color codes
 class Colors:
     CYAN = '\033[96m'
@@ -153,7 +158,7 @@ def find_relevant_page_via_map(objective, url, app, client):
         print(f"{Colors.RED}Error encountered during relevant page identification: {str(e)}{Colors.RESET}")
         return None
     
-# Scrape the top 3 pages and see if the objective is met, if so return in json format else return None
+# Scrape the top 3 pages concurrently and return the first result that meets the objective in json format, else None
 def find_objective_in_top_pages(map_website, objective, app, client):
     try:
         # Get top 3 links from the map result
@@ -162,15 +167,15 @@ def find_objective_in_top_pages(map_website, objective, app, client):
             return None
             
         top_links = map_website[:3]
-        print(f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links: {top_links}{Colors.RESET}")
+        print(f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links in parallel: {top_links}{Colors.RESET}")
         
-        for link in top_links:
+        def scrape_page(link):
             print(f"{Colors.YELLOW}Initiating scrape of page: {link}{Colors.RESET}")
-            # Scrape the page
             scrape_result = app.scrape_url(link, params={'formats': ['markdown']})
-            print(f"{Colors.GREEN}Page scraping completed successfully.{Colors.RESET}")
-     
-            
+            print(f"{Colors.GREEN}Page scraping completed successfully: {link}{Colors.RESET}")
+            return scrape_result.get('markdown', '')
+
+        def check_page(link, markdown):
             # Check if objective is met
             check_prompt = f"""
             Given the following scraped content and objective, determine if the objective is met.
@@ -178,7 +183,7 @@ def find_objective_in_top_pages(map_website, objective, app, client):
             If the objective is not met with confidence, respond with 'Objective not met'.
 
             Objective: {objective}
-            Scraped content: {scrape_result['markdown']}
+            Scraped content: {markdown}
 
             Remember:
             1. Only return JSON if you are confident the objective is fully met.
@@ -204,7 +209,7 @@ def find_objective_in_top_pages(map_website, objective, app, client):
             result = completion.choices[0].message.content
             
             if result != "Objective not met":
-                print(f"{Colors.GREEN}Objective potentially fulfilled. Relevant information identified.{Colors.RESET}")
+                print(f"{Colors.GREEN}Objective potentially fulfilled on {link}. Relevant information identified.{Colors.RESET}")
                 try:
                     # Clean up potential markdown formatting or extra text
                     if "```json" in result:
@@ -221,11 +226,20 @@ def find_objective_in_top_pages(map_website, objective, app, client):
                     
                     return json.loads(result)
                 except json.JSONDecodeError as e:
-                    print(f"{Colors.RED}Error in parsing response: {str(e)}. Proceeding to next page...{Colors.RESET}")
+                    print(f"{Colors.RED}Error in parsing response for {link}: {str(e)}. Waiting for the other pages...{Colors.RESET}")
                     # Optionally print the raw response for debugging
                     # print(f"{Colors.MAGENTA}Raw response: {result}{Colors.RESET}")
             else:
-                print(f"{Colors.YELLOW}Objective not met on this page. Proceeding to next link...{Colors.RESET}")
+                print(f"{Colors.YELLOW}Objective not met on {link}. Waiting for the other pages...{Colors.RESET}")
+            return None
+
+        def report_error(link, error):
+            print(f"{Colors.RED}Error encountered while analyzing {link}: {str(error)}{Colors.RESET}")
+
+        # Pages are scraped and checked in parallel; outstanding work is cancelled once one page answers
+        found = explore_top_pages(top_links, scrape_page, check_page, top_k=len(top_links), on_error=report_error)
+        if found:
+            return found[1]
         
         print(f"{Colors.RED}All available pages analyzed. Objective not fulfilled in examined content.{Colors.RESET}")
         return None
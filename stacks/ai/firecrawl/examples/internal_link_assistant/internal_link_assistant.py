@@ -1,8 +1,13 @@
 import os
-import json
+import re
+import math
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from firecrawl import FirecrawlApp
 from dotenv import load_dotenv
 from openai import OpenAI
+from site_map_cache import SiteMapCache
 
 # Load environment variables
 load_dotenv()
@@ -15,31 +20,78 @@ openai_api_key = os.getenv("OPENAI_API_KEY")
 app = FirecrawlApp(api_key=firecrawl_api_key)
 client = OpenAI(api_key=openai_api_key)
 
-def main():
-    # Get user input
-    blog_url = input("Enter the blog URL: ")
-
-    if not blog_url.strip():
-        blog_url = "https://www.firecrawl.dev/blog/how-to-use-openai-o1-reasoning-models-in-applications"
-
+# Posts processed at the same time
+MAX_CONCURRENT_POSTS = int(os.getenv("MAX_CONCURRENT_POSTS", "4"))
+# Candidate links sent to the LLM per post
+TOP_N_LINKS = int(os.getenv("TOP_N_LINKS", "25"))
+OUTPUT_DIR = "revised_posts"
+
+# Map each domain once and reuse it for a day, across posts and across runs
+site_maps = SiteMapCache(
+    lambda domain: app.map_url(domain).get('links', []),
+    ttl_seconds=24 * 3600,
+    cache_dir=".site_map_cache",
+)
+
+STOP_WORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "your", "you", "are", "was", "how",
+    "what", "why", "can", "use", "using", "will", "into", "about", "our", "has", "have",
+    "www", "http", "https", "com", "html", "htm", "php", "blog", "page",
+}
+
+def tokenize(text):
+    return [t for t in re.findall(r'[a-z0-9]+', text.lower()) if len(t) > 2 and t not in STOP_WORDS]
+
+def link_terms(url):
+    # Only the path says what a page is about; the domain is shared by every link
+    path = url.split('/', 3)[3] if url.count('/') >= 3 else ''
+    return tokenize(path)
+
+# Rank site links by how well their URL terms match the post (TF-IDF over the link set)
+def rank_links(blog_content, links, top_n=TOP_N_LINKS, exclude=()):
+    excluded = {u.rstrip('/') for u in exclude}
+    candidates = [(url, set(link_terms(url))) for url in dict.fromkeys(links) if url.rstrip('/') not in excluded]
+    candidates = [(url, terms) for url, terms in candidates if terms]
+    if not candidates:
+        return []
+
+    document_frequency = Counter(term for _, terms in candidates for term in terms)
+    blog_terms = Counter(tokenize(blog_content))
+    total = len(candidates)
+
+    scored = []
+    for url, terms in candidates:
+        score = sum(
+            math.log(1 + blog_terms[term]) * math.log(1 + total / document_frequency[term])
+            for term in terms
+            if term in blog_terms
+        )
+        if score > 0:
+            # Long slugs should not win just by having more words
+            scored.append((score / math.sqrt(len(terms)), url))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [url for _, url in scored[:top_n]]
+
+# Function to count links in a markdown content
+def count_links(markdown_content):
+    return len(re.findall(r'\[.*?\]\(.*?\)', markdown_content))
+
+def add_internal_links(blog_url):
     # Scrape the blog content
-    print("Scraping the blog content...")
+    print(f"Scraping the blog content of {blog_url}...")
     blog_scrape_result = app.scrape_url(blog_url, params={'formats': ['markdown']})
 
     # Get the blog content in markdown format
     blog_content = blog_scrape_result.get('markdown', '')
 
-    # Turn the blog URL into a top-level domain
-    top_level_domain = '/'.join(blog_url.split('/')[:3])
-
-    # Map the website to get all links
-    print("Mapping the website to get all links...")
-    site_map = app.map_url(top_level_domain)
-
-    # Get the list of URLs from the site map
-    site_links = site_map.get('links', [])
+    # Get all links of the website, mapping it only if the cached map is missing or stale
+    site_links = site_maps.get(blog_url)
 
+    # Only the most relevant pages go into the prompt
+    candidate_links = rank_links(blog_content, site_links, exclude=[blog_url])
+    print(f"Selected {len(candidate_links)} of {len(site_links)} site links as candidates for {blog_url}")
 
+    links_list = "\n".join(f"- {url}" for url in candidate_links)
     prompt = f"""
 You are an AI assistant helping to improve a blog post.
 
@@ -49,21 +101,15 @@ Here is the original blog post content:
 
 Here is a list of other pages on the website:
 
-{json.dumps(site_links, indent=2)}
+{links_list}
 
 Please revise the blog post to include internal links to some of these pages where appropriate. Make sure the internal links are relevant and enhance the content.
 
 Only return the revised blog post in markdown format.
 """
 
-    import re
-
-    # Function to count links in a markdown content
-    def count_links(markdown_content):
-        return len(re.findall(r'\[.*?\]\(.*?\)', markdown_content))
-
     # Use OpenAI API to get the revised blog post
-    print("Generating the revised blog post with internal links...")
+    print(f"Generating the revised blog post with internal links for {blog_url}...")
     completion = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
@@ -76,19 +122,50 @@ Only return the revised blog post in markdown format.
             "type": "content",
             "content": blog_content
         }
-    );
+    )
 
     revised_blog_post = completion.choices[0].message.content
 
-    # Count links in the original and revised blog post
-    original_links_count = count_links(blog_content)
-    revised_links_count = count_links(revised_blog_post)
+    # Save the revised post next to the others
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    slug = re.sub(r'[^a-zA-Z0-9_-]+', '_', blog_url.split('://', 1)[-1]).strip('_')
+    output_path = os.path.join(OUTPUT_DIR, f"{slug}.md")
+    with open(output_path, "w") as f:
+        f.write(revised_blog_post)
+
+    return {
+        "url": blog_url,
+        "revised": revised_blog_post,
+        "output_path": output_path,
+        "original_links_count": count_links(blog_content),
+        "revised_links_count": count_links(revised_blog_post),
+    }
 
-    # Output a portion of the revised blog post and link counts
-    print("\nRevised blog post (first 500 characters):")
-    print(revised_blog_post[:500])
-    print(f"\nNumber of links in the original blog post: {original_links_count}")
-    print(f"Number of links in the revised blog post: {revised_links_count}")
+def main():
+    # Blog URLs come from the command line or the prompt (comma separated)
+    blog_urls = sys.argv[1:] or [u.strip() for u in input("Enter the blog URLs (comma separated): ").split(',') if u.strip()]
+
+    if not blog_urls:
+        blog_urls = ["https://www.firecrawl.dev/blog/how-to-use-openai-o1-reasoning-models-in-applications"]
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_POSTS) as executor:
+        futures = {executor.submit(add_internal_links, url): url for url in blog_urls}
+        for future in as_completed(futures):
+            blog_url = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"\nError processing {blog_url}: {str(e)}")
+                continue
+
+            # Output a portion of the revised blog post and link counts
+            print(f"\nRevised blog post for {blog_url} (first 500 characters):")
+            print(result["revised"][:500])
+            print(f"\nSaved to {result['output_path']}")
+            print(f"Number of links in the original blog post: {result['original_links_count']}")
+            print(f"Number of links in the revised blog post: {result['revised_links_count']}")
+
+    print(f"\nSite map cache: {site_maps.hits} hits, {site_maps.misses} maps")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,90 @@
+import json
+import os
+import re
+import threading
+import time
+
+class SiteMapCache:
+    """
+    Cache of site maps keyed by domain, with a time-to-live.
+
+    Posts on the same domain share one map_url call: concurrent lookups for a
+    domain wait for the first one instead of mapping the site again. With a
+    cache_dir the maps are also kept on disk, so later runs reuse them until
+    they expire.
+    """
+
+    def __init__(self, map_site, ttl_seconds=24 * 3600, cache_dir=None):
+        """
+        map_site: Called with a domain URL (e.g. "https://www.firecrawl.dev"); returns its list of links
+        ttl_seconds: How long a map stays fresh
+        cache_dir: Optional directory to persist maps across runs
+        """
+        self.map_site = map_site
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def domain_of(url):
+        """Turn a page URL into its top-level domain URL."""
+        return '/'.join(url.split('/')[:3]).lower()
+
+    def get(self, url):
+        """Return the links of the site that url belongs to, mapping it only if the cached map is missing or stale."""
+        domain = self.domain_of(url)
+        with self._lock:
+            domain_lock = self._locks.setdefault(domain, threading.Lock())
+        with domain_lock:
+            entry = self._entries.get(domain) or self._load(domain)
+            if entry and time.time() - entry["mapped_at"] < self.ttl_seconds:
+                with self._lock:
+                    self.hits += 1
+                return entry["links"]
+            with self._lock:
+                self.misses += 1
+            links = self.map_site(domain)
+            entry = {"mapped_at": time.time(), "links": links}
+            self._entries[domain] = entry
+            self._save(domain, entry)
+            return links
+
+    def invalidate(self, url):
+        domain = self.domain_of(url)
+        self._entries.pop(domain, None)
+        path = self._path(domain)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def _path(self, domain):
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, re.sub(r'[^a-z0-9.-]+', '_', domain) + ".json")
+
+    def _load(self, domain):
+        path = self._path(domain)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._entries[domain] = entry
+        return entry
+
+    def _save(self, domain, entry):
+        path = self._path(domain)
+        if not path:
+            return
+        # Write then rename so a concurrent run never reads half a file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
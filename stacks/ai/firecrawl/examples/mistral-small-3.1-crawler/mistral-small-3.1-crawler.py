@@ -1,9 +1,14 @@
 import os
+import sys
 from firecrawl import FirecrawlApp
 import json
 from dotenv import load_dotenv
 from mistralai import Mistral
 
+# The shared explorer lives one directory up, next to the other examples
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from objective_explorer import explore_top_pages
+
 # ANSI color codes
 class Colors:
     CYAN = '\033[96m'
@@ -173,7 +178,7 @@ def find_relevant_page_via_map(objective, url, app, client):
         print(f"{Colors.RED}Error encountered during relevant page identification: {str(e)}{Colors.RESET}")
         return None
     
-# Scrape the top 3 pages and see if the objective is met, if so return in json format else return None
+# Scrape the top 3 pages concurrently and return the first result that meets the objective in json format, else None
 def find_objective_in_top_pages(map_website, objective, app, client):
     try:
         # Get top 3 links from the map result
@@ -182,20 +187,22 @@ def find_objective_in_top_pages(map_website, objective, app, client):
             return None
             
         top_links = map_website[:3]
-        print(f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links: {top_links}{Colors.RESET}")
+        print(f"{Colors.CYAN}Proceeding to analyze top {len(top_links)} links in parallel: {top_links}{Colors.RESET}")
         
-        for link in top_links:
+        def scrape_page(link):
             print(f"{Colors.YELLOW}Initiating scrape of page: {link}{Colors.RESET}")
             scrape_result = app.scrape_url(link, params={'formats': ['markdown']})
-            print(f"{Colors.GREEN}Page scraping completed successfully.{Colors.RESET}")
-     
+            print(f"{Colors.GREEN}Page scraping completed successfully: {link}{Colors.RESET}")
+            return scrape_result.get('markdown', '')
+
+        def check_page(link, markdown):
             check_prompt = f"""
             Given the following scraped content and objective, determine if the objective is met.
             If it is, extract the relevant information in a simple and concise JSON format. Use only the necessary fields and avoid nested structures if possible.
             If the objective is not met with confidence, respond with exactly 'Objective not met'.
 
             Objective: {objective}
-            Scraped content: {scrape_result['markdown']}
+            Scraped content: {markdown}
 
             Remember:
             1. Only return JSON if you are confident the objective is fully met.
@@ -224,19 +231,27 @@ def find_objective_in_top_pages(map_website, objective, app, client):
                 result = result[start_idx:end_idx].strip()
             
             if result == "Objective not met":
-                print(f"{Colors.YELLOW}Objective not met on this page. Proceeding to next link...{Colors.RESET}")
-                continue
+                print(f"{Colors.YELLOW}Objective not met on {link}. Waiting for the other pages...{Colors.RESET}")
+                return None
                 
             try:
                 print(f"{Colors.YELLOW}Parsing extracted content: {result[:100]}...{Colors.RESET}")
                 json_result = json.loads(result)
                 print(f"{Colors.GREEN}Successfully parsed JSON response{Colors.RESET}")
-                print(f"{Colors.GREEN}Objective fulfilled. Relevant information found.{Colors.RESET}")
+                print(f"{Colors.GREEN}Objective fulfilled on {link}. Relevant information found.{Colors.RESET}")
                 return json_result
             except json.JSONDecodeError as e:
-                print(f"{Colors.RED}Error parsing JSON response: {str(e)}{Colors.RESET}")
+                print(f"{Colors.RED}Error parsing JSON response for {link}: {str(e)}{Colors.RESET}")
                 print(f"{Colors.MAGENTA}Raw response: {result}{Colors.RESET}")
-                continue
+                return None
+
+        def report_error(link, error):
+            print(f"{Colors.RED}Error encountered while analyzing {link}: {str(error)}{Colors.RESET}")
+
+        # Pages are scraped and checked in parallel; outstanding work is cancelled once one page answers
+        found = explore_top_pages(top_links, scrape_page, check_page, top_k=len(top_links), on_error=report_error)
+        if found:
+            return found[1]
 
         print(f"{Colors.RED}All available pages analyzed. Objective not fulfilled in examined content.{Colors.RESET}")
         return None
@@ -0,0 +1,94 @@
+"""
+Shared concurrent explorer for the objective-driven example crawlers.
+
+The crawlers map a site, rank the most promising pages and then check each
+one with an LLM until a page satisfies the objective. ``explore_top_pages``
+runs that last step concurrently: the top-K pages are scraped in parallel,
+each page is evaluated as soon as its scrape returns, and once one page
+satisfies the objective the remaining work is cancelled.
+
+Usage (from an example directory):
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from objective_explorer import explore_top_pages
+
+    found = explore_top_pages(
+        links,
+        scrape=lambda link: app.scrape_url(link, params={"formats": ["markdown"]})["markdown"],
+        evaluate=lambda link, markdown: ask_llm(objective, markdown),
+    )
+    if found:
+        link, result = found
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def explore_top_pages(
+    links: List[str],
+    scrape: Callable[[str], Any],
+    evaluate: Callable[[str, Any], Any],
+    *,
+    top_k: int = 3,
+    max_workers: Optional[int] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> Optional[Tuple[str, Any]]:
+    """
+    Scrape the top-K links in parallel and return the first page that
+    satisfies the objective.
+
+    Each link is scraped and then evaluated on its own worker, so a slow
+    scrape or LLM call never holds up the other pages. Pages are evaluated in
+    the order their scrapes finish, not in rank order.
+
+    Args:
+        links: Candidate URLs, most relevant first
+        scrape: Called with a link; returns the page content (None or empty to skip the page)
+        evaluate: Called with a link and its content; returns the extracted
+            result, or None if the page does not satisfy the objective
+        top_k: Number of links to explore
+        max_workers: Pages explored at once (defaults to top_k)
+        on_error: Called with the link and exception when a page fails;
+            failures are otherwise ignored so the other pages can still answer
+
+    Returns:
+        (link, result) for the first page that satisfied the objective, or None
+    """
+    top_links = list(links)[:top_k]
+    if not top_links:
+        return None
+
+    stop = threading.Event()
+
+    def explore(link: str) -> Any:
+        if stop.is_set():
+            return None
+        page = scrape(link)
+        # Skip the LLM call if another page answered while this one was scraping
+        if not page or stop.is_set():
+            return None
+        return evaluate(link, page)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(top_links))
+    pending = {executor.submit(explore, link): link for link in top_links}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                link = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(link, e)
+                    continue
+                if result is not None:
+                    return link, result
+        return None
+    finally:
+        stop.set()
+        for future in pending:
+            future.cancel()
+        # Do not wait for in-flight requests that can no longer change the answer
+        executor.shutdown(wait=False)